@@ -45,7 +45,7 @@ lint_commands: List[LintCommand] = [
         'mypy --ignore-missing-imports --follow-imports skip '
         '--disallow-untyped-calls --disallow-untyped-defs '
         '--strict-optional --strict-equality ./apyscript/ '
-        './tests/ ./test_projects/',
+        './tests/ ./test_projects/ ./benchmarks/',
         'lint_name': 'mypy',
     },
 ]
@@ -26,6 +26,13 @@ from typing import Tuple
 
 from apyscript.console.trace import trace
 from apyscript.expression import expression_file_util
+from apyscript.expression.expression_ir import BinaryOp
+from apyscript.expression.expression_ir import Expression
+from apyscript.expression.expression_ir import ExpressionStatement
+from apyscript.expression.expression_ir import Literal
+from apyscript.expression.expression_ir import UnaryOp
+from apyscript.expression.expression_ir import get_value_expression
+from apyscript.expression.expression_ir import make_method_call
 from apyscript.string import string_util
 from apyscript.type import value_util
 
@@ -56,15 +63,13 @@ def assert_equal(expected: Any, actual: Any, msg: str = '') -> None:
     _trace_info(
         interface_label='assert_equal', expected=expected, actual=actual)
 
-    expected_str, actual_str = _get_expected_and_actual_strs(
+    expected_exp, actual_exp = _get_expected_and_actual_expressions(
         expected=expected, actual=actual)
 
-    msg = string_util.escape_str(string=msg)
-    expression: str = (
-        f'console.assert({expected_str} === {actual_str}, "{msg}");'
-    )
-    expression_file_util.wrap_by_script_tag_and_append_expression(
-        expression=expression)
+    _append_assertion_statement(
+        condition=BinaryOp(
+            left=expected_exp, operator='===', right=actual_exp),
+        msg=msg)
 
 
 def assert_not_equal(expected: Any, actual: Any, msg: str = '') -> None:
@@ -92,15 +97,13 @@ def assert_not_equal(expected: Any, actual: Any, msg: str = '') -> None:
 
     _trace_info(
         interface_label='assert_not_equal', expected=expected, actual=actual)
-    expected_str, actual_str = _get_expected_and_actual_strs(
+    expected_exp, actual_exp = _get_expected_and_actual_expressions(
         expected=expected, actual=actual)
 
-    msg = string_util.escape_str(string=msg)
-    expression: str = (
-        f'console.assert({expected_str} !== {actual_str}, "{msg}");'
-    )
-    expression_file_util.wrap_by_script_tag_and_append_expression(
-        expression=expression)
+    _append_assertion_statement(
+        condition=BinaryOp(
+            left=expected_exp, operator='!==', right=actual_exp),
+        msg=msg)
 
 
 def assert_true(
@@ -122,18 +125,15 @@ def assert_true(
     """
     _trace_info(
         interface_label='assert_true', expected='true', actual=actual)
-    _, actual_str = _get_expected_and_actual_strs(
+    _, actual_exp = _get_expected_and_actual_expressions(
         expected='true', actual=actual)
 
-    msg = string_util.escape_str(string=msg)
-    expression: str = (
-        f'console.assert({actual_str} =='
-    )
-    expression = _add_equal_if_type_strict_setting_is_true(
-        expression=expression, type_strict=type_strict)
-    expression += f' true, "{msg}");'
-    expression_file_util.wrap_by_script_tag_and_append_expression(
-        expression=expression)
+    _append_assertion_statement(
+        condition=BinaryOp(
+            left=actual_exp,
+            operator=_get_equal_operator(type_strict=type_strict),
+            right=Literal(value=True)),
+        msg=msg)
 
 
 def assert_false(
@@ -155,18 +155,15 @@ def assert_false(
     """
     _trace_info(
         interface_label='assert_false', expected='false', actual=actual)
-    _, actual_str = _get_expected_and_actual_strs(
+    _, actual_exp = _get_expected_and_actual_expressions(
         expected='false', actual=actual)
 
-    msg = string_util.escape_str(string=msg)
-    expression: str = (
-        f'console.assert({actual_str} =='
-    )
-    expression = _add_equal_if_type_strict_setting_is_true(
-        expression=expression, type_strict=type_strict)
-    expression += f' false, "{msg}");'
-    expression_file_util.wrap_by_script_tag_and_append_expression(
-        expression=expression)
+    _append_assertion_statement(
+        condition=BinaryOp(
+            left=actual_exp,
+            operator=_get_equal_operator(type_strict=type_strict),
+            right=Literal(value=False)),
+        msg=msg)
 
 
 def assert_arrays_equal(
@@ -193,10 +190,9 @@ def assert_arrays_equal(
         interface_label='assert_arrays_equal',
         expected=expected, actual=actual)
 
-    expression: str = _make_arrays_comparison_expression(
+    statement: ExpressionStatement = _make_arrays_comparison_expression(
         expected=expected, actual=actual, msg=msg, not_condition=False)
-    expression_file_util.wrap_by_script_tag_and_append_expression(
-        expression=expression)
+    expression_file_util.append_statement(statement=statement)
 
 
 def assert_arrays_not_equal(
@@ -223,10 +219,9 @@ def assert_arrays_not_equal(
         interface_label='assert_arrays_not_equal',
         expected=expected, actual=actual)
 
-    expression: str = _make_arrays_comparison_expression(
+    statement: ExpressionStatement = _make_arrays_comparison_expression(
         expected=expected, actual=actual, msg=msg, not_condition=True)
-    expression_file_util.wrap_by_script_tag_and_append_expression(
-        expression=expression)
+    expression_file_util.append_statement(statement=statement)
 
 
 def assert_defined(actual: Any, msg: str = '') -> None:
@@ -244,15 +239,13 @@ def assert_defined(actual: Any, msg: str = '') -> None:
     _trace_info(
         interface_label='assert_defined', expected='other than undefined',
         actual=actual)
-    _, actual_str = _get_expected_and_actual_strs(
+    _, actual_exp = _get_expected_and_actual_expressions(
         expected='other than undefined', actual=actual)
 
-    msg = string_util.escape_str(string=msg)
-    expression: str = (
-        f'console.assert(!_.isUndefined({actual_str}), "{msg}");'
-    )
-    expression_file_util.wrap_by_script_tag_and_append_expression(
-        expression=expression)
+    is_undefined: Expression = make_method_call(
+        variable_name='_', method_name='isUndefined', args=[actual_exp])
+    _append_assertion_statement(
+        condition=UnaryOp(operator='!', operand=is_undefined), msg=msg)
 
 
 def assert_undefined(actual: Any, msg: str = '') -> None:
@@ -269,23 +262,62 @@ def assert_undefined(actual: Any, msg: str = '') -> None:
     _trace_info(
         interface_label='assert_undefined', expected='undefined',
         actual=actual)
-    _, actual_str = _get_expected_and_actual_strs(
+    _, actual_exp = _get_expected_and_actual_expressions(
         expected='undefined', actual=actual)
 
+    is_undefined: Expression = make_method_call(
+        variable_name='_', method_name='isUndefined', args=[actual_exp])
+    _append_assertion_statement(
+        condition=is_undefined, msg=msg)
+
+
+def _append_assertion_statement(condition: Expression, msg: str) -> None:
+    """
+    Append assertion (console.assert) statement to file.
+
+    Parameters
+    ----------
+    condition : Expression
+        Condition expression to assert.
+    msg : str
+        Message to display when assertion failed.
+    """
+    expression_file_util.append_statement(
+        statement=_make_assertion_statement(condition=condition, msg=msg))
+
+
+def _make_assertion_statement(
+        condition: Expression, msg: str) -> ExpressionStatement:
+    """
+    Make assertion (console.assert) statement.
+
+    Parameters
+    ----------
+    condition : Expression
+        Condition expression to assert.
+    msg : str
+        Message to display when assertion failed (this will be
+        escaped).
+
+    Returns
+    -------
+    statement : ExpressionStatement
+        Assertion statement.
+    """
     msg = string_util.escape_str(string=msg)
-    expression: str = (
-        f'console.assert(_.isUndefined({actual_str}), "{msg}");'
-    )
-    expression_file_util.wrap_by_script_tag_and_append_expression(
-        expression=expression)
+    statement: ExpressionStatement = ExpressionStatement(
+        expression=make_method_call(
+            variable_name='console', method_name='assert',
+            args=[condition, Literal(value=msg)]))
+    return statement
 
 
 def _make_arrays_comparison_expression(
         expected: Any, actual: Any, msg: str,
-        not_condition: bool) -> str:
+        not_condition: bool) -> ExpressionStatement:
     """
     Make arrays comparison (assert_arrays_equal or
-    assert_arrays_not_equal) expression string.
+    assert_arrays_not_equal) expression statement.
 
     Parameters
     ----------
@@ -301,23 +333,19 @@ def _make_arrays_comparison_expression(
 
     Returns
     -------
-    expression : str
-        Result expression string.
+    statement : ExpressionStatement
+        Result expression statement.
     """
-    expected_exp_str: str = value_util.get_value_str_for_expression(
-        value=expected)
-    actual_exp_str: str = value_util.get_value_str_for_expression(
-        value=actual)
-    msg = string_util.escape_str(string=msg)
+    expected_exp, actual_exp = _get_expected_and_actual_expressions(
+        expected=expected, actual=actual)
+    condition: Expression = make_method_call(
+        variable_name='_', method_name='isEqual',
+        args=[expected_exp, actual_exp])
     if not_condition:
-        not_condition_str: str = '!'
-    else:
-        not_condition_str = ''
-    expression: str = (
-        f'console.assert({not_condition_str}_.isEqual({expected_exp_str}, '
-        f'{actual_exp_str}), "{msg}");'
-    )
-    return expression
+        condition = UnaryOp(operator='!', operand=condition)
+    statement: ExpressionStatement = _make_assertion_statement(
+        condition=condition, msg=msg)
+    return statement
 
 
 def _trace_arrays_assertion_info(
@@ -374,35 +402,30 @@ def _actual_value_type_is_array(actual: Any) -> bool:
     return False
 
 
-def _add_equal_if_type_strict_setting_is_true(
-        expression: str, type_strict: bool) -> str:
+def _get_equal_operator(type_strict: bool) -> str:
     """
-    Add single equal character to expression if type_string setting
-    is True.
+    Get equal operator of specified type_strict setting.
 
     Parameters
     ----------
-    expression : str
-        Expression to be added.
     type_strict: bool
         Type strict setting value.
 
     Returns
     -------
-    expression : str
-        If type_string setting is true, then single equal character
-        will be added to tail.
+    operator : str
+        If type_string setting is true, `===` will be returned,
+        otherwise `==` will be returned.
     """
-    if not type_strict:
-        return expression
-    expression += '='
-    return expression
+    if type_strict:
+        return '==='
+    return '=='
 
 
-def _get_expected_and_actual_strs(
-        expected: Any, actual: Any) -> Tuple[str, str]:
+def _get_expected_and_actual_expressions(
+        expected: Any, actual: Any) -> Tuple[Expression, Expression]:
     """
-    Get expected and actual value strings from specified values.
+    Get expected and actual value expressions from specified values.
 
     Parameters
     ----------
@@ -413,17 +436,16 @@ def _get_expected_and_actual_strs(
 
     Returns
     -------
-    expected_str : str
-        Expected value's string. If value is string, this will be
+    expected_exp : Expression
+        Expected value's expression. If value is string, this will be
         wrapped by double quotation.
-    actual_str : str
-        Actual value's string. If value is string, this will be
+    actual_exp : Expression
+        Actual value's expression. If value is string, this will be
         wrapped by double quotation.
     """
-    expected_str: str = value_util.get_value_str_for_expression(
-        value=expected)
-    actual_str: str = value_util.get_value_str_for_expression(value=actual)
-    return expected_str, actual_str
+    expected_exp: Expression = get_value_expression(value=expected)
+    actual_exp: Expression = get_value_expression(value=actual)
+    return expected_exp, actual_exp
 
 
 def _trace_info(interface_label: str, expected: Any, actual: Any) -> None:
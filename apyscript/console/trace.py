@@ -5,7 +5,11 @@ from typing import Any
 from typing import List
 
 from apyscript.expression import expression_file_util
-from apyscript.html import html_util
+from apyscript.expression.expression_ir import Expression
+from apyscript.expression.expression_ir import ExpressionStatement
+from apyscript.expression.expression_ir import Literal
+from apyscript.expression.expression_ir import Ref
+from apyscript.expression.expression_ir import make_method_call
 from apyscript.string import string_util
 from apyscript.type.variable_name_interface import VariableNameInterface
 
@@ -20,16 +24,15 @@ def trace(*args: Any) -> None:
     *args : list
         Any arguments to display to console.
     """
-    expression: str = 'console.log('
-    arg_strs: List[str] = []
+    arg_exps: List[Expression] = []
     for arg in args:
         if isinstance(arg, VariableNameInterface):
-            arg_strs.append(f'{arg.variable_name}')
+            arg_exps.append(Ref(name=arg.variable_name))
             continue
         arg = string_util.escape_str(string=str(arg))
-        arg_strs.append(f'"{arg}"')
-    expression += ', '.join(arg_strs)
-    expression += ');'
-    expression = html_util.wrap_expression_by_script_tag(
-        expression=expression)
-    expression_file_util.append_expression(expression=expression)
+        arg_exps.append(Literal(value=arg))
+    expression_file_util.append_statement(
+        statement=ExpressionStatement(
+            expression=make_method_call(
+                variable_name='console', method_name='log',
+                args=arg_exps)))
@@ -37,18 +37,19 @@ class BiginFillInterface:
         if isinstance(color, String):
             color.value = color_util.complement_hex_color(
                 hex_color_code=color.value)
+            color_: str = color.value
         else:
-            color = color_util.complement_hex_color(
+            color_ = color_util.complement_hex_color(
                 hex_color_code=color)
-        self._fill_color.value = color
+        self._fill_color = String(color_)
         number_validation.validate_num(num=alpha)
         if not isinstance(alpha, Number):
             alpha = cast.to_float_from_int(int_or_float=alpha)
         color_validation.validate_alpha_range(alpha=alpha)
         if isinstance(alpha, Number):
-            self._fill_alpha.value = alpha.value
+            self._fill_alpha = Number(alpha.value)
         else:
-            self._fill_alpha.value = alpha
+            self._fill_alpha = Number(alpha)
 
     @property
     def fill_color(self) -> String:
@@ -2,22 +2,31 @@
 """
 
 from typing import Any
+from typing import List
 from typing import Union
 
 from apyscript.display.display_object import DisplayObject
 from apyscript.expression import expression_file_util
 from apyscript.expression import expression_variables_util
-from apyscript.html import html_util
-from apyscript.type import Array
+from apyscript.expression.expression_ir import Assign
+from apyscript.expression.expression_ir import BinaryOp
+from apyscript.expression.expression_ir import ExpressionStatement
+from apyscript.expression.expression_ir import Index
+from apyscript.expression.expression_ir import Literal
+from apyscript.expression.expression_ir import Member
+from apyscript.expression.expression_ir import Ref
+from apyscript.expression.expression_ir import get_value_expression
+from apyscript.expression.expression_ir import make_method_call
 from apyscript.type import Boolean
 from apyscript.type import Int
-from apyscript.type import value_util
 from apyscript.validation import display_validation
 
 
 class ChildInterface:
 
-    _childs: Array
+    # Python-only children list (bookkeeping). This list appends no
+    # expression, since js side children are managed by svg.js.
+    _childs: List[DisplayObject]
     _variable_name: str
     _js_child_adjust_num: int = 0
     stage: Any
@@ -46,13 +55,11 @@ class ChildInterface:
             Child object to add.
         """
         parent_name: str = child.parent.variable_name  # type: ignore
-        child_name: str = child.variable_name
-        expression: str = (
-            f'{parent_name}.add({child_name});'
-        )
-        expression = html_util.wrap_expression_by_script_tag(
-            expression=expression)
-        expression_file_util.append_expression(expression=expression)
+        expression_file_util.append_statement(
+            statement=ExpressionStatement(
+                expression=make_method_call(
+                    variable_name=parent_name, method_name='add',
+                    args=[Ref(name=child.variable_name)])))
 
     def remove_child(self, child: DisplayObject) -> None:
         """
@@ -64,7 +71,7 @@ class ChildInterface:
             Child instance to remove.
         """
         self._append_expression_of_remove_child(child=child)
-        for child_ in self._childs.value:
+        for child_ in self._childs:
             if child_ != child:
                 continue
             self._childs.remove(child)
@@ -81,13 +88,11 @@ class ChildInterface:
             Child object to remove.
         """
         parent_name: str = child.parent.variable_name  # type: ignore
-        child_name: str = child.variable_name
-        expression: str = (
-            f'{parent_name}.removeElement({child_name});'
-        )
-        expression = html_util.wrap_expression_by_script_tag(
-            expression=expression)
-        expression_file_util.append_expression(expression=expression)
+        expression_file_util.append_statement(
+            statement=ExpressionStatement(
+                expression=make_method_call(
+                    variable_name=parent_name, method_name='removeElement',
+                    args=[Ref(name=child.variable_name)])))
 
     def contains(self, child: DisplayObject) -> Boolean:
         """
@@ -104,11 +109,7 @@ class ChildInterface:
             If this instance contains specified child, True will
             be set.
         """
-        index: Int = self._childs.index_of(value=child)
-        if index == -1:
-            result: Boolean = Boolean(False)
-        else:
-            result = Boolean(True)
+        result: Boolean = Boolean(child in self._childs)
         self._append_contains_expression(result=result, child=child)
         return result
 
@@ -124,12 +125,12 @@ class ChildInterface:
         child : DisplayObject
             Child instance to check.
         """
-        expression: str = (
-            f'{result.variable_name} = '
-            f'{self._variable_name}.has({child.variable_name});'
-        )
-        expression_file_util.wrap_by_script_tag_and_append_expression(
-            expression=expression)
+        expression_file_util.append_statement(
+            statement=Assign(
+                target=Ref(name=result.variable_name),
+                value=make_method_call(
+                    variable_name=self._variable_name, method_name='has',
+                    args=[Ref(name=child.variable_name)])))
 
     @property
     def num_children(self) -> Int:
@@ -141,7 +142,7 @@ class ChildInterface:
         num_children : int
             Current children number.
         """
-        num_children: Int = Int(value=self._childs.length)
+        num_children: Int = Int(value=len(self._childs))
         self._append_num_children_expression(num_children=num_children)
         return num_children
 
@@ -155,13 +156,16 @@ class ChildInterface:
         num_children : Int
             Current children number.
         """
-        expression: str = (
-            f'{num_children.variable_name} = '
-            f'{self._variable_name}.children().length'
-            f' - {self._js_child_adjust_num};'
-        )
-        expression_file_util.wrap_by_script_tag_and_append_expression(
-            expression=expression)
+        children_length: Member = Member(
+            target=make_method_call(
+                variable_name=self._variable_name, method_name='children'),
+            name='length')
+        expression_file_util.append_statement(
+            statement=Assign(
+                target=Ref(name=num_children.variable_name),
+                value=BinaryOp(
+                    left=children_length, operator='-',
+                    right=Literal(value=self._js_child_adjust_num))))
 
     def get_child_at(self, index: Union[int, Int]) -> DisplayObject:
         """
@@ -177,8 +181,8 @@ class ChildInterface:
         child : DisplayObject
             Target index child instance.
         """
-        if self.num_children > index:
-            child: DisplayObject = self._childs[index]
+        if len(self._childs) > int(index):
+            child: DisplayObject = self._childs[int(index)]
         else:
             variable_name: str = expression_variables_util.\
                 get_next_variable_name(type_name='display_object')
@@ -199,12 +203,14 @@ class ChildInterface:
         index : int or Int
             Child's index (start from 0).
         """
-        index_str: str = value_util.get_value_str_for_expression(value=index)
-        expression: str = (
-            f'{child.variable_name} = '
-            f'{self._variable_name}.children()'
-            f'[{index_str} + {self._js_child_adjust_num}];'
-        )
-        print(expression)
-        expression_file_util.wrap_by_script_tag_and_append_expression(
-            expression=expression)
+        adjusted_index: BinaryOp = BinaryOp(
+            left=get_value_expression(value=index), operator='+',
+            right=Literal(value=self._js_child_adjust_num))
+        expression_file_util.append_statement(
+            statement=Assign(
+                target=Ref(name=child.variable_name),
+                value=Index(
+                    target=make_method_call(
+                        variable_name=self._variable_name,
+                        method_name='children'),
+                    index=adjusted_index)))
@@ -6,7 +6,9 @@ from typing import Optional
 
 from apyscript.converter import cast
 from apyscript.expression import expression_file_util
-from apyscript.html import html_util
+from apyscript.expression.expression_ir import AttrSet
+from apyscript.expression.expression_ir import Ref
+from apyscript.expression.expression_ir import get_value_expression
 from apyscript.type import Number
 from apyscript.type import value_util
 from apyscript.type.number_value_interface import NumberValueInterface
@@ -52,15 +54,11 @@ class FillAlphaInterface(VariableNameInterface):
         """
         Append fill alpha updating expression.
         """
-        value_str: str = value_util.get_value_str_for_expression(
-            value=self._fill_alpha)
-        expression: str = (
-            f'{self.variable_name}.fill({{opacity: {value_str}}});'
-        )
-        expression = html_util.wrap_expression_by_script_tag(
-            expression=expression)
-        expression_file_util.append_expression(
-            expression=expression)
+        expression_file_util.append_statement(
+            statement=AttrSet(
+                target=Ref(name=self.variable_name),
+                attr_name='fill-opacity',
+                value=get_value_expression(value=self._fill_alpha)))
 
     def update_fill_alpha_and_skip_appending_exp(
             self, value: Any) -> None:
@@ -5,14 +5,26 @@ from typing import Union
 
 from apyscript.color import color_util
 from apyscript.expression import expression_file_util
-from apyscript.html import html_util
+from apyscript.expression.expression_ir import AttrSet
+from apyscript.expression.expression_ir import Literal
+from apyscript.expression.expression_ir import Ref
 from apyscript.type import String
 from apyscript.type.variable_name_interface import VariableNameInterface
 
 
 class FillColorInterface(VariableNameInterface):
 
-    _fill_color: String = String('')
+    _fill_color: String
+
+    def _initialize_fill_color_if_not_initialized(self) -> None:
+        """
+        Initialize fill_color attribute if it is not initialized yet.
+        Each instance has its own attribute, so the value is never
+        shared between instances.
+        """
+        if hasattr(self, '_fill_color'):
+            return
+        self._fill_color = String('')
 
     @property
     def fill_color(self) -> Union[str, String]:
@@ -23,8 +35,9 @@ class FillColorInterface(VariableNameInterface):
         -------
         fill_color : String
             Current fill color (hexadecimal string, e.g., '#00aaff').
-            If not be set, None will be returned.
+            If not be set, blank string will be returned.
         """
+        self._initialize_fill_color_if_not_initialized()
         return self._fill_color
 
     @fill_color.setter
@@ -44,13 +57,11 @@ class FillColorInterface(VariableNameInterface):
         """
         Append fill color updating expression.
         """
-        expression: str = (
-            f'{self.variable_name}.fill("{self.fill_color}");'
-        )
-        expression = html_util.wrap_expression_by_script_tag(
-            expression=expression)
-        expression_file_util.append_expression(
-            expression=expression)
+        expression_file_util.append_statement(
+            statement=AttrSet(
+                target=Ref(name=self.variable_name),
+                attr_name='fill',
+                value=Literal(value=str(self.fill_color))))
 
     def update_fill_color_and_skip_appending_exp(
             self, value: Union[str, String]) -> None:
@@ -68,4 +79,4 @@ class FillColorInterface(VariableNameInterface):
         else:
             value_ = color_util.complement_hex_color(
                 hex_color_code=value)
-        self._fill_color.value = value_
+        self._fill_color = String(value_)
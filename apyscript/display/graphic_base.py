@@ -13,6 +13,7 @@ from apyscript.validation import string_validation
 class GraphicBase(DisplayObject):
 
     _variable_name: str
+    _is_position_element_attr: bool = True
 
     def __init__(
             self, parent: Any, x: Int, y: Int, variable_name: str) -> None:
@@ -2,7 +2,10 @@
 """
 
 from typing import Any
+from typing import List
 from typing import Optional
+from typing import Sequence
+from typing import Union
 
 from apyscript.display.begin_fill_interface import BiginFillInterface
 from apyscript.display.child_interface import ChildInterface
@@ -10,9 +13,16 @@ from apyscript.display.graphics_clear_interface import GraphicsClearInterface
 from apyscript.display.line_style_interface import LineStyleInterface
 from apyscript.display.rectangle import Rectangle
 from apyscript.display.rectangle import append_draw_rect_expression
+from apyscript.display.rectangles import RECT_DATA_UNIT_LENGTH
+from apyscript.display.rectangles import Rectangles
+from apyscript.display.rectangles import append_draw_rects_expression
+from apyscript.display.rectangles import get_rects_data
 from apyscript.expression import expression_file_util
 from apyscript.expression import expression_variables_util
-from apyscript.html import html_util
+from apyscript.expression.expression_ir import ExpressionStatement
+from apyscript.expression.expression_ir import Ref
+from apyscript.expression.expression_ir import VarDecl
+from apyscript.expression.expression_ir import make_method_call
 from apyscript.type import Array
 from apyscript.type import Int
 from apyscript.type import Number
@@ -51,7 +61,7 @@ class Graphics(
         self._line_color = String('')
         self._line_alpha = Number(1.0)
         self._line_thickness = Int(1.0)
-        self._childs = Array([])
+        self._childs = []
         self._append_constructor_expression()
 
     def _append_constructor_expression(self) -> None:
@@ -60,13 +70,16 @@ class Graphics(
         """
         stage_name: str = self.parent_sprite.stage.variable_name
         parent_name: str = self.parent_sprite.variable_name
-        expression: str = (
-            f'var {self.variable_name} = {stage_name}.group();'
-            f'\n{parent_name}.add({self.variable_name});'
-        )
-        expression = html_util.wrap_expression_by_script_tag(
-            expression=expression)
-        expression_file_util.append_expression(expression=expression)
+        expression_file_util.append_statement(
+            statement=VarDecl(
+                name=self.variable_name,
+                value=make_method_call(
+                    variable_name=stage_name, method_name='group')))
+        expression_file_util.append_statement(
+            statement=ExpressionStatement(
+                expression=make_method_call(
+                    variable_name=parent_name, method_name='add',
+                    args=[Ref(name=self.variable_name)])))
 
     def draw_rect(
             self, x: int, y: int, width: int, height: int) -> Rectangle:
@@ -97,3 +110,44 @@ class Graphics(
         append_draw_rect_expression(rectangle=rectangle)
         self.add_child(child=rectangle)
         return rectangle
+
+    def draw_rects(
+            self,
+            xs: Union[Sequence[Any], Array],
+            ys: Union[Sequence[Any], Array],
+            widths: Union[Sequence[Any], Array],
+            heights: Union[Sequence[Any], Array]) -> Rectangles:
+        """
+        Draw multiple rectangles vector graphics at once. This is
+        faster and the html is smaller than the draw_rect calls when
+        drawing many rectangles (e.g., heat-map cells), since the
+        rectangles are drawn by a single js loop over one data payload.
+
+        Notes
+        -----
+        Current fill and line settings are applied to every rectangle.
+        No Rectangle instance is created for each rectangle, so these
+        rectangles are not counted in the Python side children.
+
+        Parameters
+        ----------
+        xs : sequence or Array
+            X positions to start drawing.
+        ys : sequence or Array
+            Y positions to start drawing.
+        widths : sequence or Array
+            Rectangles widths.
+        heights : sequence or Array
+            Rectangles heights.
+
+        Returns
+        -------
+        rectangles : Rectangles
+            Created rectangles handle.
+        """
+        data: List[Union[int, float]] = get_rects_data(
+            xs=xs, ys=ys, widths=widths, heights=heights)
+        rectangles: Rectangles = Rectangles(
+            parent=self, length=len(data) // RECT_DATA_UNIT_LENGTH)
+        append_draw_rects_expression(rectangles=rectangles, data=data)
+        return rectangles
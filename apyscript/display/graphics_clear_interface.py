@@ -1,8 +1,9 @@
 """Class implementation for graphics clear method related interface.
 """
 
+from typing import Any
+from typing import List
 
-from apyscript.type import Array
 from apyscript.type import Int
 from apyscript.type import Number
 from apyscript.type import String
@@ -15,15 +16,15 @@ class GraphicsClearInterface:
     _line_color: String
     _line_thickness: Int
     _line_alpha: Number
-    _childs: Array
+    _childs: List[Any]
 
     def clear(self) -> None:
         """
         Clear all graphics and reset fill and line settings.
         """
-        self._fill_color.value = ''
+        self._fill_color = String('')
         self._fill_alpha = Number(1.0)
-        self._line_color.value = ''
+        self._line_color = String('')
         self._line_thickness = Int(1)
         self._line_alpha = Number(1.0)
         while self._childs:
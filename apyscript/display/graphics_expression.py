@@ -1,192 +1,124 @@
 """Graphics class related expression implementations.
+
+Each function sets a graphic's attribute to the specified
+attributes object literal (e.g., rectangle's `.attr({...})`
+argument).
 """
 
 from apyscript.display.graphic_base import GraphicBase
 from apyscript.display.graphics import Graphics
-from apyscript.string import indent_util
+from apyscript.expression.expression_ir import Literal
+from apyscript.expression.expression_ir import ObjectLiteral
 
 
-def append_fill_expression(
-        graphics: Graphics, expression: str, indent_num: int) -> str:
+def append_fill_attr(graphics: Graphics, attrs: ObjectLiteral) -> None:
     """
-    Append fill expression to specified expression's string.
+    Append fill attribute to specified attributes object.
 
     Parameters
     ----------
     graphics : Graphics
         Target Graphics instance.
-    expression : str
-        Expression string to be appended fill expression.
-    indent_num : int
-        Indentation number.
-
-    Returns
-    -------
-    expression : str
-        After appended expression string.
+    attrs : ObjectLiteral
+        Attributes object to be appended fill attribute. If fill
+        color is not set, nothing will be appended.
     """
     if graphics.fill_color == '':
-        return expression
-    spaces: str = indent_util.make_spaces_for_html(indent_num=indent_num)
-    expression += (
-        f'\n{spaces}fill: "{graphics.fill_color}",'
-    )
-    return expression
+        return
+    attrs.set_item(
+        key='fill', value=Literal(value=str(graphics.fill_color)))
 
 
-def append_fill_opacity_expression(
-        graphics: Graphics, expression: str, indent_num: int) -> str:
+def append_fill_opacity_attr(
+        graphics: Graphics, attrs: ObjectLiteral) -> None:
     """
-    Append fill opacity expression to specified expression's string.
+    Append fill opacity attribute to specified attributes object.
 
     Parameters
     ----------
     graphics : Graphics
         Target Graphics instance.
-    expression : str
-        Expression string to be appended fill opacity expression.
-    indent_num : int
-        Indentation number.
-
-    Returns
-    -------
-    expression : str
-        After appended expression string.
+    attrs : ObjectLiteral
+        Attributes object to be appended fill opacity attribute.
     """
-    spaces: str = indent_util.make_spaces_for_html(indent_num=indent_num)
-    expression += (
-        f'\n{spaces}"fill-opacity": {graphics.fill_alpha},'
-    )
-    return expression
+    attrs.set_item(
+        key='fill-opacity', value=Literal(value=graphics.fill_alpha.value))
 
 
-def append_x_expression(
-        graphic: GraphicBase, expression: str, indent_num: int) -> str:
+def append_x_attr(graphic: GraphicBase, attrs: ObjectLiteral) -> None:
     """
-    Append x position expression to specified expression's string.
+    Append x position attribute to specified attributes object.
 
     Parameters
     ----------
     graphic : GraphicBase
         Target graphic instance, for example, Rectangle.
-    expression : str
-        Expression string to be appended x position expression.
-    indent_num : int
-        Indentation number.
-
-    Returns
-    -------
-    expression : str
-        After appended expression string.
+    attrs : ObjectLiteral
+        Attributes object to be appended x position attribute.
     """
-    spaces: str = indent_util.make_spaces_for_html(indent_num=indent_num)
-    expression += (
-        f'\n{spaces}x: {graphic.x},'
-    )
-    return expression
+    attrs.set_item(key='x', value=Literal(value=graphic.x.value))
 
 
-def append_y_expression(
-        graphic: GraphicBase, expression: str, indent_num: int) -> str:
+def append_y_attr(graphic: GraphicBase, attrs: ObjectLiteral) -> None:
     """
-    Append y position expression to specified expression's string.
+    Append y position attribute to specified attributes object.
 
     Parameters
     ----------
     graphic : GraphicBase
         Target graphic instance, for example, Rectangle.
-    expression : str
-        Expression string to be appended y position expression.
-    indent_num : int
-        Indentation number.
-
-    Returns
-    -------
-    expression : str
-        After appended expression string.
+    attrs : ObjectLiteral
+        Attributes object to be appended y position attribute.
     """
-    spaces: str = indent_util.make_spaces_for_html(indent_num=indent_num)
-    expression += (
-        f'\n{spaces}y: {graphic.y},'
-    )
-    return expression
+    attrs.set_item(key='y', value=Literal(value=graphic.y.value))
 
 
-def append_stroke_expression(
-        graphics: Graphics, expression: str, indent_num: int) -> str:
+def append_stroke_attr(graphics: Graphics, attrs: ObjectLiteral) -> None:
     """
-    Append stroke expression to specified expression's string.
+    Append stroke attribute to specified attributes object.
 
     Parameters
     ----------
     graphics : Graphics
         Target Graphics instance.
-    expression : str
-        Expression string to be appended stroke expression.
-    indent_num : int
-        Indentation number.
-
-    Returns
-    -------
-    expression : str
-        After appended expression string.
+    attrs : ObjectLiteral
+        Attributes object to be appended stroke attribute. If line
+        color is not set, nothing will be appended.
     """
     if graphics.line_color == '':
-        return expression
-    spaces: str = indent_util.make_spaces_for_html(indent_num=indent_num)
-    expression += (
-        f'\n{spaces}stroke: "{graphics.line_color}",'
-    )
-    return expression
+        return
+    attrs.set_item(
+        key='stroke', value=Literal(value=str(graphics.line_color)))
 
 
-def append_stroke_width_expression(
-        graphics: Graphics, expression: str, indent_num: int) -> str:
+def append_stroke_width_attr(
+        graphics: Graphics, attrs: ObjectLiteral) -> None:
     """
-    Append stroke width expression to specified expression's string.
+    Append stroke width attribute to specified attributes object.
 
     Parameters
     ----------
     graphics : Graphics
         Target Graphics instance.
-    expression : str
-        Expression string to be appended stroke width expression.
-    indent_num : int
-        Indentation number.
-
-    Returns
-    -------
-    expression : str
-        After appended expression string.
+    attrs : ObjectLiteral
+        Attributes object to be appended stroke width attribute.
     """
-    spaces: str = indent_util.make_spaces_for_html(indent_num=indent_num)
-    expression += (
-        f'\n{spaces}"stroke-width": {graphics.line_thickness},'
-    )
-    return expression
+    attrs.set_item(
+        key='stroke-width',
+        value=Literal(value=graphics.line_thickness.value))
 
 
-def append_stroke_opacity_expression(
-        graphics: Graphics, expression: str, indent_num: int) -> str:
+def append_stroke_opacity_attr(
+        graphics: Graphics, attrs: ObjectLiteral) -> None:
     """
-    Append stroke opacity expression to specified expression's string.
+    Append stroke opacity attribute to specified attributes object.
 
     Parameters
     ----------
     graphics : Graphics
         Target Graphics instance.
-    expression : str
-        Expression string to be appended stroke opacity expression.
-    indent_num : int
-        Indentation number.
-
-    Returns
-    -------
-    expression : str
-        After appended expression string.
+    attrs : ObjectLiteral
+        Attributes object to be appended stroke opacity attribute.
     """
-    spaces: str = indent_util.make_spaces_for_html(indent_num=indent_num)
-    expression += (
-        f'\n{spaces}"stroke-opacity": {graphics.line_alpha},'
-    )
-    return expression
+    attrs.set_item(
+        key='stroke-opacity', value=Literal(value=graphics.line_alpha.value))
@@ -3,7 +3,9 @@
 
 from apyscript.converter import cast
 from apyscript.expression import expression_file_util
-from apyscript.html import html_util
+from apyscript.expression.expression_ir import AttrSet
+from apyscript.expression.expression_ir import Ref
+from apyscript.expression.expression_ir import get_value_expression
 from apyscript.type import Int
 from apyscript.type import value_util
 from apyscript.type.variable_name_interface import VariableNameInterface
@@ -43,13 +45,11 @@ class HeightInterface(VariableNameInterface):
         """
         Append height updating expression.
         """
-        expression: str = (
-            f'{self.variable_name}.height({self.height});'
-        )
-        expression = html_util.wrap_expression_by_script_tag(
-            expression=expression)
-        expression_file_util.append_expression(
-            expression=expression)
+        expression_file_util.append_statement(
+            statement=AttrSet(
+                target=Ref(name=self.variable_name),
+                attr_name='height',
+                value=get_value_expression(value=self._height)))
 
     def update_height_and_skip_appending_exp(self, value: Int) -> None:
         """
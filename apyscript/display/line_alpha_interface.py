@@ -3,7 +3,9 @@
 
 
 from apyscript.expression import expression_file_util
-from apyscript.html import html_util
+from apyscript.expression.expression_ir import AttrSet
+from apyscript.expression.expression_ir import Ref
+from apyscript.expression.expression_ir import get_value_expression
 from apyscript.type import Number
 from apyscript.type import value_util
 from apyscript.type.variable_name_interface import VariableNameInterface
@@ -44,13 +46,11 @@ class LineAlphaInterface(VariableNameInterface):
         """
         Append line alpha updating expression.
         """
-        expression: str = (
-            f'{self.variable_name}.stroke({{opacity: {self.line_alpha}}});'
-        )
-        expression = html_util.wrap_expression_by_script_tag(
-            expression=expression)
-        expression_file_util.append_expression(
-            expression=expression)
+        expression_file_util.append_statement(
+            statement=AttrSet(
+                target=Ref(name=self.variable_name),
+                attr_name='stroke-opacity',
+                value=get_value_expression(value=self._line_alpha)))
 
     def update_line_alpha_and_skip_appending_exp(
             self, value: Number) -> None:
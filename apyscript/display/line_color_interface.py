@@ -5,7 +5,9 @@ from typing import Union
 
 from apyscript.color import color_util
 from apyscript.expression import expression_file_util
-from apyscript.html import html_util
+from apyscript.expression.expression_ir import AttrSet
+from apyscript.expression.expression_ir import Literal
+from apyscript.expression.expression_ir import Ref
 from apyscript.type import String
 from apyscript.type.variable_name_interface import VariableNameInterface
 
@@ -14,6 +16,14 @@ class LineColorInterface(VariableNameInterface):
 
     _line_color: String
 
+    def _initialize_line_color_if_not_initialized(self) -> None:
+        """
+        Initialize line_color attribute if it is not initialized yet.
+        """
+        if hasattr(self, '_line_color'):
+            return
+        self._line_color = String('')
+
     @property
     def line_color(self) -> Union[str, String]:
         """
@@ -25,6 +35,7 @@ class LineColorInterface(VariableNameInterface):
             Current line color (hexadecimal string, e.g., '#00aaff').
             If not be set, blank string will be returned.
         """
+        self._initialize_line_color_if_not_initialized()
         return self._line_color
 
     @line_color.setter
@@ -44,13 +55,11 @@ class LineColorInterface(VariableNameInterface):
         """
         Append line color updating expression.
         """
-        expression: str = (
-            f'{self.variable_name}.stroke("{self.line_color}");'
-        )
-        expression = html_util.wrap_expression_by_script_tag(
-            expression=expression)
-        expression_file_util.append_expression(
-            expression=expression)
+        expression_file_util.append_statement(
+            statement=AttrSet(
+                target=Ref(name=self.variable_name),
+                attr_name='stroke',
+                value=Literal(value=str(self.line_color))))
 
     def update_line_color_and_skip_appending_exp(
             self, value: Union[str, String]) -> None:
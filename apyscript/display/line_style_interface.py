@@ -43,10 +43,11 @@ class LineStyleInterface:
         if isinstance(color, String):
             color.value = color_util.complement_hex_color(
                 hex_color_code=color.value)
+            color_: str = color.value
         else:
-            color = color_util.complement_hex_color(
+            color_ = color_util.complement_hex_color(
                 hex_color_code=color)
-        self._line_color.value = color
+        self._line_color = String(color_)
         number_validation.validate_integer(integer=thickness)
         number_validation.validate_num_is_gt_zero(num=thickness)
         self._line_thickness = Int(thickness)
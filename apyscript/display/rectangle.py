@@ -15,7 +15,12 @@ from apyscript.display.stage import get_stage_variable_name
 from apyscript.display.width_interface import WidthInterface
 from apyscript.expression import expression_file_util
 from apyscript.expression import expression_variables_util
-from apyscript.html import html_const
+from apyscript.expression.expression_ir import Call
+from apyscript.expression.expression_ir import Literal
+from apyscript.expression.expression_ir import Member
+from apyscript.expression.expression_ir import ObjectLiteral
+from apyscript.expression.expression_ir import VarDecl
+from apyscript.expression.expression_ir import make_method_call
 from apyscript.type import Int
 from apyscript.type import Number
 from apyscript.type import String
@@ -96,23 +101,23 @@ def append_draw_rect_expression(rectangle: Rectangle) -> None:
     rectangle : Rectanble
         Created rectangle instance.
     """
-    variable_name: str = rectangle.variable_name
-    stage_variable_name: str = get_stage_variable_name()
-    expression: str = (
-        f'{html_const.SCRIPT_START_TAG}'
-        f'\nvar {variable_name} = {stage_variable_name}'
-        f'\n  .rect({rectangle.width}, {rectangle.height})'
-    )
-    attrs_str: str = _make_rect_attrs_expression(rectangle=rectangle)
-    expression += f'{attrs_str};'
-    expression += f'\n{html_const.SCRIPT_END_TAG}'
-    expression_file_util.append_expression(
-        expression=expression)
+    rect_exp: Call = make_method_call(
+        variable_name=get_stage_variable_name(), method_name='rect',
+        args=[
+            Literal(value=rectangle.width.value),
+            Literal(value=rectangle.height.value),
+        ])
+    attrs: ObjectLiteral = _make_rect_attrs_expression(rectangle=rectangle)
+    expression_file_util.append_statement(
+        statement=VarDecl(
+            name=rectangle.variable_name,
+            value=Call(
+                callee=Member(target=rect_exp, name='attr'), args=[attrs])))
 
 
-def _make_rect_attrs_expression(rectangle: Rectangle) -> str:
+def _make_rect_attrs_expression(rectangle: Rectangle) -> ObjectLiteral:
     """
-    Make rectangle attributes expression string.
+    Make rectangle attributes expression (object literal).
 
     Parameters
     ----------
@@ -121,38 +126,22 @@ def _make_rect_attrs_expression(rectangle: Rectangle) -> str:
 
     Returns
     -------
-    rect_attrs_expression : str
-        Rectangle attributes expression string.
+    rect_attrs : ObjectLiteral
+        Rectangle attributes object literal.
     """
     from apyscript.display import graphics_expression
     from apyscript.display.graphics import Graphics
     graphics: Graphics = rectangle.parent_graphics
-    INDENT_NUM: int = 2
-    rect_attrs_expression: str = '\n  .attr({'
-    rect_attrs_expression = graphics_expression.append_fill_expression(
-        graphics=graphics, expression=rect_attrs_expression,
-        indent_num=INDENT_NUM)
-    rect_attrs_expression = \
-        graphics_expression.append_fill_opacity_expression(
-            graphics=graphics, expression=rect_attrs_expression,
-            indent_num=INDENT_NUM)
-    rect_attrs_expression = graphics_expression.append_stroke_expression(
-        graphics=graphics, expression=rect_attrs_expression,
-        indent_num=INDENT_NUM)
-    rect_attrs_expression = \
-        graphics_expression.append_stroke_width_expression(
-            graphics=graphics, expression=rect_attrs_expression,
-            indent_num=INDENT_NUM)
-    rect_attrs_expression = \
-        graphics_expression.append_stroke_opacity_expression(
-            graphics=graphics, expression=rect_attrs_expression,
-            indent_num=INDENT_NUM)
-    rect_attrs_expression = graphics_expression.append_x_expression(
-        graphic=rectangle, expression=rect_attrs_expression,
-        indent_num=INDENT_NUM)
-    rect_attrs_expression = graphics_expression.append_y_expression(
-        graphic=rectangle, expression=rect_attrs_expression,
-        indent_num=INDENT_NUM)
-
-    rect_attrs_expression += '\n  })'
-    return rect_attrs_expression
+    rect_attrs: ObjectLiteral = ObjectLiteral()
+    graphics_expression.append_fill_attr(graphics=graphics, attrs=rect_attrs)
+    graphics_expression.append_fill_opacity_attr(
+        graphics=graphics, attrs=rect_attrs)
+    graphics_expression.append_stroke_attr(
+        graphics=graphics, attrs=rect_attrs)
+    graphics_expression.append_stroke_width_attr(
+        graphics=graphics, attrs=rect_attrs)
+    graphics_expression.append_stroke_opacity_attr(
+        graphics=graphics, attrs=rect_attrs)
+    graphics_expression.append_x_attr(graphic=rectangle, attrs=rect_attrs)
+    graphics_expression.append_y_attr(graphic=rectangle, attrs=rect_attrs)
+    return rect_attrs
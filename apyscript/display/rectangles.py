@@ -0,0 +1,243 @@
+"""Implementations of Rectangles class (batch of rectangles) and other
+interfaces.
+
+Mainly following interfaces are defined:
+
+- Rectangles : The lightweight handle of the rectangles drawn by
+    one batch (e.g., heat-map cells).
+- get_rects_data : Get a flat data payload of the rectangles.
+- append_draw_rects_expression : Append Graphics's draw_rects
+    interface expression to the file.
+"""
+
+from typing import Any
+from typing import List
+from typing import Sequence
+from typing import Union
+
+from apyscript.display.stage import get_stage_variable_name
+from apyscript.expression import expression_file_util
+from apyscript.expression import expression_variables_util
+from apyscript.expression.expression_ir import ArrayLiteral
+from apyscript.expression.expression_ir import BinaryOp
+from apyscript.expression.expression_ir import Index
+from apyscript.expression.expression_ir import Literal
+from apyscript.expression.expression_ir import ObjectLiteral
+from apyscript.expression.expression_ir import Raw
+from apyscript.expression.expression_ir import Ref
+from apyscript.expression.expression_ir import VarDecl
+from apyscript.type import Array
+from apyscript.type import value_util
+from apyscript.type.variable_name_interface import VariableNameInterface
+from apyscript.validation import number_validation
+
+# Number of the values of each rectangle in the data payload
+# (x, y, width, and height).
+RECT_DATA_UNIT_LENGTH: int = 4
+
+_DATA_NAME: str = 'data'
+_INDEX_NAME: str = 'i'
+
+
+class Rectangles(VariableNameInterface):
+
+    parent_graphics: Any
+    _length: int
+
+    def __init__(self, parent: Any, length: int) -> None:
+        """
+        The lightweight handle of the rectangles drawn by one batch.
+        Each rectangle is held only in the js side array (no Python
+        instance is created for each rectangle).
+
+        Parameters
+        ----------
+        parent : Graphics
+            Graphics instance that drew the rectangles.
+        length : int
+            Number of the rectangles.
+        """
+        self.parent_graphics = parent
+        self._length = length
+        self.variable_name = expression_variables_util.get_next_variable_name(
+            type_name='rectangles')
+
+    @property
+    def length(self) -> int:
+        """
+        Get a number of the rectangles.
+
+        Returns
+        -------
+        length : int
+            Number of the rectangles.
+        """
+        return self._length
+
+
+def get_rects_data(
+        xs: Union[Sequence[Any], Array],
+        ys: Union[Sequence[Any], Array],
+        widths: Union[Sequence[Any], Array],
+        heights: Union[Sequence[Any], Array]) -> List[Union[int, float]]:
+    """
+    Get a flat data payload of the rectangles, e.g.,
+    `[x1, y1, width1, height1, x2, y2, width2, height2, ...]`.
+
+    Parameters
+    ----------
+    xs : sequence or Array
+        X positions of the rectangles.
+    ys : sequence or Array
+        Y positions of the rectangles.
+    widths : sequence or Array
+        Widths of the rectangles.
+    heights : sequence or Array
+        Heights of the rectangles.
+
+    Returns
+    -------
+    data : list of int or float
+        Flat data payload of the rectangles.
+
+    Raises
+    ------
+    ValueError
+        If the sequences' lengths are not the same, or any width or
+        height is less than zero.
+    """
+    xs_: List[Union[int, float]] = _get_builtin_nums(values=xs)
+    ys_: List[Union[int, float]] = _get_builtin_nums(values=ys)
+    widths_: List[Union[int, float]] = _get_builtin_nums(values=widths)
+    heights_: List[Union[int, float]] = _get_builtin_nums(values=heights)
+    if not len(xs_) == len(ys_) == len(widths_) == len(heights_):
+        raise ValueError(
+            'Lengths of xs, ys, widths, and heights must be the same: '
+            f'{len(xs_)}, {len(ys_)}, {len(widths_)}, {len(heights_)}')
+    data: List[Union[int, float]] = []
+    for x, y, width, height in zip(xs_, ys_, widths_, heights_):
+        if width < 0 or height < 0:
+            raise ValueError(
+                'Width and height must be greater than or equal to zero: '
+                f'{width}, {height}')
+        data.extend((x, y, width, height))
+    return data
+
+
+def _get_builtin_nums(
+        values: Union[Sequence[Any], Array]) -> List[Union[int, float]]:
+    """
+    Get a list of the (Python's) builtin numbers from specified values.
+
+    Parameters
+    ----------
+    values : sequence or Array
+        Target values. Int and Number values are also acceptable for
+        each value.
+
+    Returns
+    -------
+    nums : list of int or float
+        Builtin numbers list.
+    """
+    from apyscript.type.number_value_interface import NumberValueInterface
+    if isinstance(values, Array):
+        values = values.value
+    nums: List[Union[int, float]] = []
+    for value in values:
+        number_validation.validate_num(num=value)
+        if isinstance(value, NumberValueInterface):
+            value = value.value
+        nums.append(value)
+    return nums
+
+
+def append_draw_rects_expression(
+        rectangles: Rectangles, data: List[Union[int, float]]) -> None:
+    """
+    Append Graphics's draw_rects interface expression to the file.
+    Rectangles are drawn by a single js loop over the data payload.
+
+    Parameters
+    ----------
+    rectangles : Rectangles
+        Created rectangles handle.
+    data : list of int or float
+        Flat data payload of the rectangles.
+    """
+    expression_file_util.append_statement(
+        statement=VarDecl(
+            name=rectangles.variable_name, value=ArrayLiteral(elements=[])))
+    attrs: ObjectLiteral = _make_rects_attrs_expression(rectangles=rectangles)
+    graphics_name: str = rectangles.parent_graphics.variable_name
+    data_str: str = value_util.get_value_str_for_expression(value=data)
+    expression: str = (
+        f'(function({_DATA_NAME}) {{'
+        f'\n  for (var {_INDEX_NAME} = 0; {_INDEX_NAME} < {_DATA_NAME}.length;'
+        f' {_INDEX_NAME} += {RECT_DATA_UNIT_LENGTH}) {{'
+        f'\n    var rectangle = {get_stage_variable_name()}.rect('
+        f'{_get_data_item_expression(offset=2).to_js()}, '
+        f'{_get_data_item_expression(offset=3).to_js()})'
+        f'.attr({attrs.to_js()});'
+        f'\n    {graphics_name}.add(rectangle);'
+        f'\n    {rectangles.variable_name}.push(rectangle);'
+        '\n  }'
+        f'\n}})({data_str});'
+    )
+    expression_file_util.append_statement(statement=Raw(js=expression))
+
+
+def _make_rects_attrs_expression(rectangles: Rectangles) -> ObjectLiteral:
+    """
+    Make rectangles attributes expression (object literal). Each
+    rectangle's position refers the data payload.
+
+    Parameters
+    ----------
+    rectangles : Rectangles
+        Target rectangles handle.
+
+    Returns
+    -------
+    rects_attrs : ObjectLiteral
+        Rectangles attributes object literal.
+    """
+    from apyscript.display import graphics_expression
+    graphics: Any = rectangles.parent_graphics
+    rects_attrs: ObjectLiteral = ObjectLiteral()
+    graphics_expression.append_fill_attr(graphics=graphics, attrs=rects_attrs)
+    graphics_expression.append_fill_opacity_attr(
+        graphics=graphics, attrs=rects_attrs)
+    graphics_expression.append_stroke_attr(
+        graphics=graphics, attrs=rects_attrs)
+    graphics_expression.append_stroke_width_attr(
+        graphics=graphics, attrs=rects_attrs)
+    graphics_expression.append_stroke_opacity_attr(
+        graphics=graphics, attrs=rects_attrs)
+    rects_attrs.set_item(key='x', value=_get_data_item_expression(offset=0))
+    rects_attrs.set_item(key='y', value=_get_data_item_expression(offset=1))
+    return rects_attrs
+
+
+def _get_data_item_expression(offset: int) -> Index:
+    """
+    Get a current rectangle's data item expression in the js loop,
+    e.g., `data[i + 2]`.
+
+    Parameters
+    ----------
+    offset : int
+        Offset of the item (0: x, 1: y, 2: width, and 3: height).
+
+    Returns
+    -------
+    expression : Index
+        Data item expression.
+    """
+    if offset == 0:
+        return Index(target=Ref(name=_DATA_NAME), index=Ref(name=_INDEX_NAME))
+    return Index(
+        target=Ref(name=_DATA_NAME),
+        index=BinaryOp(
+            left=Ref(name=_INDEX_NAME), operator='+',
+            right=Literal(value=offset)))
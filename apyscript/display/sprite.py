@@ -10,8 +10,8 @@ from apyscript.display.stage import Stage
 from apyscript.display.stage import get_stage_variable_name
 from apyscript.expression import expression_file_util
 from apyscript.expression import expression_variables_util
-from apyscript.html import html_const
-from apyscript.type import Array
+from apyscript.expression.expression_ir import VarDecl
+from apyscript.expression.expression_ir import make_method_call
 from apyscript.type import type_util
 
 
@@ -40,7 +40,7 @@ class Sprite(DisplayObject, ChildInterface):
         if variable_name is None:
             variable_name = expression_variables_util.\
                 get_next_variable_name(type_name='sprite')
-        self._childs = Array([])
+        self._childs = []
         super(Sprite, self).__init__(
             stage=stage, variable_name=variable_name)
         self._append_constructor_expression()
@@ -64,11 +64,10 @@ class Sprite(DisplayObject, ChildInterface):
         if not is_same_class_instance:
             return False
         stage_variable_name: str = get_stage_variable_name()
-        expression: str = (
-            f'{html_const.SCRIPT_START_TAG}'
-            f'\nvar {self.variable_name} = {stage_variable_name}.group();'
-            f'\n{html_const.SCRIPT_END_TAG}'
-        )
-        expression_file_util.append_expression(
-            expression=expression)
+        expression_file_util.append_statement(
+            statement=VarDecl(
+                name=self.variable_name,
+                value=make_method_call(
+                    variable_name=stage_variable_name,
+                    method_name='group')))
         return True
@@ -1,4 +1,13 @@
 """Stage (canvas) implementation.
+
+Mainly following interfaces are defined:
+
+- Stage : Stage (canvas) class.
+- StageRegistry : The class to hold the current (active) stage
+    in the process memory.
+- get_stage_registry : Get a current stage registry.
+- get_stage_element_id : Get current stage's element id.
+- get_stage_variable_name : Get current stage's global variable name.
 """
 
 import os
@@ -11,17 +20,18 @@ from apyscript.color import color_util
 from apyscript.display.child_interface import ChildInterface
 from apyscript.display.height_interface import HeightInterface
 from apyscript.display.width_interface import WidthInterface
+from apyscript.expression import build_session
 from apyscript.expression import expression_file_util
 from apyscript.file import file_util
 from apyscript.html import html_const
 from apyscript.html import html_util
-from apyscript.type import Array
 from apyscript.type import Int
 from apyscript.type.variable_name_interface import VariableNameInterface
 from apyscript.validation import string_validation
 
+_STAGE_ELEM_ID_FILE_NAME: str = 'stage_elem_id.txt'
 _STAGE_ELEM_ID_FILE_PATH: str = os.path.join(
-    expression_file_util.EXPRESSION_ROOT_DIR, 'stage_elem_id.txt',
+    expression_file_util.EXPRESSION_ROOT_DIR, _STAGE_ELEM_ID_FILE_NAME,
 )
 
 
@@ -65,6 +75,8 @@ class Stage(
         string_validation.validate_not_empty_string(
             string=self._stage_elem_id)
         self._save_stage_elem_id_to_expression_file()
+        get_stage_registry().register(
+            stage=self, stage_elem_id=self._stage_elem_id)
         self._stage_elem_id = html_util.remove_first_selector_symbol_char(
             str_val=self._stage_elem_id)
         self.variable_name = get_stage_variable_name()
@@ -77,15 +89,19 @@ class Stage(
         string_validation.validate_not_empty_string(string=add_to)
         self._add_to = add_to
         self._append_constructor_expression()
-        self._childs = Array([])
+        self._childs = []
 
     def _save_stage_elem_id_to_expression_file(self) -> None:
         """
         Save stage element id to expression directory's file.
+        If current build session not saves any file, this will
+        be skipped.
         """
+        file_path: Optional[str] = _get_stage_elem_id_file_path()
+        if file_path is None:
+            return
         file_util.save_plain_txt(
-            txt=self._stage_elem_id,
-            file_path=_STAGE_ELEM_ID_FILE_PATH)
+            txt=self._stage_elem_id, file_path=file_path)
 
     def _create_stage_elem_id_if_none(
             self, stage_elem_id: Optional[str]) -> str:
@@ -171,20 +187,137 @@ class Stage(
         return self._stage_elem_id
 
 
+class StageRegistry:
+
+    _stage: Optional[Stage]
+    _stage_elem_id: Optional[str]
+    _stage_variable_name: Optional[str]
+
+    def __init__(self) -> None:
+        """
+        The class to hold the current (active) stage, it's element id,
+        and it's variable name in the process memory.
+        """
+        self.clear()
+
+    def register(self, stage: Stage, stage_elem_id: str) -> None:
+        """
+        Register a stage as the current stage. Previously registered
+        stage's values will be invalidated.
+
+        Parameters
+        ----------
+        stage : Stage
+            Stage instance to register.
+        stage_elem_id : str
+            Stage's element id (same value as saved to file).
+        """
+        self._stage = stage
+        self._stage_elem_id = stage_elem_id
+        self._stage_variable_name = stage_elem_id.replace('-', '_')
+
+    def clear(self) -> None:
+        """
+        Clear the registered stage's values.
+        """
+        self._stage = None
+        self._stage_elem_id = None
+        self._stage_variable_name = None
+
+    @property
+    def stage(self) -> Optional[Stage]:
+        """
+        Get the registered stage.
+
+        Returns
+        -------
+        stage : Stage or None
+            Registered stage. If stage is not registered yet,
+            None will be returned.
+        """
+        return self._stage
+
+    @property
+    def stage_elem_id(self) -> Optional[str]:
+        """
+        Get the registered stage's element id.
+
+        Returns
+        -------
+        stage_elem_id : str or None
+            Registered stage's element id. If stage is not registered
+            yet, None will be returned.
+        """
+        return self._stage_elem_id
+
+    @property
+    def stage_variable_name(self) -> Optional[str]:
+        """
+        Get the registered stage's global variable name.
+
+        Returns
+        -------
+        stage_variable_name : str or None
+            Registered stage's global variable name. If stage is not
+            registered yet, None will be returned.
+        """
+        return self._stage_variable_name
+
+
+def get_stage_registry() -> StageRegistry:
+    """
+    Get a current stage registry.
+
+    Returns
+    -------
+    stage_registry : StageRegistry
+        Current build session's stage registry.
+    """
+    stage_registry: StageRegistry = \
+        build_session.get_current_session().stage_registry
+    return stage_registry
+
+
+def _get_stage_elem_id_file_path() -> Optional[str]:
+    """
+    Get current build session's stage element id file path.
+
+    Returns
+    -------
+    file_path : str or None
+        Stage element id file path (_STAGE_ELEM_ID_FILE_PATH in the
+        default session). If current build session not saves any
+        file, None will be returned.
+    """
+    expression_root_dir: Optional[str] = \
+        expression_file_util.get_expression_root_dir()
+    if expression_root_dir is None:
+        return None
+    return os.path.join(expression_root_dir, _STAGE_ELEM_ID_FILE_NAME)
+
+
 def get_stage_element_id() -> str:
     """
     Get current stage's element id.
 
+    Notes
+    -----
+    Registered stage's value will be returned. Only if there is no
+    registered stage, stage element id file will be read.
+
     Returns
     -------
     stage_elem_id : str
         Current stage's element id. If stage is not instantiated yet,
         blank string will be set.
     """
-    if not os.path.isfile(_STAGE_ELEM_ID_FILE_PATH):
+    stage_registry: StageRegistry = get_stage_registry()
+    if stage_registry.stage_elem_id is not None:
+        return stage_registry.stage_elem_id
+    file_path: Optional[str] = _get_stage_elem_id_file_path()
+    if file_path is None or not os.path.isfile(file_path):
         return ''
-    stage_elem_id: str = file_util.read_txt(
-        file_path=_STAGE_ELEM_ID_FILE_PATH)
+    stage_elem_id: str = file_util.read_txt(file_path=file_path)
     return stage_elem_id
 
 
@@ -198,6 +331,9 @@ def get_stage_variable_name() -> str:
         Current stage's js global variable name. If stage is not
         instantiated yet, blank string will be set.
     """
+    stage_registry: StageRegistry = get_stage_registry()
+    if stage_registry.stage_variable_name is not None:
+        return stage_registry.stage_variable_name
     stage_elem_id: str = get_stage_element_id()
     stage_variable_name: str = stage_elem_id.replace('-', '_')
     return stage_variable_name
@@ -2,6 +2,9 @@
 """
 
 from apyscript.expression import expression_file_util
+from apyscript.expression.expression_ir import AttrSet
+from apyscript.expression.expression_ir import Ref
+from apyscript.expression.expression_ir import get_value_expression
 from apyscript.type import Int
 from apyscript.type import value_util
 from apyscript.type.number_value_interface import NumberValueInterface
@@ -13,6 +16,11 @@ class YInterface(VariableNameInterface):
 
     _y: Int
 
+    # If True, position is the svg element's own attribute (e.g.,
+    # rectangle). Container (group) element's position is updated by
+    # the transform.
+    _is_position_element_attr: bool = False
+
     @property
     def y(self) -> Int:
         """
@@ -45,10 +53,9 @@ class YInterface(VariableNameInterface):
         """
         Append y position updating expression.
         """
-        value_str: str = value_util.get_value_str_for_expression(
-            value=self._y)
-        expression: str = (
-            f'{self.variable_name}.y({value_str});'
-        )
-        expression_file_util.wrap_by_script_tag_and_append_expression(
-            expression=expression)
+        expression_file_util.append_statement(
+            statement=AttrSet(
+                target=Ref(name=self.variable_name),
+                attr_name='y',
+                value=get_value_expression(value=self._y),
+                is_element_attr=self._is_position_element_attr))
@@ -0,0 +1,147 @@
+"""Build session (each build state's owner) implementations.
+
+Mainly following interfaces are defined:
+
+- BuildSession : The class that owns each build state (expression
+    store, variable name allocator, and stage registry).
+- get_current_session : Get a current build session.
+
+Current build session is propagated by the `contextvars`, so each
+thread (or asyncio task) can build independent stages concurrently
+by entering a different session:
+
+>>> with BuildSession():
+...     stage = Stage(stage_elem_id='line-graph')
+...     exporter.save_expressions_overall_html(dest_dir_path='./line/')
+"""
+
+from contextvars import ContextVar
+from contextvars import Token
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import List
+from typing import Optional
+
+from apyscript.expression.expression_store import BufferExpressionStore
+from apyscript.expression.expression_store import ExpressionStore
+from apyscript.file import file_util
+
+if TYPE_CHECKING:
+    from apyscript.display.stage import StageRegistry
+    from apyscript.expression.expression_variables_util import \
+        VariableNameAllocator
+
+
+class BuildSession:
+
+    expression_store: ExpressionStore
+    variable_name_allocator: 'VariableNameAllocator'
+    stage_registry: 'StageRegistry'
+    expression_root_dir: Optional[str]
+    _tokens: List[Token]
+
+    def __init__(
+            self,
+            expression_root_dir: Optional[str] = None,
+            expression_store: Optional[ExpressionStore] = None) -> None:
+        """
+        The class that owns each build state (expression store,
+        variable name allocator, and stage registry).
+
+        Parameters
+        ----------
+        expression_root_dir : str or None, default None
+            Directory path to save each expression related file
+            (e.g., stage element id and variable names snapshot).
+            If None is specified, no file will be saved and every
+            state is held in the process memory only.
+        expression_store : ExpressionStore or None, default None
+            Expression store to use. If None is specified,
+            BufferExpressionStore will be used.
+        """
+        from apyscript.display.stage import StageRegistry
+        from apyscript.expression.expression_variables_util import \
+            VariableNameAllocator
+        if expression_store is None:
+            expression_store = BufferExpressionStore()
+        self.expression_store = expression_store
+        self.variable_name_allocator = VariableNameAllocator()
+        self.stage_registry = StageRegistry()
+        self.expression_root_dir = expression_root_dir
+        self._tokens = []
+
+    def reset(self) -> None:
+        """
+        Reset each build state. If expression root directory is set,
+        that directory will also be emptied.
+        """
+        if self.expression_root_dir is not None:
+            file_util.empty_directory(
+                directory_path=self.expression_root_dir)
+        self.expression_store.clear()
+        self.variable_name_allocator.clear()
+        self.stage_registry.clear()
+
+    def __enter__(self) -> 'BuildSession':
+        """
+        Set this session to the current build session.
+
+        Returns
+        -------
+        session : BuildSession
+            This session.
+        """
+        token: Token = _current_session.set(self)
+        self._tokens.append(token)
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """
+        Restore the previous build session.
+
+        Parameters
+        ----------
+        *args : list
+            Exception related arguments (not used).
+        """
+        token: Token = self._tokens.pop()
+        _current_session.reset(token)
+
+
+_current_session: ContextVar = ContextVar(
+    'apyscript_build_session', default=None)
+_default_session: Optional[BuildSession] = None
+
+
+def get_current_session() -> BuildSession:
+    """
+    Get a current build session.
+
+    Returns
+    -------
+    session : BuildSession
+        Current build session. If any session is not entered, the
+        default session (that saves each file under the
+        `EXPRESSION_ROOT_DIR`) will be returned.
+    """
+    session: Optional[BuildSession] = _current_session.get()
+    if session is not None:
+        return session
+    return _get_default_session()
+
+
+def _get_default_session() -> BuildSession:
+    """
+    Get the default build session (create it if not created yet).
+
+    Returns
+    -------
+    default_session : BuildSession
+        The default build session.
+    """
+    global _default_session
+    if _default_session is None:
+        from apyscript.expression import expression_file_util
+        _default_session = BuildSession(
+            expression_root_dir=expression_file_util.EXPRESSION_ROOT_DIR)
+    return _default_session
@@ -0,0 +1,207 @@
+"""Attribute updates coalescing (peephole merging of the attribute
+updates of the same display object into one `attr` method call)
+implementations.
+
+Mainly following interfaces are defined:
+
+- coalesce_attr_updates : Merge the run of the attribute updates of
+    the same display object into one `attr` method call.
+"""
+
+from typing import List
+from typing import Optional
+from typing import Set
+
+from apyscript.expression.expression_ir import Assign
+from apyscript.expression.expression_ir import AttrSet
+from apyscript.expression.expression_ir import ExpressionStatement
+from apyscript.expression.expression_ir import ObjectLiteral
+from apyscript.expression.expression_ir import Ref
+from apyscript.expression.expression_ir import Statement
+from apyscript.expression.expression_ir import VarDecl
+from apyscript.expression.expression_ir import make_method_call
+
+
+class _AttrUpdatesRun:
+
+    target_name: str
+    attr_sets: List[AttrSet]
+    result_indexes: List[int]
+    read_names: Set[str]
+
+    def __init__(self, target_name: str) -> None:
+        """
+        The class that holds the run of the (not yet coalesced)
+        attribute updates of the same display object.
+
+        Parameters
+        ----------
+        target_name : str
+            Target display object's variable name.
+        """
+        self.target_name = target_name
+        self.attr_sets = []
+        self.result_indexes = []
+        self.read_names = set()
+
+    def append(self, attr_set: AttrSet, result_index: int) -> None:
+        """
+        Append an attribute updating statement to this run.
+
+        Parameters
+        ----------
+        attr_set : AttrSet
+            Attribute updating statement to append.
+        result_index : int
+            Index of the statement in the result list.
+        """
+        self.attr_sets.append(attr_set)
+        self.result_indexes.append(result_index)
+        self.read_names |= attr_set.value.get_read_names()
+
+    def can_pass(self, statement: Statement) -> bool:
+        """
+        Get a boolean whether this run's updates can be moved after
+        specified statement (the statement never reads the target
+        display object nor stores the values of the updates).
+
+        Parameters
+        ----------
+        statement : Statement
+            Statement after this run's updates.
+
+        Returns
+        -------
+        result : bool
+            If this run's updates can be moved after the statement,
+            True will be returned.
+        """
+        if not isinstance(statement, (VarDecl, Assign)):
+            return False
+        if not statement.is_pure_store():
+            return False
+        stored_name: Optional[str] = statement.get_stored_name()
+        if stored_name is None or stored_name in self.read_names:
+            return False
+        return self.target_name not in (
+            statement.get_read_names() | {stored_name})
+
+    def make_coalesced_statement(self) -> ExpressionStatement:
+        """
+        Make an `attr` method call statement of this run's updates,
+        e.g., `rectangle_1.attr({x: 10, y: int_1});`.
+
+        Returns
+        -------
+        statement : ExpressionStatement
+            Coalesced `attr` method call statement.
+        """
+        attrs: ObjectLiteral = ObjectLiteral()
+        for attr_set in self.attr_sets:
+            attrs.set_item(key=attr_set.attr_name, value=attr_set.value)
+        return ExpressionStatement(
+            expression=make_method_call(
+                variable_name=self.target_name, method_name='attr',
+                args=[attrs]))
+
+
+def coalesce_attr_updates(statements: List[Statement]) -> List[Statement]:
+    """
+    Merge the run of the attribute updates of the same display object
+    (e.g., `rectangle_1.x(10);` and `rectangle_1.fill("#333333");`)
+    into one `attr` method call (e.g.,
+    `rectangle_1.attr({x: 10, fill: "#333333"});`) to touch the DOM
+    once.
+
+    Notes
+    -----
+    Side-effect-free stores that don't read the display object nor
+    store the updates' values (e.g., `var int_2 = 20;`) can be between
+    the updates. Coalesced call will be placed at the last update's
+    position.
+
+    Parameters
+    ----------
+    statements : list of Statement
+        Statement nodes to optimize.
+
+    Returns
+    -------
+    statements : list of Statement
+        Statement nodes that attribute updates are coalesced.
+    """
+    result: List[Optional[Statement]] = []
+    run: Optional[_AttrUpdatesRun] = None
+    for statement in statements:
+        attr_set: Optional[AttrSet] = _get_coalescable_attr_set(
+            statement=statement)
+        if run is not None and attr_set is not None \
+                and isinstance(attr_set.target, Ref) \
+                and attr_set.target.name == run.target_name:
+            result.append(statement)
+            run.append(attr_set=attr_set, result_index=len(result) - 1)
+            continue
+        if run is not None and attr_set is None \
+                and run.can_pass(statement=statement):
+            result.append(statement)
+            continue
+        if run is not None:
+            _flush_run(run=run, result=result)
+            run = None
+        result.append(statement)
+        if attr_set is not None and isinstance(attr_set.target, Ref):
+            run = _AttrUpdatesRun(target_name=attr_set.target.name)
+            run.append(attr_set=attr_set, result_index=len(result) - 1)
+    if run is not None:
+        _flush_run(run=run, result=result)
+    return [statement for statement in result if statement is not None]
+
+
+def _get_coalescable_attr_set(statement: Statement) -> Optional[AttrSet]:
+    """
+    Get a coalescable attribute updating statement (the target is a
+    variable, the attribute is the element's own attribute, and the
+    value is side-effect-free) from specified statement.
+
+    Parameters
+    ----------
+    statement : Statement
+        Target statement node.
+
+    Returns
+    -------
+    attr_set : AttrSet or None
+        If specified statement is a coalescable attribute updating
+        statement, that statement will be returned. Otherwise None
+        will be returned.
+    """
+    if not isinstance(statement, AttrSet):
+        return None
+    if not isinstance(statement.target, Ref):
+        return None
+    if not statement.is_element_attr or not statement.value.is_pure():
+        return None
+    return statement
+
+
+def _flush_run(
+        run: _AttrUpdatesRun, result: List[Optional[Statement]]) -> None:
+    """
+    Replace the run's updates in the result list by a coalesced
+    `attr` method call. If the run has only one update, the result
+    list will not be changed.
+
+    Parameters
+    ----------
+    run : _AttrUpdatesRun
+        Target run of the attribute updates.
+    result : list of Statement
+        Result statements list. Coalesced statement will be set to
+        the last update's index and other updates will be replaced
+        by None.
+    """
+    if len(run.attr_sets) < 2:
+        return
+    for result_index in run.result_indexes[:-1]:
+        result[result_index] = None
+    result[run.result_indexes[-1]] = run.make_coalesced_statement()
@@ -0,0 +1,546 @@
+"""Constant folding (export-time evaluation of the operations on the
+known values) implementations.
+
+The python side already knows each concrete value, so operations
+whose operands are derived only from literals (e.g.,
+`var number_5 = number_3 + 10;`) can be evaluated at the export time
+and emitted as literals (e.g., `var number_5 = 20;`).
+
+Mainly following interfaces are defined:
+
+- fold_constants : Evaluate the operations on the known values and
+    replace them by literals.
+- fold_expression : Fold constants of specified expression node.
+"""
+
+import math
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+
+from apyscript.expression.expression_ir import ArrayLiteral
+from apyscript.expression.expression_ir import Assign
+from apyscript.expression.expression_ir import AttrSet
+from apyscript.expression.expression_ir import BinaryOp
+from apyscript.expression.expression_ir import Call
+from apyscript.expression.expression_ir import Expression
+from apyscript.expression.expression_ir import ExpressionStatement
+from apyscript.expression.expression_ir import Index
+from apyscript.expression.expression_ir import Literal
+from apyscript.expression.expression_ir import Member
+from apyscript.expression.expression_ir import ObjectLiteral
+from apyscript.expression.expression_ir import Raw
+from apyscript.expression.expression_ir import Ref
+from apyscript.expression.expression_ir import Statement
+from apyscript.expression.expression_ir import UnaryOp
+from apyscript.expression.expression_ir import VarDecl
+
+# Integers greater than this can't be represented exactly by js number.
+_MAX_SAFE_INTEGER: int = 2 ** 53 - 1
+
+# Number that js converts to the exponential notation string.
+_MAX_DECIMAL_NOTATION_NUMBER: float = 1e21
+_MIN_DECIMAL_NOTATION_NUMBER: float = 1e-6
+
+
+def fold_constants(statements: List[Statement]) -> List[Statement]:
+    """
+    Evaluate the operations on the known values and replace them by
+    literals (e.g., `var number_5 = number_3 + 10;` will be
+    `var number_5 = 20;`).
+
+    Notes
+    -----
+    A variable's value is known from its last literal store until
+    the next non-literal store. Raw statements are not analysable, so
+    each variable referenced in a raw statement (e.g., a loop
+    variable) will be unknown after that statement.
+
+    Parameters
+    ----------
+    statements : list of Statement
+        Statement nodes to optimize.
+
+    Returns
+    -------
+    statements : list of Statement
+        Statement nodes that constants are folded.
+    """
+    known_values: Dict[str, Any] = {}
+    result: List[Statement] = []
+    for statement in statements:
+        result.append(
+            _fold_statement(statement=statement, known_values=known_values))
+    return result
+
+
+def _fold_statement(
+        statement: Statement, known_values: Dict[str, Any]) -> Statement:
+    """
+    Fold constants of specified statement node and update the known
+    values.
+
+    Parameters
+    ----------
+    statement : Statement
+        Target statement node.
+    known_values : dict
+        A dict that has variable names in key and known (literal)
+        values in value. This dict will be updated by the statement's
+        store.
+
+    Returns
+    -------
+    statement : Statement
+        Statement node that constants are folded.
+    """
+    if isinstance(statement, Raw):
+        for read_name in statement.get_read_names():
+            known_values.pop(read_name, None)
+        return statement
+    if isinstance(statement, VarDecl):
+        value: Expression = fold_expression(
+            expression=statement.value, known_values=known_values)
+        _update_known_value(
+            name=statement.name, value=value, known_values=known_values)
+        return VarDecl(name=statement.name, value=value)
+    if isinstance(statement, Assign):
+        return _fold_assign(statement=statement, known_values=known_values)
+    if isinstance(statement, AttrSet):
+        return AttrSet(
+            target=statement.target, attr_name=statement.attr_name,
+            value=fold_expression(
+                expression=statement.value, known_values=known_values),
+            is_element_attr=statement.is_element_attr)
+    if isinstance(statement, ExpressionStatement):
+        statement = ExpressionStatement(
+            expression=fold_expression(
+                expression=statement.expression,
+                known_values=known_values))
+    stored_name: Optional[str] = statement.get_stored_name()
+    if stored_name is not None:
+        known_values.pop(stored_name, None)
+    return statement
+
+
+def _fold_assign(
+        statement: Assign, known_values: Dict[str, Any]) -> Statement:
+    """
+    Fold constants of specified assignment statement node and update
+    the known values.
+
+    Parameters
+    ----------
+    statement : Assign
+        Target assignment statement node.
+    known_values : dict
+        A dict that has variable names in key and known (literal)
+        values in value.
+
+    Returns
+    -------
+    statement : Statement
+        Assignment statement node that constants are folded. If the
+        compound assignment (e.g., `int_1 += 10;`) is folded, plain
+        assignment (e.g., `int_1 = 20;`) will be returned.
+    """
+    if not isinstance(statement.target, Ref):
+        return Assign(
+            target=_fold_target(
+                expression=statement.target, known_values=known_values),
+            value=fold_expression(
+                expression=statement.value, known_values=known_values),
+            operator=statement.operator)
+    name: str = statement.target.name
+    value: Expression = fold_expression(
+        expression=statement.value, known_values=known_values)
+    if statement.operator != '=':
+        folded: Expression = fold_expression(
+            expression=BinaryOp(
+                left=statement.target, operator=statement.operator[:-1],
+                right=value),
+            known_values=known_values)
+        if not isinstance(folded, Literal):
+            known_values.pop(name, None)
+            return Assign(
+                target=statement.target, value=value,
+                operator=statement.operator)
+        value = folded
+    _update_known_value(name=name, value=value, known_values=known_values)
+    return Assign(target=statement.target, value=value)
+
+
+def _update_known_value(
+        name: str, value: Expression, known_values: Dict[str, Any]) -> None:
+    """
+    Update the known value of specified variable.
+
+    Parameters
+    ----------
+    name : str
+        Stored variable name.
+    value : Expression
+        Stored (folded) value expression.
+    known_values : dict
+        A dict that has variable names in key and known (literal)
+        values in value. If stored value is not a primitive literal,
+        the variable will be removed from this dict.
+    """
+    constant: Optional[Literal] = _get_constant(
+        expression=value, known_values=known_values)
+    if constant is None:
+        known_values.pop(name, None)
+        return
+    known_values[name] = constant.value
+
+
+def fold_expression(
+        expression: Expression, known_values: Dict[str, Any]) -> Expression:
+    """
+    Fold constants of specified expression node.
+
+    Notes
+    -----
+    Known variable reference will be inlined only if the literal is
+    not longer than the variable name (e.g., `10` instead of `int_1`)
+    to avoid increasing the js text size. Operations are folded
+    regardless of the length.
+
+    Parameters
+    ----------
+    expression : Expression
+        Target expression node.
+    known_values : dict
+        A dict that has variable names in key and known (literal)
+        values in value.
+
+    Returns
+    -------
+    expression : Expression
+        Expression node that constants are folded.
+    """
+    if isinstance(expression, Ref):
+        constant: Optional[Literal] = _get_constant(
+            expression=expression, known_values=known_values)
+        if constant is not None \
+                and len(constant.to_js()) <= len(expression.name):
+            return constant
+        return expression
+    if isinstance(expression, BinaryOp):
+        return _fold_binary_op(
+            expression=expression, known_values=known_values)
+    if isinstance(expression, Call):
+        return _fold_call(expression=expression, known_values=known_values)
+    if isinstance(expression, UnaryOp):
+        return UnaryOp(
+            operator=expression.operator,
+            operand=fold_expression(
+                expression=expression.operand, known_values=known_values))
+    if isinstance(expression, ArrayLiteral):
+        return ArrayLiteral(
+            elements=[
+                fold_expression(expression=element, known_values=known_values)
+                for element in expression.elements])
+    if isinstance(expression, ObjectLiteral):
+        return ObjectLiteral(
+            items={
+                key: fold_expression(
+                    expression=value, known_values=known_values)
+                for key, value in expression.items.items()})
+    if isinstance(expression, (Member, Index)):
+        return _fold_target(expression=expression, known_values=known_values)
+    return expression
+
+
+def _fold_target(
+        expression: Expression, known_values: Dict[str, Any]) -> Expression:
+    """
+    Fold constants of specified member access, index access, or call
+    target expression node. Variable reference will not be replaced
+    by the literal (e.g., `10.toString()` is invalid js).
+
+    Parameters
+    ----------
+    expression : Expression
+        Target expression node.
+    known_values : dict
+        A dict that has variable names in key and known (literal)
+        values in value.
+
+    Returns
+    -------
+    expression : Expression
+        Expression node that constants are folded.
+    """
+    if isinstance(expression, Ref):
+        return expression
+    if isinstance(expression, Member):
+        return Member(
+            target=_fold_target(
+                expression=expression.target, known_values=known_values),
+            name=expression.name)
+    if isinstance(expression, Index):
+        return Index(
+            target=_fold_target(
+                expression=expression.target, known_values=known_values),
+            index=fold_expression(
+                expression=expression.index, known_values=known_values))
+    return fold_expression(expression=expression, known_values=known_values)
+
+
+def _fold_binary_op(
+        expression: BinaryOp, known_values: Dict[str, Any]) -> Expression:
+    """
+    Fold constants of specified binary operation expression node.
+
+    Parameters
+    ----------
+    expression : BinaryOp
+        Target binary operation expression node.
+    known_values : dict
+        A dict that has variable names in key and known (literal)
+        values in value.
+
+    Returns
+    -------
+    expression : Expression
+        If both of the operands are known and the operation can be
+        evaluated same as js, the result literal will be returned.
+        Otherwise the binary operation that operands are folded will
+        be returned.
+    """
+    left: Expression = fold_expression(
+        expression=expression.left, known_values=known_values)
+    right: Expression = fold_expression(
+        expression=expression.right, known_values=known_values)
+    left_constant: Optional[Literal] = _get_constant(
+        expression=left, known_values=known_values)
+    right_constant: Optional[Literal] = _get_constant(
+        expression=right, known_values=known_values)
+    if left_constant is not None and right_constant is not None:
+        result: Optional[Literal] = _evaluate_binary_op(
+            left_value=left_constant.value, operator=expression.operator,
+            right_value=right_constant.value)
+        if result is not None:
+            return result
+    return BinaryOp(left=left, operator=expression.operator, right=right)
+
+
+def _fold_call(expression: Call, known_values: Dict[str, Any]) -> Expression:
+    """
+    Fold constants of specified call expression node.
+
+    Parameters
+    ----------
+    expression : Call
+        Target call expression node.
+    known_values : dict
+        A dict that has variable names in key and known (literal)
+        values in value.
+
+    Returns
+    -------
+    expression : Expression
+        If the call is the integer cast (`parseInt`) of the known
+        number, the result literal will be returned. Otherwise the
+        call that arguments are folded will be returned.
+    """
+    args: List[Expression] = [
+        fold_expression(expression=arg, known_values=known_values)
+        for arg in expression.args]
+    if isinstance(expression.callee, Ref) \
+            and expression.callee.name == 'parseInt' \
+            and _is_decimal_radix(args=args):
+        constant: Optional[Literal] = _get_constant(
+            expression=args[0], known_values=known_values)
+        if constant is not None:
+            result: Optional[Literal] = _evaluate_parse_int(
+                value=constant.value)
+            if result is not None:
+                return result
+    return Call(
+        callee=_fold_target(
+            expression=expression.callee, known_values=known_values),
+        args=args)
+
+
+def _is_decimal_radix(args: List[Expression]) -> bool:
+    """
+    Get a boolean whether specified `parseInt` arguments are the
+    decimal ones (e.g., `parseInt(int_1)` or `parseInt(int_1, 10)`).
+
+    Parameters
+    ----------
+    args : list of Expression
+        `parseInt` call arguments.
+
+    Returns
+    -------
+    result : bool
+        If arguments are the decimal ones, True will be returned.
+    """
+    if len(args) == 1:
+        return True
+    if len(args) != 2:
+        return False
+    return args[1] == Literal(value=10)
+
+
+def _get_constant(
+        expression: Expression,
+        known_values: Dict[str, Any]) -> Optional[Literal]:
+    """
+    Get a primitive literal of specified expression node if the value
+    is known.
+
+    Parameters
+    ----------
+    expression : Expression
+        Target expression node.
+    known_values : dict
+        A dict that has variable names in key and known (literal)
+        values in value.
+
+    Returns
+    -------
+    constant : Literal or None
+        Literal of the bool, int, float, or str value. If the value is
+        not known (or not primitive), None will be returned.
+    """
+    if isinstance(expression, Ref):
+        if expression.name not in known_values:
+            return None
+        return Literal(value=known_values[expression.name])
+    if not isinstance(expression, Literal):
+        return None
+    if not isinstance(expression.value, (bool, int, float, str)):
+        return None
+    return expression
+
+
+def _is_number(value: Any) -> bool:
+    """
+    Get a boolean whether specified value is a (not bool) number that
+    js can represent same as python.
+
+    Parameters
+    ----------
+    value : *
+        Target value.
+
+    Returns
+    -------
+    result : bool
+        If specified value is a finite float or a safe integer, True
+        will be returned.
+    """
+    if isinstance(value, bool):
+        return False
+    if isinstance(value, int):
+        return abs(value) <= _MAX_SAFE_INTEGER
+    if isinstance(value, float):
+        return math.isfinite(value)
+    return False
+
+
+def _evaluate_binary_op(
+        left_value: Any, operator: str, right_value: Any) -> Optional[Literal]:
+    """
+    Evaluate specified binary operation same as js.
+
+    Parameters
+    ----------
+    left_value : *
+        Left side operand value.
+    operator : str
+        Operator string, e.g., `+`.
+    right_value : *
+        Right side operand value.
+
+    Returns
+    -------
+    result : Literal or None
+        Operation result literal. If the operation can't be evaluated
+        same as js (e.g., division by zero or comparison), None will
+        be returned.
+    """
+    if isinstance(left_value, str) or isinstance(right_value, str):
+        if operator != '+':
+            return None
+        left_str: Optional[str] = _get_concatenation_str(value=left_value)
+        right_str: Optional[str] = _get_concatenation_str(value=right_value)
+        if left_str is None or right_str is None:
+            return None
+        return Literal(value=left_str + right_str)
+    if not _is_number(value=left_value) or not _is_number(value=right_value):
+        return None
+    result: Any
+    if operator == '+':
+        result = left_value + right_value
+    elif operator == '-':
+        result = left_value - right_value
+    elif operator == '*':
+        result = left_value * right_value
+    elif operator == '/' and right_value != 0:
+        result = left_value / right_value
+    elif operator == '%' and right_value != 0:
+        # js remainder has the dividend's sign (same as math.fmod).
+        result = math.fmod(left_value, right_value)
+        if isinstance(left_value, int) and isinstance(right_value, int):
+            result = int(result)
+    else:
+        return None
+    if not _is_number(value=result):
+        return None
+    return Literal(value=result)
+
+
+def _get_concatenation_str(value: Any) -> Optional[str]:
+    """
+    Get a string of specified value that js uses for the string
+    concatenation.
+
+    Parameters
+    ----------
+    value : *
+        Target value.
+
+    Returns
+    -------
+    value_str : str or None
+        String of the str or int value. If the string may differ
+        from js (e.g., float or bool value), None will be returned.
+    """
+    if isinstance(value, str):
+        return value
+    if isinstance(value, int) and _is_number(value=value):
+        return str(value)
+    return None
+
+
+def _evaluate_parse_int(value: Any) -> Optional[Literal]:
+    """
+    Evaluate the `parseInt` call of specified number same as js.
+
+    Parameters
+    ----------
+    value : *
+        Target value.
+
+    Returns
+    -------
+    result : Literal or None
+        Truncated integer literal. If the value is not a number or
+        js converts the number to the exponential notation string
+        (e.g., `1e-7`), None will be returned.
+    """
+    if not _is_number(value=value):
+        return None
+    if isinstance(value, int):
+        return Literal(value=value)
+    if value != 0 and not (
+            _MIN_DECIMAL_NOTATION_NUMBER <= abs(value)
+            < _MAX_DECIMAL_NOTATION_NUMBER):
+        return None
+    return Literal(value=int(value))
@@ -2,121 +2,223 @@
 
 Mainly following interfaces are defined:
 
-- empty_expression_dir : Remove expression directory
-    (EXPRESSION_ROOT_DIR) to initialize.
-- append_expression : Append html and js expression to file.
+- empty_expression_dir : Reset current build session and remove
+    it's expression directory to initialize.
+- get_expression_root_dir : Get current build session's expression
+    root directory path.
+- get_expression_file_path : Get current build session's expression
+    file path.
+- get_expression_store : Get a current expression store.
+- set_expression_store : Set an expression store to use.
+- append_expression : Append html and js expression to the
+    current expression store.
 - wrap_by_script_tag_and_append_expression : Wrap an expression
-    string by script tags and append it's expression to file.
+    string by script tags and append it's expression to the
+    current expression store.
+- append_statement : Append js statement node (expression IR) to
+    the current expression store.
 - get_current_expression : Get current expression string.
+- save_expression_file : Save current expression to file.
 - remove_expression_file : Remove expression file.
+
+Each state (expression store, etc.) is owned by the current build
+session (see the `build_session` module).
 """
 
 import os
-from typing import List
+from typing import Optional
 
+from apyscript.expression import build_session
+from apyscript.expression.expression_ir import Statement
+from apyscript.expression.expression_optimizer import ExpressionOptimizer
+from apyscript.expression.expression_store import ExpressionStore
 from apyscript.file import file_util
-from apyscript.html import html_const
-from apyscript.html import html_util
-from apyscript.html.html_util import ScriptLineUtil
 
 EXPRESSION_ROOT_DIR: str = '../.apyscript_expression/'
+_EXPRESSION_FILE_NAME: str = 'expression.txt'
 EXPRESSION_FILE_PATH: str = os.path.join(
-    EXPRESSION_ROOT_DIR, 'expression.txt')
+    EXPRESSION_ROOT_DIR, _EXPRESSION_FILE_NAME)
+
+
+def get_expression_root_dir() -> Optional[str]:
+    """
+    Get current build session's expression root directory path.
+
+    Returns
+    -------
+    expression_root_dir : str or None
+        Current build session's expression root directory path
+        (EXPRESSION_ROOT_DIR in the default session). If the session
+        not saves any file, None will be returned.
+    """
+    return build_session.get_current_session().expression_root_dir
+
+
+def get_expression_file_path() -> Optional[str]:
+    """
+    Get current build session's expression file path.
+
+    Returns
+    -------
+    expression_file_path : str or None
+        Current build session's expression file path
+        (EXPRESSION_FILE_PATH in the default session). If the session
+        not saves any file, None will be returned.
+    """
+    expression_root_dir: Optional[str] = get_expression_root_dir()
+    if expression_root_dir is None:
+        return None
+    return os.path.join(expression_root_dir, _EXPRESSION_FILE_NAME)
+
+
+def get_expression_store() -> ExpressionStore:
+    """
+    Get a current expression store.
+
+    Returns
+    -------
+    expression_store : ExpressionStore
+        Current build session's expression store.
+        BufferExpressionStore (in-memory buffer) is used by default.
+    """
+    return build_session.get_current_session().expression_store
+
+
+def set_expression_store(expression_store: ExpressionStore) -> None:
+    """
+    Set an expression store to the current build session.
+
+    Parameters
+    ----------
+    expression_store : ExpressionStore
+        Expression store to use, e.g., if FileExpressionStore is
+        specified, each expression will be appended to the file.
+    """
+    build_session.get_current_session().expression_store = \
+        expression_store
 
 
 def empty_expression_dir() -> None:
     """
-    Remove expression directory (EXPRESSION_ROOT_DIR) to initialize.
+    Reset current build session (clear expression store, allocated
+    variable names, and registered stage) and remove it's expression
+    directory (EXPRESSION_ROOT_DIR in the default session) to
+    initialize.
     """
-    file_util.empty_directory(directory_path=EXPRESSION_ROOT_DIR)
+    build_session.get_current_session().reset()
 
 
 def append_expression(expression: str) -> None:
     """
-    Append html and js expression to file.
+    Append html and js expression to the current expression store.
+
+    Notes
+    -----
+    Expression will not be saved to file at this point. Script
+    section (inner script tags) will be appended to the store's
+    script segment and merged into single script section when
+    the expression is read.
 
     Parameters
     ----------
     expression : str
         HTML and js Expression string.
     """
-    dir_path: str = file_util.get_abs_directory_path_from_file_path(
-        file_path=EXPRESSION_FILE_PATH)
-    os.makedirs(dir_path, exist_ok=True)
-    file_util.append_plain_txt(
-        txt=f'{expression}\n', file_path=EXPRESSION_FILE_PATH)
-    _merge_script_section()
+    get_expression_store().append(expression=expression)
 
 
 def wrap_by_script_tag_and_append_expression(expression: str) -> None:
     """
     Wrap an expression string by script tags and append it's
-    expression to file (helper function of `append_expression`).
+    expression to the current expression store (helper function
+    of `append_expression`).
+
+    Notes
+    -----
+    Script tags are not actually added and the expression is appended
+    to the store's script segment directly.
 
     Parameters
     ----------
     expression : str
         HTML and js Expression string.
     """
-    expression = html_util.wrap_expression_by_script_tag(
-        expression=expression)
-    append_expression(expression=expression)
-
-
-def _merge_script_section() -> None:
-    """
-    Merge expression's script section (If there are multiple
-    script tag in expression file, then they will be merged).
-    """
-    result_expression: str = ''
-    current_expression: str = file_util.read_txt(
-        file_path=EXPRESSION_FILE_PATH)
-    current_exp_lines: List[str] = current_expression.splitlines()
-    script_line_util: ScriptLineUtil = ScriptLineUtil(
-        html=current_expression)
-    script_strings: str = ''
-    for i, current_exp_line in enumerate(current_exp_lines):
-        if current_exp_line == html_const.SCRIPT_START_TAG:
-            continue
-        if current_exp_line == html_const.SCRIPT_END_TAG:
-            continue
-        line_num: int = i + 1
-        if script_line_util.is_script_line(line_number=line_num):
-            if current_exp_line == '':
-                continue
-            script_strings += f'{current_exp_line}\n'
-            continue
-        result_expression += f'{current_exp_line}\n'
-    if script_strings != '':
-        result_expression += (
-            f'{html_const.SCRIPT_START_TAG}\n'
-            f'{script_strings}'
-            f'{html_const.SCRIPT_END_TAG}\n'
-        )
-    file_util.save_plain_txt(
-        txt=result_expression,
-        file_path=EXPRESSION_FILE_PATH)
-
-
-def get_current_expression() -> str:
-    """
-    Get current expression's string from file.
+    script: str = expression.strip('\n')
+    if script == '':
+        return
+    get_expression_store().append_script(script=script)
+
+
+def append_statement(statement: Statement) -> None:
+    """
+    Append js statement node (expression IR) to the current
+    expression store.
+
+    Parameters
+    ----------
+    statement : Statement
+        Statement node to append, e.g., `VarDecl`.
+    """
+    get_expression_store().append_statement(statement=statement)
+
+
+def get_current_expression(
+        optimizer: Optional[ExpressionOptimizer] = None) -> str:
+    """
+    Get current expression's string from the current expression store.
+
+    Parameters
+    ----------
+    optimizer : ExpressionOptimizer or None, default None
+        Optimizer to apply to the script statements. If None is
+        specified, statements will not be optimized.
 
     Returns
     -------
     current_expression : str
-        Current expression's string.
+        Current expression's string (script sections are merged).
     """
-    if not os.path.isfile(EXPRESSION_FILE_PATH):
-        return ''
-    current_expression: str = file_util.read_txt(
-        file_path=EXPRESSION_FILE_PATH)
+    current_expression: str = get_expression_store().get_expression(
+        optimizer=optimizer)
     current_expression = current_expression.strip()
     return current_expression
 
 
+def save_expression_file(
+        optimizer: Optional[ExpressionOptimizer] = None) -> str:
+    """
+    Save current expression to file (EXPRESSION_FILE_PATH in the
+    default session).
+
+    Notes
+    -----
+    If current build session not saves any file, only the current
+    expression will be returned.
+
+    Parameters
+    ----------
+    optimizer : ExpressionOptimizer or None, default None
+        Optimizer to apply to the script statements. If None is
+        specified, statements will not be optimized.
+
+    Returns
+    -------
+    current_expression : str
+        Saved expression's string.
+    """
+    current_expression: str = get_current_expression(optimizer=optimizer)
+    expression_file_path: Optional[str] = get_expression_file_path()
+    if expression_file_path is not None:
+        file_util.save_plain_txt(
+            txt=f'{current_expression}\n', file_path=expression_file_path)
+    return current_expression
+
+
 def remove_expression_file() -> None:
     """
-    Remove expression file.
+    Remove expression file and clear current expression store.
     """
-    file_util.remove_file_if_exists(file_path=EXPRESSION_FILE_PATH)
+    expression_file_path: Optional[str] = get_expression_file_path()
+    if expression_file_path is not None:
+        file_util.remove_file_if_exists(file_path=expression_file_path)
+    get_expression_store().clear()
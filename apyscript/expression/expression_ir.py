@@ -0,0 +1,1060 @@
+"""Expression IR (typed js statement nodes) implementations.
+
+Each interface appends these nodes to the expression store instead
+of the formatted js strings, and js text is generated only when the
+expression is read (e.g., at the export time). This makes it
+possible to analyse and optimize the statements before the export.
+
+Mainly following interfaces are defined:
+
+- Node : Base class of each IR node.
+- Expression : Base class of each js expression node.
+- Ref : Variable reference expression, e.g., `int_1`.
+- Literal : Literal value expression, e.g., `10` or `"Hello!"`.
+- ArrayLiteral : Array literal expression, e.g., `[1, int_1]`.
+- TypedArrayLiteral : Array expression decoded from a base64 typed
+    array payload (e.g., NumPy's array or `array.array`).
+- ObjectLiteral : Object literal expression, e.g., `{x: 10}`.
+- BinaryOp : Binary operation expression, e.g., `int_1 + 10`.
+- UnaryOp : Unary operation expression, e.g., `!boolean_1`.
+- Member : Member access expression, e.g., `array_1.length`.
+- Index : Index access expression, e.g., `array_1[0]`.
+- Call : Function or method call expression, e.g., `array_1.pop()`.
+- Statement : Base class of each js statement node.
+- VarDecl : Variable declaration statement, e.g., `var int_1 = 10;`.
+- Assign : Assignment statement, e.g., `int_1 = 10;` or
+    `int_1 += 10;`.
+- AttrSet : Display object's attribute updating statement, e.g.,
+    `rectangle_1.x(10);`.
+- ExpressionStatement : Statement of single expression (mainly
+    call), e.g., `array_1.reverse();`.
+- Raw : Raw js statements string (not analysable).
+- get_value_expression : Get an expression node of specified value.
+- make_method_call : Make a method call expression node of specified
+    variable.
+
+Each node also has analysis interfaces (e.g., `get_read_names` or
+`is_pure`) that are used by the expression optimizer.
+"""
+
+import re
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Pattern
+from typing import Set
+from typing import Tuple
+
+_IDENTIFIER_PATTERN: Pattern = re.compile(r'^[A-Za-z_$][0-9A-Za-z_$]*$')
+_IDENTIFIER_SEARCH_PATTERN: Pattern = re.compile(r'[A-Za-z_$][0-9A-Za-z_$]*')
+
+# Functions that have no side effect (a call can be removed if the
+# result is not used).
+PURE_FUNCTION_NAMES: Set[str] = {
+    'Boolean', 'parseInt', 'JSON.parse', 'JSON.stringify',
+    '_.isEqual', '_.isUndefined',
+}
+
+# Methods that not update the target value and have no side effect.
+PURE_METHOD_NAMES: Set[str] = {
+    'concat', 'slice', 'indexOf', 'join', 'repeat', 'has', 'children',
+}
+
+# Methods that update only the target (e.g., Array) value itself.
+SELF_MUTATING_METHOD_NAMES: Set[str] = {
+    'push', 'unshift', 'splice', 'reverse', 'sort', 'pop', 'shift',
+}
+
+
+class Node:
+
+    def to_js(self) -> str:
+        """
+        Get a js text of this node.
+
+        Raises
+        ------
+        NotImplementedError
+            If subclass not overrides this method.
+        """
+        raise NotImplementedError()
+
+    def get_child_nodes(self) -> List['Node']:
+        """
+        Get child nodes of this node.
+
+        Returns
+        -------
+        child_nodes : list of Node
+            Child nodes (attributes, or list or dict attribute's
+            values that are Node).
+        """
+        child_nodes: List[Node] = []
+        for value in self.__dict__.values():
+            if isinstance(value, dict):
+                value = list(value.values())
+            if not isinstance(value, list):
+                value = [value]
+            child_nodes.extend(
+                unit_value for unit_value in value
+                if isinstance(unit_value, Node))
+        return child_nodes
+
+    def get_read_names(self) -> Set[str]:
+        """
+        Get variable names that this node reads.
+
+        Returns
+        -------
+        read_names : set of str
+            Variable names that this node (and each child node) reads.
+        """
+        read_names: Set[str] = set()
+        for child_node in self.get_child_nodes():
+            read_names |= child_node.get_read_names()
+        return read_names
+
+    def _get_key(self) -> Tuple:
+        """
+        Get a key tuple to compare nodes.
+
+        Returns
+        -------
+        key : tuple
+            A tuple of node's class name and each attribute.
+        """
+        return (self.__class__.__name__,) + tuple(
+            _get_hashable(value=value) for value in self.__dict__.values())
+
+    def __eq__(self, other: Any) -> bool:
+        """
+        Equal comparison method (nodes that have the same class and
+        attributes are equal).
+
+        Parameters
+        ----------
+        other : *
+            Any value to compare.
+
+        Returns
+        -------
+        result : bool
+            Comparison result.
+        """
+        if not isinstance(other, Node):
+            return False
+        return self._get_key() == other._get_key()
+
+    def __hash__(self) -> int:
+        """
+        Get a hash value of this node.
+
+        Returns
+        -------
+        hash_value : int
+            Hash value of the key tuple.
+        """
+        return hash(self._get_key())
+
+    def __repr__(self) -> str:
+        """
+        Get a representation string of this node.
+
+        Returns
+        -------
+        repr_str : str
+            Representation string of this node.
+        """
+        return f'{self.__class__.__name__}({self.to_js()!r})'
+
+
+def _get_hashable(value: Any) -> Any:
+    """
+    Get a hashable value of specified node attribute.
+
+    Parameters
+    ----------
+    value : *
+        Node attribute value.
+
+    Returns
+    -------
+    hashable : *
+        Converted value (list will be converted to tuple).
+    """
+    if isinstance(value, list):
+        return tuple(_get_hashable(value=unit_value) for unit_value in value)
+    if isinstance(value, tuple):
+        return tuple(_get_hashable(value=unit_value) for unit_value in value)
+    if isinstance(value, (int, float)):
+        # Distinguish `1`, `1.0`, and `true` values.
+        return (type(value).__name__, value)
+    return value
+
+
+class Expression(Node):
+    """
+    Base class of each js expression node.
+    """
+
+    def is_pure(self) -> bool:
+        """
+        Get a boolean whether this expression has no side effect.
+
+        Returns
+        -------
+        result : bool
+            If this expression and each child expression have no
+            side effect, True will be returned.
+        """
+        for child_node in self.get_child_nodes():
+            if isinstance(child_node, Expression) \
+                    and not child_node.is_pure():
+                return False
+        return True
+
+
+class Ref(Expression):
+
+    name: str
+
+    def __init__(self, name: str) -> None:
+        """
+        Variable reference expression, e.g., `int_1`.
+
+        Parameters
+        ----------
+        name : str
+            Variable name to refer.
+        """
+        self.name = name
+
+    def to_js(self) -> str:
+        """
+        Get a js text of this node.
+
+        Returns
+        -------
+        js : str
+            Variable name.
+        """
+        return self.name
+
+    def get_read_names(self) -> Set[str]:
+        """
+        Get variable names that this node reads.
+
+        Returns
+        -------
+        read_names : set of str
+            A set that contains this reference's variable name.
+        """
+        return {self.name}
+
+
+class Literal(Expression):
+
+    value: Any
+
+    def __init__(self, value: Any) -> None:
+        """
+        Literal value expression, e.g., `10` or `"Hello!"`.
+
+        Parameters
+        ----------
+        value : *
+            Python's builtin value, e.g., int, float, str, or bool.
+        """
+        self.value = value
+
+    def to_js(self) -> str:
+        """
+        Get a js text of this node.
+
+        Returns
+        -------
+        js : str
+            Literal value string. Bool value will be lowercase and
+            str value will be quoted by double quotation.
+        """
+        from apyscript.type import value_util
+        return value_util.get_value_str_for_expression(value=self.value)
+
+
+class ArrayLiteral(Expression):
+
+    elements: List[Expression]
+
+    def __init__(self, elements: List[Expression]) -> None:
+        """
+        Array literal expression, e.g., `[1, int_1]`.
+
+        Parameters
+        ----------
+        elements : list of Expression
+            Array elements.
+        """
+        self.elements = elements
+
+    def to_js(self) -> str:
+        """
+        Get a js text of this node.
+
+        Returns
+        -------
+        js : str
+            Array literal string.
+        """
+        return f'[{", ".join(element.to_js() for element in self.elements)}]'
+
+
+class TypedArrayLiteral(Expression):
+
+    typed_array_name: str
+    base64_str: str
+
+    def __init__(self, typed_array_name: str, base64_str: str) -> None:
+        """
+        Array expression decoded from a base64 typed array payload,
+        e.g., `Array.from(new Float64Array(...))`. This is smaller
+        and faster to parse than the element by element array literal
+        for the large numeric data.
+
+        Parameters
+        ----------
+        typed_array_name : str
+            Js typed array's class name, e.g., `Float64Array`.
+        base64_str : str
+            Base64 string of the typed array's buffer.
+        """
+        self.typed_array_name = typed_array_name
+        self.base64_str = base64_str
+
+    def to_js(self) -> str:
+        """
+        Get a js text of this node.
+
+        Returns
+        -------
+        js : str
+            Array expression string. The typed array is converted to
+            the normal array to use each Array method.
+        """
+        mapper: str = ''
+        if self.typed_array_name.startswith('Big'):
+            mapper = ', Number'
+        bytes_expression: str = (
+            f'Uint8Array.from(atob("{self.base64_str}"), '
+            'function(c) {return c.charCodeAt(0);})'
+        )
+        return (
+            f'Array.from(new {self.typed_array_name}('
+            f'{bytes_expression}.buffer){mapper})'
+        )
+
+
+class ObjectLiteral(Expression):
+
+    items: Dict[str, Expression]
+
+    def __init__(self, items: Optional[Dict[str, Expression]] = None) -> None:
+        """
+        Object literal expression, e.g., `{x: 10, "fill-opacity": 0.5}`.
+
+        Parameters
+        ----------
+        items : dict or None, default None
+            Object items (keys are kept in the insertion order).
+        """
+        if items is None:
+            items = {}
+        self.items = items
+
+    def set_item(self, key: str, value: Expression) -> None:
+        """
+        Set an item to this object.
+
+        Parameters
+        ----------
+        key : str
+            Item key, e.g., `fill-opacity`.
+        value : Expression
+            Item value.
+        """
+        self.items[key] = value
+
+    def _get_key(self) -> Tuple:
+        """
+        Get a key tuple to compare nodes.
+
+        Returns
+        -------
+        key : tuple
+            A tuple of node's class name and each item.
+        """
+        return (self.__class__.__name__,) + tuple(
+            (key, value._get_key()) for key, value in self.items.items())
+
+    def to_js(self) -> str:
+        """
+        Get a js text of this node.
+
+        Returns
+        -------
+        js : str
+            Object literal string. Key that is not a js identifier
+            will be quoted by double quotation.
+        """
+        item_strs: List[str] = []
+        for key, value in self.items.items():
+            if not _IDENTIFIER_PATTERN.match(key):
+                key = f'"{key}"'
+            item_strs.append(f'{key}: {value.to_js()}')
+        return f'{{{", ".join(item_strs)}}}'
+
+
+class BinaryOp(Expression):
+
+    left: Expression
+    operator: str
+    right: Expression
+
+    def __init__(
+            self, left: Expression, operator: str,
+            right: Expression) -> None:
+        """
+        Binary operation expression, e.g., `int_1 + 10`.
+
+        Parameters
+        ----------
+        left : Expression
+            Left side operand.
+        operator : str
+            Operator string, e.g., `+` or `===`.
+        right : Expression
+            Right side operand.
+        """
+        self.left = left
+        self.operator = operator
+        self.right = right
+
+    def to_js(self) -> str:
+        """
+        Get a js text of this node.
+
+        Returns
+        -------
+        js : str
+            Binary operation string. Nested binary operation operand
+            will be wrapped by parentheses.
+        """
+        left_str: str = _wrap_by_parentheses_if_binary_op(
+            expression=self.left)
+        right_str: str = _wrap_by_parentheses_if_binary_op(
+            expression=self.right)
+        return f'{left_str} {self.operator} {right_str}'
+
+
+def _wrap_by_parentheses_if_binary_op(expression: Expression) -> str:
+    """
+    Get a js text of specified expression and wrap it by parentheses
+    if it is a binary operation.
+
+    Parameters
+    ----------
+    expression : Expression
+        Target expression.
+
+    Returns
+    -------
+    js : str
+        Expression's js text.
+    """
+    if isinstance(expression, BinaryOp):
+        return f'({expression.to_js()})'
+    return expression.to_js()
+
+
+class UnaryOp(Expression):
+
+    operator: str
+    operand: Expression
+
+    def __init__(self, operator: str, operand: Expression) -> None:
+        """
+        Unary operation expression, e.g., `!boolean_1`.
+
+        Parameters
+        ----------
+        operator : str
+            Operator string, e.g., `!`.
+        operand : Expression
+            Operand expression.
+        """
+        self.operator = operator
+        self.operand = operand
+
+    def to_js(self) -> str:
+        """
+        Get a js text of this node.
+
+        Returns
+        -------
+        js : str
+            Unary operation string.
+        """
+        operand_str: str = _wrap_by_parentheses_if_binary_op(
+            expression=self.operand)
+        return f'{self.operator}{operand_str}'
+
+
+class Member(Expression):
+
+    target: Expression
+    name: str
+
+    def __init__(self, target: Expression, name: str) -> None:
+        """
+        Member access expression, e.g., `array_1.length`.
+
+        Parameters
+        ----------
+        target : Expression
+            Target (object) expression.
+        name : str
+            Member name.
+        """
+        self.target = target
+        self.name = name
+
+    def to_js(self) -> str:
+        """
+        Get a js text of this node.
+
+        Returns
+        -------
+        js : str
+            Member access string.
+        """
+        return f'{self.target.to_js()}.{self.name}'
+
+
+class Index(Expression):
+
+    target: Expression
+    index: Expression
+
+    def __init__(self, target: Expression, index: Expression) -> None:
+        """
+        Index access expression, e.g., `array_1[0]`.
+
+        Parameters
+        ----------
+        target : Expression
+            Target (array) expression.
+        index : Expression
+            Index expression.
+        """
+        self.target = target
+        self.index = index
+
+    def to_js(self) -> str:
+        """
+        Get a js text of this node.
+
+        Returns
+        -------
+        js : str
+            Index access string.
+        """
+        return f'{self.target.to_js()}[{self.index.to_js()}]'
+
+
+class Call(Expression):
+
+    callee: Expression
+    args: List[Expression]
+
+    def __init__(
+            self, callee: Expression,
+            args: Optional[List[Expression]] = None) -> None:
+        """
+        Function or method call expression, e.g., `array_1.pop()`.
+
+        Parameters
+        ----------
+        callee : Expression
+            Function expression, e.g., `Ref('parseInt')` or
+            `Member(Ref('array_1'), 'pop')`.
+        args : list of Expression or None, default None
+            Call arguments.
+        """
+        if args is None:
+            args = []
+        self.callee = callee
+        self.args = args
+
+    def to_js(self) -> str:
+        """
+        Get a js text of this node.
+
+        Returns
+        -------
+        js : str
+            Call string.
+        """
+        args_str: str = ', '.join(arg.to_js() for arg in self.args)
+        return f'{self.callee.to_js()}({args_str})'
+
+    def is_pure(self) -> bool:
+        """
+        Get a boolean whether this expression has no side effect.
+
+        Returns
+        -------
+        result : bool
+            If callee is the pure function or method (e.g., `parseInt`
+            or `concat`) and each argument has no side effect, True
+            will be returned.
+        """
+        if self.callee.to_js() not in PURE_FUNCTION_NAMES:
+            if not isinstance(self.callee, Member):
+                return False
+            if self.callee.name not in PURE_METHOD_NAMES:
+                return False
+        return super(Call, self).is_pure()
+
+    def get_self_mutating_target_name(self) -> Optional[str]:
+        """
+        Get a variable name that this call updates by the self
+        mutating method (e.g., `array_1.push(10)`).
+
+        Returns
+        -------
+        target_name : str or None
+            Target variable name. If this call is not a self mutating
+            method call of a variable, None will be returned.
+        """
+        if not isinstance(self.callee, Member):
+            return None
+        if not isinstance(self.callee.target, Ref):
+            return None
+        if self.callee.name not in SELF_MUTATING_METHOD_NAMES:
+            return None
+        return self.callee.target.name
+
+
+class Statement(Node):
+    """
+    Base class of each js statement node.
+    """
+
+    def get_stored_name(self) -> Optional[str]:
+        """
+        Get a variable name that this statement stores a value to.
+
+        Returns
+        -------
+        stored_name : str or None
+            Stored variable name. If this statement not stores any
+            variable, None will be returned.
+        """
+        return None
+
+    def is_pure_store(self) -> bool:
+        """
+        Get a boolean whether this statement only stores a value to
+        the variable (that is, has no other side effect).
+
+        Returns
+        -------
+        result : bool
+            If this statement is a pure store, True will be returned.
+        """
+        return False
+
+
+class VarDecl(Statement):
+
+    name: str
+    value: Expression
+
+    def __init__(self, name: str, value: Expression) -> None:
+        """
+        Variable declaration statement, e.g., `var int_1 = 10;`.
+
+        Parameters
+        ----------
+        name : str
+            Variable name to declare.
+        value : Expression
+            Initial value expression.
+        """
+        self.name = name
+        self.value = value
+
+    def to_js(self) -> str:
+        """
+        Get a js text of this node.
+
+        Returns
+        -------
+        js : str
+            Variable declaration string.
+        """
+        return f'var {self.name} = {self.value.to_js()};'
+
+    def get_stored_name(self) -> Optional[str]:
+        """
+        Get a variable name that this statement stores a value to.
+
+        Returns
+        -------
+        stored_name : str
+            Declared variable name.
+        """
+        return self.name
+
+    def is_pure_store(self) -> bool:
+        """
+        Get a boolean whether this statement only stores a value to
+        the variable (that is, has no other side effect).
+
+        Returns
+        -------
+        result : bool
+            If the value expression has no side effect, True will be
+            returned.
+        """
+        return self.value.is_pure()
+
+
+class Assign(Statement):
+
+    target: Expression
+    value: Expression
+    operator: str
+
+    def __init__(
+            self, target: Expression, value: Expression,
+            operator: str = '=') -> None:
+        """
+        Assignment statement, e.g., `int_1 = 10;` or `int_1 += 10;`.
+
+        Parameters
+        ----------
+        target : Expression
+            Assignment target, e.g., `Ref('int_1')` or
+            `Index(Ref('array_1'), Literal(0))`.
+        value : Expression
+            Value expression to assign.
+        operator : str, default '='
+            Assignment operator, e.g., `=` or `+=`.
+        """
+        self.target = target
+        self.value = value
+        self.operator = operator
+
+    def to_js(self) -> str:
+        """
+        Get a js text of this node.
+
+        Returns
+        -------
+        js : str
+            Assignment string.
+        """
+        return f'{self.target.to_js()} {self.operator} {self.value.to_js()};'
+
+    def get_read_names(self) -> Set[str]:
+        """
+        Get variable names that this node reads.
+
+        Returns
+        -------
+        read_names : set of str
+            Variable names that value expression reads. If target is
+            not a variable reference (e.g., `array_1[0]`) or operator
+            is a compound one (e.g., `+=`), target's names are also
+            included.
+        """
+        read_names: Set[str] = self.value.get_read_names()
+        if not isinstance(self.target, Ref) or self.operator != '=':
+            read_names |= self.target.get_read_names()
+        return read_names
+
+    def get_stored_name(self) -> Optional[str]:
+        """
+        Get a variable name that this statement stores a value to.
+
+        Returns
+        -------
+        stored_name : str or None
+            Target variable name. If target is not a variable
+            reference (e.g., `array_1[0]`), None will be returned.
+        """
+        if not isinstance(self.target, Ref):
+            return None
+        return self.target.name
+
+    def is_pure_store(self) -> bool:
+        """
+        Get a boolean whether this statement only stores a value to
+        the variable (that is, has no other side effect).
+
+        Returns
+        -------
+        result : bool
+            If target is a variable reference and the value expression
+            has no side effect, True will be returned.
+        """
+        if not isinstance(self.target, Ref):
+            return False
+        return self.value.is_pure()
+
+
+# Attribute names that have a specific svg.js method. Other attributes
+# will be updated by the `attr` method.
+_ATTR_METHOD_FORMATS: Dict[str, str] = {
+    'x': 'x({value})',
+    'y': 'y({value})',
+    'width': 'width({value})',
+    'height': 'height({value})',
+    'fill': 'fill({value})',
+    'fill-opacity': 'fill({{opacity: {value}}})',
+    'stroke': 'stroke({value})',
+    'stroke-opacity': 'stroke({{opacity: {value}}})',
+}
+
+
+class AttrSet(Statement):
+
+    target: Expression
+    attr_name: str
+    value: Expression
+    is_element_attr: bool
+
+    def __init__(
+            self, target: Expression, attr_name: str,
+            value: Expression, is_element_attr: bool = True) -> None:
+        """
+        Display object's attribute updating statement, e.g.,
+        `rectangle_1.x(10);`.
+
+        Parameters
+        ----------
+        target : Expression
+            Target display object, e.g., `Ref('rectangle_1')`.
+        attr_name : str
+            Svg attribute name, e.g., `x` or `fill-opacity`.
+        value : Expression
+            Attribute value to set.
+        is_element_attr : bool, default True
+            Whether the attribute is the target element's own svg
+            attribute or not. If True, this update is the same as
+            the `attr` method call (e.g., `rectangle_1.attr({x: 10})`)
+            and can be coalesced with the other updates. Container
+            (group) element's position is updated by the transform,
+            so False should be specified to it.
+        """
+        self.target = target
+        self.attr_name = attr_name
+        self.value = value
+        self.is_element_attr = is_element_attr
+
+    def to_js(self) -> str:
+        """
+        Get a js text of this node.
+
+        Returns
+        -------
+        js : str
+            Attribute updating string (svg.js method call).
+        """
+        value_str: str = self.value.to_js()
+        method_format: Optional[str] = _ATTR_METHOD_FORMATS.get(
+            self.attr_name)
+        if method_format is None:
+            attrs: ObjectLiteral = ObjectLiteral(
+                items={self.attr_name: self.value})
+            return f'{self.target.to_js()}.attr({attrs.to_js()});'
+        method_str: str = method_format.format(value=value_str)
+        return f'{self.target.to_js()}.{method_str};'
+
+
+class ExpressionStatement(Statement):
+
+    expression: Expression
+
+    def __init__(self, expression: Expression) -> None:
+        """
+        Statement of single expression (mainly call), e.g.,
+        `array_1.reverse();`.
+
+        Parameters
+        ----------
+        expression : Expression
+            Target expression.
+        """
+        self.expression = expression
+
+    def to_js(self) -> str:
+        """
+        Get a js text of this node.
+
+        Returns
+        -------
+        js : str
+            Expression statement string.
+        """
+        return f'{self.expression.to_js()};'
+
+    def get_stored_name(self) -> Optional[str]:
+        """
+        Get a variable name that this statement stores a value to.
+
+        Returns
+        -------
+        stored_name : str or None
+            If this statement is a self mutating method call (e.g.,
+            `array_1.push(10);`), target variable name will be
+            returned. Otherwise None will be returned.
+        """
+        if not isinstance(self.expression, Call):
+            return None
+        return self.expression.get_self_mutating_target_name()
+
+    def is_pure_store(self) -> bool:
+        """
+        Get a boolean whether this statement only stores a value to
+        the variable (that is, has no other side effect).
+
+        Returns
+        -------
+        result : bool
+            If this statement is a self mutating method call and each
+            argument has no side effect, True will be returned.
+        """
+        if not isinstance(self.expression, Call):
+            return False
+        if self.expression.get_self_mutating_target_name() is None:
+            return False
+        for arg in self.expression.args:
+            if not arg.is_pure():
+                return False
+        return True
+
+
+class Raw(Statement):
+
+    js: str
+
+    def __init__(self, js: str) -> None:
+        """
+        Raw js statements string (not analysable).
+
+        Parameters
+        ----------
+        js : str
+            JavaScript statements string.
+        """
+        self.js = js
+
+    def to_js(self) -> str:
+        """
+        Get a js text of this node.
+
+        Returns
+        -------
+        js : str
+            Raw js statements string.
+        """
+        return self.js
+
+    def get_read_names(self) -> Set[str]:
+        """
+        Get variable names that this node reads.
+
+        Returns
+        -------
+        read_names : set of str
+            Each identifier in the js string (raw statements can not
+            be analysed, so every identifier is regarded as read).
+        """
+        return set(_IDENTIFIER_SEARCH_PATTERN.findall(self.js))
+
+
+def get_value_expression(value: Any) -> Expression:
+    """
+    Get an expression node of specified value.
+
+    Parameters
+    ----------
+    value : *
+        Any value to convert.
+
+    Returns
+    -------
+    expression : Expression
+        If value is instance of VariableNameInterface, Ref node will
+        be returned (if that instance is not declared yet, its literal
+        value will be inlined instead). Typed array (e.g., NumPy's
+        array or `array.array`) will be converted to the
+        TypedArrayLiteral node, list or tuple value will be converted
+        to the ArrayLiteral node (if that value contains only the
+        primitive values, the Literal node of the copied tuple will be
+        returned instead to serialize the whole value at once), and
+        other value will be converted to the Literal node.
+    """
+    from apyscript.type.lazy_declaration_interface import \
+        LazyDeclarationInterface
+    from apyscript.type import typed_array_util
+    from apyscript.type import value_util
+    from apyscript.type.variable_name_interface import VariableNameInterface
+    if isinstance(value, LazyDeclarationInterface) \
+            and not value._is_declared:
+        return get_value_expression(value=value._undeclared_value)
+    if isinstance(value, VariableNameInterface):
+        return Ref(name=value.variable_name)
+    typed_array_name: Optional[str] = \
+        typed_array_util.get_typed_array_name(value=value)
+    if typed_array_name is not None:
+        return TypedArrayLiteral(
+            typed_array_name=typed_array_name,
+            base64_str=typed_array_util.get_base64_str(value=value))
+    if isinstance(value, (list, tuple)):
+        primitive_copy: Optional[tuple] = \
+            value_util.get_primitive_iterable_copy(value=value)
+        if primitive_copy is not None:
+            return Literal(value=primitive_copy)
+        return ArrayLiteral(
+            elements=[
+                get_value_expression(value=unit_value)
+                for unit_value in value])
+    return Literal(value=value)
+
+
+def make_method_call(
+        variable_name: str, method_name: str,
+        args: Optional[List[Expression]] = None) -> Call:
+    """
+    Make a method call expression node of specified variable.
+
+    Parameters
+    ----------
+    variable_name : str
+        Target variable name, e.g., `array_1`.
+    method_name : str
+        Method name to call, e.g., `push`.
+    args : list of Expression or None, default None
+        Call arguments.
+
+    Returns
+    -------
+    call : Call
+        Method call expression node, e.g., `array_1.push(10)`.
+    """
+    return Call(
+        callee=Member(target=Ref(name=variable_name), name=method_name),
+        args=args)
@@ -0,0 +1,470 @@
+"""Expression optimizer (export-time optimization passes of the
+statement nodes) implementations.
+
+Mainly following interfaces are defined:
+
+- OptimizationStats : The class that holds an optimization pass's
+    removed statements number and bytes.
+- ExpressionOptimizer : The class to apply each enabled optimization
+    pass to the statement nodes.
+- get_statements_bytes : Get a js text bytes of specified statements.
+- eliminate_dead_stores : Remove side-effect-free stores (variable
+    assignments and attribute updates) that are overwritten before
+    any read.
+- eliminate_dead_variables : Remove side-effect-free stores of the
+    variables that are never referenced.
+"""
+
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
+
+from apyscript.expression import expression_attr_coalescing
+from apyscript.expression import expression_constant_folding
+from apyscript.expression import expression_subexpression_elimination
+from apyscript.expression.expression_ir import Assign
+from apyscript.expression.expression_ir import AttrSet
+from apyscript.expression.expression_ir import ExpressionStatement
+from apyscript.expression.expression_ir import Index
+from apyscript.expression.expression_ir import Member
+from apyscript.expression.expression_ir import Ref
+from apyscript.expression.expression_ir import Statement
+from apyscript.expression.expression_ir import VarDecl
+
+_OptimizationPass = Callable[[List[Statement]], List[Statement]]
+
+
+class OptimizationStats:
+
+    pass_name: str
+    removed_statement_num: int
+    removed_bytes: int
+
+    def __init__(
+            self, pass_name: str, removed_statement_num: int,
+            removed_bytes: int) -> None:
+        """
+        The class that holds an optimization pass's removed statements
+        number and bytes.
+
+        Parameters
+        ----------
+        pass_name : str
+            Optimization pass name, e.g., `dead variable elimination`.
+        removed_statement_num : int
+            Number of the removed statements.
+        removed_bytes : int
+            Removed js text bytes.
+        """
+        self.pass_name = pass_name
+        self.removed_statement_num = removed_statement_num
+        self.removed_bytes = removed_bytes
+
+    def __repr__(self) -> str:
+        """
+        Get a representation string of this stats.
+
+        Returns
+        -------
+        repr_str : str
+            Representation string of this stats.
+        """
+        return (
+            f'{self.pass_name}: removed {self.removed_statement_num} '
+            f'statements ({self.removed_bytes} bytes)'
+        )
+
+
+class ExpressionOptimizer:
+
+    stats_list: List[OptimizationStats]
+    _passes: List[Tuple[str, _OptimizationPass]]
+
+    def __init__(
+            self, fold_constants: bool = False,
+            common_subexpression_elimination: bool = True,
+            dead_store_elimination: bool = True,
+            dead_variable_elimination: bool = True,
+            attr_update_coalescing: bool = True) -> None:
+        """
+        The class to apply each enabled optimization pass to the
+        statement nodes.
+
+        Parameters
+        ----------
+        fold_constants : bool, default False
+            Whether the operations on the known values will be
+            evaluated at the export time and replaced by literals or
+            not (e.g., `var number_5 = number_3 + 10;` will be
+            `var number_5 = 20;`). This is opt-in since the browser
+            will not recompute (check) these operations.
+        common_subexpression_elimination : bool, default True
+            Whether a pure expression that is already stored to a
+            variable will be replaced by that variable reference or
+            not (e.g., the second `array_1.length` when `array_1` is
+            not updated after the first one).
+        dead_store_elimination : bool, default True
+            Whether side-effect-free stores (variable assignments and
+            attribute updates) that are overwritten before any read
+            will be removed or not.
+        dead_variable_elimination : bool, default True
+            Whether side-effect-free stores of the variables that are
+            never referenced will be removed or not.
+        attr_update_coalescing : bool, default True
+            Whether the run of the attribute updates of the same
+            display object will be merged into one `attr` method call
+            or not (e.g., `rectangle_1.x(10);` and
+            `rectangle_1.y(20);` will be
+            `rectangle_1.attr({x: 10, y: 20});`).
+        """
+        self.stats_list = []
+        self._passes = []
+        if fold_constants:
+            self._passes.append(
+                ('constant folding',
+                 expression_constant_folding.fold_constants))
+        if common_subexpression_elimination:
+            self._passes.append(
+                ('common subexpression elimination',
+                 expression_subexpression_elimination.
+                 eliminate_common_subexpressions))
+        if dead_store_elimination:
+            self._passes.append(
+                ('dead store elimination', eliminate_dead_stores))
+        if dead_variable_elimination:
+            self._passes.append(
+                ('dead variable elimination', eliminate_dead_variables))
+        if attr_update_coalescing:
+            self._passes.append(
+                ('attribute updates coalescing',
+                 expression_attr_coalescing.coalesce_attr_updates))
+
+    def optimize(self, statements: List[Statement]) -> List[Statement]:
+        """
+        Apply each enabled optimization pass to specified statements.
+
+        Notes
+        -----
+        Specified list will not be updated. Each pass's stats will be
+        set to the `stats_list` attribute.
+
+        Parameters
+        ----------
+        statements : list of Statement
+            Statement nodes to optimize.
+
+        Returns
+        -------
+        statements : list of Statement
+            Optimized statement nodes.
+        """
+        self.stats_list = []
+        for pass_name, optimization_pass in self._passes:
+            before_statement_num: int = len(statements)
+            before_bytes: int = get_statements_bytes(statements=statements)
+            statements = optimization_pass(statements)
+            self.stats_list.append(
+                OptimizationStats(
+                    pass_name=pass_name,
+                    removed_statement_num=(
+                        before_statement_num - len(statements)),
+                    removed_bytes=(
+                        before_bytes
+                        - get_statements_bytes(statements=statements)),
+                ))
+        return statements
+
+
+def get_statements_bytes(statements: List[Statement]) -> int:
+    """
+    Get a js text bytes of specified statements.
+
+    Parameters
+    ----------
+    statements : list of Statement
+        Target statement nodes.
+
+    Returns
+    -------
+    statements_bytes : int
+        Total bytes of each statement's js text (UTF-8, including
+        a line break of each statement).
+    """
+    statements_bytes: int = 0
+    for statement in statements:
+        statements_bytes += len(statement.to_js().encode('utf-8')) + 1
+    return statements_bytes
+
+
+def eliminate_dead_stores(statements: List[Statement]) -> List[Statement]:
+    """
+    Remove side-effect-free stores (e.g., `int_1 = 10;` or
+    `rectangle_1.x(int_2);`) that are overwritten by the subsequent
+    store to the same variable or attribute before any read.
+
+    Notes
+    -----
+    If overwritten store is a variable declaration, overwriting
+    assignment will be converted to the declaration, e.g.,
+    `var int_1 = 10; int_1 = 20;` will be `var int_1 = 20;`.
+
+    Parameters
+    ----------
+    statements : list of Statement
+        Statement nodes to optimize.
+
+    Returns
+    -------
+    statements : list of Statement
+        Statement nodes that dead stores are removed.
+    """
+    result: Dict[int, Statement] = dict(enumerate(statements))
+    variable_store_indexes: Dict[str, int] = {}
+    attr_store_indexes: Dict[str, Dict[str, int]] = {}
+    for index, statement in enumerate(statements):
+        attr_set: Optional[AttrSet] = _get_variable_attr_set(
+            statement=statement)
+        if attr_set is None:
+            attr_read_names: Set[str] = statement.get_read_names()
+        else:
+            attr_read_names = attr_set.value.get_read_names()
+        stored_name: Optional[str] = statement.get_stored_name()
+        if stored_name is not None:
+            attr_read_names.add(stored_name)
+        for read_name in attr_read_names:
+            attr_store_indexes.pop(read_name, None)
+        for read_name in statement.get_read_names():
+            variable_store_indexes.pop(read_name, None)
+
+        if attr_set is not None:
+            _overwrite_attr_store(
+                attr_set=attr_set, index=index, result=result,
+                attr_store_indexes=attr_store_indexes)
+        if _is_variable_overwrite(statement=statement):
+            assert stored_name is not None
+            _overwrite_variable_store(
+                statement=statement, stored_name=stored_name, index=index,
+                result=result, variable_store_indexes=variable_store_indexes)
+        elif stored_name is not None:
+            # Self mutating method call (e.g., `array_1.push(10);`) may
+            # change the aliased value, so only the assignment will be
+            # removable.
+            variable_store_indexes.pop(stored_name, None)
+            if isinstance(statement, Assign) and statement.is_pure_store():
+                variable_store_indexes[stored_name] = index
+    return [result[index] for index in sorted(result.keys())]
+
+
+def _get_variable_attr_set(statement: Statement) -> Optional[AttrSet]:
+    """
+    Get an attribute updating statement of a variable (e.g.,
+    `rectangle_1.x(10);`) from specified statement.
+
+    Parameters
+    ----------
+    statement : Statement
+        Target statement node.
+
+    Returns
+    -------
+    attr_set : AttrSet or None
+        If specified statement is the attribute updating statement
+        of a variable, that statement will be returned. Otherwise
+        None will be returned.
+    """
+    if not isinstance(statement, AttrSet):
+        return None
+    if not isinstance(statement.target, Ref):
+        return None
+    return statement
+
+
+def _overwrite_attr_store(
+        attr_set: AttrSet, index: int, result: Dict[int, Statement],
+        attr_store_indexes: Dict[str, Dict[str, int]]) -> None:
+    """
+    Remove the previous (not read) store of the same attribute and
+    set specified attribute updating statement to the pending stores.
+
+    Parameters
+    ----------
+    attr_set : AttrSet
+        Attribute updating statement of a variable.
+    index : int
+        Index of the attribute updating statement.
+    result : dict
+        A dict that has statement indexes in key and (result)
+        statements in value. Removed statement's key will be deleted.
+    attr_store_indexes : dict
+        A dict that has target variable names in key and dicts (that
+        have attribute names in key and indexes of the not read pure
+        stores in value) in value.
+    """
+    assert isinstance(attr_set.target, Ref)
+    store_indexes: Dict[str, int] = attr_store_indexes.setdefault(
+        attr_set.target.name, {})
+    previous_index: Optional[int] = store_indexes.pop(
+        attr_set.attr_name, None)
+    if previous_index is not None:
+        del result[previous_index]
+    if attr_set.value.is_pure():
+        store_indexes[attr_set.attr_name] = index
+
+
+def _is_variable_overwrite(statement: Statement) -> bool:
+    """
+    Get a boolean whether specified statement overwrites a variable's
+    whole value (declaration or plain assignment to a variable).
+
+    Parameters
+    ----------
+    statement : Statement
+        Target statement node.
+
+    Returns
+    -------
+    result : bool
+        If specified statement overwrites a variable's whole value,
+        True will be returned.
+    """
+    if isinstance(statement, VarDecl):
+        return True
+    if not isinstance(statement, Assign):
+        return False
+    return isinstance(statement.target, Ref) and statement.operator == '='
+
+
+def _overwrite_variable_store(
+        statement: Statement, stored_name: str, index: int,
+        result: Dict[int, Statement],
+        variable_store_indexes: Dict[str, int]) -> None:
+    """
+    Remove the previous (not read) store of the same variable and set
+    specified statement to the pending stores.
+
+    Parameters
+    ----------
+    statement : Statement
+        Statement that overwrites a variable's whole value.
+    stored_name : str
+        Overwritten variable name.
+    index : int
+        Index of the overwriting statement.
+    result : dict
+        A dict that has statement indexes in key and (result)
+        statements in value. Removed statement's key will be deleted
+        and the overwriting assignment may be converted to the
+        declaration.
+    variable_store_indexes : dict
+        A dict that has variable names in key and indexes of the not
+        read pure stores in value.
+    """
+    previous_index: Optional[int] = variable_store_indexes.pop(
+        stored_name, None)
+    if previous_index is not None:
+        previous_statement: Statement = result.pop(previous_index)
+        if isinstance(previous_statement, VarDecl) \
+                and isinstance(statement, Assign):
+            result[index] = VarDecl(name=stored_name, value=statement.value)
+    if statement.is_pure_store():
+        variable_store_indexes[stored_name] = index
+
+
+def eliminate_dead_variables(
+        statements: List[Statement]) -> List[Statement]:
+    """
+    Remove side-effect-free stores (e.g., `var int_1 = 10;` or
+    `array_1.push(10);`) of the variables that are never referenced.
+
+    Notes
+    -----
+    Removing a store may make other variables unreferenced, so this
+    is repeated until no variable can be removed.
+
+    Parameters
+    ----------
+    statements : list of Statement
+        Statement nodes to optimize.
+
+    Returns
+    -------
+    statements : list of Statement
+        Statement nodes that dead variables' stores are removed.
+    """
+    read_names_list: List[Set[str]] = []
+    read_counts: Dict[str, int] = {}
+    store_indexes: Dict[str, List[int]] = {}
+    unremovable_names: Set[str] = set()
+    for index, statement in enumerate(statements):
+        read_names: Set[str] = statement.get_read_names()
+        stored_name: Optional[str] = statement.get_stored_name()
+        if stored_name is not None:
+            store_indexes.setdefault(stored_name, []).append(index)
+            if statement.is_pure_store():
+                read_names.discard(stored_name)
+            else:
+                unremovable_names.add(stored_name)
+        read_names_list.append(read_names)
+        for read_name in read_names:
+            read_counts[read_name] = read_counts.get(read_name, 0) + 1
+    unremovable_names |= _get_possibly_aliased_mutated_names(
+        statements=statements, store_indexes=store_indexes)
+
+    dead_names: List[str] = [
+        name for name in store_indexes
+        if name not in unremovable_names and read_counts.get(name, 0) == 0]
+    removed_indexes: Set[int] = set()
+    while dead_names:
+        dead_name: str = dead_names.pop()
+        for index in store_indexes[dead_name]:
+            removed_indexes.add(index)
+            for read_name in read_names_list[index]:
+                read_counts[read_name] -= 1
+                if read_counts[read_name] != 0:
+                    continue
+                if read_name not in store_indexes \
+                        or read_name in unremovable_names:
+                    continue
+                dead_names.append(read_name)
+    return [
+        statement for index, statement in enumerate(statements)
+        if index not in removed_indexes]
+
+
+def _get_possibly_aliased_mutated_names(
+        statements: List[Statement],
+        store_indexes: Dict[str, List[int]]) -> Set[str]:
+    """
+    Get variable names that are updated by the self mutating method
+    (e.g., `push`) and may refer to the other variable's value (in that
+    case, mutation affects to the other variable).
+
+    Parameters
+    ----------
+    statements : list of Statement
+        Target statement nodes.
+    store_indexes : dict
+        A dict that has variable names in key and indexes of the
+        statements that store to the variable in value.
+
+    Returns
+    -------
+    names : set of str
+        Possibly aliased and mutated variable names.
+    """
+    names: Set[str] = set()
+    for name, indexes in store_indexes.items():
+        stores: List[Statement] = [statements[index] for index in indexes]
+        is_mutated: bool = any(
+            isinstance(store, ExpressionStatement) for store in stores)
+        if not is_mutated:
+            continue
+        for store in stores:
+            if not isinstance(store, (VarDecl, Assign)):
+                continue
+            if isinstance(store.value, (Ref, Index, Member)):
+                names.add(name)
+    return names
@@ -0,0 +1,399 @@
+"""Expression store (the place each appended expression is held)
+implementations.
+
+Mainly following interfaces are defined:
+
+- ExpressionStore : Abstract base class of each expression store.
+- BufferExpressionStore : Expression store that holds expressions
+    in the process memory (default store).
+- FileExpressionStore : Expression store that appends expressions
+    to the text files.
+
+Each store holds html fragments and script statements as separate
+append-only segments, so appending cost is constant regardless of
+the current expression's size. Script statements are merged into
+a single script section only when the expression is read.
+
+Script statements are appended as expression IR nodes (see the
+`expression_ir` module), and BufferExpressionStore generates the
+js text of each node only when the expression is read. The script
+can also be read chunk by chunk (see the `iter_script_chunks`
+method) to write a large expression without the whole copy.
+"""
+
+import os
+from abc import ABC
+from abc import abstractmethod
+from typing import Iterator
+from typing import List
+from typing import Optional
+
+from apyscript.expression.expression_ir import Raw
+from apyscript.expression.expression_ir import Statement
+from apyscript.expression.expression_optimizer import ExpressionOptimizer
+from apyscript.file import file_util
+from apyscript.html import html_const
+from apyscript.html import html_util
+
+
+class ExpressionStore(ABC):
+
+    def append(self, expression: str) -> None:
+        """
+        Append html and js expression to this store.
+
+        Parameters
+        ----------
+        expression : str
+            HTML and js Expression string. Script section (inner
+            script tags) will be appended to the script segment and
+            others will be appended to the html segment.
+        """
+        html, script = html_util.split_html_and_script(
+            expression=expression)
+        if html != '':
+            self.append_html(html=html)
+        if script != '':
+            self.append_script(script=script)
+
+    @abstractmethod
+    def append_html(self, html: str) -> None:
+        """
+        Append html fragment to the html segment.
+
+        Parameters
+        ----------
+        html : str
+            HTML fragment string (not including script section).
+        """
+
+    @abstractmethod
+    def append_script(self, script: str) -> None:
+        """
+        Append js statements to the script segment.
+
+        Parameters
+        ----------
+        script : str
+            JavaScript statements string (not including script tags).
+        """
+
+    def append_statement(self, statement: Statement) -> None:
+        """
+        Append js statement node to the script segment.
+
+        Notes
+        -----
+        This default implementation appends the statement's js text
+        immediately. Subclass that can hold nodes should override
+        this method.
+
+        Parameters
+        ----------
+        statement : Statement
+            Statement node to append.
+        """
+        self.append_script(script=statement.to_js())
+
+    @abstractmethod
+    def get_html_expression(self) -> str:
+        """
+        Get a concatenated string of appended html fragments.
+
+        Returns
+        -------
+        html : str
+            Each html fragment that concatenated by line break.
+        """
+
+    @abstractmethod
+    def get_script_expression(self) -> str:
+        """
+        Get a concatenated string of appended js statements.
+
+        Returns
+        -------
+        script : str
+            Each js statement that concatenated by line break.
+        """
+
+    @abstractmethod
+    def get_script_statements(self) -> List[Statement]:
+        """
+        Get appended js statement nodes.
+
+        Returns
+        -------
+        statements : list of Statement
+            Appended statement nodes.
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        """
+        Clear appended expressions.
+        """
+
+    def iter_script_chunks(
+            self,
+            optimizer: Optional[ExpressionOptimizer] = None) -> Iterator[str]:
+        """
+        Iterate js text chunks (one chunk per statement) of the script
+        segment. Each chunk's js text is generated only when that
+        chunk is requested.
+
+        Parameters
+        ----------
+        optimizer : ExpressionOptimizer or None, default None
+            Optimizer to apply to the script statements. If None is
+            specified, statements will not be optimized.
+
+        Yields
+        ------
+        chunk : str
+            Js text of each statement. Second and subsequent chunks
+            start with the line break, so the concatenated chunks are
+            the same as the merged script string.
+        """
+        statements: List[Statement] = self.get_script_statements()
+        if optimizer is not None:
+            statements = optimizer.optimize(statements=statements)
+        for i, statement in enumerate(statements):
+            if i == 0:
+                yield statement.to_js()
+                continue
+            yield f'\n{statement.to_js()}'
+
+    def get_expression(
+            self, optimizer: Optional[ExpressionOptimizer] = None) -> str:
+        """
+        Get an expression string that html fragments and single
+        (merged) script section are concatenated.
+
+        Parameters
+        ----------
+        optimizer : ExpressionOptimizer or None, default None
+            Optimizer to apply to the script statements. If None is
+            specified, statements will not be optimized. Appended
+            statements themselves are not updated by the optimizer.
+
+        Returns
+        -------
+        expression : str
+            Concatenated expression string.
+        """
+        html: str = self.get_html_expression()
+        script: str = ''.join(self.iter_script_chunks(optimizer=optimizer))
+        if script == '':
+            return html
+        expression: str = html
+        if expression != '':
+            expression += '\n'
+        expression += (
+            f'{html_const.SCRIPT_START_TAG}'
+            f'\n{script}'
+            f'\n{html_const.SCRIPT_END_TAG}'
+        )
+        return expression
+
+
+class BufferExpressionStore(ExpressionStore):
+
+    _html_segments: List[str]
+    _script_segments: List[Statement]
+
+    def __init__(self) -> None:
+        """
+        Expression store that holds expressions in the process memory.
+        """
+        self._html_segments = []
+        self._script_segments = []
+
+    def append_html(self, html: str) -> None:
+        """
+        Append html fragment to the html segment.
+
+        Parameters
+        ----------
+        html : str
+            HTML fragment string (not including script section).
+        """
+        self._html_segments.append(html)
+
+    def append_script(self, script: str) -> None:
+        """
+        Append js statements to the script segment.
+
+        Parameters
+        ----------
+        script : str
+            JavaScript statements string (not including script tags).
+        """
+        self._script_segments.append(Raw(js=script))
+
+    def append_statement(self, statement: Statement) -> None:
+        """
+        Append js statement node to the script segment (js text will
+        be generated when the expression is read).
+
+        Parameters
+        ----------
+        statement : Statement
+            Statement node to append.
+        """
+        self._script_segments.append(statement)
+
+    def get_html_expression(self) -> str:
+        """
+        Get a concatenated string of buffered html fragments.
+
+        Returns
+        -------
+        html : str
+            Each html fragment that concatenated by line break.
+        """
+        return '\n'.join(self._html_segments)
+
+    def get_script_expression(self) -> str:
+        """
+        Get a concatenated string of buffered js statements.
+
+        Returns
+        -------
+        script : str
+            Each js statement that concatenated by line break.
+        """
+        return '\n'.join(
+            statement.to_js() for statement in self._script_segments)
+
+    def get_script_statements(self) -> List[Statement]:
+        """
+        Get buffered js statement nodes.
+
+        Returns
+        -------
+        statements : list of Statement
+            Buffered statement nodes (copied list).
+        """
+        return list(self._script_segments)
+
+    def clear(self) -> None:
+        """
+        Clear buffered expressions.
+        """
+        self._html_segments.clear()
+        self._script_segments.clear()
+
+
+class FileExpressionStore(ExpressionStore):
+
+    html_file_path: str
+    script_file_path: str
+
+    def __init__(self, html_file_path: str, script_file_path: str) -> None:
+        """
+        Expression store that appends expressions to the text files.
+
+        Parameters
+        ----------
+        html_file_path : str
+            Destination text file path of html fragments.
+        script_file_path : str
+            Destination text file path of js statements.
+        """
+        self.html_file_path = html_file_path
+        self.script_file_path = script_file_path
+
+    def append_html(self, html: str) -> None:
+        """
+        Append html fragment to the html file.
+
+        Parameters
+        ----------
+        html : str
+            HTML fragment string (not including script section).
+        """
+        file_util.append_plain_txt(
+            txt=f'{html}\n', file_path=self.html_file_path)
+
+    def append_script(self, script: str) -> None:
+        """
+        Append js statements to the script file.
+
+        Parameters
+        ----------
+        script : str
+            JavaScript statements string (not including script tags).
+        """
+        file_util.append_plain_txt(
+            txt=f'{script}\n', file_path=self.script_file_path)
+
+    def get_html_expression(self) -> str:
+        """
+        Get a html file's string.
+
+        Returns
+        -------
+        html : str
+            HTML file's string. If file is not exists, blank
+            string will be returned.
+        """
+        return _read_txt_if_exists(file_path=self.html_file_path)
+
+    def get_script_expression(self) -> str:
+        """
+        Get a script file's string.
+
+        Returns
+        -------
+        script : str
+            Script file's string. If file is not exists, blank
+            string will be returned.
+        """
+        return _read_txt_if_exists(file_path=self.script_file_path)
+
+    def get_script_statements(self) -> List[Statement]:
+        """
+        Get js statements of the script file.
+
+        Returns
+        -------
+        statements : list of Statement
+            A list that contains single Raw node of the script file's
+            string (file's statements can not be analysed). If file
+            is not exists, blank list will be returned.
+        """
+        script: str = self.get_script_expression()
+        if script == '':
+            return []
+        return [Raw(js=script)]
+
+    def clear(self) -> None:
+        """
+        Remove the html and script files.
+        """
+        file_util.remove_file_if_exists(file_path=self.html_file_path)
+        file_util.remove_file_if_exists(file_path=self.script_file_path)
+
+
+def _read_txt_if_exists(file_path: str) -> str:
+    """
+    Read specified file's text if exists.
+
+    Parameters
+    ----------
+    file_path : str
+        File path to read.
+
+    Returns
+    -------
+    txt : str
+        Target file's text (last line break is removed). If file is
+        not exists, blank string will be returned.
+    """
+    if not os.path.isfile(file_path):
+        return ''
+    txt: str = file_util.read_txt(file_path=file_path)
+    if txt.endswith('\n'):
+        txt = txt[:-1]
+    return txt
@@ -0,0 +1,465 @@
+"""Common subexpression elimination (reuse of the earlier result
+variable of the same pure expression) implementations.
+
+Mainly following interfaces are defined:
+
+- eliminate_common_subexpressions : Replace a pure expression that
+    is already stored to a variable by that variable reference.
+"""
+
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Set
+
+from apyscript.expression.expression_ir import ArrayLiteral
+from apyscript.expression.expression_ir import Assign
+from apyscript.expression.expression_ir import AttrSet
+from apyscript.expression.expression_ir import BinaryOp
+from apyscript.expression.expression_ir import Call
+from apyscript.expression.expression_ir import Expression
+from apyscript.expression.expression_ir import ExpressionStatement
+from apyscript.expression.expression_ir import Literal
+from apyscript.expression.expression_ir import Member
+from apyscript.expression.expression_ir import ObjectLiteral
+from apyscript.expression.expression_ir import Raw
+from apyscript.expression.expression_ir import Ref
+from apyscript.expression.expression_ir import Statement
+from apyscript.expression.expression_ir import TypedArrayLiteral
+from apyscript.expression.expression_ir import UnaryOp
+from apyscript.expression.expression_ir import VarDecl
+
+# Calls that return a primitive value (the result never aliases the
+# arguments).
+_PRIMITIVE_RESULT_FUNCTION_NAMES: Set[str] = {
+    'Boolean', 'parseInt', 'JSON.stringify', '_.isEqual', '_.isUndefined',
+}
+_PRIMITIVE_RESULT_METHOD_NAMES: Set[str] = {
+    'indexOf', 'join', 'has', 'repeat',
+}
+
+# Calls that return a new object (e.g., a copied array) every time.
+_FRESH_OBJECT_FUNCTION_NAMES: Set[str] = {'JSON.parse'}
+_FRESH_OBJECT_METHOD_NAMES: Set[str] = {'concat', 'slice', 'children'}
+
+
+def eliminate_common_subexpressions(
+        statements: List[Statement]) -> List[Statement]:
+    """
+    Replace a pure expression that is already stored to a variable
+    (e.g., the second `array_1.length` of `int_1 = array_1.length;`
+    and `int_2 = array_1.length;`) by that variable reference (e.g.,
+    `int_2 = int_1;`).
+
+    Notes
+    -----
+    An expression is reusable until the variables it reads or its
+    result variable are stored or possibly mutated (e.g., by the
+    `push` or `sort` method, including the mutation via aliased
+    variables). A new object expression (e.g., a copy by
+    `JSON.parse(JSON.stringify(array_1))`) is reused only if neither
+    of the variables is mutated, since they will share one object.
+
+    Parameters
+    ----------
+    statements : list of Statement
+        Statement nodes to optimize.
+
+    Returns
+    -------
+    statements : list of Statement
+        Statement nodes that common subexpressions are replaced.
+    """
+    alias_groups: Dict[str, Set[str]] = _get_alias_groups(
+        statements=statements)
+    mutated_names: Set[str] = _get_possibly_mutated_names(
+        statements=statements, alias_groups=alias_groups)
+    available: Dict[Expression, str] = {}
+    dependent_expressions: Dict[str, Set[Expression]] = {}
+    result: List[Statement] = []
+    for statement in statements:
+        statement = _reuse_available_expression(
+            statement=statement, available=available,
+            mutated_names=mutated_names)
+        if isinstance(statement, Raw):
+            available.clear()
+            dependent_expressions.clear()
+        for name in _get_affected_names(
+                statement=statement, alias_groups=alias_groups):
+            for expression in dependent_expressions.pop(name, set()):
+                available.pop(expression, None)
+        _register_available_expression(
+            statement=statement, available=available,
+            dependent_expressions=dependent_expressions)
+        result.append(statement)
+    return result
+
+
+def _get_alias_groups(statements: List[Statement]) -> Dict[str, Set[str]]:
+    """
+    Get the groups of the variables that may refer the same object
+    (or its element).
+
+    Parameters
+    ----------
+    statements : list of Statement
+        Target statement nodes.
+
+    Returns
+    -------
+    alias_groups : dict
+        A dict that has variable names in key and the (shared) set of
+        the variable names of the same group in value. Variable that
+        never aliases others will not be included.
+    """
+    alias_groups: Dict[str, Set[str]] = {}
+    for statement in statements:
+        names: Set[str] = _get_aliasing_names(statement=statement)
+        if len(names) < 2:
+            continue
+        group: Set[str] = set()
+        for name in names:
+            group |= alias_groups.get(name, {name})
+        for name in group:
+            alias_groups[name] = group
+    return alias_groups
+
+
+def _get_aliasing_names(statement: Statement) -> Set[str]:
+    """
+    Get the variable names that may refer the same object (or its
+    element) after specified statement, e.g., `array_2` and `array_1`
+    of `var array_2 = array_1;` or `array_1.push(array_2);`.
+
+    Parameters
+    ----------
+    statement : Statement
+        Target statement node.
+
+    Returns
+    -------
+    names : set of str
+        Aliasing variable names.
+    """
+    if isinstance(statement, AttrSet) or _is_console_call_statement(
+            statement=statement):
+        return set()
+    if isinstance(statement, (VarDecl, Assign)):
+        value: Expression = statement.value
+        if _is_primitive_result_expression(expression=value) \
+                or _is_call_of(
+                    expression=value,
+                    function_names=_FRESH_OBJECT_FUNCTION_NAMES):
+            return set()
+    names: Set[str] = statement.get_read_names()
+    stored_name: Optional[str] = statement.get_stored_name()
+    if stored_name is not None:
+        names.add(stored_name)
+    return names
+
+
+def _get_possibly_mutated_names(
+        statements: List[Statement],
+        alias_groups: Dict[str, Set[str]]) -> Set[str]:
+    """
+    Get the variable names whose object may be mutated (e.g., by the
+    `push` method, index assignment, or raw statements) somewhere in
+    specified statements.
+
+    Parameters
+    ----------
+    statements : list of Statement
+        Target statement nodes.
+    alias_groups : dict
+        A dict that has variable names in key and the set of the
+        variable names of the same alias group in value.
+
+    Returns
+    -------
+    names : set of str
+        Possibly mutated variable names (including aliases).
+    """
+    names: Set[str] = set()
+    for statement in statements:
+        if _is_console_call_statement(statement=statement):
+            continue
+        if isinstance(statement, (VarDecl, Assign)) \
+                and _get_stored_ref(statement=statement) is not None:
+            if not statement.value.is_pure():
+                names |= statement.value.get_read_names()
+            continue
+        names |= statement.get_read_names()
+    return _expand_by_alias_groups(names=names, alias_groups=alias_groups)
+
+
+def _get_stored_ref(statement: Statement) -> Optional[Ref]:
+    """
+    Get a stored variable reference of specified plain store
+    statement (e.g., `var int_1 = 10;` or `int_1 = 10;`).
+
+    Parameters
+    ----------
+    statement : Statement
+        Target statement node.
+
+    Returns
+    -------
+    ref : Ref or None
+        Stored variable reference. If specified statement is not a
+        plain store to a variable (e.g., `int_1 += 10;` or
+        `array_1[0] = 10;`), None will be returned.
+    """
+    if isinstance(statement, VarDecl):
+        return Ref(name=statement.name)
+    if not isinstance(statement, Assign) or statement.operator != '=':
+        return None
+    if not isinstance(statement.target, Ref):
+        return None
+    return statement.target
+
+
+def _is_console_call_statement(statement: Statement) -> bool:
+    """
+    Get a boolean whether specified statement is a console method
+    call with pure arguments (e.g., `console.log(int_1);`), that
+    never mutates the arguments.
+
+    Parameters
+    ----------
+    statement : Statement
+        Target statement node.
+
+    Returns
+    -------
+    result : bool
+        If specified statement is a console method call, True will
+        be returned.
+    """
+    if not isinstance(statement, ExpressionStatement):
+        return False
+    expression: Expression = statement.expression
+    if not isinstance(expression, Call):
+        return False
+    if not isinstance(expression.callee, Member):
+        return False
+    if expression.callee.target != Ref(name='console'):
+        return False
+    return all(arg.is_pure() for arg in expression.args)
+
+
+def _expand_by_alias_groups(
+        names: Set[str], alias_groups: Dict[str, Set[str]]) -> Set[str]:
+    """
+    Add aliasing variable names to specified names.
+
+    Parameters
+    ----------
+    names : set of str
+        Target variable names.
+    alias_groups : dict
+        A dict that has variable names in key and the set of the
+        variable names of the same alias group in value.
+
+    Returns
+    -------
+    names : set of str
+        Variable names that aliases are added.
+    """
+    expanded: Set[str] = set(names)
+    for name in names:
+        expanded |= alias_groups.get(name, set())
+    return expanded
+
+
+def _reuse_available_expression(
+        statement: Statement, available: Dict[Expression, str],
+        mutated_names: Set[str]) -> Statement:
+    """
+    Replace specified store statement's value by the earlier result
+    variable reference if the same expression is available.
+
+    Parameters
+    ----------
+    statement : Statement
+        Target statement node.
+    available : dict
+        A dict that has available expressions in key and the result
+        variable names in value.
+    mutated_names : set of str
+        Possibly mutated variable names.
+
+    Returns
+    -------
+    statement : Statement
+        Replaced (or specified) statement node.
+    """
+    ref: Optional[Ref] = _get_stored_ref(statement=statement)
+    if ref is None:
+        return statement
+    assert isinstance(statement, (VarDecl, Assign))
+    result_name: Optional[str] = available.get(statement.value)
+    if result_name is None or result_name == ref.name:
+        return statement
+    if _is_fresh_object_expression(expression=statement.value) and (
+            result_name in mutated_names or ref.name in mutated_names):
+        return statement
+    if isinstance(statement, VarDecl):
+        return VarDecl(name=statement.name, value=Ref(name=result_name))
+    return Assign(target=ref, value=Ref(name=result_name))
+
+
+def _get_affected_names(
+        statement: Statement, alias_groups: Dict[str, Set[str]]) -> Set[str]:
+    """
+    Get the variable names that may be stored or mutated by specified
+    statement.
+
+    Parameters
+    ----------
+    statement : Statement
+        Target statement node.
+    alias_groups : dict
+        A dict that has variable names in key and the set of the
+        variable names of the same alias group in value.
+
+    Returns
+    -------
+    names : set of str
+        Affected variable names (including aliases).
+    """
+    names: Set[str] = set()
+    if _is_console_call_statement(statement=statement):
+        return names
+    stored_name: Optional[str] = statement.get_stored_name()
+    if stored_name is not None:
+        names.add(stored_name)
+    is_pure_plain_store: bool = (
+        _get_stored_ref(statement=statement) is not None
+        and statement.is_pure_store())
+    if not is_pure_plain_store:
+        names |= statement.get_read_names()
+    return _expand_by_alias_groups(names=names, alias_groups=alias_groups)
+
+
+def _register_available_expression(
+        statement: Statement, available: Dict[Expression, str],
+        dependent_expressions: Dict[str, Set[Expression]]) -> None:
+    """
+    Register specified store statement's value as an available
+    expression.
+
+    Parameters
+    ----------
+    statement : Statement
+        Target statement node.
+    available : dict
+        A dict that has available expressions in key and the result
+        variable names in value.
+    dependent_expressions : dict
+        A dict that has variable names in key and the set of the
+        available expressions that depend on (read or are stored to)
+        that variable in value.
+    """
+    ref: Optional[Ref] = _get_stored_ref(statement=statement)
+    if ref is None:
+        return
+    assert isinstance(statement, (VarDecl, Assign))
+    value: Expression = statement.value
+    if isinstance(value, Ref) or not value.is_pure():
+        return
+    if isinstance(value, Literal) and not _is_fresh_object_expression(
+            expression=value):
+        return
+    read_names: Set[str] = value.get_read_names()
+    if ref.name in read_names:
+        return
+    available[value] = ref.name
+    for name in read_names | {ref.name}:
+        dependent_expressions.setdefault(name, set()).add(value)
+
+
+def _is_call_of(
+        expression: Expression, function_names: Set[str],
+        method_names: Optional[Set[str]] = None) -> bool:
+    """
+    Get a boolean whether specified expression is a call of one of
+    the specified functions or methods.
+
+    Parameters
+    ----------
+    expression : Expression
+        Target expression node.
+    function_names : set of str
+        Function names, e.g., `JSON.parse`.
+    method_names : set of str or None, default None
+        Method names, e.g., `concat`.
+
+    Returns
+    -------
+    result : bool
+        If specified expression is a call of one of the functions or
+        methods, True will be returned.
+    """
+    if not isinstance(expression, Call):
+        return False
+    if expression.callee.to_js() in function_names:
+        return True
+    if method_names is None:
+        return False
+    return isinstance(expression.callee, Member) \
+        and expression.callee.name in method_names
+
+
+def _is_primitive_result_expression(expression: Expression) -> bool:
+    """
+    Get a boolean whether specified expression's result is a
+    primitive value (e.g., number or string).
+
+    Parameters
+    ----------
+    expression : Expression
+        Target expression node.
+
+    Returns
+    -------
+    result : bool
+        If specified expression's result is a primitive value, True
+        will be returned.
+    """
+    if isinstance(expression, (BinaryOp, UnaryOp)):
+        return True
+    if isinstance(expression, Literal):
+        return not _is_fresh_object_expression(expression=expression)
+    if isinstance(expression, Member):
+        return expression.name == 'length'
+    return _is_call_of(
+        expression=expression,
+        function_names=_PRIMITIVE_RESULT_FUNCTION_NAMES,
+        method_names=_PRIMITIVE_RESULT_METHOD_NAMES)
+
+
+def _is_fresh_object_expression(expression: Expression) -> bool:
+    """
+    Get a boolean whether specified expression creates a new object
+    every time (e.g., array literal or copy).
+
+    Parameters
+    ----------
+    expression : Expression
+        Target expression node.
+
+    Returns
+    -------
+    result : bool
+        If specified expression creates a new object, True will be
+        returned.
+    """
+    if isinstance(
+            expression, (ArrayLiteral, ObjectLiteral, TypedArrayLiteral)):
+        return True
+    if isinstance(expression, Literal):
+        return isinstance(expression.value, (list, tuple, dict))
+    return _is_call_of(
+        expression=expression,
+        function_names=_FRESH_OBJECT_FUNCTION_NAMES,
+        method_names=_FRESH_OBJECT_METHOD_NAMES)
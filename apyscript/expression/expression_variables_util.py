@@ -1,13 +1,139 @@
 """Implementations to manipulate expression variable name
 related interface.
+
+Mainly following interfaces are defined:
+
+- VariableNameAllocator : The class to allocate each type's next
+    variable name in the process memory.
+- get_variable_name_allocator : Get a current variable name
+    allocator.
+- get_next_variable_name : Get next variable name of specified
+    type name.
+- reset_variable_names : Reset each type's allocated variable names.
+- save_variable_names_files : Save each type's allocated variable
+    names to files (snapshot).
+- restore_variable_names_from_files : Restore each type's allocated
+    variable names from files.
+- get_variable_names_file_path : Get a file path of saving
+    variable names.
 """
 
 import os
+from typing import Dict
 from typing import List
+from typing import Optional
 
+from apyscript.expression import build_session
 from apyscript.expression import expression_file_util
 from apyscript.file import file_util
 
+_VARIABLE_NAMES_FILE_PREFIX: str = 'variables_'
+_VARIABLE_NAMES_FILE_EXTENSION: str = '.txt'
+
+
+class VariableNameAllocator:
+
+    _variable_nums: Dict[str, int]
+
+    def __init__(self) -> None:
+        """
+        The class to allocate each type's next variable name in the
+        process memory (only a last number of each type is held).
+        """
+        self._variable_nums = {}
+
+    def get_next_variable_name(self, type_name: str) -> str:
+        """
+        Allocate next variable name of specified type name.
+
+        Parameters
+        ----------
+        type_name : str
+            Any type name, e.g., `sprite`.
+
+        Returns
+        -------
+        variable_name : str
+            Next variable name, e.g., `sprite_3`.
+        """
+        next_variable_num: int = self._variable_nums.get(type_name, 0) + 1
+        self._variable_nums[type_name] = next_variable_num
+        variable_name: str = _make_variable_name(
+            type_name=type_name, variable_num=next_variable_num)
+        return variable_name
+
+    def get_last_variable_num(self, type_name: str) -> int:
+        """
+        Get a last allocated variable number of specified type name.
+
+        Parameters
+        ----------
+        type_name : str
+            Any type name, e.g., `sprite`.
+
+        Returns
+        -------
+        last_variable_num : int
+            Last allocated variable number. If there is no allocated
+            variable, 0 will be returned.
+        """
+        return self._variable_nums.get(type_name, 0)
+
+    def get_type_names(self) -> List[str]:
+        """
+        Get type names that have allocated variables.
+
+        Returns
+        -------
+        type_names : list of str
+            Type names, e.g., ['int', 'sprite'].
+        """
+        return list(self._variable_nums.keys())
+
+    def snapshot(self) -> Dict[str, int]:
+        """
+        Get a snapshot of each type's last allocated variable number.
+
+        Returns
+        -------
+        snapshot : dict
+            A dict that has type names in key and last allocated
+            variable numbers in value.
+        """
+        return dict(self._variable_nums)
+
+    def restore(self, snapshot: Dict[str, int]) -> None:
+        """
+        Restore each type's last allocated variable number.
+
+        Parameters
+        ----------
+        snapshot : dict
+            A dict that has type names in key and last allocated
+            variable numbers in value (`snapshot` method's result).
+        """
+        self._variable_nums = dict(snapshot)
+
+    def clear(self) -> None:
+        """
+        Clear each type's allocated variable numbers.
+        """
+        self._variable_nums.clear()
+
+
+def get_variable_name_allocator() -> VariableNameAllocator:
+    """
+    Get a current variable name allocator.
+
+    Returns
+    -------
+    variable_name_allocator : VariableNameAllocator
+        Current build session's variable name allocator.
+    """
+    allocator: VariableNameAllocator = \
+        build_session.get_current_session().variable_name_allocator
+    return allocator
+
 
 def get_next_variable_name(type_name: str) -> str:
     """
@@ -16,7 +142,8 @@ def get_next_variable_name(type_name: str) -> str:
     Notes
     -----
     If call this function multiple times, then returned number will be
-    increased.
+    increased. Variable names are allocated in the process memory and
+    files are not read or written.
 
     Parameters
     ----------
@@ -32,14 +159,18 @@ def get_next_variable_name(type_name: str) -> str:
     variable_name : str
         Next variable name.
     """
-    next_variable_num: int = _get_next_variable_num(
-        type_name=type_name)
-    variable_name = _make_variable_name(
-        type_name=type_name, variable_num=next_variable_num)
-    _save_next_variable_name_to_file(type_name=type_name)
+    variable_name: str = get_variable_name_allocator().\
+        get_next_variable_name(type_name=type_name)
     return variable_name
 
 
+def reset_variable_names() -> None:
+    """
+    Reset each type's allocated variable names.
+    """
+    get_variable_name_allocator().clear()
+
+
 def _make_variable_name(type_name: str, variable_num: int) -> str:
     """
     Make variable name from type name and variable num.
@@ -60,26 +191,65 @@ def _make_variable_name(type_name: str, variable_num: int) -> str:
     return variable_name
 
 
-def _get_next_variable_num(type_name: str) -> int:
+def save_variable_names_files() -> List[str]:
     """
-    Get a next variable number.
+    Save each type's allocated variable names to files (snapshot).
 
-    Parameters
-    ----------
-    type_name : str
-        Any type name, e.g., `sprite`.
+    Notes
+    -----
+    Each file's format is same as the `variables_{type_name}.txt`
+    file, e.g., `sprite_1,sprite_2,`. If current build session not
+    saves any file, nothing will be saved.
 
     Returns
     -------
-    next_variable_num : int
-        Next variable number (start from 1).
+    file_paths : list of str
+        Saved file paths.
     """
-    variable_names: List[str] = _read_variable_names(
-        type_name=type_name)
-    if not variable_names:
-        return 1
-    last_num: int = int(variable_names[-1].split('_')[-1])
-    return last_num + 1
+    file_paths: List[str] = []
+    if expression_file_util.get_expression_root_dir() is None:
+        return file_paths
+    allocator: VariableNameAllocator = get_variable_name_allocator()
+    for type_name in allocator.get_type_names():
+        last_variable_num: int = allocator.get_last_variable_num(
+            type_name=type_name)
+        variable_names: List[str] = [
+            _make_variable_name(type_name=type_name, variable_num=i)
+            for i in range(1, last_variable_num + 1)]
+        file_path: str = get_variable_names_file_path(type_name=type_name)
+        file_util.save_plain_txt(
+            txt=f'{",".join(variable_names)},', file_path=file_path)
+        file_paths.append(file_path)
+    return file_paths
+
+
+def restore_variable_names_from_files() -> None:
+    """
+    Restore each type's allocated variable names from files (files
+    saved by `save_variable_names_files`).
+    """
+    snapshot: Dict[str, int] = {}
+    expression_root_dir: Optional[str] = \
+        expression_file_util.get_expression_root_dir()
+    if expression_root_dir is not None \
+            and os.path.isdir(expression_root_dir):
+        file_names: List[str] = os.listdir(expression_root_dir)
+    else:
+        file_names = []
+    for file_name in file_names:
+        if not file_name.startswith(_VARIABLE_NAMES_FILE_PREFIX):
+            continue
+        if not file_name.endswith(_VARIABLE_NAMES_FILE_EXTENSION):
+            continue
+        type_name: str = file_name[
+            len(_VARIABLE_NAMES_FILE_PREFIX):
+            -len(_VARIABLE_NAMES_FILE_EXTENSION)]
+        variable_names: List[str] = _read_variable_names(
+            type_name=type_name)
+        if not variable_names:
+            continue
+        snapshot[type_name] = int(variable_names[-1].split('_')[-1])
+    get_variable_name_allocator().restore(snapshot=snapshot)
 
 
 def _read_variable_names(type_name: str) -> List[str]:
@@ -103,29 +273,12 @@ def _read_variable_names(type_name: str) -> List[str]:
         return []
     variables_str: str = file_util.read_txt(file_path=file_path)
     variables_str = variables_str.strip(',')
+    if variables_str == '':
+        return []
     variable_names: List[str] = variables_str.split(',')
     return variable_names
 
 
-def _save_next_variable_name_to_file(type_name: str) -> None:
-    """
-    Save next variable's name to file.
-
-    Parameters
-    ----------
-    type_name : str
-        Any type name, e.g., `sprite`.
-    """
-    file_path: str = get_variable_names_file_path(
-        type_name=type_name)
-    next_variable_num: int = _get_next_variable_num(
-        type_name=type_name)
-    variable_name: str = _make_variable_name(
-        type_name=type_name, variable_num=next_variable_num)
-    file_util.append_plain_txt(
-        txt=f'{variable_name},', file_path=file_path)
-
-
 def get_variable_names_file_path(type_name: str) -> str:
     """
     Get a file path of saving variable names.
@@ -138,10 +291,16 @@ def get_variable_names_file_path(type_name: str) -> str:
     Returns
     -------
     file_path : str
-        Specified type name's target file path.
+        Specified type name's target file path (under the current
+        build session's expression root directory).
     """
+    expression_root_dir: Optional[str] = \
+        expression_file_util.get_expression_root_dir()
+    if expression_root_dir is None:
+        expression_root_dir = expression_file_util.EXPRESSION_ROOT_DIR
     file_path: str = os.path.join(
-        expression_file_util.EXPRESSION_ROOT_DIR,
-        f'variables_{type_name}.txt',
+        expression_root_dir,
+        f'{_VARIABLE_NAMES_FILE_PREFIX}{type_name}'
+        f'{_VARIABLE_NAMES_FILE_EXTENSION}',
     )
     return file_path
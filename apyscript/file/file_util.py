@@ -3,6 +3,7 @@
 
 import os
 import shutil
+import threading
 from types import ModuleType
 
 
@@ -90,6 +91,46 @@ def remove_file_if_exists(file_path: str) -> None:
     os.remove(file_path)
 
 
+def get_tmp_file_path(file_path: str) -> str:
+    """
+    Get a temporary file path to replace specified file atomically
+    (the temporary file is in the same directory).
+
+    Parameters
+    ----------
+    file_path : str
+        Target file path.
+
+    Returns
+    -------
+    tmp_file_path : str
+        Temporary file path that is unique for each process and
+        thread, e.g., 'index.html.1234.5678.tmp'.
+    """
+    return f'{file_path}.{os.getpid()}.{threading.get_ident()}.tmp'
+
+
+def save_bytes_atomically(data: bytes, file_path: str) -> None:
+    """
+    Save bytes to file atomically (readers never see the partially
+    written file).
+
+    Parameters
+    ----------
+    data : bytes
+        Bytes to save.
+    file_path : str
+        Destination file path.
+    """
+    dir_path: str = get_abs_directory_path_from_file_path(
+        file_path=file_path)
+    os.makedirs(dir_path, exist_ok=True)
+    tmp_file_path: str = get_tmp_file_path(file_path=file_path)
+    with open(tmp_file_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_file_path, file_path)
+
+
 def get_abs_directory_path_from_file_path(file_path: str) -> str:
     """
     Get an absolute directory path of specified file.
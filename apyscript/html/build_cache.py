@@ -0,0 +1,395 @@
+"""Build result (exported html) cache implementations.
+
+Mainly following interfaces are defined:
+
+- BuildCache : The class that caches each exported html by the
+    fingerprint of the build script, input files, apyscript version,
+    and export options.
+
+Cached html is restored without calling the build function (i.e., any
+Stage or Sprite code is not executed):
+
+>>> build_cache = BuildCache(cache_dir_path='../.build_cache/')
+>>> def build() -> None:
+...     stage = Stage(stage_elem_id='line-graph')
+>>> build_cache.export(
+...     build_func=build, dest_dir_path='./line/',
+...     input_file_paths=['./line.csv'])
+"""
+
+import hashlib
+import inspect
+import json
+import os
+from logging import Logger
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+from apyscript import __version__
+from apyscript.console import loggers
+from apyscript.expression.build_session import BuildSession
+from apyscript.file import file_util
+from apyscript.html import exporter
+
+info_logger: Logger = loggers.get_info_logger()
+
+DEFAULT_CACHE_DIR_PATH: str = '../.apyscript_build_cache/'
+
+_ENTRY_EXTENSION: str = '.html'
+_STATS_FILE_NAME: str = 'stats.json'
+_STATS_KEYS: Tuple[str, ...] = ('hits', 'misses', 'evictions')
+
+
+class BuildCache:
+
+    cache_dir_path: str
+    max_entries: int
+    max_size: int
+
+    def __init__(
+            self, cache_dir_path: str = DEFAULT_CACHE_DIR_PATH,
+            max_entries: int = 256,
+            max_size: int = 256 * 1024 * 1024) -> None:
+        """
+        The class that caches each exported html by the fingerprint
+        of the build script, input files, apyscript version, and
+        export options. The least recently used entries are evicted
+        when the number of entries or total size exceeds the limit.
+
+        Parameters
+        ----------
+        cache_dir_path : str, default DEFAULT_CACHE_DIR_PATH
+            Directory path to save each cached html and statistics.
+        max_entries : int, default 256
+            Maximum number of the cached htmls.
+        max_size : int, default 256 * 1024 * 1024
+            Maximum total bytes of the cached htmls.
+
+        Raises
+        ------
+        ValueError
+            If max_entries or max_size is less than one.
+        """
+        if max_entries < 1 or max_size < 1:
+            raise ValueError(
+                'max_entries and max_size must be greater than zero: '
+                f'{max_entries}, {max_size}')
+        self.cache_dir_path = cache_dir_path
+        self.max_entries = max_entries
+        self.max_size = max_size
+
+    def export(
+            self, build_func: Callable[[], Any], dest_dir_path: str,
+            script_file_path: Optional[str] = None,
+            input_file_paths: Optional[Sequence[str]] = None,
+            optimize: bool = True,
+            jslib_dir_path: Optional[str] = None) -> bool:
+        """
+        Save the overall html under the specified directory path. If
+        the html is cached, that html will be restored without calling
+        the build function. Otherwise the build function is called in
+        a new build session and the exported html is cached.
+
+        Parameters
+        ----------
+        build_func : Callable
+            Function that builds the stage (e.g., creates Stage and
+            Sprite instances). This function should not export the
+            html itself.
+        dest_dir_path : str
+            Destination directory path to save each html and js files.
+        script_file_path : str or None, default None
+            Build script's file path to fingerprint. If None is
+            specified, the build function's source file will be used.
+        input_file_paths : sequence of str or None, default None
+            Input file paths (e.g., data files) that the build function
+            reads.
+        optimize : bool, default True
+            Whether exporting js statements will be optimized or not.
+        jslib_dir_path : str or None, default None
+            Shared directory path to export each JavaScript library.
+            If None is specified, each library will be copied to the
+            destination directory.
+
+        Returns
+        -------
+        is_hit : bool
+            If the cached html was restored, True will be returned.
+        """
+        if script_file_path is None:
+            script_file_path = inspect.getsourcefile(build_func)
+        if script_file_path is None:
+            raise ValueError(
+                'Source file of the build function is not found. Please '
+                'specify the script_file_path argument.')
+        fingerprint: str = self.get_fingerprint(
+            script_file_path=script_file_path,
+            input_file_paths=input_file_paths, optimize=optimize,
+            dest_dir_path=dest_dir_path, jslib_dir_path=jslib_dir_path)
+        html: Optional[str] = self.get_cached_html(fingerprint=fingerprint)
+        if html is not None:
+            info_logger.info(msg=f'Build cache hit: {fingerprint}')
+            self._increment_stats(key='hits')
+            exporter.save_overall_html(
+                html=html, dest_dir_path=dest_dir_path,
+                jslib_dir_path=jslib_dir_path)
+            return True
+        info_logger.info(msg=f'Build cache miss: {fingerprint}')
+        self._increment_stats(key='misses')
+        with BuildSession():
+            build_func()
+            exporter.save_expressions_overall_html(
+                dest_dir_path=dest_dir_path, optimize=optimize,
+                jslib_dir_path=jslib_dir_path)
+        with open(os.path.join(dest_dir_path, 'index.html'), 'rb') as f:
+            html_bytes: bytes = f.read()
+        self._save_entry(
+            fingerprint=fingerprint, html=html_bytes.decode('utf-8'))
+        return False
+
+    def get_fingerprint(
+            self, script_file_path: str,
+            input_file_paths: Optional[Sequence[str]] = None,
+            optimize: bool = True, dest_dir_path: str = './',
+            jslib_dir_path: Optional[str] = None) -> str:
+        """
+        Get a fingerprint of the build (cache key).
+
+        Parameters
+        ----------
+        script_file_path : str
+            Build script's file path.
+        input_file_paths : sequence of str or None, default None
+            Input file paths that the build script reads.
+        optimize : bool, default True
+            Whether exporting js statements will be optimized or not.
+        dest_dir_path : str, default './'
+            Destination directory path. This is used only to get the
+            relative path of the shared JavaScript libraries'
+            directory (that the html refers).
+        jslib_dir_path : str or None, default None
+            Shared directory path of each JavaScript library.
+
+        Returns
+        -------
+        fingerprint : str
+            SHA-256 hex digest of the apyscript version, each file's
+            content, and export options.
+        """
+        if input_file_paths is None:
+            input_file_paths = []
+        jslib_dir_rel_path: Optional[str] = None
+        if jslib_dir_path is not None:
+            jslib_dir_rel_path = os.path.relpath(
+                jslib_dir_path, dest_dir_path).replace(os.sep, '/')
+        input_file_digests: List[List[str]] = [
+            [os.path.abspath(file_path), _get_file_digest(file_path)]
+            for file_path in sorted(input_file_paths)]
+        fingerprint_src: Dict[str, Any] = {
+            'version': __version__,
+            'script': _get_file_digest(file_path=script_file_path),
+            'input_files': input_file_digests,
+            'optimize': optimize,
+            'jslib_dir_path': jslib_dir_rel_path,
+        }
+        fingerprint_src_str: str = json.dumps(fingerprint_src, sort_keys=True)
+        return hashlib.sha256(fingerprint_src_str.encode('utf-8')).hexdigest()
+
+    def get_cached_html(self, fingerprint: str) -> Optional[str]:
+        """
+        Get a cached html of specified fingerprint. The entry is
+        marked as the most recently used one.
+
+        Parameters
+        ----------
+        fingerprint : str
+            Target fingerprint.
+
+        Returns
+        -------
+        html : str or None
+            Cached html. If the html is not cached, None will be
+            returned.
+        """
+        entry_file_path: str = self._get_entry_file_path(
+            fingerprint=fingerprint)
+        try:
+            with open(entry_file_path, 'rb') as f:
+                html_bytes: bytes = f.read()
+            os.utime(entry_file_path)
+        except OSError:
+            return None
+        return html_bytes.decode('utf-8')
+
+    def _save_entry(self, fingerprint: str, html: str) -> None:
+        """
+        Save specified html as the cache entry and evict the least
+        recently used entries if the limit is exceeded.
+
+        Parameters
+        ----------
+        fingerprint : str
+            Fingerprint of the html.
+        html : str
+            Html to cache.
+        """
+        file_util.save_bytes_atomically(
+            data=html.encode('utf-8'),
+            file_path=self._get_entry_file_path(fingerprint=fingerprint))
+        self._evict()
+
+    def _evict(self) -> None:
+        """
+        Evict the least recently used entries until the number of
+        entries and total size are within the limit.
+        """
+        entries: List[Tuple[float, str, int]] = self._get_entries()
+        total_size: int = sum(size for _, _, size in entries)
+        evicted_num: int = 0
+        for _, file_path, size in entries:
+            if len(entries) - evicted_num <= self.max_entries \
+                    and total_size <= self.max_size:
+                break
+            file_util.remove_file_if_exists(file_path=file_path)
+            total_size -= size
+            evicted_num += 1
+        if evicted_num:
+            self._increment_stats(key='evictions', num=evicted_num)
+
+    def _get_entries(self) -> List[Tuple[float, str, int]]:
+        """
+        Get each cache entry's information, sorted in the least
+        recently used order.
+
+        Returns
+        -------
+        entries : list of tuple
+            Each entry's last used time, file path, and size.
+        """
+        if not os.path.isdir(self.cache_dir_path):
+            return []
+        entries: List[Tuple[float, str, int]] = []
+        for file_name in os.listdir(self.cache_dir_path):
+            if not file_name.endswith(_ENTRY_EXTENSION):
+                continue
+            file_path: str = os.path.join(self.cache_dir_path, file_name)
+            try:
+                stat: os.stat_result = os.stat(file_path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, file_path, stat.st_size))
+        entries.sort()
+        return entries
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get the cache statistics.
+
+        Returns
+        -------
+        stats : dict
+            A dict that has the number of `hits`, `misses`, and
+            `evictions` (accumulated across processes), and the
+            current number of `entries` and total `size` (bytes).
+        """
+        stats: Dict[str, int] = self._read_stats()
+        entries: List[Tuple[float, str, int]] = self._get_entries()
+        stats['entries'] = len(entries)
+        stats['size'] = sum(size for _, _, size in entries)
+        return stats
+
+    def clear(self) -> None:
+        """
+        Remove every cache entry and statistics.
+        """
+        file_util.empty_directory(directory_path=self.cache_dir_path)
+
+    def _read_stats(self) -> Dict[str, int]:
+        """
+        Read the accumulated statistics file.
+
+        Returns
+        -------
+        stats : dict
+            A dict that has the number of `hits`, `misses`, and
+            `evictions`. If the file does not exist or is broken, each
+            value will be zero.
+        """
+        stats: Dict[str, int] = {key: 0 for key in _STATS_KEYS}
+        stats_file_path: str = os.path.join(
+            self.cache_dir_path, _STATS_FILE_NAME)
+        if not os.path.isfile(stats_file_path):
+            return stats
+        try:
+            saved_stats: Any = json.loads(
+                file_util.read_txt(file_path=stats_file_path))
+        except ValueError:
+            return stats
+        if not isinstance(saved_stats, dict):
+            return stats
+        for key in _STATS_KEYS:
+            value: Any = saved_stats.get(key)
+            if isinstance(value, int):
+                stats[key] = value
+        return stats
+
+    def _increment_stats(self, key: str, num: int = 1) -> None:
+        """
+        Increment specified statistics value and save it.
+
+        Parameters
+        ----------
+        key : str
+            Statistics key, e.g., `hits`.
+        num : int, default 1
+            Number to add.
+        """
+        stats: Dict[str, int] = self._read_stats()
+        stats[key] += num
+        stats_str: str = json.dumps(stats, indent=2, sort_keys=True)
+        file_util.save_bytes_atomically(
+            data=f'{stats_str}\n'.encode('utf-8'),
+            file_path=os.path.join(self.cache_dir_path, _STATS_FILE_NAME))
+
+    def _get_entry_file_path(self, fingerprint: str) -> str:
+        """
+        Get a cache entry's file path of specified fingerprint.
+
+        Parameters
+        ----------
+        fingerprint : str
+            Target fingerprint.
+
+        Returns
+        -------
+        entry_file_path : str
+            Cache entry's file path.
+        """
+        return os.path.join(
+            self.cache_dir_path, f'{fingerprint}{_ENTRY_EXTENSION}')
+
+
+def _get_file_digest(file_path: str) -> str:
+    """
+    Get a SHA-256 hex digest of specified file's content.
+
+    Parameters
+    ----------
+    file_path : str
+        Target file path.
+
+    Returns
+    -------
+    digest : str
+        SHA-256 hex digest of the file's content.
+    """
+    hash_obj: Any = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            hash_obj.update(chunk)
+    return str(hash_obj.hexdigest())
@@ -1,84 +1,566 @@
 """Expression exporting interface implementation.
+
+Mainly following interfaces are defined:
+
+- save_expressions_overall_html : Save each expressions html under
+    the specified directory path.
+- save_overall_html : Save specified (e.g., cached) overall html
+    and each JavaScript library under the specified directory path.
+- read_export_manifest : Read the export manifest (each saved file's
+    digest) of specified directory.
+- write_expressions_overall_html : Write overall html to specified
+    stream chunk by chunk.
+- iter_html_chunks : Iterate overall html chunks (e.g., to stream
+    the html from a web process without any file).
+- get_jslib_assets : Get each JavaScript library's file name and
+    bytes that the html refers.
+- get_entry_point_func_name : Get an entry point function name.
 """
 
+import hashlib
+import json
 import os
 from logging import Logger
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterator
 from typing import List
+from typing import Optional
+from typing import TextIO
 
 from apyscript.console import loggers
 from apyscript.display.stage import get_stage_element_id
 from apyscript.display.stage import get_stage_variable_name
+from apyscript.expression import build_session
 from apyscript.expression import expression_file_util
+from apyscript.expression import expression_variables_util
+from apyscript.expression.build_session import BuildSession
+from apyscript.expression.expression_optimizer import ExpressionOptimizer
+from apyscript.expression.expression_store import ExpressionStore
 from apyscript.file import file_util
 from apyscript.html import html_const
-from apyscript.html import html_util
 from apyscript.jslib import jslib_util
+from apyscript.string import indent_util
 
 info_logger: Logger = loggers.get_info_logger()
 
+# File name of the export manifest (each saved file's digest) in the
+# destination directory.
+EXPORT_MANIFEST_FILE_NAME: str = '.apyscript_export_manifest.json'
+
+_INDEX_FILE_NAME: str = 'index.html'
+
 
-def save_expressions_overall_html(dest_dir_path: str) -> None:
+def save_expressions_overall_html(
+        dest_dir_path: str, optimize: bool = True,
+        optimizer: Optional[ExpressionOptimizer] = None,
+        jslib_dir_path: Optional[str] = None) -> None:
     """
     Save each expressions html under the specified directory path.
 
     Notes
     -----
-    Specified directory will be emptied before saving.
+    Specified directory is not emptied. Each saved file's digest is
+    recorded to the manifest file (EXPORT_MANIFEST_FILE_NAME) in the
+    directory, and only changed files are rewritten (replaced
+    atomically). Files that were saved by the previous export and
+    are not saved anymore are removed.
+    The html is written to the file chunk by chunk, so the whole html
+    string is not held in memory.
 
     Parameters
     ----------
     dest_dir_path : str
         Destination directory path to save each html and js files.
+    optimize : bool, default True
+        Whether exporting js statements will be optimized (e.g.,
+        unreferenced variables will be removed) or not.
+    optimizer : ExpressionOptimizer or None, default None
+        Optimizer to use when the optimize argument is True. If None
+        is specified, the default setting optimizer will be used.
+    jslib_dir_path : str or None, default None
+        Shared directory path to export each JavaScript library with
+        the content-addressed file name (e.g., to share the libraries
+        between many exported htmls). Already exported libraries are
+        not rewritten, and the html refers the shared files. If None
+        is specified, each library will be copied to the destination
+        directory.
     """
+    optimizer = _get_optimizer(optimize=optimize, optimizer=optimizer)
     info_logger.info(msg='Overall exporting started...')
-    file_util.empty_directory(directory_path=dest_dir_path)
+
+    def make_chunks(
+            jslib_dir_url: str, hash_jslib_file_names: bool) -> Iterator[str]:
+        return _iter_overall_html_chunks(
+            optimizer=optimizer, jslib_dir_url=jslib_dir_url,
+            hash_jslib_file_names=hash_jslib_file_names)
+
+    _save_overall_html_files(
+        dest_dir_path=dest_dir_path, jslib_dir_path=jslib_dir_path,
+        make_chunks=make_chunks)
+    expression_variables_util.save_variable_names_files()
+
+
+def save_overall_html(
+        html: str, dest_dir_path: str,
+        jslib_dir_path: Optional[str] = None) -> None:
+    """
+    Save specified (e.g., cached) overall html and each JavaScript
+    library under the specified directory path. Unchanged files are
+    not rewritten, the same as `save_expressions_overall_html`.
+
+    Parameters
+    ----------
+    html : str
+        Overall html to save. This html needs to refer each library
+        in the same way as this call (i.e., it needs to be exported
+        with the same `jslib_dir_path` setting).
+    dest_dir_path : str
+        Destination directory path to save each html and js files.
+    jslib_dir_path : str or None, default None
+        Shared directory path to export each JavaScript library with
+        the content-addressed file name. If None is specified, each
+        library will be copied to the destination directory.
+    """
+    info_logger.info(msg='Overall html saving started...')
+
+    def make_chunks(
+            jslib_dir_url: str, hash_jslib_file_names: bool) -> Iterator[str]:
+        return iter([html])
+
+    _save_overall_html_files(
+        dest_dir_path=dest_dir_path, jslib_dir_path=jslib_dir_path,
+        make_chunks=make_chunks)
+
+
+def _save_overall_html_files(
+        dest_dir_path: str, jslib_dir_path: Optional[str],
+        make_chunks: Callable[[str, bool], Iterator[str]]) -> None:
+    """
+    Save overall html and each JavaScript library under the specified
+    directory path (only changed files are rewritten).
+
+    Parameters
+    ----------
+    dest_dir_path : str
+        Destination directory path to save each html and js files.
+    jslib_dir_path : str or None
+        Shared directory path to export each JavaScript library. If
+        None is specified, each library will be copied to the
+        destination directory.
+    make_chunks : Callable
+        Function that makes the html chunks. This function needs to
+        accept the libraries' directory url and the boolean whether
+        the libraries' file names are content-addressed or not.
+    """
+    os.makedirs(dest_dir_path, exist_ok=True)
+    previous_manifest: Dict[str, str] = read_export_manifest(
+        dest_dir_path=dest_dir_path)
+    manifest: Dict[str, str] = {}
     info_logger.info(msg='JavaScript libraries exporting...')
-    _ = _export_js_libs(dest_dir_path=dest_dir_path)
-    html_str: str = html_util.append_html_to_str(
-        to_append_html='<html>', dest_html='', indent_num=0)
-    html_str = _append_head_to_html_str(html_str=html_str)
-    html_str = html_util.append_html_to_str(
-        to_append_html='<body>', dest_html=html_str, indent_num=0)
-    html_str = _append_stage_global_variable_to_html(html_str=html_str)
-    info_logger.info(msg='Reading each expression files...')
-    html_str = _append_expression_to_html_str(html_str=html_str)
-    html_str = html_util.append_html_to_str(
-        to_append_html='</body>', dest_html=html_str, indent_num=0)
-    html_str = _append_entry_point_function_call(html_str=html_str)
-    html_str = html_util.append_html_to_str(
-        to_append_html='</html>', dest_html=html_str, indent_num=0)
+    jslib_dir_url: str = './'
+    hash_jslib_file_names: bool = False
+    if jslib_dir_path is None:
+        _ = _export_js_libs(
+            dest_dir_path=dest_dir_path, previous_manifest=previous_manifest)
+        manifest.update(jslib_util.get_jslib_manifest())
+    else:
+        _ = _export_hashed_js_libs(jslib_dir_path=jslib_dir_path)
+        jslib_dir_url = _get_jslib_dir_url(
+            dest_dir_path=dest_dir_path, jslib_dir_path=jslib_dir_path)
+        hash_jslib_file_names = True
     info_logger.info(msg='HTML saving started...')
-    _save_html(
-        html_str=html_str, dir_path=dest_dir_path, file_name='index.html')
-    file_path: str = os.path.join(dest_dir_path, 'index.html')
+    file_path: str = os.path.join(dest_dir_path, _INDEX_FILE_NAME)
+    chunks: Iterator[str] = make_chunks(jslib_dir_url, hash_jslib_file_names)
+    manifest[_INDEX_FILE_NAME] = _save_html_if_changed(
+        chunks=chunks, file_path=file_path,
+        previous_digest=previous_manifest.get(_INDEX_FILE_NAME))
+    _remove_stale_files(
+        dest_dir_path=dest_dir_path, previous_manifest=previous_manifest,
+        manifest=manifest)
+    if manifest != previous_manifest:
+        _save_export_manifest(dest_dir_path=dest_dir_path, manifest=manifest)
     info_logger.info(
         msg=f'All files were exported! \nFile path is : {file_path}')
 
 
-def _append_stage_global_variable_to_html(html_str: str) -> str:
+def read_export_manifest(dest_dir_path: str) -> Dict[str, str]:
+    """
+    Read the export manifest (each saved file's digest) of specified
+    directory.
+
+    Parameters
+    ----------
+    dest_dir_path : str
+        Exported directory path.
+
+    Returns
+    -------
+    manifest : dict
+        A dict that has saved file name in key and that file's
+        SHA-256 hex digest in value. If the manifest file does not
+        exist or is broken, blank dict will be returned.
+    """
+    manifest_file_path: str = os.path.join(
+        dest_dir_path, EXPORT_MANIFEST_FILE_NAME)
+    if not os.path.isfile(manifest_file_path):
+        return {}
+    try:
+        manifest: Any = json.loads(
+            file_util.read_txt(file_path=manifest_file_path))
+    except ValueError:
+        return {}
+    if not isinstance(manifest, dict):
+        return {}
+    return {
+        str(file_name): str(digest) for file_name, digest in manifest.items()}
+
+
+def _save_export_manifest(
+        dest_dir_path: str, manifest: Dict[str, str]) -> None:
+    """
+    Save the export manifest to specified directory (atomically).
+
+    Parameters
+    ----------
+    dest_dir_path : str
+        Exported directory path.
+    manifest : dict
+        A dict that has saved file name in key and that file's
+        SHA-256 hex digest in value.
+    """
+    manifest_str: str = json.dumps(manifest, indent=2, sort_keys=True)
+    file_util.save_bytes_atomically(
+        data=f'{manifest_str}\n'.encode('utf-8'),
+        file_path=os.path.join(dest_dir_path, EXPORT_MANIFEST_FILE_NAME))
+
+
+def _save_html_if_changed(
+        chunks: Iterator[str], file_path: str,
+        previous_digest: Optional[str]) -> str:
+    """
+    Save html chunks to specified file (UTF-8) if the html is changed.
+    Chunks are written to the temporary file (with calculating the
+    digest), and that file replaces the html file atomically. If any
+    error is raised, the temporary file is removed.
+
+    Parameters
+    ----------
+    chunks : Iterator of str
+        Html chunks to save.
+    file_path : str
+        Destination html file path.
+    previous_digest : str or None
+        Digest of the previously saved html. If this is the same as
+        the html's digest and the file exists, the file will not be
+        rewritten.
+
+    Returns
+    -------
+    digest : str
+        SHA-256 hex digest of the html.
+    """
+    tmp_file_path: str = file_util.get_tmp_file_path(file_path=file_path)
+    hash_obj: Any = hashlib.sha256()
+    try:
+        with open(tmp_file_path, 'w', encoding='utf-8') as f:
+            for chunk in chunks:
+                f.write(chunk)
+                hash_obj.update(chunk.encode('utf-8'))
+        digest: str = hash_obj.hexdigest()
+        if digest == previous_digest and os.path.isfile(file_path):
+            os.remove(tmp_file_path)
+            info_logger.info(msg=f'Skipped unchanged file: {file_path}')
+            return digest
+        os.replace(tmp_file_path, file_path)
+    except BaseException:
+        file_util.remove_file_if_exists(file_path=tmp_file_path)
+        raise
+    return digest
+
+
+def _remove_stale_files(
+        dest_dir_path: str, previous_manifest: Dict[str, str],
+        manifest: Dict[str, str]) -> None:
+    """
+    Remove files that were saved by the previous export and are not
+    saved anymore (other files are not removed).
+
+    Parameters
+    ----------
+    dest_dir_path : str
+        Exported directory path.
+    previous_manifest : dict
+        Previous export manifest.
+    manifest : dict
+        Current export manifest.
+    """
+    for file_name in previous_manifest:
+        if file_name in manifest:
+            continue
+        if os.path.basename(file_name) != file_name:
+            continue
+        file_util.remove_file_if_exists(
+            file_path=os.path.join(dest_dir_path, file_name))
+
+
+def _get_optimizer(
+        optimize: bool,
+        optimizer: Optional[ExpressionOptimizer]) -> Optional[
+            ExpressionOptimizer]:
+    """
+    Get an optimizer to apply to the exporting statements.
+
+    Parameters
+    ----------
+    optimize : bool
+        Whether exporting js statements will be optimized or not.
+    optimizer : ExpressionOptimizer or None
+        Optimizer to use when the optimize argument is True.
+
+    Returns
+    -------
+    optimizer : ExpressionOptimizer or None
+        Optimizer to apply. If optimize argument is False, None will
+        be returned. If optimizer argument is None, the default
+        setting optimizer will be returned.
+    """
+    if not optimize:
+        return None
+    if optimizer is None:
+        return ExpressionOptimizer()
+    return optimizer
+
+
+def iter_html_chunks(
+        optimize: bool = True,
+        optimizer: Optional[ExpressionOptimizer] = None,
+        jslib_dir_url: str = './',
+        hash_jslib_file_names: bool = False) -> Iterator[str]:
+    """
+    Iterate overall html chunks of the current build session. No file
+    or directory is saved, so each chunk can be streamed directly,
+    e.g., as a WSGI or ASGI response body.
+
+    Notes
+    -----
+    The build session at the time of this function's call is used
+    even if each chunk is requested after that session is exited.
+    Head section's chunks are yielded before the expression is read
+    (optimized), so the first chunk does not depend on the html size.
+
+    Parameters
+    ----------
+    optimize : bool, default True
+        Whether exporting js statements will be optimized or not.
+    optimizer : ExpressionOptimizer or None, default None
+        Optimizer to use when the optimize argument is True. If None
+        is specified, the default setting optimizer will be used.
+    jslib_dir_url : str, default './'
+        URL (or relative path) of the directory that serves each
+        JavaScript library (see the `get_jslib_assets` function),
+        e.g., '/static/apyscript/'. It must end with slash.
+    hash_jslib_file_names : bool, default False
+        Whether the html refers each JavaScript library by the
+        content-addressed file name (e.g., for the long-term browser
+        cache) or not.
+
+    Returns
+    -------
+    chunks : Iterator of str
+        Html chunks. Concatenated chunks are the overall html.
+    """
+    optimizer = _get_optimizer(optimize=optimize, optimizer=optimizer)
+    session: BuildSession = build_session.get_current_session()
+    chunks: Iterator[str] = _iter_overall_html_chunks(
+        optimizer=optimizer, jslib_dir_url=jslib_dir_url,
+        hash_jslib_file_names=hash_jslib_file_names)
+    return _iter_chunks_in_session(chunks=chunks, session=session)
+
+
+def _iter_chunks_in_session(
+        chunks: Iterator[str], session: BuildSession) -> Iterator[str]:
+    """
+    Iterate specified chunks while entering specified build session
+    (for each chunk's generation).
+
+    Parameters
+    ----------
+    chunks : Iterator of str
+        Chunks to iterate.
+    session : BuildSession
+        Build session to enter.
+
+    Yields
+    ------
+    chunk : str
+        Each chunk.
+    """
+    while True:
+        with session:
+            chunk: Optional[str] = next(chunks, None)
+        if chunk is None:
+            return
+        yield chunk
+
+
+def get_jslib_assets(hash_jslib_file_names: bool = False) -> Dict[str, bytes]:
+    """
+    Get each JavaScript library's file name and bytes that the html
+    refers (e.g., to serve them from a web process at the
+    `jslib_dir_url` of the `iter_html_chunks` function).
+
+    Parameters
+    ----------
+    hash_jslib_file_names : bool, default False
+        Whether each file name will be the content-addressed file
+        name or not.
+
+    Returns
+    -------
+    jslib_assets : dict
+        A dict that has JavaScript library's file name in key and
+        that file's bytes in value.
+    """
+    jslib_assets: Dict[str, bytes] = {
+        _get_jslib_src_file_name(
+            jslib_file_name=jslib_file_name,
+            hash_jslib_file_names=hash_jslib_file_names):
+        jslib_util.get_jslib_bytes(jslib_name=jslib_file_name)
+        for jslib_file_name in jslib_util.get_jslib_file_names()
+    }
+    return jslib_assets
+
+
+def _get_jslib_src_file_name(
+        jslib_file_name: str, hash_jslib_file_names: bool) -> str:
+    """
+    Get a JavaScript library's file name that the html refers.
+
+    Parameters
+    ----------
+    jslib_file_name : str
+        JavaScript library's file name, e.g., 'jquery.min.js'.
+    hash_jslib_file_names : bool
+        Whether the content-addressed file name will be returned or
+        not.
+
+    Returns
+    -------
+    src_file_name : str
+        File name that the html refers.
+    """
+    if not hash_jslib_file_names:
+        return jslib_file_name
+    return jslib_util.get_hashed_jslib_file_name(jslib_name=jslib_file_name)
+
+
+def _get_jslib_dir_url(dest_dir_path: str, jslib_dir_path: str) -> str:
+    """
+    Get a (relative) URL of the shared JavaScript libraries directory
+    from the html's directory.
+
+    Parameters
+    ----------
+    dest_dir_path : str
+        Directory path to save the html.
+    jslib_dir_path : str
+        Shared JavaScript libraries directory path.
+
+    Returns
+    -------
+    jslib_dir_url : str
+        Relative URL that ends with slash, e.g., '../assets/'.
+    """
+    relative_path: str = os.path.relpath(
+        os.path.abspath(jslib_dir_path), os.path.abspath(dest_dir_path))
+    return f'{relative_path.replace(os.sep, "/")}/'
+
+
+def write_expressions_overall_html(
+        stream: TextIO,
+        optimizer: Optional[ExpressionOptimizer] = None,
+        jslib_dir_url: str = './',
+        hash_jslib_file_names: bool = False) -> None:
+    """
+    Write overall html (head, stage's global variable, expression, and
+    entry point function call) to specified stream chunk by chunk.
+
+    Parameters
+    ----------
+    stream : TextIO
+        Destination text stream, e.g., opened file or `io.StringIO`.
+    optimizer : ExpressionOptimizer or None, default None
+        Optimizer to apply to the script statements. If None is
+        specified, statements will not be optimized.
+    jslib_dir_url : str, default './'
+        URL (or relative path) of the directory of each JavaScript
+        library.
+    hash_jslib_file_names : bool, default False
+        Whether the html refers each JavaScript library by the
+        content-addressed file name or not.
+    """
+    chunks: Iterator[str] = _iter_overall_html_chunks(
+        optimizer=optimizer, jslib_dir_url=jslib_dir_url,
+        hash_jslib_file_names=hash_jslib_file_names)
+    for chunk in chunks:
+        stream.write(chunk)
+
+
+def _iter_overall_html_chunks(
+        optimizer: Optional[ExpressionOptimizer] = None,
+        jslib_dir_url: str = './',
+        hash_jslib_file_names: bool = False) -> Iterator[str]:
     """
-    Append stage's global variable to html string.
+    Iterate overall html chunks.
 
     Parameters
     ----------
-    html_str : str
-        Target HTML string.
+    optimizer : ExpressionOptimizer or None, default None
+        Optimizer to apply to the script statements. If None is
+        specified, statements will not be optimized.
+    jslib_dir_url : str, default './'
+        URL (or relative path) of the directory of each JavaScript
+        library.
+    hash_jslib_file_names : bool, default False
+        Whether the html refers each JavaScript library by the
+        content-addressed file name or not.
+
+    Yields
+    ------
+    chunk : str
+        Each html chunk. Concatenated chunks are the overall html.
+    """
+    yield '<html>'
+    yield from _iter_head_chunks(
+        jslib_dir_url=jslib_dir_url,
+        hash_jslib_file_names=hash_jslib_file_names)
+    yield '\n<body>'
+    yield _make_stage_global_variable_html()
+    info_logger.info(msg='Reading each expression files...')
+    yield from _iter_expression_chunks(optimizer=optimizer)
+    _log_optimization_stats(optimizer=optimizer)
+    yield '\n</body>'
+    yield _make_entry_point_function_call_html()
+    yield '\n</html>'
+
+
+def _make_stage_global_variable_html() -> str:
+    """
+    Make stage's global variable script html.
 
     Returns
     -------
-    html_str : str
-        After appended HTML string.
+    html : str
+        Stage's global variable script html (starts with line
+        break).
     """
-    html_str = html_util.append_html_to_str(
-        to_append_html=html_const.SCRIPT_START_TAG,
-        dest_html=html_str, indent_num=0)
-    html_str = html_util.append_html_to_str(
-        to_append_html=f'var {get_stage_element_id()};',
-        dest_html=html_str, indent_num=0)
-    html_str = html_util.append_html_to_str(
-        to_append_html=html_const.SCRIPT_END_TAG,
-        dest_html=html_str, indent_num=0)
-    return html_str
+    return (
+        f'\n{html_const.SCRIPT_START_TAG}'
+        f'\nvar {get_stage_element_id()};'
+        f'\n{html_const.SCRIPT_END_TAG}'
+    )
 
 
 def get_entry_point_func_name() -> str:
@@ -95,116 +577,149 @@ def get_entry_point_func_name() -> str:
     return entry_point_func_name
 
 
-def _append_entry_point_function_call(html_str: str) -> str:
+def _make_entry_point_function_call_html() -> str:
     """
-    Append entry point function call script to html string.
-
-    Parameters
-    ----------
-    html_str : str
-        Target HTML string.
+    Make entry point function call script html.
 
     Returns
     -------
-    html_str : str
-        After appended html string.
+    html : str
+        Entry point function call script html (starts with line
+        break).
     """
-    html_str += (
+    entry_point_func_name: str = get_entry_point_func_name()
+    return (
         '\n<script type="text/javascript">'
         '\n$(document).ready(function() {'
-    )
-    entry_point_func_name: str = get_entry_point_func_name()
-    html_str += f'\n  {entry_point_func_name}();'
-    html_str += (
+        f'\n  {entry_point_func_name}();'
         '\n});'
         '\n</script>'
     )
-    return html_str
 
 
-def _save_html(
-        html_str: str, dir_path: str, file_name: str) -> None:
+def _log_optimization_stats(
+        optimizer: Optional[ExpressionOptimizer]) -> None:
     """
-    Save HTML string to file.
+    Log each optimization pass's stats (removed statements and bytes).
 
     Parameters
     ----------
-    html_str : str
-        HTML String to save.
-    dir_path : str
-        Destination directory path to save html.
-    file_name : str
-        HTML file name. e.g., 'index.html'
+    optimizer : ExpressionOptimizer or None
+        Optimizer that was applied to the exporting statements. If None
+        is specified, nothing will be logged.
     """
-    os.makedirs(dir_path, exist_ok=True)
-    file_path: str = os.path.join(dir_path, file_name)
-    file_util.save_plain_txt(txt=html_str, file_path=file_path)
+    if optimizer is None:
+        return
+    for stats in optimizer.stats_list:
+        info_logger.info(msg=f'Optimized ({stats})')
 
 
-def _append_expression_to_html_str(html_str: str) -> str:
+def _iter_expression_chunks(
+        optimizer: Optional[ExpressionOptimizer] = None) -> Iterator[str]:
     """
-    Append expression strings to a specified HTML string.
+    Iterate expression's html chunks. Script statements are wrapped
+    by the entry point function and indented chunk by chunk.
 
     Parameters
     ----------
-    html_str : str
-        Target HTML string.
-
-    Returns
-    -------
-    html_str : str
-        HTML string after appended expressions.
+    optimizer : ExpressionOptimizer or None, default None
+        Optimizer to apply to the script statements. If None is
+        specified, statements will not be optimized.
+
+    Yields
+    ------
+    chunk : str
+        Each expression's html chunk (first chunk starts with line
+        break).
     """
-    expression: str = file_util.read_txt(
-        file_path=expression_file_util.EXPRESSION_FILE_PATH)
-    expression = html_util.append_indent_to_each_script_line(
-        html=expression, indent_num=1)
+    expression_store: ExpressionStore = \
+        expression_file_util.get_expression_store()
+    html: str = expression_store.get_html_expression().lstrip()
+    script_chunks: Iterator[str] = expression_store.iter_script_chunks(
+        optimizer=optimizer)
+    first_script_chunk: str = ''
+    for script_chunk in script_chunks:
+        if script_chunk != '':
+            first_script_chunk = script_chunk
+            break
+    if first_script_chunk == '':
+        yield f'\n{html.rstrip()}'
+        return
+    if html != '':
+        yield f'\n{html}'
     entry_point_func_name: str = get_entry_point_func_name()
-    expression = expression.replace(
-        f'{html_const.SCRIPT_START_TAG}',
-        f'{html_const.SCRIPT_START_TAG}'
-        f'\nfunction {entry_point_func_name}() {{',
-        1)
-    expression = expression.replace(
-        f'{html_const.SCRIPT_END_TAG}',
-        f'}}\n{html_const.SCRIPT_END_TAG}')
-
-    html_str += f'\n{expression}'
-    return html_str
+    yield (
+        f'\n{html_const.SCRIPT_START_TAG}'
+        f'\nfunction {entry_point_func_name}() {{'
+    )
+    yield f'\n{_indent_script_chunk(script_chunk=first_script_chunk)}'
+    for script_chunk in script_chunks:
+        yield _indent_script_chunk(script_chunk=script_chunk)
+    yield f'\n}}\n{html_const.SCRIPT_END_TAG}'
 
 
-def _append_head_to_html_str(html_str: str) -> str:
+def _indent_script_chunk(script_chunk: str) -> str:
     """
-    Append head tag section to specified html string.
+    Append indentation spaces to each line of specified script chunk.
 
     Parameters
     ----------
-    html_str : str
-        Target HTML string.
+    script_chunk : str
+        Target script chunk. If chunk starts with line break, the
+        first line is not indented (it is the last line of the
+        previous chunk).
 
     Returns
     -------
-    html_str : str
-        HTML string after appended.
-    """
-    html_str = html_util.append_html_to_str(
-        to_append_html='<head>', dest_html=html_str, indent_num=0)
-    html_str = html_util.append_html_to_str(
-        to_append_html='<meta charset="utf-8">',
-        dest_html=html_str, indent_num=1)
-    jslib_file_names: List[str] = jslib_util.get_jslib_file_names()
-    for jslib_file_name in jslib_file_names:
-        html_str = html_util.append_html_to_str(
-            to_append_html=(
-                '<script type="text/javascript" '
-                f'src="./{jslib_file_name}"></script>'),
-            dest_html=html_str, indent_num=1)
-    html_str = html_util.append_html_to_str(
-        to_append_html='</head>', dest_html=html_str, indent_num=0)
-    return html_str
+    script_chunk : str
+        Indentation added script chunk.
+    """
+    spaces: str = indent_util.make_spaces_for_html(indent_num=1)
+    script_chunk = script_chunk.replace('\n', f'\n{spaces}')
+    if script_chunk.startswith('\n'):
+        return script_chunk
+    return f'{spaces}{script_chunk}'
+
 
+def _iter_head_chunks(
+        jslib_dir_url: str = './',
+        hash_jslib_file_names: bool = False) -> Iterator[str]:
+    """
+    Iterate head tag section's html chunks.
 
-def _export_js_libs(dest_dir_path: str) -> List[str]:
+    Parameters
+    ----------
+    jslib_dir_url : str, default './'
+        URL (or relative path) of the directory of each JavaScript
+        library.
+    hash_jslib_file_names : bool, default False
+        Whether each JavaScript library is referred by the
+        content-addressed file name or not.
+
+    Yields
+    ------
+    chunk : str
+        Each head section's html chunk (each chunk starts with line
+        break).
+    """
+    spaces: str = indent_util.make_spaces_for_html(indent_num=1)
+    yield '\n<head>'
+    yield f'\n{spaces}<meta charset="utf-8">'
+    jslib_file_names: List[str] = jslib_util.get_jslib_file_names()
+    for jslib_file_name in jslib_file_names:
+        src_file_name: str = _get_jslib_src_file_name(
+            jslib_file_name=jslib_file_name,
+            hash_jslib_file_names=hash_jslib_file_names)
+        yield (
+            f'\n{spaces}<script type="text/javascript" '
+            f'src="{jslib_dir_url}{src_file_name}"></script>'
+        )
+    yield '\n</head>'
+
+
+def _export_js_libs(
+        dest_dir_path: str,
+        previous_manifest: Optional[Dict[str, str]] = None) -> List[str]:
     """
     Export JavaScript libraries to a specified directory.
 
@@ -212,16 +727,54 @@ def _export_js_libs(dest_dir_path: str) -> List[str]:
     ----------
     dest_dir_path : str
         Directory path to export JavaScript libraries.
+    previous_manifest : dict or None, default None
+        Previous export manifest of the directory. Libraries that
+        have the same digest in this manifest (and exist) are not
+        rewritten.
 
     Returns
     -------
     saved_js_file_paths : str
-        Saved JavaScript file paths.
+        Saved (or unchanged existing) JavaScript file paths.
     """
+    if previous_manifest is None:
+        previous_manifest = {}
+    jslib_manifest: Dict[str, str] = jslib_util.get_jslib_manifest()
     jslib_file_names: List[str] = jslib_util.get_jslib_file_names()
     saved_js_file_paths: List[str] = []
     for jslib_file_name in jslib_file_names:
+        js_file_path: str = os.path.join(dest_dir_path, jslib_file_name)
+        if previous_manifest.get(jslib_file_name) == \
+                jslib_manifest[jslib_file_name] \
+                and os.path.isfile(js_file_path):
+            saved_js_file_paths.append(js_file_path)
+            continue
         saved_js_file_path: str = jslib_util.export_jslib_to_specified_dir(
             dest_dir_path=dest_dir_path, jslib_name=jslib_file_name)
         saved_js_file_paths.append(saved_js_file_path)
     return saved_js_file_paths
+
+
+def _export_hashed_js_libs(jslib_dir_path: str) -> List[str]:
+    """
+    Export JavaScript libraries with the content-addressed file names
+    to a specified shared directory (already exported libraries are
+    skipped).
+
+    Parameters
+    ----------
+    jslib_dir_path : str
+        Shared directory path to export JavaScript libraries.
+
+    Returns
+    -------
+    js_file_paths : list of str
+        Exported (or already existing) JavaScript file paths.
+    """
+    jslib_file_names: List[str] = jslib_util.get_jslib_file_names()
+    js_file_paths: List[str] = []
+    for jslib_file_name in jslib_file_names:
+        js_file_path: str = jslib_util.export_hashed_jslib_to_specified_dir(
+            dest_dir_path=jslib_dir_path, jslib_name=jslib_file_name)
+        js_file_paths.append(js_file_path)
+    return js_file_paths
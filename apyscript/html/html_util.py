@@ -15,8 +15,11 @@ Mainly following interfaces are defined:
     contains script end tag (`</script>`).
 - wrap_expression_by_script_tag : Wrap an expression string by
     script start and end tag.
+- split_html_and_script : Split an expression string into html
+    and script (inner script tags) strings.
 """
 
+import bisect
 import re
 from typing import List
 from typing import Match
@@ -100,34 +103,42 @@ def append_indent_to_each_script_line(html: str, indent_num: int) -> str:
     result_html : str
         Indentation added html string.
     """
-    each_lines: List[str] = html.splitlines()
-    result_html: str = ''
     script_line_util: ScriptLineUtil = ScriptLineUtil(html=html)
-    for i, line in enumerate(each_lines):
-        if result_html != '':
-            result_html += '\n'
-        if script_line_util.is_script_line(line_number=i + 1):
-            result_html += indent_util.make_spaces_for_html(
-                indent_num=indent_num)
-        result_html += line
+    spaces: str = indent_util.make_spaces_for_html(indent_num=indent_num)
+    script_line_flags: List[bool] = script_line_util.get_script_line_flags()
+    result_lines: List[str] = [
+        f'{spaces}{line}' if is_script_line else line
+        for line, is_script_line in zip(
+            script_line_util.lines, script_line_flags)
+    ]
+    result_html: str = '\n'.join(result_lines)
     return result_html
 
 
 class ScriptLineUtil:
 
     html: str
+    lines: List[str]
     script_line_ranges: List[Tuple[int, int]]
+    _script_start_line_nums: List[int]
 
     def __init__(self, html: str) -> None:
         """
         The class for HTML's script line utility.
 
+        Notes
+        -----
+        Each script line range is detected by a single pass and
+        sorted by line number, so the `is_script_line` method can
+        look up a range by binary search.
+
         Parameters
         ----------
         html : str
             Target HTML string.
         """
         self.html = html
+        self.lines = html.splitlines()
         self._set_script_line_ranges()
 
     def _set_script_line_ranges(self) -> None:
@@ -135,9 +146,10 @@ class ScriptLineUtil:
         Set each script start and end line numbers.
         """
         self.script_line_ranges = []
-        each_lines: List[str] = self.html.splitlines()
         start_line_num: int = 0
-        for i, line in enumerate(each_lines):
+        for i, line in enumerate(self.lines):
+            if '<script' not in line and '</script>' not in line:
+                continue
             line_number: int = i + 1
             if is_script_start_tag_line(line=line):
                 start_line_num = line_number + 1
@@ -146,6 +158,9 @@ class ScriptLineUtil:
                 end_line_num: int = line_number - 1
                 self.script_line_ranges.append(
                     (start_line_num, end_line_num))
+        self._script_start_line_nums = [
+            script_line_start
+            for script_line_start, _ in self.script_line_ranges]
 
     def is_script_line(self, line_number: int) -> bool:
         """
@@ -162,11 +177,34 @@ class ScriptLineUtil:
         result : bool
             If the target line is script line, then True will be set.
         """
+        index: int = bisect.bisect_right(
+            self._script_start_line_nums, line_number) - 1
+        if index < 0:
+            return False
+        script_line_end: int = self.script_line_ranges[index][1]
+        return line_number <= script_line_end
+
+    def get_script_line_flags(self) -> List[bool]:
+        """
+        Get a list of boolean values whether each line is script line
+        or not.
+
+        Returns
+        -------
+        script_line_flags : list of bool
+            Boolean values of each line. The index 0 value corresponds
+            to the line number 1.
+        """
+        line_count: int = len(self.lines)
+        script_line_flags: List[bool] = [False] * line_count
         for script_line_start, script_line_end in self.script_line_ranges:
-            if (script_line_start <= line_number
-                    and line_number <= script_line_end):
-                return True
-        return False
+            start_index: int = max(script_line_start - 1, 0)
+            end_index: int = min(script_line_end, line_count)
+            if start_index >= end_index:
+                continue
+            script_line_flags[start_index:end_index] = \
+                [True] * (end_index - start_index)
+        return script_line_flags
 
 
 def is_script_start_tag_line(line: str) -> bool:
@@ -249,3 +287,48 @@ def wrap_expression_by_script_tag(expression: str) -> str:
         f'\n{html_const.SCRIPT_END_TAG}'
     )
     return expression
+
+
+def split_html_and_script(expression: str) -> Tuple[str, str]:
+    """
+    Split an expression string into html and script (inner script
+    tags) strings.
+
+    Notes
+    -----
+    Script tags and blank script lines will be removed. If script
+    end tag is not found, remaining lines will be treated as html.
+
+    Parameters
+    ----------
+    expression : str
+        Target expression string.
+
+    Returns
+    -------
+    html : str
+        HTML string (lines outside of script tags).
+    script : str
+        Script string (lines inside of script tags).
+    """
+    html_lines: List[str] = []
+    script_lines: List[str] = []
+    pending_lines: List[str] = []
+    in_script: bool = False
+    for line in expression.splitlines():
+        if not in_script:
+            if is_script_start_tag_line(line=line):
+                in_script = True
+                pending_lines = [line]
+                continue
+            html_lines.append(line)
+            continue
+        if is_script_end_tag_line(line=line):
+            in_script = False
+            script_lines.extend(
+                [line_ for line_ in pending_lines[1:] if line_ != ''])
+            pending_lines = []
+            continue
+        pending_lines.append(line)
+    html_lines.extend(pending_lines)
+    return '\n'.join(html_lines), '\n'.join(script_lines)
@@ -1,11 +1,44 @@
 """Common JavaScript library utility implementations.
+
+Mainly following interfaces are defined:
+
+- get_jslib_file_names : Get JavaScript libraries file names.
+- get_jslib_abs_dir_path : Get a Javascript library's absolute
+    directory path.
+- export_jslib_to_specified_dir : Export JavaScript library to
+    specified directory.
+- get_jslib_bytes : Get a JavaScript library file's bytes.
+- get_jslib_manifest : Get a manifest (each library's content hash)
+    of the JavaScript libraries.
+- get_hashed_jslib_file_name : Get a content-addressed file name of
+    specified JavaScript library.
+- export_hashed_jslib_to_specified_dir : Export JavaScript library
+    with the content-addressed file name to specified (shared)
+    directory.
 """
 
+import hashlib
 import os
 import shutil
 import sys
 from types import ModuleType
+from typing import Dict
 from typing import List
+from typing import Optional
+
+from apyscript.file import file_util
+
+# Caches of the library file names, each library's bytes, and
+# manifest (library files are not updated while the process is
+# running). File names and manifest caches are assigned only after
+# each value is completely made, so other threads never refer a
+# partially made value.
+_jslib_file_names_cache: Optional[List[str]] = None
+_jslib_bytes_cache: Dict[str, bytes] = {}
+_jslib_manifest_cache: Optional[Dict[str, str]] = None
+
+# Number of the content hash's characters in the hashed file name.
+_HASH_LENGTH_IN_FILE_NAME: int = 16
 
 
 def get_jslib_file_names() -> List[str]:
@@ -16,17 +49,19 @@ def get_jslib_file_names() -> List[str]:
     -------
     jslib_file_names : list of str
         JavaScript libraries file names existing in this module's
-        directory.
+        directory (sorted and cached at the first call).
         e.g., ['jquery.min.js', 'svg.min.js']
     """
-    this_modules_dir_path: str = get_jslib_abs_dir_path()
-    jslib_file_names: List[str] = []
-    file_names: List[str] = os.listdir(this_modules_dir_path)
-    for file_name in file_names:
-        if not file_name.endswith('.js'):
-            continue
-        jslib_file_names.append(file_name)
-    return jslib_file_names
+    global _jslib_file_names_cache
+    jslib_file_names: Optional[List[str]] = _jslib_file_names_cache
+    if jslib_file_names is None:
+        this_modules_dir_path: str = get_jslib_abs_dir_path()
+        file_names: List[str] = os.listdir(this_modules_dir_path)
+        jslib_file_names = sorted(
+            file_name for file_name in file_names
+            if file_name.endswith('.js'))
+        _jslib_file_names_cache = jslib_file_names
+    return list(jslib_file_names)
 
 
 def get_jslib_abs_dir_path() -> str:
@@ -47,7 +82,8 @@ def get_jslib_abs_dir_path() -> str:
 def export_jslib_to_specified_dir(
         dest_dir_path: str, jslib_name: str) -> str:
     """
-    Export JavaScript library to specified directory.
+    Export JavaScript library to specified directory (the existing
+    file is replaced atomically).
 
     Parameters
     ----------
@@ -74,5 +110,131 @@ def export_jslib_to_specified_dir(
             'Specified JavaScript library file is not found: '
             f'{src_file_path}')
     dest_file_path: str = os.path.join(dest_dir_path, jslib_name)
-    shutil.copyfile(src_file_path, dest_file_path)
+    tmp_file_path: str = file_util.get_tmp_file_path(file_path=dest_file_path)
+    shutil.copyfile(src_file_path, tmp_file_path)
+    os.replace(tmp_file_path, dest_file_path)
+    return dest_file_path
+
+
+def get_jslib_bytes(jslib_name: str) -> bytes:
+    """
+    Get a JavaScript library file's bytes (e.g., to serve the library
+    from a web process without exporting it to a directory).
+
+    Parameters
+    ----------
+    jslib_name : str
+        JavaScript file name, e.g., 'jquery.min.js'.
+
+    Returns
+    -------
+    jslib_bytes : bytes
+        Library file's bytes. Read bytes are cached in the process
+        memory.
+
+    Raises
+    ------
+    FileNotFoundError
+        If specified JavaScript file is not found.
+    """
+    if jslib_name in _jslib_bytes_cache:
+        return _jslib_bytes_cache[jslib_name]
+    src_file_path: str = os.path.join(get_jslib_abs_dir_path(), jslib_name)
+    if os.path.basename(jslib_name) != jslib_name \
+            or not os.path.isfile(src_file_path):
+        raise FileNotFoundError(
+            'Specified JavaScript library file is not found: '
+            f'{src_file_path}')
+    with open(src_file_path, 'rb') as f:
+        jslib_bytes: bytes = f.read()
+    _jslib_bytes_cache[jslib_name] = jslib_bytes
+    return jslib_bytes
+
+
+def get_jslib_manifest() -> Dict[str, str]:
+    """
+    Get a manifest (each library's content hash) of the JavaScript
+    libraries.
+
+    Returns
+    -------
+    jslib_manifest : dict
+        A dict that has JavaScript library's file name in key and
+        that file's SHA-256 hex digest in value (cached at the first
+        call).
+    """
+    global _jslib_manifest_cache
+    jslib_manifest: Optional[Dict[str, str]] = _jslib_manifest_cache
+    if jslib_manifest is None:
+        jslib_manifest = {}
+        for jslib_file_name in get_jslib_file_names():
+            jslib_bytes: bytes = get_jslib_bytes(jslib_name=jslib_file_name)
+            jslib_manifest[jslib_file_name] = hashlib.sha256(
+                jslib_bytes).hexdigest()
+        _jslib_manifest_cache = jslib_manifest
+    return dict(jslib_manifest)
+
+
+def get_hashed_jslib_file_name(jslib_name: str) -> str:
+    """
+    Get a content-addressed file name of specified JavaScript library.
+
+    Parameters
+    ----------
+    jslib_name : str
+        JavaScript file name, e.g., 'jquery.min.js'.
+
+    Returns
+    -------
+    hashed_file_name : str
+        File name that contains the content hash, e.g.,
+        'jquery.min.0123456789abcdef.js'.
+
+    Raises
+    ------
+    FileNotFoundError
+        If specified JavaScript file is not found.
+    """
+    jslib_manifest: Dict[str, str] = get_jslib_manifest()
+    if jslib_name not in jslib_manifest:
+        raise FileNotFoundError(
+            'Specified JavaScript library file is not found: '
+            f'{jslib_name}')
+    content_hash: str = jslib_manifest[jslib_name][:_HASH_LENGTH_IN_FILE_NAME]
+    stem, extension = os.path.splitext(jslib_name)
+    return f'{stem}.{content_hash}{extension}'
+
+
+def export_hashed_jslib_to_specified_dir(
+        dest_dir_path: str, jslib_name: str) -> str:
+    """
+    Export JavaScript library with the content-addressed file name to
+    specified (shared) directory. If the same content file already
+    exists, that file will not be rewritten.
+
+    Parameters
+    ----------
+    dest_dir_path : str
+        Directory path to export JavaScript library file.
+    jslib_name : str
+        JavaScript file name to export, e.g., 'jquery.min.js'.
+
+    Returns
+    -------
+    dest_file_path : str
+        Exported (or already existing) Javascript library's file
+        path.
+
+    Raises
+    ------
+    FileNotFoundError
+        If specified JavaScript file is not found.
+    """
+    hashed_file_name: str = get_hashed_jslib_file_name(jslib_name=jslib_name)
+    dest_file_path: str = os.path.join(dest_dir_path, hashed_file_name)
+    if os.path.isfile(dest_file_path):
+        return dest_file_path
+    file_util.save_bytes_atomically(
+        data=get_jslib_bytes(jslib_name=jslib_name),
+        file_path=dest_file_path)
     return dest_file_path
@@ -1,6 +1,7 @@
 """Class implementation for array.
 """
 
+from copy import copy
 from typing import Any
 from typing import List
 from typing import Optional
@@ -8,9 +9,20 @@ from typing import Union
 
 from apyscript.expression import expression_file_util
 from apyscript.expression import expression_variables_util
+from apyscript.expression.expression_ir import Assign
+from apyscript.expression.expression_ir import Call
+from apyscript.expression.expression_ir import Expression
+from apyscript.expression.expression_ir import ExpressionStatement
+from apyscript.expression.expression_ir import Index
+from apyscript.expression.expression_ir import Literal
+from apyscript.expression.expression_ir import Member
+from apyscript.expression.expression_ir import Ref
+from apyscript.expression.expression_ir import VarDecl
+from apyscript.expression.expression_ir import get_value_expression
+from apyscript.expression.expression_ir import make_method_call
 from apyscript.type import Int
 from apyscript.type import String
-from apyscript.type import value_util
+from apyscript.type import typed_array_util
 from apyscript.type.copy_interface import CopyInterface
 from apyscript.type.variable_name_interface import VariableNameInterface
 from apyscript.validation import number_validation
@@ -18,8 +30,12 @@ from apyscript.validation import number_validation
 
 class Array(CopyInterface):
 
-    _initial_value: Union[List[Any], tuple, Any]
-    _value: List[Any]
+    _list_value: List[Any]
+
+    # Original typed array (e.g., NumPy's array or `array.array`)
+    # buffer. This is converted to the list value only when that
+    # value is accessed.
+    _typed_array_value: Optional[Any] = None
 
     def __init__(self, value: Union[List[Any], tuple, Any]) -> None:
         """
@@ -27,41 +43,146 @@ class Array(CopyInterface):
 
         Parameters
         ----------
-        value : list or tuple or Array
-            Initial array value.
+        value : list or tuple or Array or array.array or numpy.ndarray
+            Initial array value. Numeric typed array (e.g.,
+            `array.array('d', ...)` or NumPy's 1-dimensional numeric
+            array) will be exported as a base64 payload.
         """
         TYPE_NAME: str = 'array'
         self._validate_acceptable_value_type(value=value)
-        self._initial_value = value
         self._type_name = TYPE_NAME
-        self._value = self._get_list_value(value=value)
+        self._update_value(value=value)
         self.variable_name = expression_variables_util.get_next_variable_name(
             type_name=TYPE_NAME)
-        self._append_constructor_expression()
+        self._append_constructor_expression(value=value)
 
-    def _append_constructor_expression(self) -> None:
+    def _append_constructor_expression(
+            self, value: Union[List[Any], tuple, Any]) -> None:
         """
         Append constructor expression to file.
+
+        Parameters
+        ----------
+        value : list or tuple or Array or array.array or numpy.ndarray
+            Initial array value (constructor argument).
         """
-        expression: str = f'var {self.variable_name} = '
-        if isinstance(self._initial_value, Array):
-            expression += f'{self._initial_value.variable_name};'
-        else:
-            value_str: str = value_util.get_value_str_for_expression(
-                value=self._value)
-            expression += f'{value_str};'
-        expression_file_util.wrap_by_script_tag_and_append_expression(
-            expression=expression)
+        expression_file_util.append_statement(
+            statement=VarDecl(
+                name=self.variable_name,
+                value=self._get_value_expression(value=value)))
+
+    def _get_value_expression(
+            self, value: Union[List[Any], tuple, Any]) -> Expression:
+        """
+        Get an expression node of specified (constructor or setter's)
+        value.
+
+        Parameters
+        ----------
+        value : list or tuple or Array or array.array or numpy.ndarray
+            Specified array value. This value must be already set to
+            this array.
+
+        Returns
+        -------
+        expression : Expression
+            Ref node if value is Array, otherwise ArrayLiteral or
+            TypedArrayLiteral node of this array's value.
+        """
+        if isinstance(value, Array):
+            return get_value_expression(value=value)
+        if self._typed_array_value is not None:
+            return get_value_expression(value=self._typed_array_value)
+        return get_value_expression(value=self._value)
+
+    @property
+    def _value(self) -> List[Any]:
+        """
+        Get a (Python's) list value of this array. If this array has
+        the typed array buffer, it will be converted to the list at
+        the first access.
+
+        Returns
+        -------
+        value : list
+            List value of this array.
+        """
+        if self._typed_array_value is not None:
+            self._list_value = typed_array_util.to_list(
+                value=self._typed_array_value)
+            self._typed_array_value = None
+        return self._list_value
+
+    @_value.setter
+    def _value(self, value: List[Any]) -> None:
+        """
+        Set a (Python's) list value of this array.
+
+        Parameters
+        ----------
+        value : list
+            List value to set.
+        """
+        self._list_value = value
+        self._typed_array_value = None
+
+    def _update_value(self, value: Union[List[Any], tuple, Any]) -> None:
+        """
+        Update the Python side value of this array. Typed array will be
+        kept as the original buffer (not converted to the list).
+
+        Parameters
+        ----------
+        value : list or tuple or Array or array.array or numpy.ndarray
+            Value to set.
+        """
+        if isinstance(value, Array) and value._typed_array_value is not None:
+            value = value._typed_array_value
+        if typed_array_util.is_typed_array(value=value):
+            self._list_value = []
+            self._typed_array_value = value
+            return
+        self._value = self._get_list_value(value=value)
+
+    def _append_method_call_statement(
+            self, method_name: str,
+            args: Optional[List[Expression]] = None) -> None:
+        """
+        Append this array's method call statement to file.
+
+        Parameters
+        ----------
+        method_name : str
+            Method name to call, e.g., `push`.
+        args : list of Expression or None, default None
+            Call arguments.
+        """
+        expression_file_util.append_statement(
+            statement=ExpressionStatement(
+                expression=make_method_call(
+                    variable_name=self.variable_name,
+                    method_name=method_name, args=args)))
+
+    def _copy_mutable_attributes(self) -> None:
+        """
+        Copy list value (including nested lists) or typed array
+        buffer that must not be shared with the copy source array.
+        """
+        if self._typed_array_value is not None:
+            self._typed_array_value = copy(self._typed_array_value)
+            return
+        self._value = _copy_nested_list(value=self._value)
 
     def _get_list_value(
             self, value: Union[List[Any], tuple, Any]) -> List[Any]:
         """
-        Get a list value from specified list, tuple, or Array value.
+        Get a list value from specified list, tuple, Array, or NumPy's
+        array value.
 
         Parameters
         ----------
-        value : list or tuple or Array
-            Specified list, tuple, or Array value.
+        value : list or tuple or Array or numpy.ndarray
+            Specified list, tuple, Array, or NumPy's array value.
 
         Returns
         -------
@@ -72,6 +193,9 @@ class Array(CopyInterface):
             return list(value)
         if isinstance(value, Array):
             return value._value
+        if not isinstance(value, list):
+            list_value: List[Any] = value.tolist()
+            return list_value
         return value
 
     def _validate_acceptable_value_type(
@@ -81,20 +205,26 @@ class Array(CopyInterface):
 
         Parameters
         ----------
-        value : list or tuple or Array
+        value : list or tuple or Array or array.array or numpy.ndarray
             Iterable value to check.
 
         Raises
         ------
         ValueError
-            If specified value's type is not list, tuple, or Array.
+            If specified value's type is not list, tuple, Array, typed
+            array, or NumPy's array.
         """
         if isinstance(value, (list, tuple, Array)):
             return
+        if typed_array_util.is_typed_array(value=value):
+            return
+        if callable(getattr(value, 'tolist', None)):
+            return
         raise ValueError(
             'Not acceptable value\'s type is specified.'
             f'\nSpecified value type: {type(value)}'
-            '\nAcceptable types: list, tuple, and Array')
+            '\nAcceptable types: list, tuple, Array, array.array, and '
+            'numpy.ndarray')
 
     @property
     def value(self) -> Union[List[Any], tuple, Any]:
@@ -115,11 +245,11 @@ class Array(CopyInterface):
 
         Parameters
         ----------
-        value : list or tuple or Array
-            Iterable value (list, tuple, or Array) to set.
+        value : list or tuple or Array or array.array or numpy.ndarray
+            Iterable value (list, tuple, Array, or typed array) to set.
         """
         self._validate_acceptable_value_type(value=value)
-        self._value = self._get_list_value(value=value)
+        self._update_value(value=value)
         self._append_value_setter_expression(value=value)
 
     def _append_value_setter_expression(
@@ -129,18 +259,13 @@ class Array(CopyInterface):
 
         Parameters
         ----------
-        value : list or tuple or Array
-            Iterable value (list, tuple, or Array) to set.
+        value : list or tuple or Array or array.array or numpy.ndarray
+            Iterable value (list, tuple, Array, or typed array) to set.
         """
-        expression: str = f'{self.variable_name} = '
-        if isinstance(value, Array):
-            expression += f'{value.variable_name};'
-        else:
-            value_str: str = value_util.get_value_str_for_expression(
-                value=value)
-            expression += f'{value_str};'
-        expression_file_util.wrap_by_script_tag_and_append_expression(
-            expression=expression)
+        expression_file_util.append_statement(
+            statement=Assign(
+                target=Ref(name=self.variable_name),
+                value=self._get_value_expression(value=value)))
 
     def append(self, value: Any) -> None:
         """
@@ -176,12 +301,8 @@ class Array(CopyInterface):
         value : *
             Any value to append.
         """
-        value_str: str = value_util.get_value_str_for_expression(value=value)
-        expression: str = (
-            f'{self.variable_name}.push({value_str});'
-        )
-        expression_file_util.wrap_by_script_tag_and_append_expression(
-            expression=expression)
+        self._append_method_call_statement(
+            method_name='push', args=[get_value_expression(value=value)])
 
     def extend(self, other_arr: Union[List[Any], tuple, Any]) -> None:
         """
@@ -213,13 +334,12 @@ class Array(CopyInterface):
         other_arr : list or tuple or Array
             Other array-like value to concatenate.
         """
-        value_str: str = value_util.get_value_str_for_expression(
-            value=other_arr)
-        expression: str = (
-            f'{self.variable_name} = {self.variable_name}'
-            f'.concat({value_str});')
-        expression_file_util.wrap_by_script_tag_and_append_expression(
-            expression=expression)
+        expression_file_util.append_statement(
+            statement=Assign(
+                target=Ref(name=self.variable_name),
+                value=make_method_call(
+                    variable_name=self.variable_name, method_name='concat',
+                    args=[get_value_expression(value=other_arr)])))
 
     def concat(self, other_arr: Union[List[Any], tuple, Any]) -> Any:
         """
@@ -239,8 +359,12 @@ class Array(CopyInterface):
         concatenated : Array
             Concatenated array value.
         """
-        concatenated: Array = self._copy()
-        concatenated.extend(other_arr)
+        self._validate_acceptable_value_type(value=other_arr)
+        concatenated: Array = self._make_copied_instance()
+        if isinstance(other_arr, Array):
+            concatenated._value.extend(other_arr.value)
+        else:
+            concatenated._value.extend(other_arr)
         self._append_concat_expression(
             concatenated=concatenated, other_arr=other_arr)
         return concatenated
@@ -258,14 +382,12 @@ class Array(CopyInterface):
         other_arr : list or tuple or Array
             Other array-like value to concatenate.
         """
-        value_str: str = value_util.get_value_str_for_expression(
-            value=other_arr)
-        expression: str = (
-            f'var {concatenated.variable_name} = '
-            f'{self.variable_name}.concat({value_str});'
-        )
-        expression_file_util.wrap_by_script_tag_and_append_expression(
-            expression=expression)
+        expression_file_util.append_statement(
+            statement=VarDecl(
+                name=concatenated.variable_name,
+                value=make_method_call(
+                    variable_name=self.variable_name, method_name='concat',
+                    args=[get_value_expression(value=other_arr)])))
 
     def insert(
             self, index: Union[int, Int], value: Any) -> None:
@@ -319,13 +441,12 @@ class Array(CopyInterface):
         value : *
             Any value to append.
         """
-        value_str: str = value_util.get_value_str_for_expression(value=value)
-        index_str: str = value_util.get_value_str_for_expression(value=index)
-        expression: str = (
-            f'{self.variable_name}.splice({index_str}, 0, {value_str});'
-        )
-        expression_file_util.wrap_by_script_tag_and_append_expression(
-            expression=expression)
+        self._append_method_call_statement(
+            method_name='splice',
+            args=[
+                get_value_expression(value=index), Literal(value=0),
+                get_value_expression(value=value),
+            ])
 
     def pop(self) -> Any:
         """
@@ -349,11 +470,15 @@ class Array(CopyInterface):
         value : *
             Removed value.
         """
-        expression: str = f'{self.variable_name}.pop();'
+        call: Call = make_method_call(
+            variable_name=self.variable_name, method_name='pop')
         if isinstance(value, VariableNameInterface):
-            expression = f'{value.variable_name} = {expression}'
-        expression_file_util.wrap_by_script_tag_and_append_expression(
-            expression=expression)
+            expression_file_util.append_statement(
+                statement=Assign(
+                    target=Ref(name=value.variable_name), value=call))
+            return
+        expression_file_util.append_statement(
+            statement=ExpressionStatement(expression=call))
 
     def remove(self, value: Any) -> None:
         """
@@ -378,13 +503,18 @@ class Array(CopyInterface):
         """
         index_var_name: str = expression_variables_util.\
             get_next_variable_name(type_name='index')
-        value_str: str = value_util.get_value_str_for_expression(value=value)
-        expression: str = (
-            f'var {index_var_name} = _.indexOf'
-            f'({self.variable_name}, {value_str});'
-            f'\n{self.variable_name}.splice({index_var_name}, 1);')
-        expression_file_util.wrap_by_script_tag_and_append_expression(
-            expression=expression)
+        expression_file_util.append_statement(
+            statement=VarDecl(
+                name=index_var_name,
+                value=make_method_call(
+                    variable_name='_', method_name='indexOf',
+                    args=[
+                        Ref(name=self.variable_name),
+                        get_value_expression(value=value),
+                    ])))
+        self._append_method_call_statement(
+            method_name='splice',
+            args=[Ref(name=index_var_name), Literal(value=1)])
 
     def remove_at(self, index: Union[int, Int]) -> None:
         """
@@ -413,12 +543,9 @@ class Array(CopyInterface):
         index : int or Int
             Index to remove value.
         """
-        index_str: str = value_util.get_value_str_for_expression(value=index)
-        expression: str = (
-            f'{self.variable_name}.splice({index_str}, 1);'
-        )
-        expression_file_util.wrap_by_script_tag_and_append_expression(
-            expression=expression)
+        self._append_method_call_statement(
+            method_name='splice',
+            args=[get_value_expression(value=index), Literal(value=1)])
 
     def reverse(self) -> None:
         """
@@ -431,11 +558,7 @@ class Array(CopyInterface):
         """
         Append reverse method expression to file.
         """
-        expression: str = (
-            f'{self.variable_name}.reverse();'
-        )
-        expression_file_util.wrap_by_script_tag_and_append_expression(
-            expression=expression)
+        self._append_method_call_statement(method_name='reverse')
 
     def sort(self, ascending: bool = True) -> None:
         """
@@ -456,11 +579,7 @@ class Array(CopyInterface):
         """
         Append sort method expression to file.
         """
-        expression: str = (
-            f'{self.variable_name}.sort();'
-        )
-        expression_file_util.wrap_by_script_tag_and_append_expression(
-            expression=expression)
+        self._append_method_call_statement(method_name='sort')
 
     def slice(
             self,
@@ -502,7 +621,7 @@ class Array(CopyInterface):
             end_: Optional[int] = int(end.value)
         else:
             end_ = end
-        sliced_arr: Array = self._copy()
+        sliced_arr: Array = self._make_copied_instance()
         sliced_arr._value = self._value[slice(start_, end_)]
         self._append_slice_expression(
             sliced_arr=sliced_arr, start=start, end=end)
@@ -527,16 +646,15 @@ class Array(CopyInterface):
         """
         if start is None:
             start = 0
-        expression: str = (
-            f'var {sliced_arr.variable_name} = '
-            f'{self.variable_name}.slice('
-            f'{start}'
-        )
+        args: List[Expression] = [get_value_expression(value=start)]
         if end is not None:
-            expression += f', {end}'
-        expression += ');'
-        expression_file_util.wrap_by_script_tag_and_append_expression(
-            expression=expression)
+            args.append(get_value_expression(value=end))
+        expression_file_util.append_statement(
+            statement=VarDecl(
+                name=sliced_arr.variable_name,
+                value=make_method_call(
+                    variable_name=self.variable_name, method_name='slice',
+                    args=args)))
 
     def __getitem__(self, index: Union[int, Int]) -> Any:
         """
@@ -619,14 +737,12 @@ class Array(CopyInterface):
         """
         if not isinstance(value, VariableNameInterface):
             return
-        index_str: str = value_util.get_value_str_for_expression(
-            value=index)
-        expression: str = (
-            f'var {value.variable_name} = '
-            f'{self.variable_name}[{index_str}];'
-        )
-        expression_file_util.wrap_by_script_tag_and_append_expression(
-            expression=expression)
+        expression_file_util.append_statement(
+            statement=VarDecl(
+                name=value.variable_name,
+                value=Index(
+                    target=Ref(name=self.variable_name),
+                    index=get_value_expression(value=index))))
 
     def __setitem__(self, index: Union[int, Int], value: Any) -> None:
         """
@@ -663,16 +779,12 @@ class Array(CopyInterface):
         value : *
             Any value to set.
         """
-        index_str: str = value_util.get_value_str_for_expression(
-            value=index)
-        value_str: str = value_util.get_value_str_for_expression(
-            value=value)
-        expression: str = (
-            f'{self.variable_name}[{index_str}] = '
-            f'{value_str};'
-        )
-        expression_file_util.wrap_by_script_tag_and_append_expression(
-            expression=expression)
+        expression_file_util.append_statement(
+            statement=Assign(
+                target=Index(
+                    target=Ref(name=self.variable_name),
+                    index=get_value_expression(value=index)),
+                value=get_value_expression(value=value)))
 
     def __delitem__(self, index: Union[int, Int]) -> None:
         """
@@ -702,7 +814,10 @@ class Array(CopyInterface):
         length : Int
             This array's length.
         """
-        length: Int = Int(len(self._value))
+        if self._typed_array_value is not None:
+            length: Int = Int(len(self._typed_array_value))
+        else:
+            length = Int(len(self._value))
         self._append_length_expression(length=length)
         return length
 
@@ -715,11 +830,11 @@ class Array(CopyInterface):
         length : Int
             Created length Int variable.
         """
-        expression: str = (
-            f'{length.variable_name} = {self.variable_name}.length;'
-        )
-        expression_file_util.wrap_by_script_tag_and_append_expression(
-            expression=expression)
+        expression_file_util.append_statement(
+            statement=Assign(
+                target=Ref(name=length.variable_name),
+                value=Member(
+                    target=Ref(name=self.variable_name), name='length')))
 
     def __len__(self) -> None:
         """
@@ -770,13 +885,12 @@ class Array(CopyInterface):
         sep : str or String
             Separator string.
         """
-        sep_str: str = value_util.get_value_str_for_expression(value=sep)
-        expression: str = (
-            f'{joined.variable_name} = {self.variable_name}'
-            f'.join({sep_str});'
-        )
-        expression_file_util.wrap_by_script_tag_and_append_expression(
-            expression=expression)
+        expression_file_util.append_statement(
+            statement=Assign(
+                target=Ref(name=joined.variable_name),
+                value=make_method_call(
+                    variable_name=self.variable_name, method_name='join',
+                    args=[get_value_expression(value=sep)])))
 
     def __str__(self) -> str:
         """
@@ -840,14 +954,12 @@ class Array(CopyInterface):
         value : *
             Any value to search.
         """
-        value_str: str = value_util.get_value_str_for_expression(
-            value=value)
-        expression: str = (
-            f'{index.variable_name} = {self.variable_name}'
-            f'.indexOf({value_str});'
-        )
-        expression_file_util.wrap_by_script_tag_and_append_expression(
-            expression=expression)
+        expression_file_util.append_statement(
+            statement=Assign(
+                target=Ref(name=index.variable_name),
+                value=make_method_call(
+                    variable_name=self.variable_name, method_name='indexOf',
+                    args=[get_value_expression(value=value)])))
 
     def __eq__(self, other: Any) -> bool:
         """
@@ -877,3 +989,25 @@ class Array(CopyInterface):
             If this array is empty, True will be returned.
         """
         return bool(self._value)
+
+
+def _copy_nested_list(value: List[Any]) -> List[Any]:
+    """
+    Copy specified list and nested lists. Other elements (e.g., Int
+    instances) are not copied and the same references will be set.
+
+    Parameters
+    ----------
+    value : list
+        List value to copy.
+
+    Returns
+    -------
+    copied : list
+        Copied list value.
+    """
+    copied: List[Any] = [
+        _copy_nested_list(value=element) if isinstance(element, list)
+        else element
+        for element in value]
+    return copied
@@ -7,15 +7,22 @@ from typing import Union
 from apyscript.converter import cast
 from apyscript.expression import expression_file_util
 from apyscript.expression import expression_variables_util
-from apyscript.type.copy_interface import CopyInterface
+from apyscript.expression.expression_ir import Assign
+from apyscript.expression.expression_ir import Call
+from apyscript.expression.expression_ir import Expression
+from apyscript.expression.expression_ir import Literal
+from apyscript.expression.expression_ir import Ref
+from apyscript.expression.expression_ir import VarDecl
+from apyscript.type.lazy_declaration_interface import \
+    LazyDeclarationInterface
 from apyscript.type.variable_name_interface import VariableNameInterface
 from apyscript.validation import bool_validation
 from apyscript.validation import number_validation
 
 
-class Boolean(CopyInterface):
+class Boolean(LazyDeclarationInterface):
 
-    _initial_value: Union[bool, int, Any]
+    _is_immutable_value: bool = True
     _value: bool
 
     def __init__(self, value: Union[bool, int, Any]) -> None:
@@ -30,13 +37,10 @@ class Boolean(CopyInterface):
         """
         TYPE_NAME: str = 'boolean'
         number_validation.validate_int_is_zero_or_one(integer=value)
-        self._initial_value = value
         value_: bool = self._get_bool_from_arg_value(value=value)
         self._value = value_
         self._type_name = TYPE_NAME
-        self.variable_name = expression_variables_util.get_next_variable_name(
-            type_name=TYPE_NAME)
-        self._append_constructor_expression()
+        self._append_constructor_expression(value=value)
 
     def _get_bool_from_arg_value(
             self, value: Union[bool, int, Any]) -> bool:
@@ -64,19 +68,28 @@ class Boolean(CopyInterface):
         bool_validation.validate_bool(value=result)
         return result
 
-    def _append_constructor_expression(self) -> None:
+    def _append_constructor_expression(
+            self, value: Union[bool, int, Any]) -> None:
         """
-        Append constructor expression to file.
+        Append constructor expression to file. If a literal (or not
+        declared) value is specified, the declaration will be delayed
+        until the variable name is read.
+
+        Parameters
+        ----------
+        value : bool or int or Boolean or Int
+            Initial boolean value (constructor argument).
         """
-        expression: str = f'var {self.variable_name} = '
-        if isinstance(self._initial_value, VariableNameInterface):
-            expression += f'Boolean({self._initial_value.variable_name});'
-        elif self._value:
-            expression += 'true;'
-        else:
-            expression += 'false;'
-        expression_file_util.wrap_by_script_tag_and_append_expression(
-            expression=expression)
+        if not isinstance(value, VariableNameInterface) \
+                or not value._is_declared:
+            self._set_undeclared_value(value=self._value)
+            return
+        self.variable_name = expression_variables_util.get_next_variable_name(
+            type_name=self.type_name)
+        expression_file_util.append_statement(
+            statement=VarDecl(
+                name=self.variable_name,
+                value=self._get_bool_expression(value=value)))
 
     @property
     def value(self) -> Union[bool, int, Any]:
@@ -116,15 +129,32 @@ class Boolean(CopyInterface):
         value : bool or VariableNameInterface
             Any value to set.
         """
-        expression: str = f'{self.variable_name} = '
+        expression_file_util.append_statement(
+            statement=Assign(
+                target=Ref(name=self.variable_name),
+                value=self._get_bool_expression(value=value)))
+
+    def _get_bool_expression(self, value: Union[bool, Any]) -> Expression:
+        """
+        Get a boolean value's expression node.
+
+        Parameters
+        ----------
+        value : bool or VariableNameInterface
+            Any value to convert.
+
+        Returns
+        -------
+        expression : Expression
+            If VariableNameInterface value is specified, then
+            `Boolean(variable_name)` call will be returned. Otherwise
+            `true` or `false` literal will be returned.
+        """
         if isinstance(value, VariableNameInterface):
-            expression += f'Boolean({value._variable_name});'
-        elif value:
-            expression += 'true;'
-        else:
-            expression += 'false;'
-        expression_file_util.wrap_by_script_tag_and_append_expression(
-            expression=expression)
+            return Call(
+                callee=Ref(name='Boolean'),
+                args=[Ref(name=value.variable_name)])
+        return Literal(value=bool(value))
 
     def _set_value_and_skip_expression_appending(
             self, value: Union[bool, int, Any]) -> None:
@@ -1,34 +1,66 @@
 """Class implementation for copy interface.
 """
 
-from copy import deepcopy
+from copy import copy
 from typing import Any
 
 from apyscript.expression import expression_file_util
 from apyscript.expression import expression_variables_util
+from apyscript.expression.expression_ir import Expression
+from apyscript.expression.expression_ir import Ref
+from apyscript.expression.expression_ir import VarDecl
+from apyscript.expression.expression_ir import make_method_call
 from apyscript.type.type_name_interface import TypeNameInterface
 from apyscript.type.variable_name_interface import VariableNameInterface
 
 
 class CopyInterface(TypeNameInterface, VariableNameInterface):
 
+    # If True, value is immutable in the js side (e.g., number or
+    # string) and copy expression will be a plain assignment.
+    _is_immutable_value: bool = False
+
     def _copy(self) -> Any:
         """
-        Make a deep copy of this instance.
+        Make a copy of this instance and append copy expression.
 
         Returns
         -------
         result : *
             Copied instance.
         """
-        result: CopyInterface = deepcopy(self)
+        result: CopyInterface = self._make_copied_instance()
+        self._append_copy_expression(
+            result_variable_name=result.variable_name)
+        return result
+
+    def _make_copied_instance(self) -> Any:
+        """
+        Make a shallow copy of this instance that has a new variable
+        name. Copy expression will not be appended, so this is used
+        when a caller appends its own expression to declare the
+        result variable (e.g., arithmetic operation).
+
+        Returns
+        -------
+        result : *
+            Copied instance.
+        """
+        result: CopyInterface = copy(self)
+        result._copy_mutable_attributes()
         result.variable_name = \
             expression_variables_util.get_next_variable_name(
                 type_name=self.type_name)
-        self._append_copy_expression(
-            result_variable_name=result.variable_name)
         return result
 
+    def _copy_mutable_attributes(self) -> None:
+        """
+        Copy mutable attributes that must not be shared with the copy
+        source instance. This method is called for a shallow-copied
+        instance and subclass that has mutable attributes (e.g., list
+        value) should override this.
+        """
+
     def _append_copy_expression(self, result_variable_name: str) -> None:
         """
         Append copy expression to file.
@@ -38,9 +70,14 @@ class CopyInterface(TypeNameInterface, VariableNameInterface):
         result_variable_name : str
             Copied value's variable name.
         """
-        expression: str = (
-            f'var {result_variable_name} = '
-            f'JSON.parse(JSON.stringify({self.variable_name}));'
-        )
-        expression_file_util.wrap_by_script_tag_and_append_expression(
-            expression=expression)
+        value: Expression = Ref(name=self.variable_name)
+        if not self._is_immutable_value:
+            value = make_method_call(
+                variable_name='JSON', method_name='parse',
+                args=[
+                    make_method_call(
+                        variable_name='JSON', method_name='stringify',
+                        args=[value]),
+                ])
+        expression_file_util.append_statement(
+            statement=VarDecl(name=result_variable_name, value=value))
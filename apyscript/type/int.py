@@ -6,7 +6,10 @@ from typing import Union
 
 from apyscript.converter import cast
 from apyscript.expression import expression_file_util
-from apyscript.expression import expression_variables_util
+from apyscript.expression.expression_ir import Assign
+from apyscript.expression.expression_ir import Call
+from apyscript.expression.expression_ir import Literal
+from apyscript.expression.expression_ir import Ref
 from apyscript.type import type_util
 from apyscript.type.number_value_interface import NumberValueInterface
 from apyscript.validation import number_validation
@@ -27,18 +30,18 @@ class Int(NumberValueInterface):
         is_number_specified: bool = type_util.is_number(
             value=value)
         type_name: str = 'int'
-        self.variable_name = expression_variables_util.get_next_variable_name(
-            type_name=type_name)
         super(Int, self).__init__(value=value, type_name=type_name)
         self._value = cast.to_int_from_float(int_or_float=self.value)
-        self.append_constructor_expression()
+        self.append_constructor_expression(value=value)
         self._append_cast_expression(
             is_number_specified=is_number_specified)
 
     def _append_cast_expression(
             self, is_number_specified: bool) -> None:
         """
-        Append integer cast (parseInt) expression to file.
+        Append integer cast (parseInt) expression to file. If this
+        instance is not declared yet, the value is already cast in
+        the literal, so the expression will not be appended.
 
         Parameters
         ----------
@@ -46,13 +49,14 @@ class Int(NumberValueInterface):
             Boolean value whether a specified value is Number
             instance or not.
         """
-        if not is_number_specified:
+        if not is_number_specified or not self._is_declared:
             return
-        expression: str = (
-            f'{self.variable_name} = parseInt({self.variable_name}, 10);'
-        )
-        expression_file_util.wrap_by_script_tag_and_append_expression(
-            expression=expression)
+        expression_file_util.append_statement(
+            statement=Assign(
+                target=Ref(name=self.variable_name),
+                value=Call(
+                    callee=Ref(name='parseInt'),
+                    args=[Ref(name=self.variable_name), Literal(value=10)])))
 
     def set_value_and_skip_expression_appending(
             self, value: Union[int, float, Any]) -> None:
@@ -74,6 +78,44 @@ class Int(NumberValueInterface):
             value_ = value
         self._value = value_
 
+    def _append_incremental_expression(
+            self, operator: str, other: Union[int, float, Any]) -> None:
+        """
+        Append incremental (in-place) operation expression to file.
+        If float or Number value is specified, integer cast expression
+        will also be appended.
+
+        Parameters
+        ----------
+        operator : str
+            Augmented assignment operator, e.g., `+=`.
+        other : int or float or NumberValueInterface
+            Other value for the operation.
+        """
+        super(Int, self)._append_incremental_expression(
+            operator=operator, other=other)
+        self._append_cast_expression(
+            is_number_specified=type_util.is_float_or_number(value=other))
+
+    def __itruediv__(self, other: Union[int, float, Any]) -> Any:
+        """
+        Method for incremental true division. Result value will be
+        a floating point number, so this is not an in-place operation
+        and a new Number value will be returned.
+
+        Parameters
+        ----------
+        other : int or float or NumberValueInterface
+            Other value for incremental true division.
+
+        Returns
+        -------
+        result : Number
+            True division result value.
+        """
+        result: NumberValueInterface = self / other
+        return result
+
     def __repr__(self) -> str:
         """
         Get a representation string of this instance.
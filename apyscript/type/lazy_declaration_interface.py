@@ -0,0 +1,62 @@
+"""Class implementation for lazy declaration interface.
+"""
+
+from copy import copy
+from typing import Any
+
+from apyscript.expression import expression_file_util
+from apyscript.expression import expression_variables_util
+from apyscript.expression.expression_ir import VarDecl
+from apyscript.expression.expression_ir import get_value_expression
+from apyscript.type.copy_interface import CopyInterface
+
+
+class LazyDeclarationInterface(CopyInterface):
+
+    # Literal value to declare. This is the js side value while this
+    # instance is not declared.
+    _undeclared_value: Any
+
+    def _set_undeclared_value(self, value: Any) -> None:
+        """
+        Delay the declaration of this instance until the variable name
+        is read (e.g., by an appended expression). While this instance
+        is not declared, the value will be inlined as a literal in the
+        expression.
+
+        Parameters
+        ----------
+        value : *
+            Literal value to declare (e.g., 10 or 'Hello!').
+        """
+        self._undeclared_value = value
+        self._is_declared = False
+
+    def _declare(self) -> None:
+        """
+        Allocate a variable name and append the declaration expression
+        of this instance.
+        """
+        self.variable_name = expression_variables_util.get_next_variable_name(
+            type_name=self.type_name)
+        expression_file_util.append_statement(
+            statement=VarDecl(
+                name=self._variable_name,
+                value=get_value_expression(value=self._undeclared_value)))
+
+    def _copy(self) -> Any:
+        """
+        Make a copy of this instance. If this instance is not declared
+        yet, the copy will also be an undeclared instance and no
+        expression will be appended.
+
+        Returns
+        -------
+        result : *
+            Copied instance.
+        """
+        if self._is_declared:
+            return super(LazyDeclarationInterface, self)._copy()
+        result: LazyDeclarationInterface = copy(self)
+        result._copy_mutable_attributes()
+        return result
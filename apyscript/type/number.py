@@ -5,7 +5,6 @@ from typing import Any
 from typing import Union
 
 from apyscript.converter import cast
-from apyscript.expression import expression_variables_util
 from apyscript.type.number_value_interface import NumberValueInterface
 from apyscript.validation import number_validation
 
@@ -23,11 +22,9 @@ class Number(NumberValueInterface):
             is specified, that value will be cast to float.
         """
         type_name: str = 'number'
-        self.variable_name = expression_variables_util.get_next_variable_name(
-            type_name=type_name)
         super(Number, self).__init__(value=value, type_name=type_name)
         self._value = cast.to_float_from_int(int_or_float=self.value)
-        self.append_constructor_expression()
+        self.append_constructor_expression(value=value)
 
     def set_value_and_skip_expression_appending(
             self, value: Union[int, float, Any]) -> None:
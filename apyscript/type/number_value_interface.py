@@ -5,16 +5,22 @@ from typing import Any
 from typing import Union
 
 from apyscript.expression import expression_file_util
-from apyscript.html import html_util
-from apyscript.type.copy_interface import CopyInterface
-from apyscript.type.value_util import get_value_str_for_expression
+from apyscript.expression import expression_variables_util
+from apyscript.expression.expression_ir import Assign
+from apyscript.expression.expression_ir import BinaryOp
+from apyscript.expression.expression_ir import Call
+from apyscript.expression.expression_ir import Ref
+from apyscript.expression.expression_ir import VarDecl
+from apyscript.expression.expression_ir import get_value_expression
+from apyscript.type.lazy_declaration_interface import \
+    LazyDeclarationInterface
 from apyscript.type.variable_name_interface import VariableNameInterface
 from apyscript.validation import number_validation
 
 
-class NumberValueInterface(CopyInterface):
+class NumberValueInterface(LazyDeclarationInterface):
 
-    _initial_value: Union[int, float, Any]
+    _is_immutable_value: bool = True
     _value: Union[int, float]
 
     def __init__(
@@ -30,7 +36,6 @@ class NumberValueInterface(CopyInterface):
             This instance expression's type name (e.g., int, number).
         """
         number_validation.validate_num(num=value)
-        self._initial_value = value
         if isinstance(value, NumberValueInterface):
             value_ = value._value
         else:
@@ -38,20 +43,30 @@ class NumberValueInterface(CopyInterface):
         self._value = value_
         self._type_name = type_name
 
-    def append_constructor_expression(self) -> None:
-        """
-        Append current value's constructor expression to file.
+    def append_constructor_expression(
+            self, value: Union[int, float, Any]) -> None:
         """
-        if isinstance(self._initial_value, NumberValueInterface):
-            value_: Union[int, float, str] = self._initial_value.variable_name
-        else:
-            value_ = self.value
-        expression: str = (
-            f'var {self.variable_name} = {value_};'
-        )
-        expression = html_util.wrap_expression_by_script_tag(
-            expression=expression)
-        expression_file_util.append_expression(expression=expression)
+        Append current value's constructor expression to file. If
+        a literal (or not declared) value is specified, the declaration
+        will be delayed until the variable name is read.
+
+        Parameters
+        ----------
+        value : int or float or NumberValueInterface
+            Initial number value (constructor argument). Only the
+            variable name is referenced if NumberValueInterface is
+            specified, so that instance will not be held.
+        """
+        if not isinstance(value, NumberValueInterface) \
+                or not value._is_declared:
+            self._set_undeclared_value(value=self._value)
+            return
+        self.variable_name = expression_variables_util.get_next_variable_name(
+            type_name=self.type_name)
+        expression_file_util.append_statement(
+            statement=VarDecl(
+                name=self.variable_name,
+                value=get_value_expression(value=value)))
 
     @property
     def value(self) -> Union[int, float, Any]:
@@ -108,16 +123,10 @@ class NumberValueInterface(CopyInterface):
         value : int or float or NumberValueInterface
             Any number value to set.
         """
-        if isinstance(value, NumberValueInterface):
-            right_value: Union[str, int, float] = value.variable_name
-        else:
-            right_value = value
-        expression: str = (
-            f'{self.variable_name} = {right_value};'
-        )
-        expression = html_util.wrap_expression_by_script_tag(
-            expression=expression)
-        expression_file_util.append_expression(expression=expression)
+        expression_file_util.append_statement(
+            statement=Assign(
+                target=Ref(name=self.variable_name),
+                value=get_value_expression(value=value)))
 
     def __add__(self, other: Union[int, float, Any]) -> Any:
         """
@@ -137,7 +146,7 @@ class NumberValueInterface(CopyInterface):
             value: Union[int, float, Any] = self._value + other.value
         else:
             value = self._value + other
-        result: NumberValueInterface = self._copy()
+        result: NumberValueInterface = self._make_copied_instance()
         result.set_value_and_skip_expression_appending(value=value)
         self._append_addition_expression(result=result, other=other)
         return result
@@ -155,13 +164,12 @@ class NumberValueInterface(CopyInterface):
         other : int or float or NumberValueInterface
             Other value to add.
         """
-        right_value: str = get_value_str_for_expression(value=other)
-        expression: str = (
-            f'var {result.variable_name} = '
-            f'{self.variable_name} + {right_value};'
-        )
-        expression_file_util.wrap_by_script_tag_and_append_expression(
-            expression=expression)
+        expression_file_util.append_statement(
+            statement=VarDecl(
+                name=result.variable_name,
+                value=BinaryOp(
+                    left=Ref(name=self.variable_name), operator='+',
+                    right=get_value_expression(value=other))))
 
     def __sub__(self, other: Union[int, float, Any]) -> Any:
         """
@@ -181,7 +189,7 @@ class NumberValueInterface(CopyInterface):
             value: Union[int, float, Any] = self._value - other.value
         else:
             value = self._value - other
-        result: NumberValueInterface = self._copy()
+        result: NumberValueInterface = self._make_copied_instance()
         result.set_value_and_skip_expression_appending(value=value)
         self._append_subtraction_expression(result=result, other=other)
         return result
@@ -199,13 +207,12 @@ class NumberValueInterface(CopyInterface):
         other : int or float or NumberValueInterface
             Other value to subtract.
         """
-        right_value: str = get_value_str_for_expression(value=other)
-        expression: str = (
-            f'var {result.variable_name} = '
-            f'{self.variable_name} - {right_value};'
-        )
-        expression_file_util.wrap_by_script_tag_and_append_expression(
-            expression=expression)
+        expression_file_util.append_statement(
+            statement=VarDecl(
+                name=result.variable_name,
+                value=BinaryOp(
+                    left=Ref(name=self.variable_name), operator='-',
+                    right=get_value_expression(value=other))))
 
     def __mul__(self, other: Union[int, float, Any]) -> Any:
         """
@@ -225,7 +232,7 @@ class NumberValueInterface(CopyInterface):
             value: Union[int, float, Any] = self._value * other.value
         else:
             value = self._value * other
-        result: NumberValueInterface = self._copy()
+        result: NumberValueInterface = self._make_copied_instance()
         result.set_value_and_skip_expression_appending(value=value)
         self._append_multiplication_expression(result=result, other=other)
         return result
@@ -243,13 +250,12 @@ class NumberValueInterface(CopyInterface):
         other : int or float or NumberValueInterface
             Other value to multiply.
         """
-        right_value: str = get_value_str_for_expression(value=other)
-        expression: str = (
-            f'var {result.variable_name} = '
-            f'{self.variable_name} * {right_value};'
-        )
-        expression_file_util.wrap_by_script_tag_and_append_expression(
-            expression=expression)
+        expression_file_util.append_statement(
+            statement=VarDecl(
+                name=result.variable_name,
+                value=BinaryOp(
+                    left=Ref(name=self.variable_name), operator='*',
+                    right=get_value_expression(value=other))))
 
     def __truediv__(self, other: Union[int, float, Any]) -> Any:
         """
@@ -288,13 +294,12 @@ class NumberValueInterface(CopyInterface):
         other : int or float or NumberValueInterface
             Other value for true division.
         """
-        right_value: str = get_value_str_for_expression(value=other)
-        expression: str = (
-            f'{result.variable_name} = {result.variable_name} / '
-            f'{right_value};'
-        )
-        expression_file_util.wrap_by_script_tag_and_append_expression(
-            expression=expression)
+        expression_file_util.append_statement(
+            statement=Assign(
+                target=Ref(name=result.variable_name),
+                value=BinaryOp(
+                    left=Ref(name=result.variable_name), operator='/',
+                    right=get_value_expression(value=other))))
 
     def __floordiv__(self, other: Union[int, float, Any]) -> Any:
         """
@@ -333,17 +338,22 @@ class NumberValueInterface(CopyInterface):
         other : int or float or NumberValueInterface
             Other value for floor division.
         """
-        right_value: str = get_value_str_for_expression(value=other)
-        expression: str = (
-            f'{result.variable_name} = '
-            f'parseInt({result.variable_name} / {right_value});'
-        )
-        expression_file_util.wrap_by_script_tag_and_append_expression(
-            expression=expression)
+        expression_file_util.append_statement(
+            statement=Assign(
+                target=Ref(name=result.variable_name),
+                value=Call(
+                    callee=Ref(name='parseInt'),
+                    args=[
+                        BinaryOp(
+                            left=Ref(name=result.variable_name),
+                            operator='/',
+                            right=get_value_expression(value=other)),
+                    ])))
 
     def __iadd__(self, other: Union[int, float, Any]) -> Any:
         """
-        Method for incremental addition.
+        Method for incremental addition. This value will be updated
+        in place and the same js variable will be reused.
 
         Parameters
         ----------
@@ -353,14 +363,20 @@ class NumberValueInterface(CopyInterface):
         Returns
         -------
         result : NumberValueInterface
-            Incremental addition result value.
+            This instance (updated value).
         """
-        result: NumberValueInterface = self + other
-        return result
+        if isinstance(other, NumberValueInterface):
+            value: Union[int, float, Any] = self._value + other.value
+        else:
+            value = self._value + other
+        self.set_value_and_skip_expression_appending(value=value)
+        self._append_incremental_expression(operator='+=', other=other)
+        return self
 
     def __isub__(self, other: Union[int, float, Any]) -> Any:
         """
-        Method for incremental subtraction.
+        Method for incremental subtraction. This value will be updated
+        in place and the same js variable will be reused.
 
         Parameters
         ----------
@@ -370,14 +386,20 @@ class NumberValueInterface(CopyInterface):
         Returns
         -------
         result : NumberValueInterface
-            Incremental subtraction result value.
+            This instance (updated value).
         """
-        result: NumberValueInterface = self - other
-        return result
+        if isinstance(other, NumberValueInterface):
+            value: Union[int, float, Any] = self._value - other.value
+        else:
+            value = self._value - other
+        self.set_value_and_skip_expression_appending(value=value)
+        self._append_incremental_expression(operator='-=', other=other)
+        return self
 
     def __imul__(self, other: Union[int, float, Any]) -> Any:
         """
-        Method for incremental multiplication.
+        Method for incremental multiplication. This value will be updated
+        in place and the same js variable will be reused.
 
         Parameters
         ----------
@@ -387,14 +409,20 @@ class NumberValueInterface(CopyInterface):
         Returns
         -------
         result : NumberValueInterface
-            Incremental multiplication result value.
+            This instance (updated value).
         """
-        result: NumberValueInterface = self * other
-        return result
+        if isinstance(other, NumberValueInterface):
+            value: Union[int, float, Any] = self._value * other.value
+        else:
+            value = self._value * other
+        self.set_value_and_skip_expression_appending(value=value)
+        self._append_incremental_expression(operator='*=', other=other)
+        return self
 
     def __itruediv__(self, other: Union[int, float, Any]) -> Any:
         """
-        Method for incremental true division.
+        Method for incremental true division. This value will be updated
+        in place and the same js variable will be reused.
 
         Parameters
         ----------
@@ -404,10 +432,33 @@ class NumberValueInterface(CopyInterface):
         Returns
         -------
         result : NumberValueInterface
-            Incremental true division result value.
+            This instance (updated value).
         """
-        result: NumberValueInterface = self / other
-        return result
+        if isinstance(other, NumberValueInterface):
+            value: Union[int, float, Any] = self._value / other.value
+        else:
+            value = self._value / other
+        self.set_value_and_skip_expression_appending(value=value)
+        self._append_incremental_expression(operator='/=', other=other)
+        return self
+
+    def _append_incremental_expression(
+            self, operator: str, other: Union[int, float, Any]) -> None:
+        """
+        Append incremental (in-place) operation expression to file.
+
+        Parameters
+        ----------
+        operator : str
+            Augmented assignment operator, e.g., `+=`.
+        other : int or float or NumberValueInterface
+            Other value for the operation.
+        """
+        expression_file_util.append_statement(
+            statement=Assign(
+                target=Ref(name=self.variable_name),
+                value=get_value_expression(value=other),
+                operator=operator))
 
     def __str__(self) -> str:
         """
@@ -6,15 +6,21 @@ from typing import Union
 
 from apyscript.expression import expression_file_util
 from apyscript.expression import expression_variables_util
-from apyscript.type.copy_interface import CopyInterface
-from apyscript.type.value_util import get_value_str_for_expression
+from apyscript.expression.expression_ir import Assign
+from apyscript.expression.expression_ir import BinaryOp
+from apyscript.expression.expression_ir import Ref
+from apyscript.expression.expression_ir import VarDecl
+from apyscript.expression.expression_ir import get_value_expression
+from apyscript.expression.expression_ir import make_method_call
+from apyscript.type.lazy_declaration_interface import \
+    LazyDeclarationInterface
 from apyscript.type.variable_name_interface import VariableNameInterface
 from apyscript.validation import string_validation
 
 
-class String(CopyInterface):
+class String(LazyDeclarationInterface):
 
-    _initial_value: Union[str, Any]
+    _is_immutable_value: bool = True
     _value: str
 
     def __init__(self, value: Union[str, Any]) -> None:
@@ -28,24 +34,30 @@ class String(CopyInterface):
         """
         TYPE_NAME: str = 'string'
         string_validation.validate_string_type(string=value)
-        self._initial_value = value
         self._type_name = TYPE_NAME
         self._value = self._get_str_value(value=value)
-        self.variable_name = expression_variables_util.get_next_variable_name(
-            type_name=TYPE_NAME)
-        self._append_constructor_expression()
+        self._append_constructor_expression(value=value)
 
-    def _append_constructor_expression(self) -> None:
+    def _append_constructor_expression(self, value: Union[str, Any]) -> None:
         """
-        Append constructor expression to file.
+        Append constructor expression to file. If a literal (or not
+        declared) value is specified, the declaration will be delayed
+        until the variable name is read.
+
+        Parameters
+        ----------
+        value : str or String
+            Initial string value (constructor argument).
         """
-        expression: str = f'var {self.variable_name} = '
-        if isinstance(self._initial_value, String):
-            expression += f'{self._initial_value.variable_name};'
-        else:
-            expression += f'"{self._value}";'
-        expression_file_util.wrap_by_script_tag_and_append_expression(
-            expression=expression)
+        if not isinstance(value, String) or not value._is_declared:
+            self._set_undeclared_value(value=self._value)
+            return
+        self.variable_name = expression_variables_util.get_next_variable_name(
+            type_name=self.type_name)
+        expression_file_util.append_statement(
+            statement=VarDecl(
+                name=self.variable_name,
+                value=get_value_expression(value=value)))
 
     def _get_str_value(self, value: Union[str, Any]) -> str:
         """
@@ -101,13 +113,10 @@ class String(CopyInterface):
         value : str or String
             Any string value to set.
         """
-        expression: str = f'{self.variable_name} = '
-        if isinstance(value, String):
-            expression += f'{value.variable_name};'
-        else:
-            expression += f'"{value}";'
-        expression_file_util.wrap_by_script_tag_and_append_expression(
-            expression=expression)
+        expression_file_util.append_statement(
+            statement=Assign(
+                target=Ref(name=self.variable_name),
+                value=get_value_expression(value=value)))
 
     def __add__(self, other: Union[str, Any]) -> Any:
         """
@@ -128,7 +137,7 @@ class String(CopyInterface):
             value: str = self._value + other.value
         else:
             value = self._value + other
-        result: String = self._copy()
+        result: String = self._make_copied_instance()
         result._value = value
         self._append_addition_expression(result=result, other=other)
         return result
@@ -146,13 +155,12 @@ class String(CopyInterface):
         other : str or String
             Other string value to concatenate.
         """
-        right_value: str = get_value_str_for_expression(value=other)
-        expression: str = (
-            f'var {result.variable_name} = '
-            f'{self.variable_name} + {right_value};'
-        )
-        expression_file_util.wrap_by_script_tag_and_append_expression(
-            expression=expression)
+        expression_file_util.append_statement(
+            statement=VarDecl(
+                name=result.variable_name,
+                value=BinaryOp(
+                    left=Ref(name=self.variable_name), operator='+',
+                    right=get_value_expression(value=other))))
 
     def __mul__(self, other: Union[int, Any]) -> Any:
         """
@@ -175,7 +183,7 @@ class String(CopyInterface):
             value: int = other.value  # type: ignore
         else:
             value = other
-        result: String = self._copy()
+        result: String = self._make_copied_instance()
         result._value = result._value * value
         self._append_multiplication_expression(result=result, other=other)
         return result
@@ -209,6 +217,8 @@ class String(CopyInterface):
     def __iadd__(self, other: Union[str, Any]) -> Any:
         """
         Method for incremental addition (string concatenation).
+        This value will be updated in place and the same js variable
+        will be reused.
 
         Parameters
         ----------
@@ -218,14 +228,21 @@ class String(CopyInterface):
         Returns
         -------
         result : String
-            Concatenated result string.
+            This instance (concatenated string).
         """
-        result: String = self + other
-        return result
+        string_validation.validate_string_type(string=other)
+        self._value += self._get_str_value(value=other)
+        expression_file_util.append_statement(
+            statement=Assign(
+                target=Ref(name=self.variable_name),
+                value=get_value_expression(value=other), operator='+='))
+        return self
 
     def __imul__(self, other: Union[int, Any]) -> Any:
         """
         Method for incremental multiplication (string repetition).
+        This value will be updated in place and the same js variable
+        will be reused.
 
         Parameters
         ----------
@@ -235,10 +252,23 @@ class String(CopyInterface):
         Returns
         -------
         result : String
-            Repetition result string.
+            This instance (repeated string).
         """
-        result: String = self * other
-        return result
+        from apyscript.type import Int
+        from apyscript.validation import number_validation
+        number_validation.validate_integer(integer=other)
+        if isinstance(other, Int):
+            value: int = other.value  # type: ignore
+        else:
+            value = other
+        self._value *= value
+        expression_file_util.append_statement(
+            statement=Assign(
+                target=Ref(name=self.variable_name),
+                value=make_method_call(
+                    variable_name=self.variable_name, method_name='repeat',
+                    args=[get_value_expression(value=other)])))
+        return self
 
     def __str__(self) -> str:
         """
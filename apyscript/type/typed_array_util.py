@@ -0,0 +1,132 @@
+"""Typed array (e.g., `array.array` or NumPy's 1-dimensional numeric
+array) related utilities. NumPy is not required; each value is handled
+by the buffer protocol.
+
+Mainly following interfaces are defined:
+
+- get_typed_array_name
+    Get a js typed array's class name of specified value.
+- is_typed_array
+    Get a boolean whether specified value is a typed array.
+- get_base64_str
+    Get a base64 string of specified typed array's buffer.
+- to_list
+    Convert specified typed array to (Python's) builtin list.
+"""
+
+import base64
+import sys
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+# Pairs of the buffer's format character and item size, and js typed
+# array's class name.
+_TYPED_ARRAY_NAMES: Dict[Tuple[str, int], str] = {
+    ('b', 1): 'Int8Array',
+    ('B', 1): 'Uint8Array',
+    ('h', 2): 'Int16Array',
+    ('H', 2): 'Uint16Array',
+    ('i', 4): 'Int32Array',
+    ('I', 4): 'Uint32Array',
+    ('l', 4): 'Int32Array',
+    ('L', 4): 'Uint32Array',
+    ('l', 8): 'BigInt64Array',
+    ('L', 8): 'BigUint64Array',
+    ('q', 8): 'BigInt64Array',
+    ('Q', 8): 'BigUint64Array',
+    ('f', 4): 'Float32Array',
+    ('d', 8): 'Float64Array',
+}
+
+# Js typed arrays' byte order is the platform's one, and it is
+# little-endian in practice.
+_IS_LITTLE_ENDIAN: bool = sys.byteorder == 'little'
+
+
+def get_typed_array_name(value: Any) -> Optional[str]:
+    """
+    Get a js typed array's class name of specified value.
+
+    Parameters
+    ----------
+    value : *
+        Any value to check.
+
+    Returns
+    -------
+    typed_array_name : str or None
+        Js typed array's class name, e.g., `Float64Array`. If
+        specified value is not a 1-dimensional numeric buffer of the
+        native byte order (e.g., list, bytes, or NumPy's object
+        array), None will be returned.
+    """
+    if not _IS_LITTLE_ENDIAN:
+        return None
+    if isinstance(value, (str, bytes, bytearray, memoryview)):
+        return None
+    try:
+        view: memoryview = memoryview(value)
+    except TypeError:
+        return None
+    if view.ndim != 1:
+        return None
+    format_: str = view.format
+    if format_.startswith('@'):
+        format_ = format_[1:]
+    return _TYPED_ARRAY_NAMES.get((format_, view.itemsize))
+
+
+def is_typed_array(value: Any) -> bool:
+    """
+    Get a boolean whether specified value is a typed array (e.g.,
+    `array.array` or NumPy's 1-dimensional numeric array).
+
+    Parameters
+    ----------
+    value : *
+        Any value to check.
+
+    Returns
+    -------
+    result : bool
+        If specified value is a typed array, True will be returned.
+    """
+    return get_typed_array_name(value=value) is not None
+
+
+def get_base64_str(value: Any) -> str:
+    """
+    Get a base64 string of specified typed array's buffer.
+
+    Parameters
+    ----------
+    value : *
+        Target typed array.
+
+    Returns
+    -------
+    base64_str : str
+        Base64 string of the buffer's bytes.
+    """
+    return base64.b64encode(memoryview(value).tobytes()).decode('ascii')
+
+
+def to_list(value: Any) -> List[Any]:
+    """
+    Convert specified typed array to (Python's) builtin list.
+
+    Parameters
+    ----------
+    value : *
+        Target typed array.
+
+    Returns
+    -------
+    list_value : list
+        Converted list (each value is builtin int or float).
+    """
+    list_value: List[Any] = memoryview(value).tolist()
+    return list_value
@@ -4,14 +4,27 @@ Mainly following interfaces are defined:
 
 - get_value_str_for_expression
     Get a value string for expression.
+- get_primitive_iterable_copy
+    Get a copy (nested tuple) of specified list or tuple if it
+    contains only primitive values.
 - get_copy
     Get a copy of specified instance if it is instance of CopyInterface.
 """
 
+import json
 from typing import Any
 from typing import List
+from typing import Optional
+from typing import Set
 from typing import Union
 
+# Types that can be serialized by the `json.dumps` with the same
+# result as the js expression (exact types; subclasses, e.g., Int,
+# are not included).
+_JSON_PRIMITIVE_TYPES: Set[type] = {bool, int, float}
+
+_PRIMITIVE_TYPES: Set[type] = {bool, int, float, str}
+
 
 def get_value_str_for_expression(value: Any) -> str:
     """
@@ -26,20 +39,43 @@ def get_value_str_for_expression(value: Any) -> str:
     -------
     value_str : str
         String for expression. If value is instance of
-        VariableNameInterface, then variable's name will be returned,
-        otherwise string casted value will be returned.
+        VariableNameInterface, then variable's name will be returned
+        (if that instance is not declared yet, its literal value's
+        string will be returned instead), otherwise string casted
+        value will be returned.
         Bool value will be lowercase (true or false) and str value
         will be quoted by double quotation.
         List or tuple value will be converted to js Array expression,
         e.g., '[10, "Hello!", true, any_variable]'.
+        Typed array (e.g., NumPy's array or `array.array`) will be
+        converted to js Array expression decoded from the base64
+        payload.
     """
+    type_: type = type(value)
+    if type_ is bool:
+        return str(value).lower()
+    if type_ is str:
+        return f'"{value}"'
+    if type_ is int or type_ is float:
+        return str(value)
+    if type_ is list or type_ is tuple:
+        return _get_value_str_from_iterable(value=value)
+    from apyscript.expression.expression_ir import get_value_expression
+    from apyscript.type import typed_array_util
+    from apyscript.type.lazy_declaration_interface import \
+        LazyDeclarationInterface
     from apyscript.type.variable_name_interface import VariableNameInterface
+    if isinstance(value, LazyDeclarationInterface) \
+            and not value._is_declared:
+        return get_value_str_for_expression(value=value._undeclared_value)
     if isinstance(value, VariableNameInterface):
         return value.variable_name
     if isinstance(value, bool):
         return str(value).lower()
     if isinstance(value, str):
         return f'"{value}"'
+    if typed_array_util.is_typed_array(value=value):
+        return get_value_expression(value=value).to_js()
     if isinstance(value, (list, tuple)):
         value_str: str = _get_value_str_from_iterable(value=value)
         return value_str
@@ -59,25 +95,92 @@ def _get_value_str_from_iterable(value: Union[list, tuple, Any]) -> str:
     -------
     value_str : str
         Converted string, e.g., '[10, "Hello!", true, any_variable]'.
+        Iterable of only numbers or booleans will be serialized by the
+        `json.dumps`, and iterable of only strings will be joined
+        directly (per-element conversion is used only when other
+        values, e.g., variables, are included).
     """
-    from apyscript.type import Array
-    from apyscript.type.variable_name_interface import VariableNameInterface
-    if isinstance(value, Array):
-        value_: List[Any] = value.value  # type: ignore
-    elif isinstance(value, tuple):
-        value_ = list(value)
-    else:
-        value_ = value
-    value_str: str = '['
-    for unit_value in value_:
-        if value_str != '[':
-            value_str += ', '
-        if isinstance(unit_value, VariableNameInterface):
-            value_str += f'{unit_value.variable_name}'
+    if not isinstance(value, (list, tuple)):
+        from apyscript.type import Array
+        if isinstance(value, Array):
+            value = value.value
+    if _is_json_primitive_iterable(value=value):
+        return json.dumps(value, separators=(', ', ': '))
+    value_types: Set[type] = {type(unit_value) for unit_value in value}
+    if value_types == {str}:
+        joined: str = '", "'.join(value)
+        return f'["{joined}"]'
+    value_str: str = ', '.join([
+        get_value_str_for_expression(value=unit_value)
+        for unit_value in value])
+    return f'[{value_str}]'
+
+
+def _is_json_primitive_iterable(value: Union[list, tuple]) -> bool:
+    """
+    Get a boolean whether specified iterable (including nested lists
+    or tuples) contains only the numbers or booleans.
+
+    Parameters
+    ----------
+    value : list or tuple
+        Target iterable value.
+
+    Returns
+    -------
+    result : bool
+        If specified iterable can be serialized by the `json.dumps`
+        with the same result as the js expression, True will be
+        returned.
+    """
+    value_types: Set[type] = {type(unit_value) for unit_value in value}
+    if value_types <= _JSON_PRIMITIVE_TYPES:
+        return True
+    if not value_types <= _JSON_PRIMITIVE_TYPES | {list, tuple}:
+        return False
+    for unit_value in value:
+        if type(unit_value) in _JSON_PRIMITIVE_TYPES:
+            continue
+        if not _is_json_primitive_iterable(value=unit_value):
+            return False
+    return True
+
+
+def get_primitive_iterable_copy(
+        value: Union[list, tuple]) -> Optional[tuple]:
+    """
+    Get a copy (nested tuple) of specified list or tuple if it
+    contains only primitive values.
+
+    Parameters
+    ----------
+    value : list or tuple
+        Target iterable value.
+
+    Returns
+    -------
+    copied : tuple or None
+        Copied value (nested list will also be converted to tuple).
+        If specified value contains any value other than the builtin
+        bool, int, float, str, list, or tuple (e.g., Int instance),
+        None will be returned.
+    """
+    value_types: Set[type] = {type(unit_value) for unit_value in value}
+    if value_types <= _PRIMITIVE_TYPES:
+        return tuple(value)
+    if not value_types <= _PRIMITIVE_TYPES | {list, tuple}:
+        return None
+    copied: List[Any] = []
+    for unit_value in value:
+        if type(unit_value) in _PRIMITIVE_TYPES:
+            copied.append(unit_value)
             continue
-        value_str += get_value_str_for_expression(value=unit_value)
-    value_str += ']'
-    return value_str
+        nested: Optional[tuple] = get_primitive_iterable_copy(
+            value=unit_value)
+        if nested is None:
+            return None
+        copied.append(nested)
+    return tuple(copied)
 
 
 def get_copy(value: Any) -> Any:
@@ -8,16 +8,25 @@ class VariableNameInterface:
 
     _variable_name: str
 
+    # If False, the variable name is not allocated and the declaration
+    # expression is not appended yet (e.g., value created from a
+    # literal). Declaration will be appended when the name is read.
+    _is_declared: bool = True
+
     @property
     def variable_name(self) -> str:
         """
-        Get a js variable name of this instance.
+        Get a js variable name of this instance. If this instance is
+        not declared yet, the declaration expression will be appended
+        before the name is returned.
 
         Returns
         -------
         variable_name : str
             A js variable name of this instance.
         """
+        if not self._is_declared:
+            self._declare()
         return self._variable_name
 
     @variable_name.setter
@@ -32,3 +41,12 @@ class VariableNameInterface:
         """
         string_validation.validate_not_empty_string(string=variable_name)
         self._variable_name = variable_name
+        self._is_declared = True
+
+    def _declare(self) -> None:
+        """
+        Allocate a variable name and append the declaration expression
+        of this instance. Subclass that delays the declaration should
+        override this.
+        """
+        self._is_declared = True
@@ -0,0 +1,104 @@
+"""Benchmark of the memory usage of long arithmetic chains
+(e.g., `total = total + x` in a loop).
+
+Each chain length's peak traced memory per operation is logged.
+Per-operation memory should stay flat regardless of the chain
+length (each result value not holds its predecessors).
+
+Command examples:
+$ python benchmarks/arithmetic_chain_memory/main.py
+$ python benchmarks/arithmetic_chain_memory/main.py --max_length 100000
+"""
+
+import sys
+
+sys.path.append('./')
+
+import argparse
+import time
+import tracemalloc
+from logging import Logger
+from typing import List
+from typing import Tuple
+
+from apyscript.console import loggers
+from apyscript.expression.build_session import BuildSession
+from apyscript.type import Int
+
+logger: Logger = loggers.get_info_logger()
+
+
+def _run_chain(chain_length: int) -> Tuple[float, int]:
+    """
+    Run an arithmetic chain in an independent (in-memory) build
+    session and measure it.
+
+    Parameters
+    ----------
+    chain_length : int
+        Number of the addition operations.
+
+    Returns
+    -------
+    elapsed_sec : float
+        Elapsed seconds of the chain.
+    peak_bytes : int
+        Peak traced memory bytes (including the emitted expression
+        buffer).
+    """
+    with BuildSession():
+        tracemalloc.start()
+        start_time: float = time.perf_counter()
+        total: Int = Int(0)
+        increment: Int = Int(1)
+        for _ in range(chain_length):
+            total = total + increment
+        elapsed_sec: float = time.perf_counter() - start_time
+        _, peak_bytes = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return elapsed_sec, peak_bytes
+
+
+def _get_chain_lengths(max_length: int) -> List[int]:
+    """
+    Get chain lengths to measure (powers of 10 up to max length).
+
+    Parameters
+    ----------
+    max_length : int
+        Maximum chain length.
+
+    Returns
+    -------
+    chain_lengths : list of int
+        Chain lengths, e.g., [10, 100, 1000].
+    """
+    chain_lengths: List[int] = []
+    chain_length: int = 10
+    while chain_length <= max_length:
+        chain_lengths.append(chain_length)
+        chain_length *= 10
+    return chain_lengths
+
+
+def main() -> None:
+    """
+    Entry point of this benchmark.
+    """
+    parser: argparse.ArgumentParser = argparse.ArgumentParser()
+    parser.add_argument('--max_length', type=int, default=10000)
+    args: argparse.Namespace = parser.parse_args()
+    for chain_length in _get_chain_lengths(max_length=args.max_length):
+        elapsed_sec, peak_bytes = _run_chain(chain_length=chain_length)
+        logger.info(
+            msg=(
+                f'chain length: {chain_length}, '
+                f'elapsed: {elapsed_sec:.3f}s, '
+                f'peak memory: {peak_bytes} bytes, '
+                f'per operation: {peak_bytes / chain_length:.1f} bytes, '
+                f'{elapsed_sec / chain_length * 1e6:.2f}us'
+            ))
+
+
+if __name__ == '__main__':
+    main()
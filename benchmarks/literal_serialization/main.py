@@ -0,0 +1,204 @@
+"""Benchmark of the literal serialization of large lists (e.g.,
+`Array([...])` of the plotting data).
+
+Each list size's elapsed seconds of the serialization and of the
+Array construction (including the js expression reading) are logged.
+Elapsed seconds should grow linearly with the list size.
+
+Command examples:
+$ python benchmarks/literal_serialization/main.py
+$ python benchmarks/literal_serialization/main.py --max_size 100000
+"""
+
+import sys
+
+sys.path.append('./')
+
+import argparse
+import time
+from logging import Logger
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+
+from apyscript.console import loggers
+from apyscript.expression import expression_file_util
+from apyscript.expression.build_session import BuildSession
+from apyscript.type import Array
+from apyscript.type import Int
+from apyscript.type import value_util
+
+logger: Logger = loggers.get_info_logger()
+
+
+def _make_float_list(size: int) -> List[Any]:
+    """
+    Make a flat float values list.
+
+    Parameters
+    ----------
+    size : int
+        Number of the values.
+
+    Returns
+    -------
+    values : list of float
+        Created list, e.g., [0.0, 0.5, 1.0].
+    """
+    return [i * 0.5 for i in range(size)]
+
+
+def _make_nested_list(size: int) -> List[Any]:
+    """
+    Make a nested (pairs of int and float) values list.
+
+    Parameters
+    ----------
+    size : int
+        Number of the values (sum of each pair's values).
+
+    Returns
+    -------
+    values : list of list
+        Created list, e.g., [[0, 0.0], [1, 0.5]].
+    """
+    return [[i, i * 0.5] for i in range(size // 2)]
+
+
+def _make_string_list(size: int) -> List[Any]:
+    """
+    Make a string values list.
+
+    Parameters
+    ----------
+    size : int
+        Number of the values.
+
+    Returns
+    -------
+    values : list of str
+        Created list, e.g., ['0', '1', '2'].
+    """
+    return [str(i) for i in range(size)]
+
+
+def _make_variables_list(size: int) -> List[Any]:
+    """
+    Make a list that embeds a variable (per-element fallback path).
+
+    Parameters
+    ----------
+    size : int
+        Number of the values.
+
+    Returns
+    -------
+    values : list
+        Created list, e.g., [int_1, 1, 2].
+    """
+    int_1: Int = Int(0)
+    int_1.variable_name
+    values: List[Any] = [int_1]
+    values.extend(range(1, size))
+    return values
+
+
+_LIST_MAKERS: Dict[str, Callable[[int], List[Any]]] = {
+    'float': _make_float_list,
+    'nested': _make_nested_list,
+    'string': _make_string_list,
+    'variables': _make_variables_list,
+}
+
+
+def _run_serialization(values: List[Any]) -> float:
+    """
+    Measure the literal serialization of specified list.
+
+    Parameters
+    ----------
+    values : list
+        Target list.
+
+    Returns
+    -------
+    elapsed_sec : float
+        Elapsed seconds of the serialization.
+    """
+    start_time: float = time.perf_counter()
+    value_util.get_value_str_for_expression(value=values)
+    return time.perf_counter() - start_time
+
+
+def _run_array(values: List[Any]) -> float:
+    """
+    Measure the Array construction and js expression reading of
+    specified list in an independent (in-memory) build session.
+
+    Parameters
+    ----------
+    values : list
+        Target list.
+
+    Returns
+    -------
+    elapsed_sec : float
+        Elapsed seconds of the construction and reading.
+    """
+    with BuildSession():
+        start_time: float = time.perf_counter()
+        Array(values)
+        expression_file_util.get_current_expression()
+        elapsed_sec: float = time.perf_counter() - start_time
+    return elapsed_sec
+
+
+def _get_sizes(max_size: int) -> List[int]:
+    """
+    Get list sizes to measure (powers of 10 up to max size).
+
+    Parameters
+    ----------
+    max_size : int
+        Maximum list size.
+
+    Returns
+    -------
+    sizes : list of int
+        List sizes, e.g., [10, 100, 1000].
+    """
+    sizes: List[int] = []
+    size: int = 10
+    while size <= max_size:
+        sizes.append(size)
+        size *= 10
+    return sizes
+
+
+def main() -> None:
+    """
+    Entry point of this benchmark.
+    """
+    parser: argparse.ArgumentParser = argparse.ArgumentParser()
+    parser.add_argument('--max_size', type=int, default=1000000)
+    args: argparse.Namespace = parser.parse_args()
+    for list_type, make_list in _LIST_MAKERS.items():
+        for size in _get_sizes(max_size=args.max_size):
+            with BuildSession():
+                values: List[Any] = make_list(size)
+                serialization_sec: float = _run_serialization(
+                    values=values)
+                array_sec: float = _run_array(values=values)
+            logger.info(
+                msg=(
+                    f'list type: {list_type}, size: {size}, '
+                    f'serialization: {serialization_sec:.3f}s '
+                    f'({serialization_sec / size * 1e6:.2f}us per value), '
+                    f'array: {array_sec:.3f}s '
+                    f'({array_sec / size * 1e6:.2f}us per value)'
+                ))
+
+
+if __name__ == '__main__':
+    main()
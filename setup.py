@@ -28,9 +28,12 @@ setup(
     description=_DESCRIPTION,
     long_description=_LONG_DESCRIPTION,
     packages=find_packages(
-        exclude=('tests', 'tests.*', 'test_projects', 'test_projects.*')),
+        exclude=(
+            'tests', 'tests.*', 'test_projects', 'test_projects.*',
+            'benchmarks', 'benchmarks.*')),
     install_requires=[
         'typing-extensions',
+        'contextvars; python_version < "3.7"',
     ],
     include_package_data=True,
     license='MIT',
@@ -10,6 +10,7 @@ import sys
 sys.path.append('./')
 
 import os
+from array import array
 from types import ModuleType
 
 from apyscript.console.assertion import assert_arrays_equal
@@ -133,6 +134,14 @@ def main() -> None:
     assert_equal(expected=1, actual=array_24.index_of(int_3))
     assert_equal(expected=2, actual=array_24.index_of(3))
 
+    array_25: Array = Array(array('d', [1.5, 2.5, 3.5]))
+    assert_arrays_equal(expected=[1.5, 2.5, 3.5], actual=array_25)
+    array_25.append(4.5)
+    assert_arrays_equal(expected=[1.5, 2.5, 3.5, 4.5], actual=array_25)
+
+    array_26: Array = Array(array('q', [-1, 2]))
+    assert_arrays_equal(expected=[-1, 2], actual=array_26)
+
     exporter.save_expressions_overall_html(dest_dir_path=_DEST_DIR_PATH)
 
 
@@ -0,0 +1,61 @@
+"""Test project for `draw_rects` interface.
+
+Command examples:
+$ python test_projects/draw_rects/main.py
+$ python draw_rects/main.py
+"""
+
+import sys
+
+sys.path.append('./')
+
+import os
+from types import ModuleType
+
+from apyscript.console.assertion import assert_equal
+from apyscript.display import Sprite
+from apyscript.display.rectangles import Rectangles
+from apyscript.display.stage import Stage
+from apyscript.file import file_util
+from apyscript.html import exporter
+from apyscript.type import Array
+from apyscript.type import Int
+
+this_module: ModuleType = sys.modules[__name__]
+
+_DEST_DIR_PATH: str = os.path.join(
+    file_util.get_abs_module_dir_path(module=this_module),
+    'test_output/'
+)
+
+
+def main() -> None:
+    """
+    Entry point of this test project.
+    """
+    stage: Stage = Stage(
+        background_color='#111',
+        stage_width=1000, stage_height=500)
+
+    sprite: Sprite = Sprite(stage=stage)
+    sprite.graphics.begin_fill(color='#00aaff')
+    rectangles: Rectangles = sprite.graphics.draw_rects(
+        xs=[50, 150, 250], ys=[50, 50, 50],
+        widths=[50, 50, 50], heights=[50, 100, 150])
+    stage.add_child(child=sprite)
+    assert rectangles.length == 3
+
+    sprite.graphics.begin_fill(color='#f0a', alpha=0.5)
+    sprite.graphics.line_style(color='#fff', thickness=3)
+    sprite.graphics.draw_rects(
+        xs=Array([350, Int(450)]), ys=Array([50, 50]),
+        widths=[50, 50], heights=[50, 50])
+    num_children: Int = sprite.graphics.num_children
+    assert_equal(expected=5, actual=num_children)
+
+    exporter.save_expressions_overall_html(
+        dest_dir_path=_DEST_DIR_PATH)
+
+
+if __name__ == '__main__':
+    main()
@@ -72,18 +72,27 @@ def test_assert_not_equal() -> None:
 
 
 @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
-def test__get_expected_and_actual_strs() -> None:
+def test__get_expected_and_actual_expressions() -> None:
     int_1: Int = Int(10)
     int_2: Int = Int(20)
-    expected_str, actual_str = assertion._get_expected_and_actual_strs(
-        expected=int_1, actual=int_2)
-    assert expected_str == int_1.variable_name
-    assert actual_str == int_2.variable_name
-
-    expected_str, actual_str = assertion._get_expected_and_actual_strs(
-        expected='Hello', actual='World!')
-    assert expected_str == '"Hello"'
-    assert actual_str == '"World!"'
+    expected_exp, actual_exp = \
+        assertion._get_expected_and_actual_expressions(
+            expected=int_1, actual=int_2)
+    assert expected_exp.to_js() == '10'
+    assert actual_exp.to_js() == '20'
+
+    int_1_name: str = int_1.variable_name
+    expected_exp, actual_exp = \
+        assertion._get_expected_and_actual_expressions(
+            expected=int_1, actual=int_2)
+    assert expected_exp.to_js() == int_1_name
+    assert actual_exp.to_js() == '20'
+
+    expected_exp, actual_exp = \
+        assertion._get_expected_and_actual_expressions(
+            expected='Hello', actual='World!')
+    assert expected_exp.to_js() == '"Hello"'
+    assert actual_exp.to_js() == '"World!"'
 
 
 @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
@@ -109,14 +118,12 @@ def test_assert_true() -> None:
     assert expected in expression
 
 
-def test__add_equal_if_type_strict_setting_is_true() -> None:
-    expression: str = assertion._add_equal_if_type_strict_setting_is_true(
-        expression='a ==', type_strict=True)
-    assert expression == 'a ==='
+def test__get_equal_operator() -> None:
+    operator: str = assertion._get_equal_operator(type_strict=True)
+    assert operator == '==='
 
-    expression = assertion._add_equal_if_type_strict_setting_is_true(
-        expression='a ==', type_strict=False)
-    assert expression == 'a =='
+    operator = assertion._get_equal_operator(type_strict=False)
+    assert operator == '=='
 
 
 @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
@@ -187,7 +194,7 @@ def test__make_arrays_comparison_expression() -> None:
         expected=[1, 2, 3],
         actual=array_1,
         msg='Array values is not equal.',
-        not_condition=False)
+        not_condition=False).to_js()
     expected: str = (
         f'console.assert(_.isEqual([1, 2, 3], {array_1.variable_name}), '
         '"Array values is not equal.");'
@@ -198,7 +205,7 @@ def test__make_arrays_comparison_expression() -> None:
         expected=[1, 2, 3],
         actual=[1],
         msg='',
-        not_condition=True)
+        not_condition=True).to_js()
     expected = (
         'console.assert(!_.isEqual([1, 2, 3], [1]), "");')
     assert expression == expected
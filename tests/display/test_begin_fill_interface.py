@@ -3,6 +3,7 @@ from random import randint
 from retrying import retry
 
 from apyscript.display.begin_fill_interface import BiginFillInterface
+from apyscript.expression import expression_file_util
 from apyscript.type import Number
 from apyscript.type import String
 
@@ -26,6 +27,11 @@ class TestBiginFillInterface:
         assert begin_fill_interface.fill_color == String('#333333')
         assert begin_fill_interface.fill_alpha == 0.3
 
+        expression_file_util.remove_expression_file()
+        begin_fill_interface.begin_fill(color='#666', alpha=0.5)
+        expression: str = expression_file_util.get_current_expression()
+        assert expression == ''
+
     @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
     def test_fill_color(self) -> None:
         begin_fill_interface: BiginFillInterface = BiginFillInterface()
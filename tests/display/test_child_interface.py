@@ -6,7 +6,6 @@ from apyscript.display import Sprite
 from apyscript.display.display_object import DisplayObject
 from apyscript.display.stage import Stage
 from apyscript.expression import expression_file_util
-from apyscript.type import Array
 from apyscript.type import Boolean
 from apyscript.type import Int
 
@@ -22,7 +21,7 @@ class TestChildInterface:
         stage: Stage = Stage()
         sprite: Sprite = Sprite(stage=stage)
         stage.add_child(child=sprite)
-        assert stage._childs == Array([sprite])
+        assert stage._childs == [sprite]
         assert sprite.parent == stage
 
     @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
@@ -35,6 +34,7 @@ class TestChildInterface:
         )
         expression: str = expression_file_util.get_current_expression()
         assert expected in expression
+        assert '.push(' not in expression
 
     @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
     def test_remove_child(self) -> None:
@@ -44,7 +44,7 @@ class TestChildInterface:
         sprite_2: Sprite = Sprite(stage=stage)
         stage.add_child(child=sprite_2)
         stage.remove_child(child=sprite_2)
-        assert stage._childs == Array([sprite_1])
+        assert stage._childs == [sprite_1]
         assert sprite_2.parent is None
 
     @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
@@ -146,7 +146,7 @@ class TestChildInterface:
         expected: str = (
             f'{child_1.variable_name} = '
             f'{stage.variable_name}.children()'
-            f'[{int_1.variable_name} + 0];'
+            '[0 + 0];'
         )
         assert expected in expression
 
@@ -19,6 +19,18 @@ class TestFillColorInterface:
         fill_color_interface.fill_color = String('999')
         assert fill_color_interface.fill_color == '#999999'
 
+        other_interface: FillColorInterface = FillColorInterface()
+        assert other_interface.fill_color == ''
+
+    def test__initialize_fill_color_if_not_initialized(self) -> None:
+        fill_color_interface: FillColorInterface = FillColorInterface()
+        fill_color_interface._initialize_fill_color_if_not_initialized()
+        assert fill_color_interface._fill_color == ''
+
+        fill_color_interface._fill_color = String('#333333')
+        fill_color_interface._initialize_fill_color_if_not_initialized()
+        assert fill_color_interface._fill_color == '#333333'
+
     @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
     def test__append_fill_color_update_expression(self) -> None:
         fill_color_interface: FillColorInterface = FillColorInterface()
@@ -41,3 +53,4 @@ class TestFillColorInterface:
         expected: str = (
             f'{fill_color_interface.variable_name}.fill(')
         assert expected not in expression
+        assert 'string_' not in expression
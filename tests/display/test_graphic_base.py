@@ -23,6 +23,7 @@ class TestGraphicBase:
                 'parent_graphics': sprite.graphics,
                 '_x': 100,
                 '_y': 200,
+                '_is_position_element_attr': True,
             },
             any_obj=graphic_base)
 
@@ -5,6 +5,7 @@ from retrying import retry
 from apyscript.display import Sprite
 from apyscript.display.graphics import Graphics
 from apyscript.display.graphics import Rectangle
+from apyscript.display.rectangles import Rectangles
 from apyscript.display.stage import Stage
 from apyscript.expression import expression_file_util
 from tests import testing_helper
@@ -61,6 +62,21 @@ class TestGraphics:
         assert isinstance(graphics.get_child_at(index=0), Rectangle)
         assert rectangle == graphics.get_child_at(index=0)
 
+    @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
+    def test_draw_rects(self) -> None:
+        stage: Stage = Stage()
+        sprite: Sprite = Sprite(stage=stage)
+        graphics: Graphics = Graphics(parent=sprite)
+        expression_file_util.remove_expression_file()
+        rectangles: Rectangles = graphics.draw_rects(
+            xs=[100, 200], ys=[300, 400], widths=[50, 60], heights=[70, 80])
+        assert rectangles.length == 2
+        assert rectangles.parent_graphics == graphics
+        assert graphics._childs == []
+        expression: str = expression_file_util.get_current_expression()
+        assert '([100, 300, 50, 70, 200, 400, 60, 80]);' in expression
+        assert expression.count('.rect(') == 1
+
     @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
     def test_clear(self) -> None:
         stage: Stage = Stage()
@@ -7,123 +7,92 @@ from apyscript.display import graphics_expression
 from apyscript.display.graphics import Graphics
 from apyscript.display.rectangle import Rectangle
 from apyscript.display.stage import Stage
+from apyscript.expression.expression_ir import ObjectLiteral
 
 
 @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
-def test_append_fill_expression() -> None:
+def test_append_fill_attr() -> None:
     stage: Stage = Stage()
     sprite: Sprite = Sprite(stage=stage)
     graphics: Graphics = sprite.graphics
-    expression: str = '.attr({'
-    expression = graphics_expression.append_fill_expression(
-        graphics=graphics, expression=expression, indent_num=1)
-    assert expression == '.attr({'
+    attrs: ObjectLiteral = ObjectLiteral()
+    graphics_expression.append_fill_attr(graphics=graphics, attrs=attrs)
+    assert attrs.to_js() == '{}'
 
     graphics.begin_fill(color='#333')
-    expression = graphics_expression.append_fill_expression(
-        graphics=graphics, expression=expression, indent_num=1)
-    assert expression == (
-        '.attr({'
-        '\n  fill: "#333333",'
-    )
+    graphics_expression.append_fill_attr(graphics=graphics, attrs=attrs)
+    assert attrs.to_js() == '{fill: "#333333"}'
 
 
 @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
-def test_append_x_expression() -> None:
+def test_append_x_attr() -> None:
     stage: Stage = Stage()
     sprite: Sprite = Sprite(stage=stage)
     rectangle: Rectangle = Rectangle(
         parent=sprite.graphics,
         x=100, y=200, width=300, height=400)
-    expression: str = '.attr({'
-    expression = graphics_expression.append_x_expression(
-        graphic=rectangle, expression=expression, indent_num=1)
-    assert expression == (
-        '.attr({'
-        '\n  x: 100,')
+    attrs: ObjectLiteral = ObjectLiteral()
+    graphics_expression.append_x_attr(graphic=rectangle, attrs=attrs)
+    assert attrs.to_js() == '{x: 100}'
 
 
 @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
-def test_append_y_expression() -> None:
+def test_append_y_attr() -> None:
     stage: Stage = Stage()
     sprite: Sprite = Sprite(stage=stage)
     rectangle: Rectangle = Rectangle(
         parent=sprite.graphics,
         x=100, y=200, width=300, height=400)
-    expression: str = '.attr({'
-    expression = graphics_expression.append_y_expression(
-        graphic=rectangle, expression=expression, indent_num=1)
-    assert expression == (
-        '.attr({'
-        '\n  y: 200,')
+    attrs: ObjectLiteral = ObjectLiteral()
+    graphics_expression.append_y_attr(graphic=rectangle, attrs=attrs)
+    assert attrs.to_js() == '{y: 200}'
 
 
 @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
-def test_append_fill_opacity_expression() -> None:
+def test_append_fill_opacity_attr() -> None:
     stage: Stage = Stage()
     sprite: Sprite = Sprite(stage=stage)
     graphics: Graphics = sprite.graphics
-    expression: str = '.attr({'
+    attrs: ObjectLiteral = ObjectLiteral()
     graphics.begin_fill(color='#333', alpha=0.5)
-    expression = graphics_expression.append_fill_opacity_expression(
-        graphics=graphics, expression=expression, indent_num=1)
-    assert expression == (
-        '.attr({'
-        '\n  "fill-opacity": 0.5,')
+    graphics_expression.append_fill_opacity_attr(
+        graphics=graphics, attrs=attrs)
+    assert attrs.to_js() == '{"fill-opacity": 0.5}'
 
 
 @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
-def test_append_stroke_expression() -> None:
+def test_append_stroke_attr() -> None:
     stage: Stage = Stage()
     sprite: Sprite = Sprite(stage=stage)
     graphics: Graphics = sprite.graphics
-    expression: str = '.attr({'
-    expression = graphics_expression.append_stroke_expression(
-        graphics=graphics, expression=expression, indent_num=1)
-    assert expression == '.attr({'
+    attrs: ObjectLiteral = ObjectLiteral()
+    graphics_expression.append_stroke_attr(graphics=graphics, attrs=attrs)
+    assert attrs.to_js() == '{}'
 
     graphics.line_style(color='#666')
-    expression = graphics_expression.append_stroke_expression(
-        graphics=graphics, expression=expression, indent_num=1)
-    assert expression == (
-        '.attr({'
-        '\n  stroke: "#666666",'
-    )
+    graphics_expression.append_stroke_attr(graphics=graphics, attrs=attrs)
+    assert attrs.to_js() == '{stroke: "#666666"}'
 
 
 @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
-def test_append_stroke_width_expression() -> None:
+def test_append_stroke_width_attr() -> None:
     stage: Stage = Stage()
     sprite: Sprite = Sprite(stage=stage)
     graphics: Graphics = sprite.graphics
-    expression: str = '.attr({'
-    expression = graphics_expression.append_stroke_expression(
-        graphics=graphics, expression=expression, indent_num=1)
-    assert expression == '.attr({'
-
+    attrs: ObjectLiteral = ObjectLiteral()
     graphics.line_style(color='#666', thickness=3)
-    expression = graphics_expression.append_stroke_width_expression(
-        graphics=graphics, expression=expression, indent_num=1)
-    assert expression == (
-        '.attr({'
-        '\n  "stroke-width": 3,'
-    )
+    graphics_expression.append_stroke_width_attr(
+        graphics=graphics, attrs=attrs)
+    assert attrs.to_js() == '{"stroke-width": 3}'
 
 
 @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
-def test_append_stroke_opacity_expression() -> None:
+def test_append_stroke_opacity_attr() -> None:
     stage: Stage = Stage()
     sprite: Sprite = Sprite(stage=stage)
     graphics: Graphics = sprite.graphics
-    expression: str = '.attr({'
-    expression = graphics_expression.append_stroke_expression(
-        graphics=graphics, expression=expression, indent_num=1)
-    assert expression == '.attr({'
-
+    attrs: ObjectLiteral = ObjectLiteral()
     graphics.line_style(color='#666', alpha=0.25)
-    expression = graphics_expression.append_stroke_opacity_expression(
-        graphics=graphics, expression=expression, indent_num=1)
-    assert expression == (
-        '.attr({'
-        '\n  "stroke-opacity": 0.25,'
-    )
+    graphics_expression.append_stroke_opacity_attr(
+        graphics=graphics, attrs=attrs)
+    assert attrs.to_js() == '{"stroke-opacity": 0.25}'
@@ -23,7 +23,9 @@ class TestLineAlphaInterface:
         expression_file_util.remove_expression_file()
         line_alpha_interface.line_alpha = Number(0.5)
         expression: str = expression_file_util.get_current_expression()
-        expected: str = 'test_line_alpha_interface.stroke({opacity: 0.5});'
+        expected: str = (
+            'test_line_alpha_interface.stroke({opacity: 0.5});'
+        )
         assert expected in expression
 
     @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
@@ -16,6 +16,15 @@ class TestLineColorInterface:
         line_color_interface.line_color = '#555'
         assert line_color_interface.line_color == '#555555'
 
+    def test__initialize_line_color_if_not_initialized(self) -> None:
+        line_color_interface: LineColorInterface = LineColorInterface()
+        line_color_interface._initialize_line_color_if_not_initialized()
+        assert line_color_interface._line_color == ''
+
+        line_color_interface._line_color = String('#333333')
+        line_color_interface._initialize_line_color_if_not_initialized()
+        assert line_color_interface._line_color == '#333333'
+
     @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
     def test__append_line_color_update_expression(self) -> None:
         line_color_interface: LineColorInterface = LineColorInterface()
@@ -54,30 +54,19 @@ def test__make_rect_attrs_expression() -> None:
         x=100, y=200,
         width=150, height=50)
     rect_attrs_expression: str = rectangle._make_rect_attrs_expression(
-        rectangle=rectangle_)
+        rectangle=rectangle_).to_js()
     expected: str = (
-        '\n  .attr({'
-        '\n    "fill-opacity": 1.0,'
-        '\n    "stroke-width": 1,'
-        '\n    "stroke-opacity": 1.0,'
-        '\n    x: 100,'
-        '\n    y: 200,'
-        '\n  })'
+        '{"fill-opacity": 1.0, "stroke-width": 1, "stroke-opacity": 1.0, '
+        'x: 100, y: 200}'
     )
-    assert expected in rect_attrs_expression
+    assert rect_attrs_expression == expected
 
     sprite.graphics.begin_fill(color='#333', alpha=0.5)
     rect_attrs_expression = rectangle._make_rect_attrs_expression(
-        rectangle=rectangle_)
+        rectangle=rectangle_).to_js()
     expected = (
-        '\n  .attr({'
-        '\n    fill: "#333333",'
-        '\n    "fill-opacity": 0.5,'
-        '\n    "stroke-width": 1,'
-        '\n    "stroke-opacity": 1.0,'
-        '\n    x: 100,'
-        '\n    y: 200,'
-        '\n  })'
+        '{fill: "#333333", "fill-opacity": 0.5, "stroke-width": 1, '
+        '"stroke-opacity": 1.0, x: 100, y: 200}'
     )
     assert rect_attrs_expression == expected
 
@@ -87,16 +76,10 @@ def test__make_rect_attrs_expression() -> None:
         parent=sprite.graphics,
         x=100, y=200, width=150, height=50)
     rect_attrs_expression = rectangle._make_rect_attrs_expression(
-        rectangle=rectangle_)
+        rectangle=rectangle_).to_js()
     expected = (
-        '\n  .attr({'
-        '\n    "fill-opacity": 1.0,'
-        '\n    stroke: "#666666",'
-        '\n    "stroke-width": 2,'
-        '\n    "stroke-opacity": 0.3,'
-        '\n    x: 100,'
-        '\n    y: 200,'
-        '\n  })'
+        '{"fill-opacity": 1.0, stroke: "#666666", "stroke-width": 2, '
+        '"stroke-opacity": 0.3, x: 100, y: 200}'
     )
     assert rect_attrs_expression == expected
 
@@ -113,15 +96,8 @@ def test_append_draw_rect_expression() -> None:
     expression: str = expression_file_util.get_current_expression()
     expected_strs: List[str] = [
         f'\nvar {rect_name} = {stage_variable_name}'
-        '\n  .rect(300, 400)'
-        '\n  .attr({'
-        '\n    fill: "#333333",'
-        '\n    "fill-opacity": 0.5,'
-        '\n    "stroke-width": 1,'
-        '\n    "stroke-opacity": 1.0,'
-        '\n    x: 100,'
-        '\n    y: 200,'
-        '\n  });',
+        '.rect(300, 400).attr({fill: "#333333", "fill-opacity": 0.5, '
+        '"stroke-width": 1, "stroke-opacity": 1.0, x: 100, y: 200});',
         f'\n{graphics_name}.add({rect_name});'
     ]
     for expected in expected_strs:
@@ -0,0 +1,120 @@
+from random import randint
+from typing import List
+from typing import Union
+
+from retrying import retry
+
+from apyscript.display import Sprite
+from apyscript.display import rectangles
+from apyscript.display.rectangles import Rectangles
+from apyscript.display.stage import Stage
+from apyscript.display.stage import get_stage_variable_name
+from apyscript.expression import expression_file_util
+from apyscript.expression.expression_ir import ObjectLiteral
+from apyscript.type import Array
+from apyscript.type import Int
+from apyscript.type import Number
+from tests import testing_helper
+
+
+class TestRectangles:
+
+    @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
+    def test___init__(self) -> None:
+        stage: Stage = Stage()
+        sprite: Sprite = Sprite(stage=stage)
+        rectangles_: Rectangles = Rectangles(
+            parent=sprite.graphics, length=3)
+        testing_helper.assert_attrs(
+            expected_attrs={
+                'parent_graphics': sprite.graphics,
+                '_length': 3,
+            },
+            any_obj=rectangles_)
+        assert rectangles_.variable_name.startswith('rectangles_')
+
+    @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
+    def test_length(self) -> None:
+        stage: Stage = Stage()
+        sprite: Sprite = Sprite(stage=stage)
+        rectangles_: Rectangles = Rectangles(
+            parent=sprite.graphics, length=3)
+        assert rectangles_.length == 3
+
+
+def test_get_rects_data() -> None:
+    data: List[Union[int, float]] = rectangles.get_rects_data(
+        xs=[10, 20], ys=Array([30, Int(40)]), widths=[50, Number(60.5)],
+        heights=(70, 80))
+    assert data == [10, 30, 50, 70, 20, 40, 60.5, 80]
+
+    testing_helper.assert_raises(
+        expected_error_class=ValueError,
+        func_or_method=rectangles.get_rects_data,
+        kwargs={'xs': [10, 20], 'ys': [30], 'widths': [50], 'heights': [70]})
+
+    testing_helper.assert_raises(
+        expected_error_class=ValueError,
+        func_or_method=rectangles.get_rects_data,
+        kwargs={'xs': [10], 'ys': [30], 'widths': [-1], 'heights': [70]})
+
+
+def test__get_builtin_nums() -> None:
+    nums: List[Union[int, float]] = rectangles._get_builtin_nums(
+        values=Array([10, Int(20), Number(30.5)]))
+    assert nums == [10, 20, 30.5]
+
+    testing_helper.assert_raises(
+        expected_error_class=ValueError,
+        func_or_method=rectangles._get_builtin_nums,
+        kwargs={'values': [10, 'Hello!']})
+
+
+@retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
+def test_append_draw_rects_expression() -> None:
+    stage: Stage = Stage()
+    sprite: Sprite = Sprite(stage=stage)
+    sprite.graphics.begin_fill(color='#333')
+    rectangles_: Rectangles = Rectangles(parent=sprite.graphics, length=2)
+    expression_file_util.remove_expression_file()
+    rectangles.append_draw_rects_expression(
+        rectangles=rectangles_, data=[10, 20, 30, 40, 50, 60, 70, 80])
+    expression: str = expression_file_util.get_current_expression()
+    expected_strs: List[str] = [
+        f'var {rectangles_.variable_name} = [];',
+        f'{get_stage_variable_name()}.rect(data[i + 2], data[i + 3])',
+        'fill: "#333333"',
+        'x: data[i], y: data[i + 1]',
+        f'{sprite.graphics.variable_name}.add(rectangle);',
+        f'{rectangles_.variable_name}.push(rectangle);',
+        '([10, 20, 30, 40, 50, 60, 70, 80]);',
+    ]
+    for expected_str in expected_strs:
+        assert expected_str in expression
+
+    expression_file_util.remove_expression_file()
+    rectangles.append_draw_rects_expression(
+        rectangles=rectangles_,
+        data=[float('inf'), float('nan'), 30.5, 40])
+    expression = expression_file_util.get_current_expression()
+    assert '([Infinity, NaN, 30.5, 40]);' in expression
+
+
+@retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
+def test__make_rects_attrs_expression() -> None:
+    stage: Stage = Stage()
+    sprite: Sprite = Sprite(stage=stage)
+    sprite.graphics.begin_fill(color='#333', alpha=0.5)
+    rectangles_: Rectangles = Rectangles(parent=sprite.graphics, length=1)
+    rects_attrs: ObjectLiteral = rectangles._make_rects_attrs_expression(
+        rectangles=rectangles_)
+    assert rects_attrs.to_js() == (
+        '{fill: "#333333", "fill-opacity": 0.5, "stroke-width": 1, '
+        '"stroke-opacity": 1.0, x: data[i], y: data[i + 1]}')
+
+
+def test__get_data_item_expression() -> None:
+    assert rectangles._get_data_item_expression(offset=0).to_js() == \
+        'data[i]'
+    assert rectangles._get_data_item_expression(offset=3).to_js() == \
+        'data[i + 3]'
@@ -8,8 +8,6 @@ from apyscript.display.graphics import Graphics
 from apyscript.display.stage import Stage
 from apyscript.display.stage import get_stage_variable_name
 from apyscript.expression import expression_file_util
-from apyscript.file import file_util
-from apyscript.type import Array
 from tests import testing_helper
 
 
@@ -36,17 +34,15 @@ class TestSprite:
         parent_sprite: Sprite = Sprite(stage=stage)
         child_sprite: Sprite = Sprite(stage=stage)
         parent_sprite.add_child(child=child_sprite)
-        assert parent_sprite._childs == Array([child_sprite])
+        assert parent_sprite._childs == [child_sprite]
 
     @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
     def test__append_constructor_expression(self) -> None:
         stage: Stage = Stage()
         stage_variable_name: str = get_stage_variable_name()
-        file_util.remove_file_if_exists(
-            file_path=expression_file_util.EXPRESSION_FILE_PATH)
+        expression_file_util.remove_expression_file()
         sprite: Sprite = Sprite(stage=stage)
-        expression: str = file_util.read_txt(
-            file_path=expression_file_util.EXPRESSION_FILE_PATH)
+        expression: str = expression_file_util.get_current_expression()
         expected_strs: List[str] = [
             f'\nvar {sprite.variable_name} = {stage_variable_name}.group();',
             f'\nvar {sprite.graphics.variable_name} = ',
@@ -56,8 +52,7 @@ class TestSprite:
         ]
         for expected_str in expected_strs:
             assert expected_str in expression
-        file_util.remove_file_if_exists(
-            file_path=expression_file_util.EXPRESSION_FILE_PATH)
+        expression_file_util.remove_expression_file()
 
         class SubClass(Sprite):
             pass
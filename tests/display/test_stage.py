@@ -8,9 +8,9 @@ from apyscript.display import stage
 from apyscript.display.display_object import DisplayObject
 from apyscript.display.stage import _STAGE_ELEM_ID_FILE_PATH
 from apyscript.display.stage import Stage
+from apyscript.display.stage import StageRegistry
 from apyscript.expression import expression_file_util
 from apyscript.file import file_util
-from apyscript.type import Array
 from tests import testing_helper
 
 
@@ -85,9 +85,8 @@ class TestStage:
         stage: Stage = Stage()
         expected_expression: str = stage._make_constructor_expression()
         expected_expression = expected_expression.strip()
-        with open(expression_file_util.EXPRESSION_FILE_PATH, 'r') as f:
-            saved_expression: str = f.read()
-        saved_expression = saved_expression.strip()
+        saved_expression: str = \
+            expression_file_util.get_current_expression()
         for expected_expression_line in expected_expression.splitlines():
             assert expected_expression_line in saved_expression
 
@@ -102,7 +101,7 @@ class TestStage:
         display_object: DisplayObject = DisplayObject(
             stage=stage, variable_name='test_display_object_1')
         stage.add_child(child=display_object)
-        assert stage._childs == Array([display_object])
+        assert stage._childs == [display_object]
 
     @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
     def test__save_stage_elem_id_to_expression_file(self) -> None:
@@ -114,6 +113,7 @@ class TestStage:
 
 @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
 def test_get_stage_element_id() -> None:
+    stage.get_stage_registry().clear()
     file_util.remove_file_if_exists(file_path=_STAGE_ELEM_ID_FILE_PATH)
     stage_elem_id: str = stage.get_stage_element_id()
     assert stage_elem_id == ''
@@ -122,9 +122,62 @@ def test_get_stage_element_id() -> None:
     stage_elem_id = stage.get_stage_element_id()
     assert stage_elem_id == 'line-graph'
 
+    file_util.remove_file_if_exists(file_path=_STAGE_ELEM_ID_FILE_PATH)
+    stage_elem_id = stage.get_stage_element_id()
+    assert stage_elem_id == 'line-graph'
+
+    stage.get_stage_registry().clear()
+    file_util.save_plain_txt(
+        txt='bar-graph', file_path=_STAGE_ELEM_ID_FILE_PATH)
+    stage_elem_id = stage.get_stage_element_id()
+    assert stage_elem_id == 'bar-graph'
+
 
 @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
 def test_get_stage_variable_name() -> None:
     Stage(stage_elem_id='line-graph')
     stage_variable_name: str = stage.get_stage_variable_name()
     assert stage_variable_name == 'line_graph'
+
+    Stage(stage_elem_id='bar-graph')
+    stage_variable_name = stage.get_stage_variable_name()
+    assert stage_variable_name == 'bar_graph'
+
+    stage.get_stage_registry().clear()
+    stage_variable_name = stage.get_stage_variable_name()
+    assert stage_variable_name == 'bar_graph'
+
+
+class TestStageRegistry:
+
+    def test___init__(self) -> None:
+        stage_registry: StageRegistry = StageRegistry()
+        assert stage_registry.stage is None
+        assert stage_registry.stage_elem_id is None
+        assert stage_registry.stage_variable_name is None
+
+    @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
+    def test_register(self) -> None:
+        stage_: Stage = Stage(stage_elem_id='line-graph')
+        stage_registry: StageRegistry = StageRegistry()
+        stage_registry.register(stage=stage_, stage_elem_id='line-graph')
+        assert stage_registry.stage == stage_
+        assert stage_registry.stage_elem_id == 'line-graph'
+        assert stage_registry.stage_variable_name == 'line_graph'
+
+    @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
+    def test_clear(self) -> None:
+        stage_: Stage = Stage(stage_elem_id='line-graph')
+        stage_registry: StageRegistry = StageRegistry()
+        stage_registry.register(stage=stage_, stage_elem_id='line-graph')
+        stage_registry.clear()
+        assert stage_registry.stage is None
+        assert stage_registry.stage_elem_id is None
+        assert stage_registry.stage_variable_name is None
+
+
+@retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
+def test_get_stage_registry() -> None:
+    stage_: Stage = Stage(stage_elem_id='line-graph')
+    stage_registry: StageRegistry = stage.get_stage_registry()
+    assert stage_registry.stage == stage_
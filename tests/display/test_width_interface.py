@@ -23,7 +23,9 @@ class TestWidthInterface:
         expression_file_util.remove_expression_file()
         width_interface.width = Int(200)
         expression: str = expression_file_util.get_current_expression()
-        expected: str = 'test_width_interface.width(200);'
+        expected: str = (
+            'test_width_interface.width(200);'
+        )
         assert expected in expression
 
     @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
@@ -35,3 +35,4 @@ class TestXInterface:
             value=x_interface._x)
         expected: str = f'test_x_interface.x({value_str});'
         assert expected in expression
+        assert not x_interface._is_position_element_attr
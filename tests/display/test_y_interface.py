@@ -35,3 +35,4 @@ class TestYInterface:
             value=y_interface._y)
         expected: str = f'test_y_interface.y({value_str});'
         assert expected in expression
+        assert not y_interface._is_position_element_attr
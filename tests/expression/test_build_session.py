@@ -0,0 +1,113 @@
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from random import randint
+from typing import List
+
+from retrying import retry
+
+from apyscript.display.stage import Stage
+from apyscript.display.stage import StageRegistry
+from apyscript.display.stage import get_stage_variable_name
+from apyscript.expression import build_session
+from apyscript.expression import expression_file_util
+from apyscript.expression import expression_variables_util
+from apyscript.expression.build_session import BuildSession
+from apyscript.expression.expression_store import BufferExpressionStore
+from apyscript.expression.expression_variables_util import \
+    VariableNameAllocator
+from apyscript.type import Int
+
+
+class TestBuildSession:
+
+    def test___init__(self) -> None:
+        session: BuildSession = BuildSession()
+        assert isinstance(session.expression_store, BufferExpressionStore)
+        assert isinstance(
+            session.variable_name_allocator, VariableNameAllocator)
+        assert isinstance(session.stage_registry, StageRegistry)
+        assert session.expression_root_dir is None
+
+        expression_store: BufferExpressionStore = BufferExpressionStore()
+        session = BuildSession(
+            expression_root_dir='../.tmp_apyscript_test_build_session/',
+            expression_store=expression_store)
+        assert session.expression_store == expression_store
+        assert session.expression_root_dir == \
+            '../.tmp_apyscript_test_build_session/'
+
+    @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
+    def test_reset(self) -> None:
+        tmp_dir_path: str = '../.tmp_apyscript_test_build_session/'
+        session: BuildSession = BuildSession(
+            expression_root_dir=tmp_dir_path)
+        os.makedirs(tmp_dir_path, exist_ok=True)
+        test_file_path: str = os.path.join(tmp_dir_path, 'test.txt')
+        with open(test_file_path, 'w') as f:
+            f.write('\n')
+        with session:
+            Stage(stage_elem_id='line-graph')
+            Int(10)
+        session.reset()
+        assert session.expression_store.get_expression() == ''
+        assert session.variable_name_allocator.snapshot() == {}
+        assert session.stage_registry.stage is None
+        assert not os.path.exists(test_file_path)
+        assert os.path.isdir(tmp_dir_path)
+        shutil.rmtree(tmp_dir_path, ignore_errors=True)
+
+    def test___enter__(self) -> None:
+        default_session: BuildSession = build_session.get_current_session()
+        session: BuildSession = BuildSession()
+        with session as entered_session:
+            assert entered_session == session
+            assert build_session.get_current_session() == session
+            Int(10).variable_name
+            expression: str = expression_file_util.get_current_expression()
+            assert 'var int_1 = 10;' in expression
+        assert build_session.get_current_session() == default_session
+
+    def test___exit__(self) -> None:
+        session_1: BuildSession = BuildSession()
+        session_2: BuildSession = BuildSession()
+        with session_1:
+            with session_2:
+                assert build_session.get_current_session() == session_2
+            assert build_session.get_current_session() == session_1
+
+
+def test_get_current_session() -> None:
+    session: BuildSession = build_session.get_current_session()
+    assert session.expression_root_dir == \
+        expression_file_util.EXPRESSION_ROOT_DIR
+    assert build_session.get_current_session() == session
+
+
+def test__get_default_session() -> None:
+    default_session: BuildSession = build_session._get_default_session()
+    assert build_session._get_default_session() == default_session
+    with BuildSession():
+        assert build_session._get_default_session() == default_session
+
+
+def _build_chart(stage_elem_id: str) -> str:
+    with BuildSession():
+        Stage(stage_elem_id=stage_elem_id)
+        for i in range(50):
+            Int(i).variable_name
+        assert get_stage_variable_name() == stage_elem_id
+        assert expression_variables_util.get_variable_name_allocator()\
+            .get_last_variable_num(type_name='int') >= 50
+        return expression_file_util.get_current_expression()
+
+
+def test_concurrent_build() -> None:
+    stage_elem_ids: List[str] = [f'stage_{i}' for i in range(8)]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        expressions: List[str] = list(
+            executor.map(_build_chart, stage_elem_ids))
+    for stage_elem_id, expression in zip(stage_elem_ids, expressions):
+        assert f'id="{stage_elem_id}"' in expression
+        assert expression.count('id="stage_') == 1
+        assert expression == _build_chart(stage_elem_id=stage_elem_id)
@@ -0,0 +1,165 @@
+from typing import List
+from typing import Optional
+
+from apyscript.expression import expression_attr_coalescing
+from apyscript.expression.expression_attr_coalescing import _AttrUpdatesRun
+from apyscript.expression.expression_ir import Assign
+from apyscript.expression.expression_ir import AttrSet
+from apyscript.expression.expression_ir import ExpressionStatement
+from apyscript.expression.expression_ir import Literal
+from apyscript.expression.expression_ir import Raw
+from apyscript.expression.expression_ir import Ref
+from apyscript.expression.expression_ir import Statement
+from apyscript.expression.expression_ir import VarDecl
+from apyscript.expression.expression_ir import make_method_call
+
+
+class Test_AttrUpdatesRun:
+
+    def test___init__(self) -> None:
+        run: _AttrUpdatesRun = _AttrUpdatesRun(target_name='rectangle_1')
+        assert run.target_name == 'rectangle_1'
+        assert run.attr_sets == []
+        assert run.result_indexes == []
+        assert run.read_names == set()
+
+    def test_append(self) -> None:
+        run: _AttrUpdatesRun = _AttrUpdatesRun(target_name='rectangle_1')
+        attr_set: AttrSet = AttrSet(
+            target=Ref(name='rectangle_1'), attr_name='x',
+            value=Ref(name='int_1'))
+        run.append(attr_set=attr_set, result_index=3)
+        assert run.attr_sets == [attr_set]
+        assert run.result_indexes == [3]
+        assert run.read_names == {'int_1'}
+
+    def test_can_pass(self) -> None:
+        run: _AttrUpdatesRun = _AttrUpdatesRun(target_name='rectangle_1')
+        run.append(
+            attr_set=AttrSet(
+                target=Ref(name='rectangle_1'), attr_name='x',
+                value=Ref(name='int_1')),
+            result_index=0)
+        assert run.can_pass(
+            statement=VarDecl(name='int_2', value=Literal(value=20)))
+        assert not run.can_pass(
+            statement=Assign(target=Ref(name='int_1'), value=Literal(value=5)))
+        assert not run.can_pass(
+            statement=VarDecl(name='rectangle_2', value=Ref('rectangle_1')))
+        assert not run.can_pass(
+            statement=VarDecl(
+                name='int_2',
+                value=make_method_call(
+                    variable_name='array_1', method_name='pop')))
+        assert not run.can_pass(
+            statement=ExpressionStatement(
+                expression=make_method_call(
+                    variable_name='graphics_1', method_name='add',
+                    args=[Ref(name='rectangle_1')])))
+
+    def test_make_coalesced_statement(self) -> None:
+        run: _AttrUpdatesRun = _AttrUpdatesRun(target_name='rectangle_1')
+        run.append(
+            attr_set=AttrSet(
+                target=Ref(name='rectangle_1'), attr_name='x',
+                value=Ref(name='int_1')),
+            result_index=0)
+        run.append(
+            attr_set=AttrSet(
+                target=Ref(name='rectangle_1'), attr_name='fill-opacity',
+                value=Literal(value=0.5)),
+            result_index=1)
+        statement: ExpressionStatement = run.make_coalesced_statement()
+        assert statement.to_js() == (
+            'rectangle_1.attr({x: int_1, "fill-opacity": 0.5});')
+
+
+def test_coalesce_attr_updates() -> None:
+    statements: List[Statement] = [
+        AttrSet(
+            target=Ref(name='rectangle_1'), attr_name='x',
+            value=Ref(name='int_1')),
+        VarDecl(name='int_2', value=Literal(value=20)),
+        AttrSet(
+            target=Ref(name='rectangle_1'), attr_name='y',
+            value=Ref(name='int_2')),
+        AttrSet(
+            target=Ref(name='rectangle_1'), attr_name='fill',
+            value=Literal(value='#333333')),
+        AttrSet(
+            target=Ref(name='rectangle_2'), attr_name='x',
+            value=Ref(name='int_1')),
+        Raw(js='a;'),
+        AttrSet(
+            target=Ref(name='rectangle_2'), attr_name='y',
+            value=Ref(name='int_1')),
+        AttrSet(
+            target=Ref(name='sprite_1'), attr_name='x',
+            value=Ref(name='int_1'), is_element_attr=False),
+        AttrSet(
+            target=Ref(name='sprite_1'), attr_name='y',
+            value=Ref(name='int_1'), is_element_attr=False),
+        AttrSet(
+            target=Ref(name='rectangle_2'), attr_name='x',
+            value=Ref(name='int_3')),
+        AttrSet(
+            target=Ref(name='rectangle_2'), attr_name='y',
+            value=Ref(name='int_3')),
+    ]
+    optimized: List[Statement] = \
+        expression_attr_coalescing.coalesce_attr_updates(
+            statements=statements)
+    assert [statement.to_js() for statement in optimized] == [
+        'var int_2 = 20;',
+        'rectangle_1.attr({x: int_1, y: int_2, fill: "#333333"});',
+        'rectangle_2.x(int_1);',
+        'a;',
+        'rectangle_2.y(int_1);',
+        'sprite_1.x(int_1);',
+        'sprite_1.y(int_1);',
+        'rectangle_2.attr({x: int_3, y: int_3});',
+    ]
+
+
+def test__get_coalescable_attr_set() -> None:
+    attr_set: AttrSet = AttrSet(
+        target=Ref(name='rectangle_1'), attr_name='x',
+        value=Ref(name='int_1'))
+    result: Optional[AttrSet] = \
+        expression_attr_coalescing._get_coalescable_attr_set(
+            statement=attr_set)
+    assert result is attr_set
+
+    result = expression_attr_coalescing._get_coalescable_attr_set(
+        statement=AttrSet(
+            target=Ref(name='sprite_1'), attr_name='x',
+            value=Ref(name='int_1'), is_element_attr=False))
+    assert result is None
+
+    result = expression_attr_coalescing._get_coalescable_attr_set(
+        statement=AttrSet(
+            target=Ref(name='rectangle_1'), attr_name='x',
+            value=make_method_call(
+                variable_name='array_1', method_name='pop')))
+    assert result is None
+
+    result = expression_attr_coalescing._get_coalescable_attr_set(
+        statement=Raw(js='a;'))
+    assert result is None
+
+
+def test__flush_run() -> None:
+    run: _AttrUpdatesRun = _AttrUpdatesRun(target_name='rectangle_1')
+    attr_set: AttrSet = AttrSet(
+        target=Ref(name='rectangle_1'), attr_name='x',
+        value=Ref(name='int_1'))
+    run.append(attr_set=attr_set, result_index=0)
+    result: List[Optional[Statement]] = [attr_set]
+    expression_attr_coalescing._flush_run(run=run, result=result)
+    assert result == [attr_set]
+
+    run.append(attr_set=attr_set, result_index=1)
+    result = [attr_set, attr_set]
+    expression_attr_coalescing._flush_run(run=run, result=result)
+    assert result[0] is None
+    assert isinstance(result[1], ExpressionStatement)
@@ -0,0 +1,321 @@
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+
+from apyscript.expression import expression_constant_folding
+from apyscript.expression.expression_ir import ArrayLiteral
+from apyscript.expression.expression_ir import Assign
+from apyscript.expression.expression_ir import AttrSet
+from apyscript.expression.expression_ir import BinaryOp
+from apyscript.expression.expression_ir import Call
+from apyscript.expression.expression_ir import Expression
+from apyscript.expression.expression_ir import ExpressionStatement
+from apyscript.expression.expression_ir import Index
+from apyscript.expression.expression_ir import Literal
+from apyscript.expression.expression_ir import Member
+from apyscript.expression.expression_ir import ObjectLiteral
+from apyscript.expression.expression_ir import Raw
+from apyscript.expression.expression_ir import Ref
+from apyscript.expression.expression_ir import Statement
+from apyscript.expression.expression_ir import VarDecl
+from apyscript.expression.expression_ir import make_method_call
+
+
+def test_fold_constants() -> None:
+    statements: List[Statement] = [
+        VarDecl(name='number_3', value=Literal(value=10)),
+        VarDecl(
+            name='number_5',
+            value=BinaryOp(
+                left=Ref(name='number_3'), operator='+',
+                right=Literal(value=10))),
+        VarDecl(name='number_6', value=Ref(name='number_5')),
+        Assign(
+            target=Ref(name='number_6'),
+            value=BinaryOp(
+                left=Ref(name='number_6'), operator='/',
+                right=Literal(value=8))),
+        Assign(
+            target=Ref(name='number_6'), value=Literal(value=1),
+            operator='+='),
+        AttrSet(
+            target=Ref(name='rectangle_1'), attr_name='x',
+            value=Ref(name='number_6')),
+        AttrSet(
+            target=Ref(name='sprite_1'), attr_name='y',
+            value=Ref(name='number_6'), is_element_attr=False),
+        Raw(js='for (var i = 0; i < 3; i++) {number_3 += i;}'),
+        VarDecl(
+            name='number_7',
+            value=BinaryOp(
+                left=Ref(name='number_3'), operator='*',
+                right=Literal(value=2))),
+    ]
+    folded: List[Statement] = expression_constant_folding.fold_constants(
+        statements=statements)
+    assert folded == [
+        statements[0],
+        VarDecl(name='number_5', value=Literal(value=20)),
+        VarDecl(name='number_6', value=Literal(value=20)),
+        Assign(target=Ref(name='number_6'), value=Literal(value=2.5)),
+        Assign(target=Ref(name='number_6'), value=Literal(value=3.5)),
+        AttrSet(
+            target=Ref(name='rectangle_1'), attr_name='x',
+            value=Literal(value=3.5)),
+        AttrSet(
+            target=Ref(name='sprite_1'), attr_name='y',
+            value=Literal(value=3.5), is_element_attr=False),
+        statements[7],
+        statements[8],
+    ]
+    assert not folded[6].is_element_attr  # type: ignore
+
+    # Value stored by the impure call will be unknown.
+    statements = [
+        VarDecl(name='int_1', value=Literal(value=10)),
+        Assign(
+            target=Ref(name='int_1'),
+            value=make_method_call(
+                variable_name='array_1', method_name='pop')),
+        Assign(
+            target=Ref(name='int_1'), value=Literal(value=1),
+            operator='+='),
+        ExpressionStatement(
+            expression=make_method_call(
+                variable_name='array_1', method_name='push',
+                args=[Ref(name='int_2')])),
+    ]
+    folded = expression_constant_folding.fold_constants(
+        statements=statements)
+    assert folded == statements
+
+
+def test__fold_assign() -> None:
+    known_values: Dict[str, Any] = {'int_1': 10, 'int_2': 3}
+    folded: Statement = expression_constant_folding._fold_assign(
+        statement=Assign(
+            target=Index(target=Ref(name='array_1'), index=Ref(name='int_2')),
+            value=Ref(name='int_1')),
+        known_values=known_values)
+    assert folded == Assign(
+        target=Index(target=Ref(name='array_1'), index=Literal(value=3)),
+        value=Literal(value=10))
+
+    folded = expression_constant_folding._fold_assign(
+        statement=Assign(
+            target=Ref(name='int_1'), value=Literal(value=5),
+            operator='-='),
+        known_values=known_values)
+    assert folded == Assign(target=Ref(name='int_1'), value=Literal(value=5))
+    assert known_values['int_1'] == 5
+
+    folded = expression_constant_folding._fold_assign(
+        statement=Assign(
+            target=Ref(name='int_3'), value=Literal(value=5),
+            operator='+='),
+        known_values=known_values)
+    assert folded == Assign(
+        target=Ref(name='int_3'), value=Literal(value=5), operator='+=')
+    assert 'int_3' not in known_values
+
+
+def test__update_known_value() -> None:
+    known_values: Dict[str, Any] = {'string_1': 'Hello!'}
+    expression_constant_folding._update_known_value(
+        name='string_2', value=Ref(name='string_1'),
+        known_values=known_values)
+    assert known_values['string_2'] == 'Hello!'
+
+    expression_constant_folding._update_known_value(
+        name='string_2', value=Ref(name='string_3'),
+        known_values=known_values)
+    assert 'string_2' not in known_values
+
+
+def test_fold_expression() -> None:
+    known_values: Dict[str, Any] = {
+        'int_1': 10,
+        'string_1': 'Hello World!',
+    }
+    expression: Expression = expression_constant_folding.fold_expression(
+        expression=Ref(name='int_1'), known_values=known_values)
+    assert expression == Literal(value=10)
+
+    # Longer literal than the variable name will not be inlined.
+    expression = expression_constant_folding.fold_expression(
+        expression=Ref(name='string_1'), known_values=known_values)
+    assert expression == Ref(name='string_1')
+
+    expression = expression_constant_folding.fold_expression(
+        expression=BinaryOp(
+            left=Ref(name='string_1'), operator='+',
+            right=Ref(name='int_1')),
+        known_values=known_values)
+    assert expression == Literal(value='Hello World!10')
+
+    expression = expression_constant_folding.fold_expression(
+        expression=ArrayLiteral(elements=[Ref(name='int_1')]),
+        known_values=known_values)
+    assert expression == ArrayLiteral(elements=[Literal(value=10)])
+
+    expression = expression_constant_folding.fold_expression(
+        expression=ObjectLiteral(items={'x': Ref(name='int_1')}),
+        known_values=known_values)
+    assert expression == ObjectLiteral(items={'x': Literal(value=10)})
+
+    expression = expression_constant_folding.fold_expression(
+        expression=make_method_call(
+            variable_name='int_1', method_name='toString'),
+        known_values=known_values)
+    assert expression == make_method_call(
+        variable_name='int_1', method_name='toString')
+
+
+def test__fold_target() -> None:
+    expression: Expression = expression_constant_folding._fold_target(
+        expression=Member(
+            target=Index(target=Ref(name='array_1'), index=Ref(name='int_1')),
+            name='length'),
+        known_values={'array_1': 10, 'int_1': 0})
+    assert expression == Member(
+        target=Index(target=Ref(name='array_1'), index=Literal(value=0)),
+        name='length')
+
+
+def test__fold_binary_op() -> None:
+    expression: Expression = expression_constant_folding._fold_binary_op(
+        expression=BinaryOp(
+            left=BinaryOp(
+                left=Ref(name='int_1'), operator='*',
+                right=Literal(value=3)),
+            operator='-', right=Ref(name='int_2')),
+        known_values={'int_1': 10, 'int_2': 5})
+    assert expression == Literal(value=25)
+
+    expression = expression_constant_folding._fold_binary_op(
+        expression=BinaryOp(
+            left=Ref(name='int_1'), operator='===',
+            right=Ref(name='int_2')),
+        known_values={'int_1': 10, 'int_2': 5})
+    assert expression == BinaryOp(
+        left=Literal(value=10), operator='===', right=Literal(value=5))
+
+
+def test__fold_call() -> None:
+    expression: Expression = expression_constant_folding._fold_call(
+        expression=Call(
+            callee=Ref(name='parseInt'),
+            args=[
+                BinaryOp(
+                    left=Ref(name='int_1'), operator='/',
+                    right=Literal(value=3)),
+            ]),
+        known_values={'int_1': 10})
+    assert expression == Literal(value=3)
+
+    expression = expression_constant_folding._fold_call(
+        expression=Call(
+            callee=Ref(name='parseInt'),
+            args=[Ref(name='number_1'), Literal(value=16)]),
+        known_values={'number_1': 10.5})
+    assert expression == Call(
+        callee=Ref(name='parseInt'),
+        args=[Literal(value=10.5), Literal(value=16)])
+
+
+def test__is_decimal_radix() -> None:
+    assert expression_constant_folding._is_decimal_radix(
+        args=[Ref(name='int_1')])
+    assert expression_constant_folding._is_decimal_radix(
+        args=[Ref(name='int_1'), Literal(value=10)])
+    assert not expression_constant_folding._is_decimal_radix(
+        args=[Ref(name='int_1'), Literal(value=16)])
+    assert not expression_constant_folding._is_decimal_radix(args=[])
+
+
+def test__get_constant() -> None:
+    constant: Optional[Literal] = expression_constant_folding._get_constant(
+        expression=Ref(name='int_1'), known_values={'int_1': 10})
+    assert constant == Literal(value=10)
+    constant = expression_constant_folding._get_constant(
+        expression=Ref(name='int_2'), known_values={'int_1': 10})
+    assert constant is None
+    constant = expression_constant_folding._get_constant(
+        expression=Literal(value='Hello!'), known_values={})
+    assert constant == Literal(value='Hello!')
+    constant = expression_constant_folding._get_constant(
+        expression=Literal(value=[1, 2]), known_values={})
+    assert constant is None
+
+
+def test__is_number() -> None:
+    assert expression_constant_folding._is_number(value=10)
+    assert expression_constant_folding._is_number(value=10.5)
+    assert not expression_constant_folding._is_number(value=True)
+    assert not expression_constant_folding._is_number(value=2 ** 60)
+    assert not expression_constant_folding._is_number(value=float('inf'))
+    assert not expression_constant_folding._is_number(value='10')
+
+
+def test__evaluate_binary_op() -> None:
+    result: Optional[Literal] = \
+        expression_constant_folding._evaluate_binary_op(
+            left_value=10, operator='+', right_value=20)
+    assert result == Literal(value=30)
+    result = expression_constant_folding._evaluate_binary_op(
+        left_value=10, operator='-', right_value=2.5)
+    assert result == Literal(value=7.5)
+    result = expression_constant_folding._evaluate_binary_op(
+        left_value=3, operator='*', right_value=4)
+    assert result == Literal(value=12)
+    result = expression_constant_folding._evaluate_binary_op(
+        left_value=7, operator='/', right_value=2)
+    assert result == Literal(value=3.5)
+    result = expression_constant_folding._evaluate_binary_op(
+        left_value=7, operator='/', right_value=0)
+    assert result is None
+    result = expression_constant_folding._evaluate_binary_op(
+        left_value=-7, operator='%', right_value=3)
+    assert result == Literal(value=-1)
+    result = expression_constant_folding._evaluate_binary_op(
+        left_value='a', operator='+', right_value='b')
+    assert result == Literal(value='ab')
+    result = expression_constant_folding._evaluate_binary_op(
+        left_value='a', operator='+', right_value=1.5)
+    assert result is None
+    result = expression_constant_folding._evaluate_binary_op(
+        left_value='a', operator='*', right_value=2)
+    assert result is None
+    result = expression_constant_folding._evaluate_binary_op(
+        left_value=2 ** 52, operator='*', right_value=4)
+    assert result is None
+    result = expression_constant_folding._evaluate_binary_op(
+        left_value=True, operator='+', right_value=1)
+    assert result is None
+
+
+def test__get_concatenation_str() -> None:
+    assert expression_constant_folding._get_concatenation_str(
+        value='a') == 'a'
+    assert expression_constant_folding._get_concatenation_str(
+        value=10) == '10'
+    assert expression_constant_folding._get_concatenation_str(
+        value=1.0) is None
+    assert expression_constant_folding._get_concatenation_str(
+        value=False) is None
+
+
+def test__evaluate_parse_int() -> None:
+    assert expression_constant_folding._evaluate_parse_int(
+        value=10) == Literal(value=10)
+    assert expression_constant_folding._evaluate_parse_int(
+        value=-2.7) == Literal(value=-2)
+    assert expression_constant_folding._evaluate_parse_int(
+        value=0.0) == Literal(value=0)
+    assert expression_constant_folding._evaluate_parse_int(
+        value=1e-7) is None
+    assert expression_constant_folding._evaluate_parse_int(
+        value=1e21) is None
+    assert expression_constant_folding._evaluate_parse_int(
+        value='10') is None
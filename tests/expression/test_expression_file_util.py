@@ -4,6 +4,13 @@ from random import randint
 from retrying import retry
 
 from apyscript.expression import expression_file_util
+from apyscript.expression.expression_ir import Literal
+from apyscript.expression.expression_ir import VarDecl
+from apyscript.expression.expression_optimizer import ExpressionOptimizer
+from apyscript.expression.expression_store import BufferExpressionStore
+from apyscript.expression.expression_store import ExpressionStore
+from apyscript.expression.expression_store import FileExpressionStore
+from apyscript.file import file_util
 from apyscript.html import html_const
 
 
@@ -40,8 +47,8 @@ def test_append_expression() -> None:
     )
     expression_file_util.append_expression(
         expression=expected_expression_3)
-    with open(expression_file_util.EXPRESSION_FILE_PATH, 'r') as f:
-        expression_txt: str = f.read()
+    assert not os.path.exists(expression_file_util.EXPRESSION_FILE_PATH)
+    expression_txt: str = expression_file_util.get_current_expression()
     expected_str: str = (
         f'{expected_expression_1}\n{expected_expression_2}\n'
     )
@@ -59,9 +66,11 @@ def test_append_expression() -> None:
 def test_remove_expression_file() -> None:
     expression_file_util.append_expression(
         expression='<body></body>')
+    expression_file_util.save_expression_file()
     assert os.path.isfile(expression_file_util.EXPRESSION_FILE_PATH)
     expression_file_util.remove_expression_file()
     assert not os.path.exists(expression_file_util.EXPRESSION_FILE_PATH)
+    assert expression_file_util.get_current_expression() == ''
 
 
 @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
@@ -77,9 +86,18 @@ def test_get_current_expression() -> None:
     expression = expression_file_util.get_current_expression()
     assert expression == ''
 
+    expression_file_util.append_statement(
+        statement=VarDecl(name='num_1', value=Literal(value=10)))
+    expression = expression_file_util.get_current_expression(
+        optimizer=ExpressionOptimizer())
+    assert 'num_1' not in expression
+    expression = expression_file_util.get_current_expression()
+    assert 'var num_1 = 10;' in expression
+    expression_file_util.remove_expression_file()
+
 
 @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
-def test__merge_script_section() -> None:
+def test_get_current_expression_merges_script_section() -> None:
     expression_file_util.remove_expression_file()
     expression_file_util.append_expression(
         '<body>'
@@ -96,7 +114,6 @@ def test__merge_script_section() -> None:
         '\n'
         f'{html_const.SCRIPT_END_TAG}'
     )
-    expression_file_util._merge_script_section()
     expression: str = expression_file_util.get_current_expression()
     expected: str = (
         '<body>'
@@ -123,3 +140,65 @@ def test_wrap_by_script_tag_and_append_expression() -> None:
         f'\n{html_const.SCRIPT_END_TAG}'
     )
     assert expected in expression
+
+
+@retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
+def test_append_statement() -> None:
+    expression_file_util.remove_expression_file()
+    expression_file_util.append_statement(
+        statement=VarDecl(name='num', value=Literal(value=100)))
+    expression: str = expression_file_util.get_current_expression()
+    expected: str = (
+        f'{html_const.SCRIPT_START_TAG}'
+        '\nvar num = 100;'
+        f'\n{html_const.SCRIPT_END_TAG}'
+    )
+    assert expected == expression
+    expression_file_util.remove_expression_file()
+
+
+def test_get_expression_store() -> None:
+    expression_store: ExpressionStore = \
+        expression_file_util.get_expression_store()
+    assert isinstance(expression_store, BufferExpressionStore)
+
+
+@retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
+def test_set_expression_store() -> None:
+    default_store: ExpressionStore = \
+        expression_file_util.get_expression_store()
+    html_file_path: str = os.path.join(
+        expression_file_util.EXPRESSION_ROOT_DIR,
+        'test_file_expression_store_html.txt')
+    script_file_path: str = os.path.join(
+        expression_file_util.EXPRESSION_ROOT_DIR,
+        'test_file_expression_store_script.txt')
+    file_store: FileExpressionStore = FileExpressionStore(
+        html_file_path=html_file_path, script_file_path=script_file_path)
+    expression_file_util.set_expression_store(
+        expression_store=file_store)
+    try:
+        assert expression_file_util.get_expression_store() == file_store
+        expression_file_util.wrap_by_script_tag_and_append_expression(
+            expression='var num = 10;')
+        assert os.path.isfile(script_file_path)
+        expression: str = expression_file_util.get_current_expression()
+        assert 'var num = 10;' in expression
+    finally:
+        expression_file_util.set_expression_store(
+            expression_store=default_store)
+    file_store.clear()
+
+
+@retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
+def test_save_expression_file() -> None:
+    expression_file_util.remove_expression_file()
+    expression_file_util.wrap_by_script_tag_and_append_expression(
+        expression='var num = 10;')
+    assert not os.path.exists(expression_file_util.EXPRESSION_FILE_PATH)
+    expression: str = expression_file_util.save_expression_file()
+    assert 'var num = 10;' in expression
+    saved_expression: str = file_util.read_txt(
+        file_path=expression_file_util.EXPRESSION_FILE_PATH)
+    assert saved_expression.strip() == expression
+    expression_file_util.remove_expression_file()
@@ -0,0 +1,464 @@
+from array import array
+
+from apyscript.expression.expression_ir import ArrayLiteral
+from apyscript.expression.expression_ir import Assign
+from apyscript.expression.expression_ir import AttrSet
+from apyscript.expression.expression_ir import BinaryOp
+from apyscript.expression.expression_ir import Call
+from apyscript.expression.expression_ir import Expression
+from apyscript.expression.expression_ir import ExpressionStatement
+from apyscript.expression.expression_ir import Index
+from apyscript.expression.expression_ir import Literal
+from apyscript.expression.expression_ir import Member
+from apyscript.expression.expression_ir import Node
+from apyscript.expression.expression_ir import ObjectLiteral
+from apyscript.expression.expression_ir import Raw
+from apyscript.expression.expression_ir import Ref
+from apyscript.expression.expression_ir import TypedArrayLiteral
+from apyscript.expression.expression_ir import UnaryOp
+from apyscript.expression.expression_ir import VarDecl
+from apyscript.expression.expression_ir import get_value_expression
+from apyscript.expression.expression_ir import make_method_call
+from apyscript.type import Int
+from tests import testing_helper
+
+
+class TestNode:
+
+    def test_to_js(self) -> None:
+        testing_helper.assert_raises(
+            expected_error_class=NotImplementedError,
+            func_or_method=Node().to_js)
+
+    def test___eq__(self) -> None:
+        assert Ref(name='int_1') == Ref(name='int_1')
+        assert Ref(name='int_1') != Ref(name='int_2')
+        assert Literal(value=1) != Literal(value=1.0)
+        assert Literal(value=1) != Literal(value=True)
+        assert Literal(value=1) != Ref(name='1')
+        assert Ref(name='int_1') != 'int_1'
+        assert BinaryOp(
+            left=Ref(name='int_1'), operator='+',
+            right=Literal(value=10)) == BinaryOp(
+                left=Ref(name='int_1'), operator='+',
+                right=Literal(value=10))
+
+    def test___hash__(self) -> None:
+        expressions: set = {
+            Ref(name='int_1'), Ref(name='int_1'), Literal(value=10)}
+        assert len(expressions) == 2
+        assert hash(ArrayLiteral(elements=[Literal(value=1)])) == hash(
+            ArrayLiteral(elements=[Literal(value=1)]))
+
+    def test___repr__(self) -> None:
+        assert repr(Ref(name='int_1')) == "Ref('int_1')"
+
+    def test_get_child_nodes(self) -> None:
+        call: Call = Call(
+            callee=Ref(name='parseInt'),
+            args=[Ref(name='int_1'), Literal(value=10)])
+        assert call.get_child_nodes() == [
+            Ref(name='parseInt'), Ref(name='int_1'), Literal(value=10)]
+
+        object_literal: ObjectLiteral = ObjectLiteral(
+            items={'x': Ref(name='int_1')})
+        assert object_literal.get_child_nodes() == [Ref(name='int_1')]
+        assert Literal(value=10).get_child_nodes() == []
+
+    def test_get_read_names(self) -> None:
+        binary_op: BinaryOp = BinaryOp(
+            left=Ref(name='int_1'), operator='+',
+            right=Index(target=Ref(name='array_1'), index=Literal(value=0)))
+        assert binary_op.get_read_names() == {'int_1', 'array_1'}
+        var_decl: VarDecl = VarDecl(name='int_2', value=binary_op)
+        assert var_decl.get_read_names() == {'int_1', 'array_1'}
+
+
+class TestExpression:
+
+    def test_is_pure(self) -> None:
+        assert Ref(name='int_1').is_pure()
+        assert BinaryOp(
+            left=Ref(name='int_1'), operator='+',
+            right=Literal(value=10)).is_pure()
+        assert not BinaryOp(
+            left=Ref(name='int_1'), operator='+',
+            right=make_method_call(
+                variable_name='array_1', method_name='pop')).is_pure()
+
+
+class TestRef:
+
+    def test_to_js(self) -> None:
+        assert Ref(name='int_1').to_js() == 'int_1'
+
+    def test_get_read_names(self) -> None:
+        assert Ref(name='int_1').get_read_names() == {'int_1'}
+
+
+class TestLiteral:
+
+    def test_to_js(self) -> None:
+        assert Literal(value=10).to_js() == '10'
+        assert Literal(value=0.5).to_js() == '0.5'
+        assert Literal(value=True).to_js() == 'true'
+        assert Literal(value='Hello!').to_js() == '"Hello!"'
+
+
+class TestArrayLiteral:
+
+    def test_to_js(self) -> None:
+        array_literal: ArrayLiteral = ArrayLiteral(
+            elements=[Literal(value=1), Ref(name='int_1')])
+        assert array_literal.to_js() == '[1, int_1]'
+        assert ArrayLiteral(elements=[]).to_js() == '[]'
+
+
+class TestTypedArrayLiteral:
+
+    def test_to_js(self) -> None:
+        typed_array_literal: TypedArrayLiteral = TypedArrayLiteral(
+            typed_array_name='Int32Array', base64_str='AQAAAAIAAAA=')
+        assert typed_array_literal.to_js() == (
+            'Array.from(new Int32Array(Uint8Array.from('
+            'atob("AQAAAAIAAAA="), function(c) {return c.charCodeAt(0);})'
+            '.buffer))'
+        )
+        assert typed_array_literal.is_pure()
+        assert typed_array_literal.get_read_names() == set()
+
+        typed_array_literal = TypedArrayLiteral(
+            typed_array_name='BigInt64Array',
+            base64_str='AQAAAAAAAAA=')
+        assert typed_array_literal.to_js().endswith('.buffer), Number)')
+
+
+class TestObjectLiteral:
+
+    def test_set_item(self) -> None:
+        object_literal: ObjectLiteral = ObjectLiteral()
+        object_literal.set_item(key='x', value=Literal(value=10))
+        assert object_literal.items == {'x': Literal(value=10)}
+
+    def test_to_js(self) -> None:
+        object_literal: ObjectLiteral = ObjectLiteral(
+            items={
+                'x': Literal(value=10),
+                'fill-opacity': Ref(name='number_1'),
+            })
+        assert object_literal.to_js() == (
+            '{x: 10, "fill-opacity": number_1}')
+        assert ObjectLiteral().to_js() == '{}'
+
+    def test___eq__(self) -> None:
+        assert ObjectLiteral(items={'x': Literal(value=10)}) == \
+            ObjectLiteral(items={'x': Literal(value=10)})
+        assert ObjectLiteral(items={'x': Literal(value=10)}) != \
+            ObjectLiteral(items={'y': Literal(value=10)})
+
+
+class TestBinaryOp:
+
+    def test_to_js(self) -> None:
+        binary_op: BinaryOp = BinaryOp(
+            left=Ref(name='int_1'), operator='+', right=Literal(value=10))
+        assert binary_op.to_js() == 'int_1 + 10'
+
+        binary_op = BinaryOp(
+            left=binary_op, operator='*', right=Ref(name='int_2'))
+        assert binary_op.to_js() == '(int_1 + 10) * int_2'
+
+
+class TestUnaryOp:
+
+    def test_to_js(self) -> None:
+        unary_op: UnaryOp = UnaryOp(
+            operator='!', operand=Ref(name='boolean_1'))
+        assert unary_op.to_js() == '!boolean_1'
+
+        unary_op = UnaryOp(
+            operator='-',
+            operand=BinaryOp(
+                left=Ref(name='int_1'), operator='+',
+                right=Literal(value=1)))
+        assert unary_op.to_js() == '-(int_1 + 1)'
+
+
+class TestMember:
+
+    def test_to_js(self) -> None:
+        member: Member = Member(target=Ref(name='array_1'), name='length')
+        assert member.to_js() == 'array_1.length'
+
+
+class TestIndex:
+
+    def test_to_js(self) -> None:
+        index: Index = Index(
+            target=Ref(name='array_1'), index=Literal(value=0))
+        assert index.to_js() == 'array_1[0]'
+
+
+class TestCall:
+
+    def test_to_js(self) -> None:
+        call: Call = Call(callee=Ref(name='parseInt'))
+        assert call.to_js() == 'parseInt()'
+
+        call = Call(
+            callee=Ref(name='parseInt'),
+            args=[Ref(name='int_1'), Literal(value=10)])
+        assert call.to_js() == 'parseInt(int_1, 10)'
+
+    def test_is_pure(self) -> None:
+        call: Call = Call(
+            callee=Ref(name='parseInt'),
+            args=[Ref(name='int_1'), Literal(value=10)])
+        assert call.is_pure()
+
+        call = make_method_call(
+            variable_name='array_1', method_name='concat',
+            args=[Ref(name='array_2')])
+        assert call.is_pure()
+
+        call = make_method_call(
+            variable_name='JSON', method_name='parse',
+            args=[
+                make_method_call(
+                    variable_name='JSON', method_name='stringify',
+                    args=[Ref(name='array_1')]),
+            ])
+        assert call.is_pure()
+
+        call = make_method_call(
+            variable_name='array_1', method_name='concat',
+            args=[
+                make_method_call(
+                    variable_name='array_2', method_name='pop'),
+            ])
+        assert not call.is_pure()
+
+        call = make_method_call(variable_name='array_1', method_name='push')
+        assert not call.is_pure()
+
+        call = Call(callee=Ref(name='alert'))
+        assert not call.is_pure()
+
+    def test_get_self_mutating_target_name(self) -> None:
+        call: Call = make_method_call(
+            variable_name='array_1', method_name='push',
+            args=[Literal(value=10)])
+        assert call.get_self_mutating_target_name() == 'array_1'
+
+        call = make_method_call(variable_name='array_1', method_name='slice')
+        assert call.get_self_mutating_target_name() is None
+
+        call = Call(callee=Ref(name='parseInt'))
+        assert call.get_self_mutating_target_name() is None
+
+        call = Call(
+            callee=Member(
+                target=Index(
+                    target=Ref(name='array_1'), index=Literal(value=0)),
+                name='push'))
+        assert call.get_self_mutating_target_name() is None
+
+
+class TestStatement:
+
+    def test_get_stored_name(self) -> None:
+        assert Raw(js='int_1 = 10;').get_stored_name() is None
+
+    def test_is_pure_store(self) -> None:
+        assert not Raw(js='int_1 = 10;').is_pure_store()
+
+
+class TestVarDecl:
+
+    def test_to_js(self) -> None:
+        var_decl: VarDecl = VarDecl(name='int_1', value=Literal(value=10))
+        assert var_decl.to_js() == 'var int_1 = 10;'
+
+    def test_get_stored_name(self) -> None:
+        var_decl: VarDecl = VarDecl(name='int_1', value=Literal(value=10))
+        assert var_decl.get_stored_name() == 'int_1'
+
+    def test_is_pure_store(self) -> None:
+        var_decl: VarDecl = VarDecl(name='int_1', value=Literal(value=10))
+        assert var_decl.is_pure_store()
+
+        var_decl = VarDecl(
+            name='rectangle_1',
+            value=make_method_call(
+                variable_name='stage_1', method_name='rect'))
+        assert not var_decl.is_pure_store()
+
+
+class TestAssign:
+
+    def test_to_js(self) -> None:
+        assign: Assign = Assign(
+            target=Ref(name='int_1'), value=Literal(value=10))
+        assert assign.to_js() == 'int_1 = 10;'
+
+        assign = Assign(
+            target=Ref(name='int_1'), value=Ref(name='int_2'),
+            operator='+=')
+        assert assign.to_js() == 'int_1 += int_2;'
+
+    def test_get_read_names(self) -> None:
+        assign: Assign = Assign(
+            target=Ref(name='int_1'), value=Ref(name='int_2'))
+        assert assign.get_read_names() == {'int_2'}
+
+        assign = Assign(
+            target=Ref(name='int_1'), value=Ref(name='int_2'),
+            operator='+=')
+        assert assign.get_read_names() == {'int_1', 'int_2'}
+
+        assign = Assign(
+            target=Index(target=Ref(name='array_1'), index=Ref(name='int_1')),
+            value=Literal(value=10))
+        assert assign.get_read_names() == {'array_1', 'int_1'}
+
+    def test_get_stored_name(self) -> None:
+        assign: Assign = Assign(
+            target=Ref(name='int_1'), value=Literal(value=10))
+        assert assign.get_stored_name() == 'int_1'
+
+        assign = Assign(
+            target=Index(target=Ref(name='array_1'), index=Literal(value=0)),
+            value=Literal(value=10))
+        assert assign.get_stored_name() is None
+
+    def test_is_pure_store(self) -> None:
+        assign: Assign = Assign(
+            target=Ref(name='int_1'), value=Literal(value=10))
+        assert assign.is_pure_store()
+
+        assign = Assign(
+            target=Ref(name='int_1'),
+            value=make_method_call(
+                variable_name='array_1', method_name='pop'))
+        assert not assign.is_pure_store()
+
+        assign = Assign(
+            target=Index(target=Ref(name='array_1'), index=Literal(value=0)),
+            value=Literal(value=10))
+        assert not assign.is_pure_store()
+
+
+class TestAttrSet:
+
+    def test_to_js(self) -> None:
+        attr_set: AttrSet = AttrSet(
+            target=Ref(name='rectangle_1'), attr_name='x',
+            value=Ref(name='int_1'))
+        assert attr_set.to_js() == 'rectangle_1.x(int_1);'
+
+        attr_set = AttrSet(
+            target=Ref(name='rectangle_1'), attr_name='fill',
+            value=Literal(value='#333333'))
+        assert attr_set.to_js() == 'rectangle_1.fill("#333333");'
+
+        attr_set = AttrSet(
+            target=Ref(name='rectangle_1'), attr_name='stroke-opacity',
+            value=Literal(value=0.5))
+        assert attr_set.to_js() == 'rectangle_1.stroke({opacity: 0.5});'
+
+        attr_set = AttrSet(
+            target=Ref(name='rectangle_1'), attr_name='stroke-width',
+            value=Literal(value=3))
+        assert attr_set.to_js() == (
+            'rectangle_1.attr({"stroke-width": 3});')
+
+
+class TestExpressionStatement:
+
+    def test_to_js(self) -> None:
+        statement: ExpressionStatement = ExpressionStatement(
+            expression=make_method_call(
+                variable_name='array_1', method_name='reverse'))
+        assert statement.to_js() == 'array_1.reverse();'
+
+    def test_get_stored_name(self) -> None:
+        statement: ExpressionStatement = ExpressionStatement(
+            expression=make_method_call(
+                variable_name='array_1', method_name='reverse'))
+        assert statement.get_stored_name() == 'array_1'
+
+        statement = ExpressionStatement(
+            expression=make_method_call(
+                variable_name='console', method_name='log'))
+        assert statement.get_stored_name() is None
+
+        statement = ExpressionStatement(expression=Ref(name='array_1'))
+        assert statement.get_stored_name() is None
+
+    def test_is_pure_store(self) -> None:
+        statement: ExpressionStatement = ExpressionStatement(
+            expression=make_method_call(
+                variable_name='array_1', method_name='push',
+                args=[Ref(name='int_1')]))
+        assert statement.is_pure_store()
+
+        statement = ExpressionStatement(
+            expression=make_method_call(
+                variable_name='array_1', method_name='push',
+                args=[
+                    make_method_call(
+                        variable_name='array_2', method_name='pop'),
+                ]))
+        assert not statement.is_pure_store()
+
+        statement = ExpressionStatement(
+            expression=make_method_call(
+                variable_name='console', method_name='log'))
+        assert not statement.is_pure_store()
+
+
+class TestRaw:
+
+    def test_to_js(self) -> None:
+        raw: Raw = Raw(js='for (var i = 0; i < 3; i++) {}')
+        assert raw.to_js() == 'for (var i = 0; i < 3; i++) {}'
+
+    def test_get_read_names(self) -> None:
+        raw: Raw = Raw(js='string_2 += string_1.repeat(3);')
+        assert raw.get_read_names() == {'string_1', 'string_2', 'repeat'}
+
+
+def test_get_value_expression() -> None:
+    int_1: Int = Int(10)
+    expression: Expression = get_value_expression(value=int_1)
+    assert expression == Literal(value=10)
+
+    int_1.variable_name
+    expression = get_value_expression(value=int_1)
+    assert expression == Ref(name=int_1.variable_name)
+
+    expression = get_value_expression(value=[1, 'Hello!', int_1])
+    assert expression == ArrayLiteral(
+        elements=[
+            Literal(value=1), Literal(value='Hello!'),
+            Ref(name=int_1.variable_name)])
+
+    expression = get_value_expression(value=[1, ['Hello!', True]])
+    assert expression == Literal(value=(1, ('Hello!', True)))
+
+    expression = get_value_expression(value=0.5)
+    assert expression == Literal(value=0.5)
+
+    expression = get_value_expression(value=array('i', [1, 2]))
+    assert expression == TypedArrayLiteral(
+        typed_array_name='Int32Array', base64_str='AQAAAAIAAAA=')
+
+
+def test_make_method_call() -> None:
+    call: Call = make_method_call(
+        variable_name='array_1', method_name='push',
+        args=[Literal(value=10)])
+    assert call == Call(
+        callee=Member(target=Ref(name='array_1'), name='push'),
+        args=[Literal(value=10)])
+    assert call.to_js() == 'array_1.push(10)'
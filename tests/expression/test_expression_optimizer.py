@@ -0,0 +1,329 @@
+from typing import List
+from typing import Set
+
+from apyscript.display.sprite import Sprite
+from apyscript.display.stage import Stage
+from apyscript.expression import expression_optimizer
+from apyscript.expression.build_session import BuildSession
+from apyscript.expression.expression_ir import Assign
+from apyscript.expression.expression_ir import AttrSet
+from apyscript.expression.expression_ir import BinaryOp
+from apyscript.expression.expression_ir import Call
+from apyscript.expression.expression_ir import ExpressionStatement
+from apyscript.expression.expression_ir import Index
+from apyscript.expression.expression_ir import Literal
+from apyscript.expression.expression_ir import Raw
+from apyscript.expression.expression_ir import Ref
+from apyscript.expression.expression_ir import Statement
+from apyscript.expression.expression_ir import VarDecl
+from apyscript.expression.expression_ir import make_method_call
+from apyscript.expression.expression_optimizer import ExpressionOptimizer
+from apyscript.expression.expression_optimizer import OptimizationStats
+from apyscript.type import Int
+
+
+def _make_log_statement(variable_name: str) -> ExpressionStatement:
+    """
+    Make a console.log statement of specified variable (for testing).
+
+    Parameters
+    ----------
+    variable_name : str
+        Variable name to log.
+
+    Returns
+    -------
+    statement : ExpressionStatement
+        Created statement.
+    """
+    return ExpressionStatement(
+        expression=make_method_call(
+            variable_name='console', method_name='log',
+            args=[Ref(name=variable_name)]))
+
+
+class TestOptimizationStats:
+
+    def test___init__(self) -> None:
+        stats: OptimizationStats = OptimizationStats(
+            pass_name='test pass', removed_statement_num=2,
+            removed_bytes=30)
+        assert stats.pass_name == 'test pass'
+        assert stats.removed_statement_num == 2
+        assert stats.removed_bytes == 30
+
+    def test___repr__(self) -> None:
+        stats: OptimizationStats = OptimizationStats(
+            pass_name='test pass', removed_statement_num=2,
+            removed_bytes=30)
+        assert repr(stats) == 'test pass: removed 2 statements (30 bytes)'
+
+
+class TestExpressionOptimizer:
+
+    def test___init__(self) -> None:
+        optimizer: ExpressionOptimizer = ExpressionOptimizer()
+        assert len(optimizer._passes) == 4
+        assert optimizer.stats_list == []
+
+        optimizer = ExpressionOptimizer(
+            common_subexpression_elimination=False,
+            dead_store_elimination=False, dead_variable_elimination=False,
+            attr_update_coalescing=False)
+        assert optimizer._passes == []
+
+        optimizer = ExpressionOptimizer(fold_constants=True)
+        assert [pass_name for pass_name, _ in optimizer._passes] == [
+            'constant folding', 'common subexpression elimination',
+            'dead store elimination', 'dead variable elimination',
+            'attribute updates coalescing']
+
+    def test_optimize(self) -> None:
+        statements: List[Statement] = [
+            VarDecl(name='int_1', value=Literal(value=10)),
+            VarDecl(name='int_2', value=Literal(value=20)),
+            _make_log_statement(variable_name='int_2'),
+        ]
+        optimizer: ExpressionOptimizer = ExpressionOptimizer()
+        optimized: List[Statement] = optimizer.optimize(
+            statements=statements)
+        assert optimized == statements[1:]
+        assert len(statements) == 3
+        assert len(optimizer.stats_list) == 4
+        stats: OptimizationStats = optimizer.stats_list[1]
+        assert stats.pass_name == 'dead store elimination'
+        assert stats.removed_statement_num == 0
+        stats = optimizer.stats_list[2]
+        assert stats.pass_name == 'dead variable elimination'
+        assert stats.removed_statement_num == 1
+        assert stats.removed_bytes == len('var int_1 = 10;\n')
+
+        optimizer = ExpressionOptimizer(
+            common_subexpression_elimination=False,
+            dead_store_elimination=False, dead_variable_elimination=False,
+            attr_update_coalescing=False)
+        optimized = optimizer.optimize(statements=statements)
+        assert optimized == statements
+        assert optimizer.stats_list == []
+
+        # Folded container positions must not be coalesced to the
+        # attr method call.
+        with BuildSession() as session:
+            stage: Stage = Stage()
+            sprite: Sprite = Sprite(stage=stage)
+            x: Int = Int(10)
+            y: Int = Int(20)
+            x.variable_name
+            y.variable_name
+            sprite.x = x
+            sprite.y = y
+            statements = session.expression_store.get_script_statements()
+        optimizer = ExpressionOptimizer(fold_constants=True)
+        optimized = optimizer.optimize(statements=statements)
+        js: str = '\n'.join(statement.to_js() for statement in optimized)
+        assert f'{sprite.variable_name}.x(10);' in js
+        assert f'{sprite.variable_name}.y(20);' in js
+        assert f'{sprite.variable_name}.attr(' not in js
+
+
+def test_get_statements_bytes() -> None:
+    statements_bytes: int = expression_optimizer.get_statements_bytes(
+        statements=[
+            VarDecl(name='string_1', value=Literal(value='あ')),
+            Raw(js='a;'),
+        ])
+    assert statements_bytes == len('var string_1 = "";\n') + 3 + len('a;\n')
+
+
+def test_eliminate_dead_stores() -> None:
+    statements: List[Statement] = [
+        VarDecl(name='int_1', value=Literal(value=10)),
+        Assign(target=Ref(name='int_1'), value=Literal(value=20)),
+        Assign(target=Ref(name='int_1'), value=Literal(value=30)),
+        _make_log_statement(variable_name='int_1'),
+        Assign(target=Ref(name='int_1'), value=Literal(value=40)),
+        Assign(
+            target=Ref(name='int_1'),
+            value=BinaryOp(
+                left=Ref(name='int_1'), operator='+',
+                right=Literal(value=1))),
+        Assign(target=Ref(name='int_1'), value=Literal(value=5),
+               operator='+='),
+        Assign(target=Ref(name='int_1'), value=Literal(value=50)),
+    ]
+    optimized: List[Statement] = \
+        expression_optimizer.eliminate_dead_stores(statements=statements)
+    assert optimized == [
+        VarDecl(name='int_1', value=Literal(value=30)),
+        statements[3],
+        statements[4],
+        statements[5],
+        statements[7],
+    ]
+
+    # Attribute updates.
+    statements = [
+        AttrSet(
+            target=Ref(name='rectangle_1'), attr_name='x',
+            value=Ref(name='int_1')),
+        AttrSet(
+            target=Ref(name='rectangle_1'), attr_name='y',
+            value=Ref(name='int_2')),
+        AttrSet(
+            target=Ref(name='rectangle_2'), attr_name='x',
+            value=Ref(name='int_3')),
+        AttrSet(
+            target=Ref(name='rectangle_1'), attr_name='x',
+            value=Ref(name='int_4')),
+        _make_log_statement(variable_name='rectangle_1'),
+        AttrSet(
+            target=Ref(name='rectangle_1'), attr_name='x',
+            value=Ref(name='int_5')),
+        VarDecl(
+            name='rectangle_1',
+            value=make_method_call(
+                variable_name='stage_1', method_name='rect')),
+        AttrSet(
+            target=Ref(name='rectangle_1'), attr_name='x',
+            value=Ref(name='int_6')),
+    ]
+    optimized = expression_optimizer.eliminate_dead_stores(
+        statements=statements)
+    assert optimized == statements[1:]
+
+    # Impure store and stores before the raw statement reading the
+    # variable will not be removed.
+    statements = [
+        Assign(
+            target=Ref(name='int_1'),
+            value=make_method_call(
+                variable_name='array_1', method_name='pop')),
+        Assign(target=Ref(name='int_1'), value=Literal(value=10)),
+        Raw(js='for (var i = 0; i < 3; i++) {int_2 += int_1;}'),
+        Assign(target=Ref(name='int_1'), value=Literal(value=20)),
+    ]
+    optimized = expression_optimizer.eliminate_dead_stores(
+        statements=statements)
+    assert optimized == statements
+
+
+def test__get_variable_attr_set() -> None:
+    attr_set: AttrSet = AttrSet(
+        target=Ref(name='rectangle_1'), attr_name='x',
+        value=Literal(value=10))
+    assert expression_optimizer._get_variable_attr_set(
+        statement=attr_set) is attr_set
+    assert expression_optimizer._get_variable_attr_set(
+        statement=AttrSet(
+            target=Index(target=Ref(name='array_1'), index=Literal(value=0)),
+            attr_name='x', value=Literal(value=10))) is None
+    assert expression_optimizer._get_variable_attr_set(
+        statement=Raw(js='a;')) is None
+
+
+def test__is_variable_overwrite() -> None:
+    assert expression_optimizer._is_variable_overwrite(
+        statement=VarDecl(name='int_1', value=Literal(value=10)))
+    assert expression_optimizer._is_variable_overwrite(
+        statement=Assign(target=Ref(name='int_1'), value=Literal(value=10)))
+    assert not expression_optimizer._is_variable_overwrite(
+        statement=Assign(
+            target=Ref(name='int_1'), value=Literal(value=10),
+            operator='+='))
+    assert not expression_optimizer._is_variable_overwrite(
+        statement=Raw(js='int_1 = 10;'))
+
+
+def test_eliminate_dead_variables() -> None:
+    statements: List[Statement] = [
+        VarDecl(name='int_1', value=Literal(value=10)),
+        VarDecl(name='int_2', value=Ref(name='int_1')),
+        Assign(
+            target=Ref(name='int_2'),
+            value=BinaryOp(
+                left=Ref(name='int_2'), operator='+',
+                right=Literal(value=1))),
+        Assign(
+            target=Ref(name='int_2'), value=Literal(value=5),
+            operator='+='),
+        VarDecl(name='int_3', value=Literal(value=30)),
+        _make_log_statement(variable_name='int_3'),
+    ]
+    optimized: List[Statement] = \
+        expression_optimizer.eliminate_dead_variables(statements=statements)
+    assert optimized == statements[4:]
+
+    # Impure store will not be removed.
+    statements = [
+        VarDecl(
+            name='rectangle_1',
+            value=make_method_call(
+                variable_name='stage_1', method_name='rect')),
+        VarDecl(name='array_1', value=Literal(value=[1, 2])),
+        Assign(
+            target=Ref(name='int_1'),
+            value=make_method_call(
+                variable_name='array_1', method_name='pop')),
+    ]
+    optimized = expression_optimizer.eliminate_dead_variables(
+        statements=statements)
+    assert optimized == statements
+
+    # Self mutating method call of the unreferenced variable will be
+    # removed.
+    statements = [
+        VarDecl(name='array_1', value=Literal(value=[])),
+        ExpressionStatement(
+            expression=make_method_call(
+                variable_name='array_1', method_name='push',
+                args=[Ref(name='sprite_1')])),
+        ExpressionStatement(
+            expression=make_method_call(
+                variable_name='array_1', method_name='reverse')),
+    ]
+    optimized = expression_optimizer.eliminate_dead_variables(
+        statements=statements)
+    assert optimized == []
+
+    # Variable that is referenced in the raw statements will not be
+    # removed.
+    statements = [
+        VarDecl(name='string_1', value=Literal(value='a')),
+        Raw(js='for (var i = 0; i < 3; i++) {string_2 += string_1;}'),
+    ]
+    optimized = expression_optimizer.eliminate_dead_variables(
+        statements=statements)
+    assert optimized == statements
+
+
+def test__get_possibly_aliased_mutated_names() -> None:
+    statements: List[Statement] = [
+        VarDecl(
+            name='array_2',
+            value=Index(target=Ref(name='array_1'), index=Literal(value=0))),
+        ExpressionStatement(
+            expression=make_method_call(
+                variable_name='array_2', method_name='push',
+                args=[Literal(value=1)])),
+        VarDecl(name='array_3', value=Ref(name='array_1')),
+        VarDecl(
+            name='array_4',
+            value=Call(
+                callee=Ref(name='JSON.parse'), args=[Ref(name='array_1')])),
+        ExpressionStatement(
+            expression=make_method_call(
+                variable_name='array_4', method_name='sort')),
+    ]
+    names: Set[str] = \
+        expression_optimizer._get_possibly_aliased_mutated_names(
+            statements=statements,
+            store_indexes={
+                'array_2': [0, 1],
+                'array_3': [2],
+                'array_4': [3, 4],
+            })
+    assert names == {'array_2'}
+
+    optimized: List[Statement] = \
+        expression_optimizer.eliminate_dead_variables(statements=statements)
+    assert optimized == statements[:2]
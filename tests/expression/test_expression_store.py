@@ -0,0 +1,288 @@
+import os
+from random import randint
+from typing import List
+
+from retrying import retry
+
+from apyscript.expression import expression_file_util
+from apyscript.expression.expression_ir import Literal
+from apyscript.expression.expression_ir import Raw
+from apyscript.expression.expression_ir import Statement
+from apyscript.expression.expression_ir import VarDecl
+from apyscript.expression.expression_optimizer import ExpressionOptimizer
+from apyscript.expression.expression_store import BufferExpressionStore
+from apyscript.expression.expression_store import ExpressionStore
+from apyscript.expression.expression_store import FileExpressionStore
+from apyscript.expression.expression_store import _read_txt_if_exists
+from apyscript.file import file_util
+from apyscript.html import html_const
+from tests import testing_helper
+
+_TEST_HTML_FILE_PATH: str = os.path.join(
+    expression_file_util.EXPRESSION_ROOT_DIR,
+    'test_expression_store_html.txt')
+_TEST_SCRIPT_FILE_PATH: str = os.path.join(
+    expression_file_util.EXPRESSION_ROOT_DIR,
+    'test_expression_store_script.txt')
+
+
+class TestExpressionStore:
+
+    def test_append(self) -> None:
+        expression_store: BufferExpressionStore = BufferExpressionStore()
+        expression_store.append(
+            expression=(
+                '<body>'
+                f'\n{html_const.SCRIPT_START_TAG}'
+                '\nconsole.log("Hello!");'
+                f'\n{html_const.SCRIPT_END_TAG}'
+                '\n</body>'
+            ))
+        assert expression_store._html_segments == ['<body>\n</body>']
+        assert expression_store._script_segments == [
+            Raw(js='console.log("Hello!");')]
+
+        expression_store.append(expression='<span></span>')
+        assert expression_store._html_segments == [
+            '<body>\n</body>', '<span></span>']
+        assert len(expression_store._script_segments) == 1
+
+    def test___init__(self) -> None:
+        testing_helper.assert_raises(
+            expected_error_class=TypeError,
+            func_or_method=ExpressionStore)
+
+        class _IncompleteExpressionStore(ExpressionStore):
+
+            def append_html(self, html: str) -> None:
+                """
+                Append html fragment (for testing).
+
+                Parameters
+                ----------
+                html : str
+                    HTML fragment string.
+                """
+
+        testing_helper.assert_raises(
+            expected_error_class=TypeError,
+            func_or_method=_IncompleteExpressionStore)
+
+    def test_iter_script_chunks(self) -> None:
+        expression_store: BufferExpressionStore = BufferExpressionStore()
+        assert list(expression_store.iter_script_chunks()) == []
+
+        expression_store.append_statement(
+            statement=VarDecl(name='num_1', value=Literal(value=10)))
+        expression_store.append_script(script='console.log(num_1);')
+        expression_store.append_statement(
+            statement=VarDecl(name='num_2', value=Literal(value=20)))
+        chunks: List[str] = list(expression_store.iter_script_chunks())
+        assert chunks == [
+            'var num_1 = 10;',
+            '\nconsole.log(num_1);',
+            '\nvar num_2 = 20;',
+        ]
+
+        chunks = list(
+            expression_store.iter_script_chunks(
+                optimizer=ExpressionOptimizer()))
+        assert chunks == ['var num_1 = 10;', '\nconsole.log(num_1);']
+
+    def test_get_expression(self) -> None:
+        expression_store: BufferExpressionStore = BufferExpressionStore()
+        assert expression_store.get_expression() == ''
+
+        expression_store.append_html(html='<body>')
+        assert expression_store.get_expression() == '<body>'
+
+        expression_store.append_script(script='var num_1 = 10;')
+        expression_store.append_html(html='</body>')
+        expression_store.append_script(script='var num_2 = 20;')
+        expected: str = (
+            '<body>'
+            '\n</body>'
+            f'\n{html_const.SCRIPT_START_TAG}'
+            '\nvar num_1 = 10;'
+            '\nvar num_2 = 20;'
+            f'\n{html_const.SCRIPT_END_TAG}'
+        )
+        assert expression_store.get_expression() == expected
+
+        expression_store = BufferExpressionStore()
+        expression_store.append_script(script='var num_1 = 10;')
+        expected = (
+            f'{html_const.SCRIPT_START_TAG}'
+            '\nvar num_1 = 10;'
+            f'\n{html_const.SCRIPT_END_TAG}'
+        )
+        assert expression_store.get_expression() == expected
+
+        expression_store = BufferExpressionStore()
+        expression_store.append_statement(
+            statement=VarDecl(name='num_1', value=Literal(value=10)))
+        expression_store.append_script(script='console.log(num_1);')
+        expression_store.append_statement(
+            statement=VarDecl(name='num_2', value=Literal(value=20)))
+        expected = (
+            f'{html_const.SCRIPT_START_TAG}'
+            '\nvar num_1 = 10;'
+            '\nconsole.log(num_1);'
+            f'\n{html_const.SCRIPT_END_TAG}'
+        )
+        optimizer: ExpressionOptimizer = ExpressionOptimizer()
+        assert expression_store.get_expression(
+            optimizer=optimizer) == expected
+        assert sum(
+            stats.removed_statement_num
+            for stats in optimizer.stats_list) == 1
+        assert len(expression_store.get_script_statements()) == 3
+
+
+class TestBufferExpressionStore:
+
+    def test___init__(self) -> None:
+        expression_store: BufferExpressionStore = BufferExpressionStore()
+        assert expression_store._html_segments == []
+        assert expression_store._script_segments == []
+
+    def test_append_html(self) -> None:
+        expression_store: BufferExpressionStore = BufferExpressionStore()
+        expression_store.append_html(html='<body>')
+        expression_store.append_html(html='</body>')
+        assert expression_store._html_segments == ['<body>', '</body>']
+
+    def test_append_script(self) -> None:
+        expression_store: BufferExpressionStore = BufferExpressionStore()
+        expression_store.append_script(script='var num = 10;')
+        assert expression_store._script_segments == [
+            Raw(js='var num = 10;')]
+
+    def test_append_statement(self) -> None:
+        expression_store: BufferExpressionStore = BufferExpressionStore()
+        statement: VarDecl = VarDecl(name='num', value=Literal(value=10))
+        expression_store.append_statement(statement=statement)
+        assert expression_store._script_segments == [statement]
+        assert expression_store.get_script_expression() == 'var num = 10;'
+
+    def test_get_html_expression(self) -> None:
+        expression_store: BufferExpressionStore = BufferExpressionStore()
+        assert expression_store.get_html_expression() == ''
+        expression_store.append_html(html='<body>')
+        expression_store.append_html(html='</body>')
+        assert expression_store.get_html_expression() == '<body>\n</body>'
+
+    def test_get_script_expression(self) -> None:
+        expression_store: BufferExpressionStore = BufferExpressionStore()
+        expression_store.append_script(script='var num_1 = 10;')
+        expression_store.append_script(script='var num_2 = 20;')
+        assert expression_store.get_script_expression() == (
+            'var num_1 = 10;\nvar num_2 = 20;')
+
+    def test_get_script_statements(self) -> None:
+        expression_store: BufferExpressionStore = BufferExpressionStore()
+        statement: VarDecl = VarDecl(name='num', value=Literal(value=10))
+        expression_store.append_statement(statement=statement)
+        statements: List[Statement] = \
+            expression_store.get_script_statements()
+        assert statements == [statement]
+        statements.clear()
+        assert expression_store._script_segments == [statement]
+
+    def test_clear(self) -> None:
+        expression_store: BufferExpressionStore = BufferExpressionStore()
+        expression_store.append_html(html='<body>')
+        expression_store.append_script(script='var num = 10;')
+        expression_store.clear()
+        assert expression_store.get_expression() == ''
+
+
+class TestFileExpressionStore:
+
+    def _make_store(self) -> FileExpressionStore:
+        expression_store: FileExpressionStore = FileExpressionStore(
+            html_file_path=_TEST_HTML_FILE_PATH,
+            script_file_path=_TEST_SCRIPT_FILE_PATH)
+        expression_store.clear()
+        return expression_store
+
+    def test___init__(self) -> None:
+        expression_store: FileExpressionStore = FileExpressionStore(
+            html_file_path=_TEST_HTML_FILE_PATH,
+            script_file_path=_TEST_SCRIPT_FILE_PATH)
+        assert expression_store.html_file_path == _TEST_HTML_FILE_PATH
+        assert expression_store.script_file_path == _TEST_SCRIPT_FILE_PATH
+
+    @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
+    def test_append_html(self) -> None:
+        expression_store: FileExpressionStore = self._make_store()
+        expression_store.append_html(html='<body>')
+        expression_store.append_html(html='</body>')
+        txt: str = file_util.read_txt(file_path=_TEST_HTML_FILE_PATH)
+        assert txt == '<body>\n</body>\n'
+        expression_store.clear()
+
+    @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
+    def test_append_script(self) -> None:
+        expression_store: FileExpressionStore = self._make_store()
+        expression_store.append_script(script='var num = 10;')
+        txt: str = file_util.read_txt(file_path=_TEST_SCRIPT_FILE_PATH)
+        assert txt == 'var num = 10;\n'
+        expression_store.clear()
+
+    @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
+    def test_append_statement(self) -> None:
+        expression_store: FileExpressionStore = self._make_store()
+        expression_store.append_statement(
+            statement=VarDecl(name='num', value=Literal(value=10)))
+        txt: str = file_util.read_txt(file_path=_TEST_SCRIPT_FILE_PATH)
+        assert txt == 'var num = 10;\n'
+        expression_store.clear()
+
+    @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
+    def test_get_html_expression(self) -> None:
+        expression_store: FileExpressionStore = self._make_store()
+        assert expression_store.get_html_expression() == ''
+        expression_store.append_html(html='<body>')
+        assert expression_store.get_html_expression() == '<body>'
+        expression_store.clear()
+
+    @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
+    def test_get_script_expression(self) -> None:
+        expression_store: FileExpressionStore = self._make_store()
+        assert expression_store.get_script_expression() == ''
+        expression_store.append_script(script='var num = 10;')
+        assert expression_store.get_script_expression() == 'var num = 10;'
+        expression_store.clear()
+
+    @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
+    def test_get_script_statements(self) -> None:
+        expression_store: FileExpressionStore = self._make_store()
+        assert expression_store.get_script_statements() == []
+        expression_store.append_statement(
+            statement=VarDecl(name='num', value=Literal(value=10)))
+        assert expression_store.get_script_statements() == [
+            Raw(js='var num = 10;')]
+        expression_store.clear()
+
+    @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
+    def test_clear(self) -> None:
+        expression_store: FileExpressionStore = self._make_store()
+        expression_store.append_html(html='<body>')
+        expression_store.append_script(script='var num = 10;')
+        expression_store.clear()
+        assert not os.path.exists(_TEST_HTML_FILE_PATH)
+        assert not os.path.exists(_TEST_SCRIPT_FILE_PATH)
+
+
+@retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
+def test__read_txt_if_exists() -> None:
+    file_util.remove_file_if_exists(file_path=_TEST_HTML_FILE_PATH)
+    txt: str = _read_txt_if_exists(file_path=_TEST_HTML_FILE_PATH)
+    assert txt == ''
+
+    file_util.save_plain_txt(
+        txt='<body>\n</body>\n', file_path=_TEST_HTML_FILE_PATH)
+    txt = _read_txt_if_exists(file_path=_TEST_HTML_FILE_PATH)
+    assert txt == '<body>\n</body>'
+    file_util.remove_file_if_exists(file_path=_TEST_HTML_FILE_PATH)
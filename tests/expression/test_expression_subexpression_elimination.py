@@ -0,0 +1,428 @@
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Set
+
+from apyscript.expression import expression_subexpression_elimination
+from apyscript.expression.expression_ir import ArrayLiteral
+from apyscript.expression.expression_ir import Assign
+from apyscript.expression.expression_ir import AttrSet
+from apyscript.expression.expression_ir import BinaryOp
+from apyscript.expression.expression_ir import Call
+from apyscript.expression.expression_ir import Expression
+from apyscript.expression.expression_ir import ExpressionStatement
+from apyscript.expression.expression_ir import Index
+from apyscript.expression.expression_ir import Literal
+from apyscript.expression.expression_ir import Member
+from apyscript.expression.expression_ir import Raw
+from apyscript.expression.expression_ir import Ref
+from apyscript.expression.expression_ir import Statement
+from apyscript.expression.expression_ir import TypedArrayLiteral
+from apyscript.expression.expression_ir import VarDecl
+from apyscript.expression.expression_ir import make_method_call
+
+
+def _make_copy_expression(variable_name: str) -> Call:
+    """
+    Make a `JSON.parse(JSON.stringify(...))` copy expression of
+    specified variable (for testing).
+
+    Parameters
+    ----------
+    variable_name : str
+        Variable name to copy.
+
+    Returns
+    -------
+    expression : Call
+        Created expression.
+    """
+    return make_method_call(
+        variable_name='JSON', method_name='parse',
+        args=[
+            make_method_call(
+                variable_name='JSON', method_name='stringify',
+                args=[Ref(name=variable_name)]),
+        ])
+
+
+def _make_length_expression(variable_name: str) -> Member:
+    """
+    Make a `length` access expression of specified variable (for
+    testing).
+
+    Parameters
+    ----------
+    variable_name : str
+        Target variable name.
+
+    Returns
+    -------
+    expression : Member
+        Created expression.
+    """
+    return Member(target=Ref(name=variable_name), name='length')
+
+
+def test_eliminate_common_subexpressions() -> None:
+    addition: BinaryOp = BinaryOp(
+        left=Ref(name='int_1'), operator='+', right=Ref(name='int_2'))
+    statements: List[Statement] = [
+        VarDecl(name='int_3', value=addition),
+        VarDecl(name='int_4', value=addition),
+        Assign(
+            target=Ref(name='int_5'),
+            value=_make_length_expression(variable_name='array_1')),
+        Assign(
+            target=Ref(name='int_6'),
+            value=_make_length_expression(variable_name='array_1')),
+        ExpressionStatement(
+            expression=make_method_call(
+                variable_name='console', method_name='log',
+                args=[Ref(name='array_1')])),
+        Assign(
+            target=Ref(name='int_7'),
+            value=_make_length_expression(variable_name='array_1')),
+        Assign(target=Ref(name='int_1'), value=Literal(value=10)),
+        VarDecl(name='int_8', value=addition),
+    ]
+    optimized: List[Statement] = \
+        expression_subexpression_elimination.eliminate_common_subexpressions(
+            statements=statements)
+    assert optimized == [
+        statements[0],
+        VarDecl(name='int_4', value=Ref(name='int_3')),
+        statements[2],
+        Assign(target=Ref(name='int_6'), value=Ref(name='int_5')),
+        statements[4],
+        Assign(target=Ref(name='int_7'), value=Ref(name='int_5')),
+        statements[6],
+        statements[7],
+    ]
+
+    # Mutating method call (including via aliased variable) and raw
+    # statements will invalidate the expressions.
+    statements = [
+        VarDecl(
+            name='int_1',
+            value=_make_length_expression(variable_name='array_1')),
+        ExpressionStatement(
+            expression=make_method_call(
+                variable_name='array_1', method_name='push',
+                args=[Literal(value=1)])),
+        VarDecl(
+            name='int_2',
+            value=_make_length_expression(variable_name='array_1')),
+        VarDecl(name='array_2', value=Ref(name='array_1')),
+        ExpressionStatement(
+            expression=make_method_call(
+                variable_name='array_2', method_name='splice',
+                args=[Literal(value=0), Literal(value=1)])),
+        VarDecl(
+            name='int_3',
+            value=_make_length_expression(variable_name='array_1')),
+        Raw(js='for (var i = 0; i < 3; i++) {array_1.push(i);}'),
+        VarDecl(
+            name='int_4',
+            value=_make_length_expression(variable_name='array_1')),
+    ]
+    optimized = \
+        expression_subexpression_elimination.eliminate_common_subexpressions(
+            statements=statements)
+    assert optimized == statements
+
+    # New object expression will be reused only if the variables are
+    # never mutated.
+    statements = [
+        VarDecl(
+            name='array_2',
+            value=_make_copy_expression(variable_name='array_1')),
+        VarDecl(
+            name='array_3',
+            value=_make_copy_expression(variable_name='array_1')),
+        VarDecl(
+            name='array_4',
+            value=_make_copy_expression(variable_name='array_1')),
+        ExpressionStatement(
+            expression=make_method_call(
+                variable_name='array_4', method_name='reverse')),
+    ]
+    optimized = \
+        expression_subexpression_elimination.eliminate_common_subexpressions(
+            statements=statements)
+    assert optimized == [
+        statements[0],
+        VarDecl(name='array_3', value=Ref(name='array_2')),
+        statements[2],
+        statements[3],
+    ]
+
+
+def test__get_alias_groups() -> None:
+    alias_groups: Dict[str, Set[str]] = \
+        expression_subexpression_elimination._get_alias_groups(
+            statements=[
+                VarDecl(name='array_2', value=Ref(name='array_1')),
+                ExpressionStatement(
+                    expression=make_method_call(
+                        variable_name='array_3', method_name='push',
+                        args=[Ref(name='array_2')])),
+                VarDecl(
+                    name='array_5',
+                    value=_make_copy_expression(variable_name='array_4')),
+            ])
+    assert alias_groups == {
+        'array_1': {'array_1', 'array_2', 'array_3'},
+        'array_2': {'array_1', 'array_2', 'array_3'},
+        'array_3': {'array_1', 'array_2', 'array_3'},
+    }
+
+
+def test__get_aliasing_names() -> None:
+    names: Set[str] = expression_subexpression_elimination.\
+        _get_aliasing_names(
+            statement=VarDecl(
+                name='array_2',
+                value=Index(
+                    target=Ref(name='array_1'), index=Literal(value=0))))
+    assert names == {'array_1', 'array_2'}
+
+    names = expression_subexpression_elimination._get_aliasing_names(
+        statement=VarDecl(
+            name='int_1',
+            value=_make_length_expression(variable_name='array_1')))
+    assert names == set()
+
+    names = expression_subexpression_elimination._get_aliasing_names(
+        statement=AttrSet(
+            target=Ref(name='rectangle_1'), attr_name='x',
+            value=Ref(name='int_1')))
+    assert names == set()
+
+
+def test__get_possibly_mutated_names() -> None:
+    names: Set[str] = expression_subexpression_elimination.\
+        _get_possibly_mutated_names(
+            statements=[
+                VarDecl(
+                    name='int_1',
+                    value=make_method_call(
+                        variable_name='array_1', method_name='pop')),
+                VarDecl(
+                    name='int_2',
+                    value=_make_length_expression(variable_name='array_2')),
+                Assign(
+                    target=Index(
+                        target=Ref(name='array_3'), index=Literal(value=0)),
+                    value=Literal(value=10)),
+                ExpressionStatement(
+                    expression=make_method_call(
+                        variable_name='console', method_name='log',
+                        args=[Ref(name='array_4')])),
+                ExpressionStatement(
+                    expression=make_method_call(
+                        variable_name='array_5', method_name='sort')),
+            ],
+            alias_groups={
+                'array_5': {'array_5', 'array_6'},
+                'array_6': {'array_5', 'array_6'},
+            })
+    assert names == {'array_1', 'array_3', 'array_5', 'array_6'}
+
+
+def test__get_stored_ref() -> None:
+    ref: Optional[Ref] = expression_subexpression_elimination._get_stored_ref(
+        statement=VarDecl(name='int_1', value=Literal(value=10)))
+    assert ref == Ref(name='int_1')
+    ref = expression_subexpression_elimination._get_stored_ref(
+        statement=Assign(target=Ref(name='int_1'), value=Literal(value=10)))
+    assert ref == Ref(name='int_1')
+    ref = expression_subexpression_elimination._get_stored_ref(
+        statement=Assign(
+            target=Ref(name='int_1'), value=Literal(value=10),
+            operator='+='))
+    assert ref is None
+    ref = expression_subexpression_elimination._get_stored_ref(
+        statement=Assign(
+            target=Index(target=Ref(name='array_1'), index=Literal(value=0)),
+            value=Literal(value=10)))
+    assert ref is None
+    ref = expression_subexpression_elimination._get_stored_ref(
+        statement=Raw(js='a;'))
+    assert ref is None
+
+
+def test__is_console_call_statement() -> None:
+    assert expression_subexpression_elimination._is_console_call_statement(
+        statement=ExpressionStatement(
+            expression=make_method_call(
+                variable_name='console', method_name='log',
+                args=[Ref(name='int_1')])))
+    assert not expression_subexpression_elimination.\
+        _is_console_call_statement(
+            statement=ExpressionStatement(
+                expression=make_method_call(
+                    variable_name='console', method_name='log',
+                    args=[
+                        make_method_call(
+                            variable_name='array_1', method_name='pop'),
+                    ])))
+    assert not expression_subexpression_elimination.\
+        _is_console_call_statement(
+            statement=ExpressionStatement(
+                expression=make_method_call(
+                    variable_name='array_1', method_name='sort')))
+    assert not expression_subexpression_elimination.\
+        _is_console_call_statement(statement=Raw(js='console.log(1);'))
+
+
+def test__expand_by_alias_groups() -> None:
+    names: Set[str] = expression_subexpression_elimination.\
+        _expand_by_alias_groups(
+            names={'array_1', 'int_1'},
+            alias_groups={
+                'array_1': {'array_1', 'array_2'},
+                'array_2': {'array_1', 'array_2'},
+            })
+    assert names == {'array_1', 'array_2', 'int_1'}
+
+
+def test__reuse_available_expression() -> None:
+    copy_expression: Call = _make_copy_expression(variable_name='array_1')
+    available: Dict[Expression, str] = {copy_expression: 'array_2'}
+    statement: Statement = expression_subexpression_elimination.\
+        _reuse_available_expression(
+            statement=VarDecl(name='array_3', value=copy_expression),
+            available=available, mutated_names=set())
+    assert statement == VarDecl(name='array_3', value=Ref(name='array_2'))
+
+    statement = expression_subexpression_elimination.\
+        _reuse_available_expression(
+            statement=VarDecl(name='array_3', value=copy_expression),
+            available=available, mutated_names={'array_2'})
+    assert statement == VarDecl(name='array_3', value=copy_expression)
+
+    statement = expression_subexpression_elimination.\
+        _reuse_available_expression(
+            statement=Assign(
+                target=Ref(name='array_2'), value=copy_expression),
+            available=available, mutated_names=set())
+    assert statement == Assign(
+        target=Ref(name='array_2'), value=copy_expression)
+
+
+def test__get_affected_names() -> None:
+    names: Set[str] = expression_subexpression_elimination.\
+        _get_affected_names(
+            statement=VarDecl(
+                name='int_1',
+                value=_make_length_expression(variable_name='array_1')),
+            alias_groups={})
+    assert names == {'int_1'}
+
+    names = expression_subexpression_elimination._get_affected_names(
+        statement=VarDecl(
+            name='int_1',
+            value=make_method_call(
+                variable_name='array_1', method_name='pop')),
+        alias_groups={
+            'array_1': {'array_1', 'array_2'},
+            'array_2': {'array_1', 'array_2'},
+        })
+    assert names == {'int_1', 'array_1', 'array_2'}
+
+
+def test__register_available_expression() -> None:
+    available: Dict[Expression, str] = {}
+    dependent_expressions: Dict[str, Set[Expression]] = {}
+    length_expression: Member = _make_length_expression(
+        variable_name='array_1')
+    expression_subexpression_elimination._register_available_expression(
+        statement=VarDecl(name='int_1', value=length_expression),
+        available=available, dependent_expressions=dependent_expressions)
+    assert available == {length_expression: 'int_1'}
+    assert dependent_expressions == {
+        'array_1': {length_expression},
+        'int_1': {length_expression},
+    }
+
+    # Variable reference, primitive literal, impure, and self reading
+    # expressions will not be registered.
+    for statement in [
+            VarDecl(name='int_2', value=Ref(name='int_1')),
+            VarDecl(name='int_2', value=Literal(value=10)),
+            VarDecl(
+                name='int_2',
+                value=make_method_call(
+                    variable_name='array_1', method_name='pop')),
+            Assign(
+                target=Ref(name='int_2'),
+                value=BinaryOp(
+                    left=Ref(name='int_2'), operator='+',
+                    right=Literal(value=1))),
+    ]:
+        expression_subexpression_elimination._register_available_expression(
+            statement=statement, available=available,
+            dependent_expressions=dependent_expressions)
+    assert available == {length_expression: 'int_1'}
+
+
+def test__is_call_of() -> None:
+    assert expression_subexpression_elimination._is_call_of(
+        expression=_make_copy_expression(variable_name='array_1'),
+        function_names={'JSON.parse'})
+    assert expression_subexpression_elimination._is_call_of(
+        expression=make_method_call(
+            variable_name='array_1', method_name='slice'),
+        function_names=set(), method_names={'slice'})
+    assert not expression_subexpression_elimination._is_call_of(
+        expression=make_method_call(
+            variable_name='array_1', method_name='slice'),
+        function_names=set())
+    assert not expression_subexpression_elimination._is_call_of(
+        expression=Ref(name='array_1'), function_names={'array_1'})
+
+
+def test__is_primitive_result_expression() -> None:
+    assert expression_subexpression_elimination.\
+        _is_primitive_result_expression(
+            expression=BinaryOp(
+                left=Ref(name='int_1'), operator='+',
+                right=Literal(value=1)))
+    assert expression_subexpression_elimination.\
+        _is_primitive_result_expression(expression=Literal(value=10))
+    assert expression_subexpression_elimination.\
+        _is_primitive_result_expression(
+            expression=_make_length_expression(variable_name='array_1'))
+    assert expression_subexpression_elimination.\
+        _is_primitive_result_expression(
+            expression=make_method_call(
+                variable_name='array_1', method_name='indexOf',
+                args=[Literal(value=1)]))
+    assert not expression_subexpression_elimination.\
+        _is_primitive_result_expression(
+            expression=Index(
+                target=Ref(name='array_1'), index=Literal(value=0)))
+    assert not expression_subexpression_elimination.\
+        _is_primitive_result_expression(expression=Literal(value=[1, 2]))
+
+
+def test__is_fresh_object_expression() -> None:
+    assert expression_subexpression_elimination._is_fresh_object_expression(
+        expression=ArrayLiteral(elements=[Ref(name='int_1')]))
+    assert expression_subexpression_elimination._is_fresh_object_expression(
+        expression=Literal(value=[1, 2]))
+    assert expression_subexpression_elimination._is_fresh_object_expression(
+        expression=TypedArrayLiteral(
+            typed_array_name='Int32Array', base64_str='AQAAAAIAAAA='))
+    assert expression_subexpression_elimination._is_fresh_object_expression(
+        expression=_make_copy_expression(variable_name='array_1'))
+    assert expression_subexpression_elimination._is_fresh_object_expression(
+        expression=make_method_call(
+            variable_name='array_1', method_name='concat',
+            args=[Ref(name='array_2')]))
+    assert not expression_subexpression_elimination.\
+        _is_fresh_object_expression(expression=Literal(value=10))
+    assert not expression_subexpression_elimination.\
+        _is_fresh_object_expression(
+            expression=_make_length_expression(variable_name='array_1'))
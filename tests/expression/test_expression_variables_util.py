@@ -1,14 +1,77 @@
+import os
 from random import randint
+from typing import Dict
 from typing import List
 
 from retrying import retry
 
 from apyscript.expression import expression_file_util
 from apyscript.expression import expression_variables_util
+from apyscript.expression.expression_variables_util import \
+    VariableNameAllocator
 from apyscript.file import file_util
 
 
-@retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
+class TestVariableNameAllocator:
+
+    def test___init__(self) -> None:
+        allocator: VariableNameAllocator = VariableNameAllocator()
+        assert allocator._variable_nums == {}
+
+    def test_get_next_variable_name(self) -> None:
+        allocator: VariableNameAllocator = VariableNameAllocator()
+        variable_name: str = allocator.get_next_variable_name(
+            type_name='sprite')
+        assert variable_name == 'sprite_1'
+        variable_name = allocator.get_next_variable_name(
+            type_name='sprite')
+        assert variable_name == 'sprite_2'
+        variable_name = allocator.get_next_variable_name(type_name='int')
+        assert variable_name == 'int_1'
+
+    def test_get_last_variable_num(self) -> None:
+        allocator: VariableNameAllocator = VariableNameAllocator()
+        assert allocator.get_last_variable_num(type_name='sprite') == 0
+        allocator.get_next_variable_name(type_name='sprite')
+        allocator.get_next_variable_name(type_name='sprite')
+        assert allocator.get_last_variable_num(type_name='sprite') == 2
+
+    def test_get_type_names(self) -> None:
+        allocator: VariableNameAllocator = VariableNameAllocator()
+        allocator.get_next_variable_name(type_name='sprite')
+        allocator.get_next_variable_name(type_name='int')
+        assert allocator.get_type_names() == ['sprite', 'int']
+
+    def test_snapshot(self) -> None:
+        allocator: VariableNameAllocator = VariableNameAllocator()
+        allocator.get_next_variable_name(type_name='sprite')
+        snapshot: Dict[str, int] = allocator.snapshot()
+        assert snapshot == {'sprite': 1}
+        allocator.get_next_variable_name(type_name='sprite')
+        assert snapshot == {'sprite': 1}
+
+    def test_restore(self) -> None:
+        allocator: VariableNameAllocator = VariableNameAllocator()
+        allocator.restore(snapshot={'sprite': 3})
+        variable_name: str = allocator.get_next_variable_name(
+            type_name='sprite')
+        assert variable_name == 'sprite_4'
+
+    def test_clear(self) -> None:
+        allocator: VariableNameAllocator = VariableNameAllocator()
+        allocator.get_next_variable_name(type_name='sprite')
+        allocator.clear()
+        variable_name: str = allocator.get_next_variable_name(
+            type_name='sprite')
+        assert variable_name == 'sprite_1'
+
+
+def test_get_variable_name_allocator() -> None:
+    allocator: VariableNameAllocator = expression_variables_util.\
+        get_variable_name_allocator()
+    assert isinstance(allocator, VariableNameAllocator)
+
+
 def test_get_variable_names_file_path() -> None:
     file_path: str = expression_variables_util.\
         get_variable_names_file_path(type_name='sprite')
@@ -26,23 +89,10 @@ def test__read_variable_names() -> None:
         _read_variable_names(type_name='sprite')
     assert variable_names == ['sprite_1', 'sprite_2', 'sprite_3']
 
-    file_util.remove_file_if_exists(file_path=file_path)
-
-
-@retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
-def test__get_next_variable_num() -> None:
-    file_path: str = expression_variables_util.\
-        get_variable_names_file_path(type_name='sprite')
-    file_util.remove_file_if_exists(file_path=file_path)
-    next_variable_num: int = expression_variables_util.\
-        _get_next_variable_num(type_name='sprite')
-    assert next_variable_num == 1
-
-    file_util.save_plain_txt(
-        txt='sprite_1,sprite_2,', file_path=file_path)
-    next_variable_num = expression_variables_util.\
-        _get_next_variable_num(type_name='sprite')
-    assert next_variable_num == 3
+    file_util.save_plain_txt(txt='', file_path=file_path)
+    variable_names = expression_variables_util._read_variable_names(
+        type_name='sprite')
+    assert variable_names == []
 
     file_util.remove_file_if_exists(file_path=file_path)
 
@@ -53,36 +103,54 @@ def test__make_variable_name() -> None:
     assert variable_name == 'sprite_3'
 
 
-@retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
-def test__save_next_variable_name_to_file() -> None:
-    file_path: str = expression_variables_util.\
-        get_variable_names_file_path(type_name='sprite')
-    file_util.remove_file_if_exists(file_path=file_path)
-    expression_variables_util._save_next_variable_name_to_file(
-        type_name='sprite')
-    next_variable_num: int = expression_variables_util.\
-        _get_next_variable_num(type_name='sprite')
-    assert next_variable_num == 2
-    expression_variables_util._save_next_variable_name_to_file(
-        type_name='sprite')
-    next_variable_num = expression_variables_util.\
-        _get_next_variable_num(type_name='sprite')
-    assert next_variable_num == 3
+def test_get_next_variable_name() -> None:
+    expression_variables_util.reset_variable_names()
 
-    file_util.remove_file_if_exists(file_path=file_path)
+    variable_name: str = expression_variables_util.\
+        get_next_variable_name(type_name='sprite')
+    assert variable_name == 'sprite_1'
 
+    variable_name = expression_variables_util.\
+        get_next_variable_name(type_name='sprite')
+    assert variable_name == 'sprite_2'
 
-def test_get_next_variable_name() -> None:
     file_path: str = expression_variables_util.\
         get_variable_names_file_path(type_name='sprite')
-    file_util.remove_file_if_exists(file_path=file_path)
+    assert not os.path.exists(file_path)
 
+
+def test_reset_variable_names() -> None:
+    expression_variables_util.get_next_variable_name(type_name='sprite')
+    expression_variables_util.reset_variable_names()
     variable_name: str = expression_variables_util.\
         get_next_variable_name(type_name='sprite')
     assert variable_name == 'sprite_1'
 
-    variable_name = expression_variables_util.\
-        get_next_variable_name(type_name='sprite')
-    assert variable_name == 'sprite_2'
 
-    file_util.remove_file_if_exists(file_path=file_path)
+@retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
+def test_save_variable_names_files() -> None:
+    expression_file_util.empty_expression_dir()
+    expression_variables_util.get_next_variable_name(type_name='sprite')
+    expression_variables_util.get_next_variable_name(type_name='sprite')
+    file_paths: List[str] = expression_variables_util.\
+        save_variable_names_files()
+    file_path: str = expression_variables_util.\
+        get_variable_names_file_path(type_name='sprite')
+    assert file_paths == [file_path]
+    txt: str = file_util.read_txt(file_path=file_path)
+    assert txt == 'sprite_1,sprite_2,'
+    expression_file_util.empty_expression_dir()
+
+
+@retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
+def test_restore_variable_names_from_files() -> None:
+    expression_file_util.empty_expression_dir()
+    file_path: str = expression_variables_util.\
+        get_variable_names_file_path(type_name='sprite')
+    file_util.save_plain_txt(
+        txt='sprite_1,sprite_2,', file_path=file_path)
+    expression_variables_util.restore_variable_names_from_files()
+    variable_name: str = expression_variables_util.\
+        get_next_variable_name(type_name='sprite')
+    assert variable_name == 'sprite_3'
+    expression_file_util.empty_expression_dir()
@@ -85,3 +85,24 @@ def test_append_plain_txt() -> None:
     file_util.append_plain_txt(txt='World!', file_path=tmp_file_path)
     txt: str = file_util.read_txt(file_path=tmp_file_path)
     assert txt == 'Hello World!'
+
+
+def test_get_tmp_file_path() -> None:
+    tmp_file_path: str = file_util.get_tmp_file_path(
+        file_path='../.tmp_apyscript_test_file_util/index.html')
+    assert tmp_file_path.startswith(
+        f'../.tmp_apyscript_test_file_util/index.html.{os.getpid()}.')
+    assert tmp_file_path.endswith('.tmp')
+
+
+@retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
+def test_save_bytes_atomically() -> None:
+    tmp_dir_path: str = '../.tmp_apyscript_test_file_util_atomic/'
+    shutil.rmtree(tmp_dir_path, ignore_errors=True)
+    file_path: str = os.path.join(tmp_dir_path, 'test.txt')
+    file_util.save_bytes_atomically(data=b'Hello!', file_path=file_path)
+    assert file_util.read_txt(file_path=file_path) == 'Hello!'
+    file_util.save_bytes_atomically(data=b'World!', file_path=file_path)
+    assert file_util.read_txt(file_path=file_path) == 'World!'
+    assert os.listdir(tmp_dir_path) == ['test.txt']
+    shutil.rmtree(tmp_dir_path, ignore_errors=True)
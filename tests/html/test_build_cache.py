@@ -0,0 +1,215 @@
+import os
+import shutil
+from random import randint
+from typing import Dict
+from typing import List
+
+import pytest
+from retrying import retry
+
+from apyscript.console.trace import trace
+from apyscript.display.stage import Stage
+from apyscript.file import file_util
+from apyscript.html import build_cache
+from apyscript.html.build_cache import BuildCache
+from apyscript.type import Int
+from apyscript.type import String
+
+_CACHE_DIR_PATH: str = '../.tmp_apyscript_test_build_cache/'
+_DEST_DIR_PATH: str = '../.tmp_apyscript_test_build_cache_dest/'
+_INPUT_FILE_PATH: str = '../.tmp_apyscript_test_build_cache_input.txt'
+
+_built_values: List[int] = []
+
+
+def _build() -> None:
+    value: int = int(file_util.read_txt(file_path=_INPUT_FILE_PATH))
+    _built_values.append(value)
+    Stage(stage_elem_id='test_build_cache_stage')
+    int_1: Int = Int(value)
+    trace(int_1)
+    string_1: String = String('\u3042')
+    trace(string_1)
+
+
+def _remove_tmp_files() -> None:
+    shutil.rmtree(_CACHE_DIR_PATH, ignore_errors=True)
+    shutil.rmtree(_DEST_DIR_PATH, ignore_errors=True)
+    file_util.remove_file_if_exists(file_path=_INPUT_FILE_PATH)
+
+
+class TestBuildCache:
+
+    def test___init__(self) -> None:
+        cache: BuildCache = BuildCache(
+            cache_dir_path=_CACHE_DIR_PATH, max_entries=10, max_size=100)
+        assert cache.cache_dir_path == _CACHE_DIR_PATH
+        assert cache.max_entries == 10
+        assert cache.max_size == 100
+
+        cache = BuildCache()
+        assert cache.cache_dir_path == build_cache.DEFAULT_CACHE_DIR_PATH
+
+        with pytest.raises(ValueError):  # type: ignore
+            BuildCache(max_entries=0)
+        with pytest.raises(ValueError):  # type: ignore
+            BuildCache(max_size=0)
+
+    @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
+    def test_export(self) -> None:
+        _remove_tmp_files()
+        _built_values.clear()
+        file_util.save_plain_txt(txt='10', file_path=_INPUT_FILE_PATH)
+        cache: BuildCache = BuildCache(cache_dir_path=_CACHE_DIR_PATH)
+        is_hit: bool = cache.export(
+            build_func=_build, dest_dir_path=_DEST_DIR_PATH,
+            input_file_paths=[_INPUT_FILE_PATH])
+        assert not is_hit
+        assert _built_values == [10]
+        index_file_path: str = os.path.join(_DEST_DIR_PATH, 'index.html')
+        with open(index_file_path, 'rb') as f:
+            html_bytes: bytes = f.read()
+        html: str = html_bytes.decode('utf-8')
+        assert 'test_build_cache_stage' in html
+        assert '= 10;' in html
+        assert '"\u3042"' in html
+
+        os.remove(index_file_path)
+        is_hit = cache.export(
+            build_func=_build, dest_dir_path=_DEST_DIR_PATH,
+            input_file_paths=[_INPUT_FILE_PATH])
+        assert is_hit
+        assert _built_values == [10]
+        with open(index_file_path, 'rb') as f:
+            assert f.read() == html_bytes
+        assert os.path.isfile(os.path.join(_DEST_DIR_PATH, 'jquery.min.js'))
+
+        file_util.save_plain_txt(txt='20', file_path=_INPUT_FILE_PATH)
+        is_hit = cache.export(
+            build_func=_build, dest_dir_path=_DEST_DIR_PATH,
+            input_file_paths=[_INPUT_FILE_PATH])
+        assert not is_hit
+        assert _built_values == [10, 20]
+        with open(index_file_path, 'rb') as f:
+            assert b'= 20;' in f.read()
+
+        is_hit = cache.export(
+            build_func=_build, dest_dir_path=_DEST_DIR_PATH,
+            input_file_paths=[_INPUT_FILE_PATH], optimize=False)
+        assert not is_hit
+
+        stats: Dict[str, int] = cache.get_stats()
+        assert stats['hits'] == 1
+        assert stats['misses'] == 3
+        assert stats['evictions'] == 0
+        assert stats['entries'] == 3
+        _remove_tmp_files()
+
+    @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
+    def test_get_fingerprint(self) -> None:
+        _remove_tmp_files()
+        file_util.save_plain_txt(txt='10', file_path=_INPUT_FILE_PATH)
+        cache: BuildCache = BuildCache(cache_dir_path=_CACHE_DIR_PATH)
+        fingerprint: str = cache.get_fingerprint(
+            script_file_path=__file__, input_file_paths=[_INPUT_FILE_PATH])
+        assert len(fingerprint) == 64
+        assert cache.get_fingerprint(
+            script_file_path=__file__,
+            input_file_paths=[_INPUT_FILE_PATH]) == fingerprint
+
+        fingerprints: List[str] = [
+            cache.get_fingerprint(script_file_path=__file__),
+            cache.get_fingerprint(
+                script_file_path=__file__,
+                input_file_paths=[_INPUT_FILE_PATH], optimize=False),
+            cache.get_fingerprint(
+                script_file_path=__file__,
+                input_file_paths=[_INPUT_FILE_PATH],
+                jslib_dir_path='../jslib/'),
+        ]
+        file_util.save_plain_txt(txt='20', file_path=_INPUT_FILE_PATH)
+        fingerprints.append(cache.get_fingerprint(
+            script_file_path=__file__, input_file_paths=[_INPUT_FILE_PATH]))
+        assert len(set(fingerprints + [fingerprint])) == 5
+
+        build_cache.__version__ = '0.0.0'  # type: ignore
+        try:
+            assert cache.get_fingerprint(
+                script_file_path=__file__,
+                input_file_paths=[_INPUT_FILE_PATH]) != fingerprints[-1]
+        finally:
+            from apyscript import __version__
+            build_cache.__version__ = __version__  # type: ignore
+        _remove_tmp_files()
+
+    @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
+    def test_get_cached_html(self) -> None:
+        _remove_tmp_files()
+        cache: BuildCache = BuildCache(cache_dir_path=_CACHE_DIR_PATH)
+        assert cache.get_cached_html(fingerprint='abc') is None
+        cache._save_entry(fingerprint='abc', html='<html></html>')
+        entry_file_path: str = cache._get_entry_file_path(fingerprint='abc')
+        os.utime(entry_file_path, (0, 0))
+        assert cache.get_cached_html(fingerprint='abc') == '<html></html>'
+        assert os.path.getmtime(entry_file_path) != 0
+        _remove_tmp_files()
+
+    @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
+    def test__evict(self) -> None:
+        _remove_tmp_files()
+        cache: BuildCache = BuildCache(
+            cache_dir_path=_CACHE_DIR_PATH, max_entries=2, max_size=10)
+        for i, fingerprint in enumerate(('a', 'b')):
+            cache._save_entry(fingerprint=fingerprint, html='123')
+            os.utime(
+                cache._get_entry_file_path(fingerprint=fingerprint), (i, i))
+        cache.get_cached_html(fingerprint='a')
+        cache._save_entry(fingerprint='c', html='123')
+        assert cache.get_cached_html(fingerprint='b') is None
+        assert cache.get_cached_html(fingerprint='a') == '123'
+        assert cache.get_cached_html(fingerprint='c') == '123'
+        assert cache.get_stats()['evictions'] == 1
+
+        cache._save_entry(fingerprint='d', html='12345678')
+        stats: Dict[str, int] = cache.get_stats()
+        assert stats['entries'] == 1
+        assert stats['size'] == 8
+        assert stats['evictions'] == 3
+        _remove_tmp_files()
+
+    @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
+    def test_get_stats(self) -> None:
+        _remove_tmp_files()
+        cache: BuildCache = BuildCache(cache_dir_path=_CACHE_DIR_PATH)
+        assert cache.get_stats() == {
+            'hits': 0, 'misses': 0, 'evictions': 0, 'entries': 0, 'size': 0}
+        cache._increment_stats(key='hits')
+        cache._increment_stats(key='misses', num=2)
+        cache._save_entry(fingerprint='abc', html='123')
+        assert cache.get_stats() == {
+            'hits': 1, 'misses': 2, 'evictions': 0, 'entries': 1, 'size': 3}
+
+        file_util.save_plain_txt(
+            txt='{', file_path=os.path.join(_CACHE_DIR_PATH, 'stats.json'))
+        assert cache.get_stats()['hits'] == 0
+        _remove_tmp_files()
+
+    @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
+    def test_clear(self) -> None:
+        _remove_tmp_files()
+        cache: BuildCache = BuildCache(cache_dir_path=_CACHE_DIR_PATH)
+        cache._save_entry(fingerprint='abc', html='123')
+        cache._increment_stats(key='hits')
+        cache.clear()
+        assert os.listdir(_CACHE_DIR_PATH) == []
+        _remove_tmp_files()
+
+
+@retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
+def test__get_file_digest() -> None:
+    _remove_tmp_files()
+    file_util.save_plain_txt(txt='10', file_path=_INPUT_FILE_PATH)
+    digest: str = build_cache._get_file_digest(file_path=_INPUT_FILE_PATH)
+    assert digest == (
+        '4a44dc15364204a80fe80e9039455cc1608281820fe2b24f1e5233ade6af1dd5')
+    _remove_tmp_files()
@@ -1,13 +1,27 @@
+import hashlib
 import os
 import shutil
+from io import StringIO
 from random import randint
+from typing import Dict
+from typing import Iterator
 from typing import List
 
+import pytest
 from retrying import retry
 
+from apyscript.display.sprite import Sprite
 from apyscript.display.stage import Stage
+from apyscript.expression import expression_file_util
+from apyscript.expression import build_session
+from apyscript.expression import expression_variables_util
+from apyscript.expression.build_session import BuildSession
+from apyscript.expression.expression_optimizer import ExpressionOptimizer
 from apyscript.file import file_util
 from apyscript.html import exporter
+from apyscript.html import html_const
+from apyscript.jslib import jslib_util
+from apyscript.type import Int
 
 
 @retry(stop_max_attempt_number=5, wait_fixed=300)
@@ -24,14 +38,34 @@ def test__export_js_libs() -> None:
         tmp_dir_path, 'jquery.min.js')
     assert expected_file_path in saved_js_file_paths
 
+    os.utime(expected_file_path, (0, 0))
+    saved_js_file_paths = exporter._export_js_libs(
+        dest_dir_path=tmp_dir_path,
+        previous_manifest=jslib_util.get_jslib_manifest())
+    assert expected_file_path in saved_js_file_paths
+    assert os.path.getmtime(expected_file_path) == 0
+
+    saved_js_file_paths = exporter._export_js_libs(
+        dest_dir_path=tmp_dir_path, previous_manifest={})
+    assert os.path.getmtime(expected_file_path) != 0
+
     shutil.rmtree(tmp_dir_path, ignore_errors=True)
 
 
-def test__append_head_to_html_str() -> None:
-    html_str: str = '<html>'
-    html_str = exporter._append_head_to_html_str(html_str=html_str)
+def test__iter_head_chunks() -> None:
+    html_str: str = ''.join(
+        exporter._iter_head_chunks(jslib_dir_url='/static/'))
+    assert 'src="/static/jquery.min.js"' in html_str
 
-    expected_str: str = '<html>\n<head>\n'
+    html_str = ''.join(
+        exporter._iter_head_chunks(hash_jslib_file_names=True))
+    hashed_file_name: str = jslib_util.get_hashed_jslib_file_name(
+        jslib_name='jquery.min.js')
+    assert f'src="./{hashed_file_name}"' in html_str
+
+    html_str = ''.join(exporter._iter_head_chunks())
+
+    expected_str: str = '\n<head>\n'
     assert html_str.startswith(expected_str)
 
     expected_str = '  <meta charset="utf-8">'
@@ -46,12 +80,54 @@ def test__append_head_to_html_str() -> None:
 
 
 @retry(stop_max_attempt_number=5, wait_fixed=300)
-def test__append_expression_to_html_str() -> None:
-    html_str: str = '<html>\n<body>'
+def test__iter_expression_chunks() -> None:
+    expression_file_util.remove_expression_file()
     stage: Stage = Stage(stage_elem_id='test_stage')
-    html_str = exporter._append_expression_to_html_str(
-        html_str=html_str)
+    html_str: str = ''.join(exporter._iter_expression_chunks())
+    assert html_str.startswith(f'\n{html_const.SCRIPT_START_TAG}')
     assert 'id="test_stage"' in html_str
+    assert (
+        f'{html_const.SCRIPT_START_TAG}'
+        f'\nfunction main_{stage.variable_name}() {{'
+        '\n  var stage_html = '
+    ) in html_str
+    assert html_str.endswith(f'\n}}\n{html_const.SCRIPT_END_TAG}')
+
+    expression_file_util.remove_expression_file()
+    int_1: Int = Int(10)
+    int_1.variable_name
+    html_str = ''.join(
+        exporter._iter_expression_chunks(optimizer=ExpressionOptimizer()))
+    assert int_1.variable_name not in html_str
+    html_str = ''.join(exporter._iter_expression_chunks())
+    assert f'\n  var {int_1.variable_name} = 10;' in html_str
+
+    expression_file_util.remove_expression_file()
+    expression_file_util.append_expression(expression='<p></p>')
+    html_str = ''.join(exporter._iter_expression_chunks())
+    assert html_str == '\n<p></p>'
+
+
+def test__indent_script_chunk() -> None:
+    script_chunk: str = exporter._indent_script_chunk(
+        script_chunk='var a = 10;\nvar b = 20;')
+    assert script_chunk == '  var a = 10;\n  var b = 20;'
+
+    script_chunk = exporter._indent_script_chunk(
+        script_chunk='\nvar a = 10;')
+    assert script_chunk == '\n  var a = 10;'
+
+
+@retry(stop_max_attempt_number=5, wait_fixed=300)
+def test_write_expressions_overall_html() -> None:
+    expression_file_util.remove_expression_file()
+    stage: Stage = Stage(stage_elem_id='test_stage')
+    stream: StringIO = StringIO()
+    exporter.write_expressions_overall_html(stream=stream)
+    html_str: str = stream.getvalue()
+    assert html_str.startswith('<html>\n<head>')
+    assert html_str.endswith('\n</body>' + (
+        exporter._make_entry_point_function_call_html()) + '\n</html>')
     assert f'function main_{stage.variable_name}() {{' in html_str
 
 
@@ -59,7 +135,8 @@ def test__append_expression_to_html_str() -> None:
 def test_save_expressions_overall_html() -> None:
     tmp_dir_path: str = '../.tmp_apyscript_test_exporter/'
     shutil.rmtree(tmp_dir_path, ignore_errors=True)
-    Stage(stage_elem_id='test_stage')
+    stage: Stage = Stage(stage_elem_id='test_stage')
+    Sprite(stage=stage)
     exporter.save_expressions_overall_html(dest_dir_path=tmp_dir_path)
     expected_index_file_path: str = os.path.join(tmp_dir_path, 'index.html')
     assert os.path.isfile(expected_index_file_path)
@@ -67,18 +144,301 @@ def test_save_expressions_overall_html() -> None:
     assert html_str.startswith('<html>\n<head>')
     assert html_str.endswith('\n</html>')
     assert 'id="test_stage"' in html_str
+    variable_names_file_path: str = expression_variables_util.\
+        get_variable_names_file_path(type_name='sprite')
+    assert os.path.isfile(variable_names_file_path)
+
+    int_1: Int = Int(10)
+    exporter.save_expressions_overall_html(dest_dir_path=tmp_dir_path)
+    html_str = file_util.read_txt(file_path=expected_index_file_path)
+    assert f'var {int_1.variable_name} = 10;' not in html_str
+
+    exporter.save_expressions_overall_html(
+        dest_dir_path=tmp_dir_path, optimize=False)
+    html_str = file_util.read_txt(file_path=expected_index_file_path)
+    assert f'var {int_1.variable_name} = 10;' in html_str
+
+    exporter.save_expressions_overall_html(
+        dest_dir_path=tmp_dir_path,
+        optimizer=ExpressionOptimizer(dead_variable_elimination=False))
+    html_str = file_util.read_txt(file_path=expected_index_file_path)
+    assert f'var {int_1.variable_name} = 10;' in html_str
+
+    jslib_dir_path: str = '../.tmp_apyscript_test_exporter_jslib/'
+    shutil.rmtree(jslib_dir_path, ignore_errors=True)
+    exporter.save_expressions_overall_html(
+        dest_dir_path=tmp_dir_path, jslib_dir_path=jslib_dir_path)
+    assert sorted(os.listdir(tmp_dir_path)) == [
+        exporter.EXPORT_MANIFEST_FILE_NAME, 'index.html']
+    hashed_file_name: str = jslib_util.get_hashed_jslib_file_name(
+        jslib_name='jquery.min.js')
+    assert os.path.isfile(os.path.join(jslib_dir_path, hashed_file_name))
+    html_str = file_util.read_txt(file_path=expected_index_file_path)
+    assert (
+        f'src="../.tmp_apyscript_test_exporter_jslib/{hashed_file_name}"'
+    ) in html_str
+
+    shutil.rmtree(tmp_dir_path, ignore_errors=True)
+    shutil.rmtree(jslib_dir_path, ignore_errors=True)
+
+
+@retry(stop_max_attempt_number=5, wait_fixed=300)
+def test_save_expressions_overall_html_incrementally() -> None:
+    tmp_dir_path: str = '../.tmp_apyscript_test_exporter_incremental/'
+    shutil.rmtree(tmp_dir_path, ignore_errors=True)
+    os.makedirs(tmp_dir_path)
+    other_file_path: str = os.path.join(tmp_dir_path, 'other.txt')
+    file_util.save_plain_txt(txt='other', file_path=other_file_path)
+    with BuildSession():
+        Stage(stage_elem_id='test_stage')
+        exporter.save_expressions_overall_html(dest_dir_path=tmp_dir_path)
+        index_file_path: str = os.path.join(tmp_dir_path, 'index.html')
+        jquery_file_path: str = os.path.join(tmp_dir_path, 'jquery.min.js')
+        manifest: Dict[str, str] = exporter.read_export_manifest(
+            dest_dir_path=tmp_dir_path)
+        assert sorted(manifest.keys()) == sorted(
+            ['index.html'] + jslib_util.get_jslib_file_names())
+        assert os.path.isfile(other_file_path)
+
+        os.utime(index_file_path, (0, 0))
+        os.utime(jquery_file_path, (0, 0))
+        exporter.save_expressions_overall_html(dest_dir_path=tmp_dir_path)
+        assert os.path.getmtime(index_file_path) == 0
+        assert os.path.getmtime(jquery_file_path) == 0
+
+        int_1: Int = Int(10)
+        int_1.variable_name
+        exporter.save_expressions_overall_html(
+            dest_dir_path=tmp_dir_path, optimize=False)
+        assert os.path.getmtime(index_file_path) != 0
+        assert os.path.getmtime(jquery_file_path) == 0
+        html_str: str = file_util.read_txt(file_path=index_file_path)
+        assert f'var {int_1.variable_name} = 10;' in html_str
+        assert exporter.read_export_manifest(
+            dest_dir_path=tmp_dir_path)['index.html'] != \
+            manifest['index.html']
+
+        jslib_dir_path: str = '../.tmp_apyscript_test_exporter_jslib/'
+        exporter.save_expressions_overall_html(
+            dest_dir_path=tmp_dir_path, jslib_dir_path=jslib_dir_path)
+        assert sorted(os.listdir(tmp_dir_path)) == [
+            exporter.EXPORT_MANIFEST_FILE_NAME, 'index.html', 'other.txt']
+    shutil.rmtree(tmp_dir_path, ignore_errors=True)
+    shutil.rmtree(jslib_dir_path, ignore_errors=True)
+
+
+@retry(stop_max_attempt_number=5, wait_fixed=300)
+def test_save_overall_html() -> None:
+    tmp_dir_path: str = '../.tmp_apyscript_test_exporter_save_html_str/'
+    shutil.rmtree(tmp_dir_path, ignore_errors=True)
+    exporter.save_overall_html(
+        html='<html></html>', dest_dir_path=tmp_dir_path)
+    index_file_path: str = os.path.join(tmp_dir_path, 'index.html')
+    assert file_util.read_txt(file_path=index_file_path) == '<html></html>'
+    assert os.path.isfile(os.path.join(tmp_dir_path, 'jquery.min.js'))
+    manifest: Dict[str, str] = exporter.read_export_manifest(
+        dest_dir_path=tmp_dir_path)
+    assert manifest['index.html'] == hashlib.sha256(
+        b'<html></html>').hexdigest()
+
+    os.utime(index_file_path, (0, 0))
+    exporter.save_overall_html(
+        html='<html></html>', dest_dir_path=tmp_dir_path)
+    assert os.path.getmtime(index_file_path) == 0
+    shutil.rmtree(tmp_dir_path, ignore_errors=True)
+
+
+def test_read_export_manifest() -> None:
+    tmp_dir_path: str = '../.tmp_apyscript_test_exporter_manifest/'
+    shutil.rmtree(tmp_dir_path, ignore_errors=True)
+    assert exporter.read_export_manifest(dest_dir_path=tmp_dir_path) == {}
+
+    exporter._save_export_manifest(
+        dest_dir_path=tmp_dir_path, manifest={'index.html': 'abc'})
+    manifest: Dict[str, str] = exporter.read_export_manifest(
+        dest_dir_path=tmp_dir_path)
+    assert manifest == {'index.html': 'abc'}
+
+    manifest_file_path: str = os.path.join(
+        tmp_dir_path, exporter.EXPORT_MANIFEST_FILE_NAME)
+    file_util.save_plain_txt(txt='{', file_path=manifest_file_path)
+    assert exporter.read_export_manifest(dest_dir_path=tmp_dir_path) == {}
 
+    file_util.save_plain_txt(txt='[]', file_path=manifest_file_path)
+    assert exporter.read_export_manifest(dest_dir_path=tmp_dir_path) == {}
     shutil.rmtree(tmp_dir_path, ignore_errors=True)
 
 
+def test__save_html_if_changed() -> None:
+    tmp_dir_path: str = '../.tmp_apyscript_test_exporter_save_html/'
+    shutil.rmtree(tmp_dir_path, ignore_errors=True)
+    os.makedirs(tmp_dir_path)
+    file_path: str = os.path.join(tmp_dir_path, 'index.html')
+    digest: str = exporter._save_html_if_changed(
+        chunks=iter(['<html>', '\n</html>']), file_path=file_path,
+        previous_digest=None)
+    assert digest == hashlib.sha256(b'<html>\n</html>').hexdigest()
+    assert file_util.read_txt(file_path=file_path) == '<html>\n</html>'
+
+    os.utime(file_path, (0, 0))
+    exporter._save_html_if_changed(
+        chunks=iter(['<html>', '\n</html>']), file_path=file_path,
+        previous_digest=digest)
+    assert os.path.getmtime(file_path) == 0
+    assert os.listdir(tmp_dir_path) == ['index.html']
+
+    exporter._save_html_if_changed(
+        chunks=iter(['<html>']), file_path=file_path,
+        previous_digest=digest)
+    assert file_util.read_txt(file_path=file_path) == '<html>'
+
+    digest = exporter._save_html_if_changed(
+        chunks=iter(['<p>\u3042</p>']), file_path=file_path,
+        previous_digest=None)
+    with open(file_path, 'rb') as f:
+        html_bytes: bytes = f.read()
+    assert html_bytes == '<p>\u3042</p>'.encode('utf-8')
+    assert digest == hashlib.sha256(html_bytes).hexdigest()
+
+    def _iter_failing_chunks() -> Iterator[str]:
+        yield '<html>'
+        raise ValueError('test error')
+
+    with pytest.raises(ValueError):  # type: ignore
+        exporter._save_html_if_changed(
+            chunks=_iter_failing_chunks(), file_path=file_path,
+            previous_digest=None)
+    assert os.listdir(tmp_dir_path) == ['index.html']
+    with open(file_path, 'rb') as f:
+        assert f.read() == html_bytes
+    shutil.rmtree(tmp_dir_path, ignore_errors=True)
+
+
+def test__remove_stale_files() -> None:
+    tmp_dir_path: str = '../.tmp_apyscript_test_exporter_stale/'
+    shutil.rmtree(tmp_dir_path, ignore_errors=True)
+    for file_name in ('a.js', 'b.js', 'c.txt'):
+        file_util.save_plain_txt(
+            txt='', file_path=os.path.join(tmp_dir_path, file_name))
+    exporter._remove_stale_files(
+        dest_dir_path=tmp_dir_path,
+        previous_manifest={'a.js': 'abc', 'b.js': 'def', '../c.txt': 'g'},
+        manifest={'b.js': 'def'})
+    assert sorted(os.listdir(tmp_dir_path)) == ['b.js', 'c.txt']
+    shutil.rmtree(tmp_dir_path, ignore_errors=True)
+
+
+def test__export_hashed_js_libs() -> None:
+    jslib_dir_path: str = '../.tmp_apyscript_test_exporter_jslib/'
+    shutil.rmtree(jslib_dir_path, ignore_errors=True)
+    js_file_paths: List[str] = exporter._export_hashed_js_libs(
+        jslib_dir_path=jslib_dir_path)
+    assert len(js_file_paths) == len(jslib_util.get_jslib_file_names())
+    for js_file_path in js_file_paths:
+        assert os.path.isfile(js_file_path)
+    shutil.rmtree(jslib_dir_path, ignore_errors=True)
+
+
+def test__get_jslib_dir_url() -> None:
+    jslib_dir_url: str = exporter._get_jslib_dir_url(
+        dest_dir_path='./reports/report_1/', jslib_dir_path='./assets')
+    assert jslib_dir_url == '../../assets/'
+
+
+def test__get_jslib_src_file_name() -> None:
+    src_file_name: str = exporter._get_jslib_src_file_name(
+        jslib_file_name='jquery.min.js', hash_jslib_file_names=False)
+    assert src_file_name == 'jquery.min.js'
+
+    src_file_name = exporter._get_jslib_src_file_name(
+        jslib_file_name='jquery.min.js', hash_jslib_file_names=True)
+    assert src_file_name == jslib_util.get_hashed_jslib_file_name(
+        jslib_name='jquery.min.js')
+
+
+def test__get_optimizer() -> None:
+    optimizer: ExpressionOptimizer = ExpressionOptimizer()
+    assert exporter._get_optimizer(
+        optimize=False, optimizer=optimizer) is None
+    assert exporter._get_optimizer(
+        optimize=True, optimizer=optimizer) is optimizer
+    assert isinstance(
+        exporter._get_optimizer(optimize=True, optimizer=None),
+        ExpressionOptimizer)
+
+
+@retry(stop_max_attempt_number=5, wait_fixed=300)
+def test_iter_html_chunks() -> None:
+    with BuildSession():
+        stage: Stage = Stage(stage_elem_id='test_stage')
+        int_1: Int = Int(10)
+        int_1.variable_name
+        chunks: Iterator[str] = exporter.iter_html_chunks(
+            jslib_dir_url='/static/')
+        unoptimized_chunks: Iterator[str] = exporter.iter_html_chunks(
+            optimize=False)
+    assert next(chunks) == '<html>'
+    html_str: str = '<html>' + ''.join(chunks)
+    assert html_str.endswith('\n</html>')
+    assert 'src="/static/jquery.min.js"' in html_str
+    assert 'id="test_stage"' in html_str
+    assert f'function main_{stage.variable_name}() {{' in html_str
+    assert f'var {int_1.variable_name} = 10;' not in html_str
+
+    html_str = ''.join(unoptimized_chunks)
+    assert f'var {int_1.variable_name} = 10;' in html_str
+
+    # Iterating chunks in the default session does not save any file.
+    build_session.get_current_session().reset()
+    stage = Stage(stage_elem_id='test_stage')
+    Sprite(stage=stage)
+    html_str = ''.join(exporter.iter_html_chunks())
+    assert 'id="test_stage"' in html_str
+    variable_names_file_path: str = expression_variables_util.\
+        get_variable_names_file_path(type_name='sprite')
+    assert not os.path.isfile(variable_names_file_path)
+
+
+def test__iter_chunks_in_session() -> None:
+    session: BuildSession = BuildSession()
+
+    def _iter_sessions() -> Iterator[str]:
+        for _ in range(2):
+            yield str(id(build_session.get_current_session()))
+
+    chunks: List[str] = list(
+        exporter._iter_chunks_in_session(
+            chunks=_iter_sessions(), session=session))
+    assert chunks == [str(id(session))] * 2
+    assert build_session.get_current_session() is not session
+
+
+def test_get_jslib_assets() -> None:
+    jslib_assets: Dict[str, bytes] = exporter.get_jslib_assets()
+    assert sorted(jslib_assets.keys()) == sorted(
+        jslib_util.get_jslib_file_names())
+    assert jslib_assets['jquery.min.js'] == jslib_util.get_jslib_bytes(
+        jslib_name='jquery.min.js')
+
+    jslib_assets = exporter.get_jslib_assets(hash_jslib_file_names=True)
+    hashed_file_name: str = jslib_util.get_hashed_jslib_file_name(
+        jslib_name='jquery.min.js')
+    assert jslib_assets[hashed_file_name] == jslib_util.get_jslib_bytes(
+        jslib_name='jquery.min.js')
+
+
+def test__log_optimization_stats() -> None:
+    exporter._log_optimization_stats(optimizer=None)
+    optimizer: ExpressionOptimizer = ExpressionOptimizer()
+    optimizer.optimize(statements=[])
+    exporter._log_optimization_stats(optimizer=optimizer)
+
+
 @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
-def test__append_entry_point_function_call() -> None:
+def test__make_entry_point_function_call_html() -> None:
     stage: Stage = Stage()
-    html_str: str = '<html>'
-    html_str = exporter._append_entry_point_function_call(
-        html_str=html_str)
+    html_str: str = exporter._make_entry_point_function_call_html()
     expected: str = (
-        '<html>'
         '\n<script type="text/javascript">'
         '\n$(document).ready(function() {'
         f'\n  main_{stage.variable_name}();'
@@ -89,13 +449,10 @@ def test__append_entry_point_function_call() -> None:
 
 
 @retry(stop_max_attempt_number=5, wait_fixed=300)
-def test__append_stage_global_variable_to_html() -> None:
+def test__make_stage_global_variable_html() -> None:
     Stage(stage_elem_id='test_stage')
-    html_str: str = '<html>'
-    html_str = exporter._append_stage_global_variable_to_html(
-        html_str=html_str)
+    html_str: str = exporter._make_stage_global_variable_html()
     expected: str = (
-        '<html>'
         '\n<script type="text/javascript">'
         '\nvar test_stage;'
         '\n</script>'
@@ -103,6 +460,16 @@ def test__append_stage_global_variable_to_html() -> None:
     assert html_str == expected
 
 
+@retry(stop_max_attempt_number=5, wait_fixed=300)
+def test__iter_overall_html_chunks() -> None:
+    Stage(stage_elem_id='test_stage')
+    chunks: List[str] = list(exporter._iter_overall_html_chunks())
+    assert chunks[0] == '<html>'
+    assert chunks[-1] == '\n</html>'
+    assert '\n<body>' in chunks
+    assert '\n</body>' in chunks
+
+
 @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
 def test_get_entry_point_func_name() -> None:
     stage: Stage = Stage()
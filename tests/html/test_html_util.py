@@ -109,7 +109,9 @@ class TestScriptLineUtil:
         testing_helper.assert_attrs(
             expected_attrs={
                 'html': html,
+                'lines': ['<html>', '</html>'],
                 'script_line_ranges': [],
+                '_script_start_line_nums': [],
             },
             any_obj=script_line_util,
         )
@@ -122,6 +124,7 @@ class TestScriptLineUtil:
             (8, 8),
         ]
         assert script_line_util.script_line_ranges == expected
+        assert script_line_util._script_start_line_nums == [3, 8]
 
     def test_is_script_line(self) -> None:
         script_line_util: ScriptLineUtil = ScriptLineUtil(
@@ -141,6 +144,19 @@ class TestScriptLineUtil:
                 line_number=line_number)
             assert result == expected
 
+    def test_get_script_line_flags(self) -> None:
+        script_line_util: ScriptLineUtil = ScriptLineUtil(
+            html=self._TEST_HTML)
+        script_line_flags: List[bool] = \
+            script_line_util.get_script_line_flags()
+        assert script_line_flags == [
+            False, False, True, True, False,
+            False, False, True, False, False,
+        ]
+        for i, script_line_flag in enumerate(script_line_flags):
+            assert script_line_util.is_script_line(
+                line_number=i + 1) == script_line_flag
+
 
 def test_wrap_expression_by_script_tag() -> None:
     expression: str = 'console.log("Hello!");'
@@ -151,3 +167,33 @@ def test_wrap_expression_by_script_tag() -> None:
         '\nconsole.log("Hello!");'
         '\n</script>'
     )
+
+
+def test_split_html_and_script() -> None:
+    html, script = html_util.split_html_and_script(
+        expression=(
+            '<body>'
+            '\n<script type="text/javascript">'
+            '\nconsole.log("Hello ");'
+            '\n'
+            '\n</script>'
+            '\n</body>'
+            '\n<script type="text/javascript">'
+            '\nconsole.log("World!");'
+            '\n</script>'
+        ))
+    assert html == '<body>\n</body>'
+    assert script == 'console.log("Hello ");\nconsole.log("World!");'
+
+    html, script = html_util.split_html_and_script(
+        expression=(
+            '<script type="text/javascript" src="./jquery.min.js"></script>'
+            '\n<script type="text/javascript">'
+            '\nconsole.log("Hello ");'
+        ))
+    assert html == (
+        '<script type="text/javascript" src="./jquery.min.js"></script>'
+        '\n<script type="text/javascript">'
+        '\nconsole.log("Hello ");'
+    )
+    assert script == ''
@@ -1,9 +1,14 @@
+import hashlib
 import os
 import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 from typing import Dict
 from typing import List
+from typing import Tuple
 
+from apyscript.expression.build_session import BuildSession
 from apyscript.jslib import jslib_util
 from tests import testing_helper
 
@@ -12,6 +17,35 @@ def test_get_jslib_file_names() -> None:
     jslib_file_names: List[str] = jslib_util.get_jslib_file_names()
     assert 'jquery.min.js' in jslib_file_names
     assert 'svg.min.js' in jslib_file_names
+    assert jslib_file_names == sorted(jslib_file_names)
+    assert jslib_util._jslib_file_names_cache == jslib_file_names
+
+
+def test_get_jslib_file_names_and_manifest_in_threads() -> None:
+    expected_file_names: List[str] = jslib_util.get_jslib_file_names()
+    expected_manifest: Dict[str, str] = jslib_util.get_jslib_manifest()
+    thread_num: int = 8
+    for _ in range(20):
+        jslib_util._jslib_file_names_cache = None
+        jslib_util._jslib_manifest_cache = None
+        barrier: threading.Barrier = threading.Barrier(thread_num)
+
+        def _get_names_and_manifest(
+                _: int) -> Tuple[List[str], Dict[str, str]]:
+            with BuildSession():
+                barrier.wait()
+                return (
+                    jslib_util.get_jslib_file_names(),
+                    jslib_util.get_jslib_manifest())
+
+        with ThreadPoolExecutor(max_workers=thread_num) as executor:
+            results: List[Tuple[List[str], Dict[str, str]]] = list(
+                executor.map(_get_names_and_manifest, range(thread_num)))
+        for file_names, manifest in results:
+            assert file_names == expected_file_names
+            assert manifest == expected_manifest
+        assert jslib_util.get_jslib_file_names() == expected_file_names
+        assert jslib_util.get_jslib_manifest() == expected_manifest
 
 
 def test_get_jslib_abs_dir_path() -> None:
@@ -42,3 +76,67 @@ def test_export_jslib_to_specified_dir() -> None:
         kwargs=kwargs)
 
     shutil.rmtree(tmp_dir_path, ignore_errors=True)
+
+
+def test_get_jslib_bytes() -> None:
+    jslib_bytes: bytes = jslib_util.get_jslib_bytes(
+        jslib_name='jquery.min.js')
+    file_path: str = os.path.join(
+        jslib_util.get_jslib_abs_dir_path(), 'jquery.min.js')
+    with open(file_path, 'rb') as f:
+        assert jslib_bytes == f.read()
+    assert jslib_util._jslib_bytes_cache['jquery.min.js'] is jslib_bytes
+    assert jslib_util.get_jslib_bytes(
+        jslib_name='jquery.min.js') is jslib_bytes
+
+    testing_helper.assert_raises(
+        expected_error_class=FileNotFoundError,
+        func_or_method=jslib_util.get_jslib_bytes,
+        kwargs={'jslib_name': 'not_existing_lib.js'})
+    testing_helper.assert_raises(
+        expected_error_class=FileNotFoundError,
+        func_or_method=jslib_util.get_jslib_bytes,
+        kwargs={'jslib_name': '../jslib/jquery.min.js'})
+
+
+def test_get_jslib_manifest() -> None:
+    jslib_manifest: Dict[str, str] = jslib_util.get_jslib_manifest()
+    assert sorted(jslib_manifest.keys()) == \
+        jslib_util.get_jslib_file_names()
+    expected: str = hashlib.sha256(
+        jslib_util.get_jslib_bytes(jslib_name='jquery.min.js')).hexdigest()
+    assert jslib_manifest['jquery.min.js'] == expected
+
+
+def test_get_hashed_jslib_file_name() -> None:
+    hashed_file_name: str = jslib_util.get_hashed_jslib_file_name(
+        jslib_name='jquery.min.js')
+    content_hash: str = jslib_util.get_jslib_manifest()['jquery.min.js']
+    assert hashed_file_name == f'jquery.min.{content_hash[:16]}.js'
+
+    testing_helper.assert_raises(
+        expected_error_class=FileNotFoundError,
+        func_or_method=jslib_util.get_hashed_jslib_file_name,
+        kwargs={'jslib_name': 'not_existing_lib.js'})
+
+
+def test_export_hashed_jslib_to_specified_dir() -> None:
+    tmp_dir_path: str = '../.tmp_apyscript_jslib_util_test_hashed/'
+    shutil.rmtree(tmp_dir_path, ignore_errors=True)
+
+    dest_file_path: str = jslib_util.export_hashed_jslib_to_specified_dir(
+        dest_dir_path=tmp_dir_path, jslib_name='jquery.min.js')
+    hashed_file_name: str = jslib_util.get_hashed_jslib_file_name(
+        jslib_name='jquery.min.js')
+    assert dest_file_path == os.path.join(tmp_dir_path, hashed_file_name)
+    with open(dest_file_path, 'rb') as f:
+        assert f.read() == jslib_util.get_jslib_bytes(
+            jslib_name='jquery.min.js')
+    assert os.listdir(tmp_dir_path) == [hashed_file_name]
+
+    os.utime(dest_file_path, (0, 0))
+    dest_file_path = jslib_util.export_hashed_jslib_to_specified_dir(
+        dest_dir_path=tmp_dir_path, jslib_name='jquery.min.js')
+    assert os.path.getmtime(dest_file_path) == 0
+
+    shutil.rmtree(tmp_dir_path, ignore_errors=True)
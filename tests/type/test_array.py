@@ -1,3 +1,4 @@
+from array import array
 from random import randint
 from typing import Any
 from typing import Dict
@@ -7,11 +8,17 @@ import pytest
 from retrying import retry
 
 from apyscript.expression import expression_file_util
+from apyscript.expression.expression_ir import ArrayLiteral
+from apyscript.expression.expression_ir import Expression
+from apyscript.expression.expression_ir import Literal
+from apyscript.expression.expression_ir import Ref
+from apyscript.expression.expression_ir import TypedArrayLiteral
 from apyscript.type import Array
 from apyscript.type import Boolean
 from apyscript.type import Int
 from apyscript.type import Number
 from apyscript.type import String
+from apyscript.type.array import _copy_nested_list
 from tests import testing_helper
 
 
@@ -21,7 +28,6 @@ class TestArray:
     def test___init__(self) -> None:
         array_1: Array = Array((1, 2, 3))
         expected_attrs: Dict[str, Any] = {
-            '_initial_value': (1, 2, 3),
             '_value': [1, 2, 3],
             '_type_name': 'array',
         }
@@ -36,11 +42,30 @@ class TestArray:
         _: Array = Array((1, 2, 3))
         _ = Array(array_1)
 
+        _ = Array(array('d', [1.5, 2.5]))
+
         testing_helper.assert_raises(
             expected_error_class=ValueError,
             func_or_method=Array,
             kwargs={'value': 100})
 
+    @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
+    def test__copy_mutable_attributes(self) -> None:
+        array_1: Array = Array([1, [2, 3]])
+        array_2: Array = array_1._copy()
+        array_2._value.append(4)
+        array_2._value[1].append(5)
+        assert array_1.value == [1, [2, 3]]
+        assert array_2.value == [1, [2, 3, 5], 4]
+
+        array_3: Array = Array(array('i', [1, 2]))
+        array_4: Array = array_3._copy()
+        typed_array_value: Any = array_4._typed_array_value
+        assert typed_array_value is not array_3._typed_array_value
+        typed_array_value.append(3)
+        assert array_3.value == [1, 2]
+        assert array_4.value == [1, 2, 3]
+
     @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
     def test__get_list_value(self) -> None:
         array_1: Array = Array([1, 2, 3])
@@ -67,6 +92,63 @@ class TestArray:
         expected = f'var {array_2.variable_name} = {array_1.variable_name}'
         assert expected in expression
 
+        array_3: Array = Array(array('i', [1, 2]))
+        expression = expression_file_util.get_current_expression()
+        expected = (
+            f'var {array_3.variable_name} = Array.from(new Int32Array('
+            'Uint8Array.from(atob("AQAAAAIAAAA="), '
+        )
+        assert expected in expression
+
+    @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
+    def test__get_value_expression(self) -> None:
+        array_1: Array = Array([1, 2])
+        expression: Expression = array_1._get_value_expression(value=(1, 2))
+        assert expression == Literal(value=(1, 2))
+
+        int_1: Int = Int(3)
+        int_1.variable_name
+        array_1.value = [1, int_1]
+        expression = array_1._get_value_expression(value=[1, int_1])
+        assert expression == ArrayLiteral(
+            elements=[Literal(value=1), Ref(name=int_1.variable_name)])
+
+        array_2: Array = Array(array_1)
+        expression = array_2._get_value_expression(value=array_1)
+        assert expression == Ref(name=array_1.variable_name)
+
+        array_3: Array = Array(array('i', [1, 2]))
+        expression = array_3._get_value_expression(value=array('i', [1, 2]))
+        assert expression == TypedArrayLiteral(
+            typed_array_name='Int32Array', base64_str='AQAAAAIAAAA=')
+
+    @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
+    def test__value(self) -> None:
+        typed_array: array = array('d', [1.5, 2.5])
+        array_1: Array = Array(typed_array)
+        assert array_1._typed_array_value is typed_array
+        assert array_1._list_value == []
+        assert array_1._value == [1.5, 2.5]
+        assert array_1._typed_array_value is None
+
+        array_1._value = [3]
+        assert array_1._list_value == [3]
+
+    @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
+    def test__update_value(self) -> None:
+        array_1: Array = Array([1, 2])
+        typed_array: array = array('i', [3, 4])
+        array_1._update_value(value=typed_array)
+        assert array_1._typed_array_value is typed_array
+
+        array_2: Array = Array([5])
+        array_2._update_value(value=array_1)
+        assert array_2._typed_array_value is typed_array
+
+        array_2._update_value(value=(6, 7))
+        assert array_2._typed_array_value is None
+        assert array_2.value == [6, 7]
+
     @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
     def test__append_value_setter_expression(self) -> None:
         expression_file_util.remove_expression_file()
@@ -93,6 +175,10 @@ class TestArray:
         array_2.value = array_1
         assert array_2.value == [4, 5, 6]  # type: ignore
 
+        array_2.value = array('i', [10, 11])
+        assert array_2._typed_array_value is not None
+        assert array_2.value == [10, 11]
+
     @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
     def test_append(self) -> None:
         array_1: Array = Array([1, 2, 3])
@@ -153,6 +239,10 @@ class TestArray:
         assert array_2.value == [1, 2, 3, 4]
         assert array_1.value == [1, 2]
 
+        array_3: Array = array_1.concat(Array([5]))
+        assert array_3.value == [1, 2, 5]
+        assert array_1.value == [1, 2]
+
     @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
     def test__append_concat_expression(self) -> None:
         expression_file_util.remove_expression_file()
@@ -202,8 +292,7 @@ class TestArray:
         array_1.insert(index=index_1, value=value_1)
         expression = expression_file_util.get_current_expression()
         expected = (
-            f'{array_1.variable_name}.splice'
-            f'({index_1.variable_name}, 0, {value_1.variable_name});'
+            f'{array_1.variable_name}.splice(2, 0, 3);'
         )
         assert expected in expression
 
@@ -279,7 +368,7 @@ class TestArray:
         array_1.remove_at(index=int_1)
         expression = expression_file_util.get_current_expression()
         expected = (
-            f'{array_1.variable_name}.splice({int_1.variable_name}, 1);'
+            f'{array_1.variable_name}.splice(1, 1);'
         )
         assert expected in expression
 
@@ -362,7 +451,7 @@ class TestArray:
         expression = expression_file_util.get_current_expression()
         expected = (
             f'{array_3.variable_name} = {array_1.variable_name}'
-            f'.slice({int_1}, {int_2});'
+            '.slice(1, 3);'
         )
         assert expected in expression
 
@@ -411,8 +500,7 @@ class TestArray:
         _ = array_1[int_2]
         expression = expression_file_util.get_current_expression()
         expected = (
-            f'{value_1.variable_name} = {array_1.variable_name}'
-            f'[{int_2.variable_name}];'
+            f'{value_1.variable_name} = {array_1.variable_name}[2];'
         )
         assert expected in expression
 
@@ -471,8 +559,7 @@ class TestArray:
         array_1[int_1] = int_2
         expression = expression_file_util.get_current_expression()
         expected = (
-            f'{array_1.variable_name}[{int_1.variable_name}] = '
-            f'{int_2.variable_name};'
+            f'{array_1.variable_name}[1] = 5;'
         )
         assert expected in expression
 
@@ -489,6 +576,11 @@ class TestArray:
         assert length == 3
         assert isinstance(length, Int)
 
+        array_2: Array = Array(array('d', [1.5, 2.5]))
+        length = array_2.length
+        assert length == 2
+        assert array_2._typed_array_value is not None
+
     @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
     def test__append_length_expression(self) -> None:
         expression_file_util.remove_expression_file()
@@ -525,7 +617,7 @@ class TestArray:
         expression: str = expression_file_util.get_current_expression()
         expected: str = (
             f'{joined.variable_name} = '
-            f'{array_1.variable_name}.join({string_2.variable_name});'
+            f'{array_1.variable_name}.join(", ");'
         )
         assert expected in expression
 
@@ -564,7 +656,7 @@ class TestArray:
         expression = expression_file_util.get_current_expression()
         expected: str = (
             f'{index_1.variable_name} = {array_1.variable_name}'
-            f'.indexOf({int_1.variable_name});'
+            '.indexOf(2);'
         )
         assert expected in expression
 
@@ -587,3 +679,14 @@ class TestArray:
 
         array_2: Array = Array([1])
         assert array_2
+
+
+def test__copy_nested_list() -> None:
+    int_1: Int = Int(1)
+    value: List[Any] = [int_1, [2, [3]]]
+    copied: List[Any] = _copy_nested_list(value=value)
+    assert copied == value
+    assert copied is not value
+    assert copied[0] is int_1
+    assert copied[1] is not value[1]
+    assert copied[1][1] is not value[1][1]
@@ -16,7 +16,6 @@ class TestBoolean:
     def test___init__(self) -> None:
         boolean_1: Boolean = Boolean(value=Int(1))
         expected_attrs: Dict[str, Any] = {
-            '_initial_value': Int(1),
             '_value': True,
             '_type_name': 'boolean',
         }
@@ -26,11 +25,11 @@ class TestBoolean:
 
         boolean_2: Boolean = Boolean(value=boolean_1)
         expected_attrs = {
-            '_initial_value': boolean_1,
             '_value': True,
         }
         testing_helper.assert_attrs(
             expected_attrs=expected_attrs, any_obj=boolean_2)
+        assert not hasattr(boolean_2, '_initial_value')
 
         boolean_3: Boolean = Boolean(value=False)
         assert not boolean_3._value
@@ -40,24 +39,30 @@ class TestBoolean:
         expression_file_util.remove_expression_file()
         int_1: Int = Int(1)
         boolean_1: Boolean = Boolean(value=int_1)
+        assert not boolean_1._is_declared
         expression: str = expression_file_util.get_current_expression()
+        assert 'Boolean(' not in expression
+
+        int_1.variable_name
+        boolean_1 = Boolean(value=int_1)
+        expression = expression_file_util.get_current_expression()
         expected: str = (
             f'{boolean_1.variable_name} = Boolean({int_1.variable_name});'
         )
         assert expected in expression
 
         boolean_2: Boolean = Boolean(value=True)
-        expression = expression_file_util.get_current_expression()
         expected = (
             f'{boolean_2.variable_name} = true;'
         )
+        expression = expression_file_util.get_current_expression()
         assert expected in expression
 
         boolean_3: Boolean = Boolean(value=False)
-        expression = expression_file_util.get_current_expression()
         expected = (
             f'{boolean_3.variable_name} = false;'
         )
+        expression = expression_file_util.get_current_expression()
         assert expected in expression
 
     @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
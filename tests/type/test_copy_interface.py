@@ -3,6 +3,7 @@ from random import randint
 from retrying import retry
 
 from apyscript.expression import expression_file_util
+from apyscript.type import Int
 from apyscript.type.copy_interface import CopyInterface
 
 
@@ -17,6 +18,23 @@ class TestCopyInterface:
         assert result.variable_name.startswith('test_copy_interface_')
         assert result.variable_name != interface.variable_name
 
+    @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
+    def test__make_copied_instance(self) -> None:
+        expression_file_util.remove_expression_file()
+        interface: CopyInterface = CopyInterface()
+        interface.variable_name = 'test_copy_interface'
+        interface._type_name = 'test_copy_interface'
+        result: CopyInterface = interface._make_copied_instance()
+        assert result is not interface
+        assert result.variable_name.startswith('test_copy_interface_')
+        assert interface.variable_name == 'test_copy_interface'
+        expression: str = expression_file_util.get_current_expression()
+        assert result.variable_name not in expression
+
+    def test__copy_mutable_attributes(self) -> None:
+        interface: CopyInterface = CopyInterface()
+        interface._copy_mutable_attributes()
+
     @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
     def test__append_copy_expression(self) -> None:
         expression_file_util.remove_expression_file()
@@ -30,3 +48,12 @@ class TestCopyInterface:
             f'JSON.parse(JSON.stringify({interface.variable_name}));'
         )
         assert expected in expression
+
+        expression_file_util.remove_expression_file()
+        int_1: Int = Int(10)
+        int_1.variable_name
+        int_2: Int = int_1._copy()
+        expression = expression_file_util.get_current_expression()
+        expected = f'var {int_2.variable_name} = {int_1.variable_name};'
+        assert expected in expression
+        assert 'JSON' not in expression
@@ -89,7 +89,9 @@ class TestInt:
     @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
     def test__append_cast_expression(self) -> None:
         expression_file_util.remove_expression_file()
-        int_val: Int = Int(value=Number(value=100.5))
+        number_1: Number = Number(value=100.5)
+        number_1.variable_name
+        int_val: Int = Int(value=number_1)
         expression: str = expression_file_util.get_current_expression()
         expected: str = (
             f'{int_val.variable_name} = '
@@ -104,11 +106,45 @@ class TestInt:
 
         expression_file_util.remove_expression_file()
         int_val = Int(value=100.5)
+        expected = f'{int_val.variable_name} = 100;'
         expression = expression_file_util.get_current_expression()
         assert 'parseInt' not in expression
+        assert expected in expression
+
+        expression_file_util.remove_expression_file()
+        int_val = Int(value=Number(value=100.5))
         expected = f'{int_val.variable_name} = 100;'
+        expression = expression_file_util.get_current_expression()
+        assert 'parseInt' not in expression
+        assert expected in expression
+
+    @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
+    def test__append_incremental_expression(self) -> None:
+        expression_file_util.remove_expression_file()
+        int_1: Int = Int(10)
+        int_1 += 2
+        expression: str = expression_file_util.get_current_expression()
+        assert f'{int_1.variable_name} += 2;' in expression
+        assert 'parseInt' not in expression
+
+        int_1 *= 1.5
+        assert int_1.value == 18
+        expression = expression_file_util.get_current_expression()
+        expected: str = (
+            f'{int_1.variable_name} *= 1.5;'
+            f'\n{int_1.variable_name} = '
+            f'parseInt({int_1.variable_name}, 10);'
+        )
         assert expected in expression
 
+    @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
+    def test___itruediv__(self) -> None:
+        int_1: Int = Int(10)
+        result: Number = int_1 / 4
+        int_1 /= 4
+        assert isinstance(int_1, Number)
+        assert int_1.value == result.value
+
     @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
     def test___repr__(self) -> None:
         int_1: Int = Int(3)
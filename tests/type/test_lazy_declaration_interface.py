@@ -0,0 +1,58 @@
+from random import randint
+
+from retrying import retry
+
+from apyscript.expression import expression_file_util
+from apyscript.type import Int
+from apyscript.type import String
+from apyscript.type.lazy_declaration_interface import \
+    LazyDeclarationInterface
+
+
+class TestLazyDeclarationInterface:
+
+    def test__set_undeclared_value(self) -> None:
+        interface: LazyDeclarationInterface = LazyDeclarationInterface()
+        interface._set_undeclared_value(value=10)
+        assert interface._undeclared_value == 10
+        assert not interface._is_declared
+
+    @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
+    def test__declare(self) -> None:
+        expression_file_util.remove_expression_file()
+        interface: LazyDeclarationInterface = LazyDeclarationInterface()
+        interface._type_name = 'test_lazy_declaration_interface'
+        interface._set_undeclared_value(value='Hello!')
+        expression: str = expression_file_util.get_current_expression()
+        assert 'test_lazy_declaration_interface' not in expression
+
+        variable_name: str = interface.variable_name
+        assert variable_name.startswith('test_lazy_declaration_interface_')
+        assert interface._is_declared
+        expression = expression_file_util.get_current_expression()
+        assert f'var {variable_name} = "Hello!";' in expression
+
+        assert interface.variable_name == variable_name
+        expression = expression_file_util.get_current_expression()
+        assert expression.count(f'var {variable_name} ') == 1
+
+    @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
+    def test__copy(self) -> None:
+        expression_file_util.remove_expression_file()
+        int_1: Int = Int(10)
+        int_2: Int = int_1._copy()
+        assert int_2 is not int_1
+        assert not int_2._is_declared
+        assert int_2.value == 10
+        expression: str = expression_file_util.get_current_expression()
+        assert expression == ''
+
+        string_1: String = String('Hello!')
+        string_1.variable_name
+        string_2: String = string_1._copy()
+        assert string_2._is_declared
+        expression = expression_file_util.get_current_expression()
+        expected: str = (
+            f'var {string_2.variable_name} = {string_1.variable_name};'
+        )
+        assert expected in expression
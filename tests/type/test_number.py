@@ -22,10 +22,10 @@ class TestNumber:
             class_=float, instance=number_1.value)
 
         number_1 = Number(value=100.5)
-        expression: str = expression_file_util.get_current_expression()
         expected: str = (
             f'var {number_1.variable_name} = 100.5;'
         )
+        expression: str = expression_file_util.get_current_expression()
         assert expected in expression
 
         number_2 = Number(value=number_1)
@@ -1,3 +1,5 @@
+import gc
+import weakref
 from random import randint
 
 import pytest
@@ -19,7 +21,6 @@ class TestNumberValueInterface:
             value=100, type_name='test_interface')
         testing_helper.assert_attrs(
             expected_attrs={
-                '_initial_value': 100,
                 '_value': 100,
                 '_type_name': 'test_interface',
             },
@@ -29,10 +30,10 @@ class TestNumberValueInterface:
             value=interface_1, type_name='test_interface')
         testing_helper.assert_attrs(
             expected_attrs={
-                '_initial_value': interface_1,
                 '_value': 100,
             },
             any_obj=interface_2)
+        assert not hasattr(interface_2, '_initial_value')
 
         testing_helper.assert_raises(
             expected_error_class=ValueError,
@@ -56,22 +57,24 @@ class TestNumberValueInterface:
         expression_file_util.remove_expression_file()
         interface_1: NumberValueInterface = NumberValueInterface(
             value=100, type_name='test_interface')
-        interface_1.variable_name = 'test_number_value_interface_1'
-        interface_1.append_constructor_expression()
+        interface_1.append_constructor_expression(value=100)
+        assert not interface_1._is_declared
         expression: str = expression_file_util.get_current_expression()
+        assert 'var test_interface_' not in expression
         expected: str = (
-            'var test_number_value_interface_1 = 100;'
+            f'var {interface_1.variable_name} = 100;'
         )
+        expression = expression_file_util.get_current_expression()
         assert expected in expression
 
         interface_2: NumberValueInterface = NumberValueInterface(
             value=interface_1, type_name='test_interface')
-        interface_2.variable_name = 'test_number_value_interface_2'
-        interface_2.append_constructor_expression()
+        interface_2.append_constructor_expression(value=interface_1)
+        assert interface_2._is_declared
         expression = expression_file_util.get_current_expression()
         expected = (
-            'var test_number_value_interface_2 = '
-            'test_number_value_interface_1'
+            f'var {interface_2.variable_name} = '
+            f'{interface_1.variable_name};'
         )
         assert expected in expression
 
@@ -127,6 +130,28 @@ class TestNumberValueInterface:
         assert interface_1.variable_name != interface_2.variable_name
         assert interface_2.variable_name.startswith('test_interface')
 
+    def test___add___not_hold_source_value(self) -> None:
+        interface_1: NumberValueInterface = NumberValueInterface(
+            value=10, type_name='test_interface')
+        interface_1.variable_name = 'test_interface_0'
+        interface_ref: weakref.ref = weakref.ref(interface_1)
+        interface_2: NumberValueInterface = interface_1 + 10
+        interface_2 = interface_2 + interface_1
+        del interface_1
+        gc.collect()
+        assert interface_ref() is None
+        assert interface_2.value == 30
+
+    @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
+    def test___add___not_append_copy_expression(self) -> None:
+        expression_file_util.remove_expression_file()
+        interface_1: NumberValueInterface = NumberValueInterface(
+            value=10, type_name='test_interface')
+        interface_1.variable_name = 'test_interface_0'
+        interface_2: NumberValueInterface = interface_1 + 10
+        expression: str = expression_file_util.get_current_expression()
+        assert expression.count(f'var {interface_2.variable_name} =') == 1
+
     @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
     def test__append_addition_expression(self) -> None:
         expression_file_util.remove_expression_file()
@@ -327,9 +352,10 @@ class TestNumberValueInterface:
 
         expression: str = expression_file_util.get_current_expression()
         expected: str = (
-            f'{interface_1.variable_name} = test_interface_0 + 5;'
+            'test_interface_0 += 5;'
         )
         assert expected in expression
+        assert interface_1.variable_name == 'test_interface_0'
 
     @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
     def test___isub__(self) -> None:
@@ -342,9 +368,10 @@ class TestNumberValueInterface:
 
         expression: str = expression_file_util.get_current_expression()
         expected: str = (
-            f'{interface_1.variable_name} = test_interface_0 - 3;'
+            'test_interface_0 -= 3;'
         )
         assert expected in expression
+        assert interface_1.variable_name == 'test_interface_0'
 
     @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
     def test___imul__(self) -> None:
@@ -357,9 +384,10 @@ class TestNumberValueInterface:
 
         expression: str = expression_file_util.get_current_expression()
         expected: str = (
-            f'{interface_1.variable_name} = test_interface_0 * 3;'
+            'test_interface_0 *= 3;'
         )
         assert expected in expression
+        assert interface_1.variable_name == 'test_interface_0'
 
     @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
     def test___itruediv__(self) -> None:
@@ -372,9 +400,24 @@ class TestNumberValueInterface:
 
         expression: str = expression_file_util.get_current_expression()
         expected: str = (
-            f'{interface_1.variable_name} = {interface_1.variable_name} / 4;'
+            'test_interface_0 /= 4;'
         )
         assert expected in expression
+        assert interface_1.variable_name == 'test_interface_0'
+
+    @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
+    def test__append_incremental_expression(self) -> None:
+        expression_file_util.remove_expression_file()
+        interface_1: NumberValueInterface = NumberValueInterface(
+            value=10, type_name='test_interface')
+        interface_1.variable_name = 'test_interface_0'
+        interface_2: NumberValueInterface = NumberValueInterface(
+            value=5, type_name='test_interface')
+        interface_2.variable_name = 'test_interface_1'
+        interface_1._append_incremental_expression(
+            operator='+=', other=interface_2)
+        expression: str = expression_file_util.get_current_expression()
+        assert 'test_interface_0 += test_interface_1;' in expression
 
     @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
     def test___str__(self) -> None:
@@ -30,7 +30,6 @@ class TestString:
 
         string_1: String = String(value='Hello!')
         expected_attrs: Dict[str, Any] = {
-            '_initial_value': 'Hello!',
             '_value': 'Hello!',
             '_type_name': 'string',
         }
@@ -46,10 +45,11 @@ class TestString:
     def test__append_constructor_expression(self) -> None:
         expression_file_util.remove_expression_file()
         string_1: String = String(value='Hello!')
-        expression: str = expression_file_util.get_current_expression()
+        assert not string_1._is_declared
         expected: str = (
             f'var {string_1.variable_name} = "Hello!";'
         )
+        expression: str = expression_file_util.get_current_expression()
         assert expected in expression
 
         string_2: String = String(value=string_1)
@@ -139,15 +139,25 @@ class TestString:
 
     @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
     def test___iadd__(self) -> None:
+        expression_file_util.remove_expression_file()
         string_1: String = String(value='Hello')
+        variable_name: str = string_1.variable_name
         string_1 += ' World!'
         assert string_1.value == 'Hello World!'
+        assert string_1.variable_name == variable_name
+        expression: str = expression_file_util.get_current_expression()
+        assert f'{variable_name} += " World!";' in expression
 
     @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
     def test___imul__(self) -> None:
+        expression_file_util.remove_expression_file()
         string_1: String = String(value='Hello!')
+        variable_name: str = string_1.variable_name
         string_1 *= 3
         assert string_1.value == 'Hello!Hello!Hello!'
+        assert string_1.variable_name == variable_name
+        expression: str = expression_file_util.get_current_expression()
+        assert f'{variable_name} = {variable_name}.repeat(3);' in expression
 
     @retry(stop_max_attempt_number=10, wait_fixed=randint(100, 1000))
     def test___str__(self) -> None:
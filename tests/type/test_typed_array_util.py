@@ -0,0 +1,61 @@
+from array import array
+from typing import Any
+from typing import List
+from typing import Optional
+
+from apyscript.type import typed_array_util
+
+
+def test_get_typed_array_name() -> None:
+    typed_array_name: Optional[str] = typed_array_util.get_typed_array_name(
+        value=array('d', [1.5, 2.5]))
+    assert typed_array_name == 'Float64Array'
+
+    typed_array_name = typed_array_util.get_typed_array_name(
+        value=array('f', [1.5, 2.5]))
+    assert typed_array_name == 'Float32Array'
+
+    typed_array_name = typed_array_util.get_typed_array_name(
+        value=array('i', [1, 2]))
+    assert typed_array_name == 'Int32Array'
+
+    typed_array_name = typed_array_util.get_typed_array_name(
+        value=array('B', [1, 2]))
+    assert typed_array_name == 'Uint8Array'
+
+    typed_array_name = typed_array_util.get_typed_array_name(
+        value=array('q', [1, 2]))
+    assert typed_array_name == 'BigInt64Array'
+
+    typed_array_name = typed_array_util.get_typed_array_name(
+        value=array('u', 'ab'))
+    assert typed_array_name is None
+
+    typed_array_name = typed_array_util.get_typed_array_name(value=[1, 2])
+    assert typed_array_name is None
+
+    typed_array_name = typed_array_util.get_typed_array_name(value=b'ab')
+    assert typed_array_name is None
+
+    typed_array_name = typed_array_util.get_typed_array_name(
+        value=memoryview(b'ab'))
+    assert typed_array_name is None
+
+
+def test_is_typed_array() -> None:
+    assert typed_array_util.is_typed_array(value=array('d', [1.5]))
+    assert not typed_array_util.is_typed_array(value=[1.5])
+    assert not typed_array_util.is_typed_array(value='Hello!')
+
+
+def test_get_base64_str() -> None:
+    base64_str: str = typed_array_util.get_base64_str(
+        value=array('i', [1, 2]))
+    assert base64_str == 'AQAAAAIAAAA='
+
+
+def test_to_list() -> None:
+    list_value: List[Any] = typed_array_util.to_list(
+        value=array('d', [1.5, 2.5]))
+    assert list_value == [1.5, 2.5]
+    assert isinstance(list_value, list)
@@ -1,4 +1,8 @@
+from array import array
 from random import randint
+from typing import Any
+from typing import List
+from typing import Optional
 
 from retrying import retry
 
@@ -11,6 +15,11 @@ def test_get_value_str_for_expression() -> None:
     int_val: Int = Int(value=10)
     value_str: str = value_util.get_value_str_for_expression(
         value=int_val)
+    assert value_str == '10'
+
+    int_val.variable_name
+    value_str = value_util.get_value_str_for_expression(
+        value=int_val)
     assert value_str == int_val.variable_name
 
     value_str = value_util.get_value_str_for_expression(value=10)
@@ -31,6 +40,33 @@ def test_get_value_str_for_expression() -> None:
     value_str = value_util.get_value_str_for_expression(value=(30, 40))
     assert value_str == '[30, 40]'
 
+    value_str = value_util.get_value_str_for_expression(
+        value=array('i', [1, 2]))
+    assert value_str.startswith('Array.from(new Int32Array(')
+    value_str = value_util.get_value_str_for_expression(value=[10, 'Hi'])
+    assert value_str == '[10, "Hi"]'
+
+
+def test__is_json_primitive_iterable() -> None:
+    assert value_util._is_json_primitive_iterable(value=[1, 0.5, True])
+    assert value_util._is_json_primitive_iterable(value=[[1, 2], (3, 4)])
+    assert value_util._is_json_primitive_iterable(value=[])
+    assert not value_util._is_json_primitive_iterable(value=[1, 'Hello!'])
+    assert not value_util._is_json_primitive_iterable(value=[[1, 'Hello!']])
+    assert not value_util._is_json_primitive_iterable(value=[Int(10)])
+
+
+def test_get_primitive_iterable_copy() -> None:
+    value: List[Any] = [1, 'Hello!', [True, 0.5]]
+    copied: Optional[tuple] = value_util.get_primitive_iterable_copy(
+        value=value)
+    assert copied == (1, 'Hello!', (True, 0.5))
+    value[2].append(2)
+    assert copied == (1, 'Hello!', (True, 0.5))
+
+    copied = value_util.get_primitive_iterable_copy(value=[1, [Int(10)]])
+    assert copied is None
+
 
 def test_get_copy() -> None:
     int_val: Int = Int(value=10)
@@ -47,9 +83,24 @@ def test__get_value_str_from_iterable() -> None:
     int_1: Int = Int(value=10)
     value_str: str = value_util._get_value_str_from_iterable(
         value=[100, True, int_1, (1000, 2000), 'Hello!'])
-    expected: str = (
+    expected: str = '[100, true, 10, [1000, 2000], "Hello!"]'
+    assert value_str == expected
+
+    value_str = value_util._get_value_str_from_iterable(value=(1, [0.5]))
+    assert value_str == '[1, [0.5]]'
+
+    value_str = value_util._get_value_str_from_iterable(
+        value=['Hello!', 'World!'])
+    assert value_str == '["Hello!", "World!"]'
+
+    value_str = value_util._get_value_str_from_iterable(value=Array([1, 2]))
+    assert value_str == '[1, 2]'
+
+    expected = (
         f'[100, true, {int_1.variable_name}, [1000, 2000], "Hello!"]'
     )
+    value_str = value_util._get_value_str_from_iterable(
+        value=[100, True, int_1, (1000, 2000), 'Hello!'])
     assert value_str == expected
 
     value_str = value_util._get_value_str_from_iterable(value=(10, 20))
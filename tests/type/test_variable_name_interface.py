@@ -7,3 +7,13 @@ class TestVariableNameInterface:
         interface: VariableNameInterface = VariableNameInterface()
         interface.variable_name = 'test_interface'
         assert interface.variable_name == 'test_interface'
+
+        interface._is_declared = False
+        interface.variable_name = 'test_interface_2'
+        assert interface._is_declared
+
+    def test__declare(self) -> None:
+        interface: VariableNameInterface = VariableNameInterface()
+        interface._is_declared = False
+        interface._declare()
+        assert interface._is_declared